@@ -0,0 +1,36 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Filter backends for the FSU API endpoints."""
+
+from typing import Any
+
+from django.db.models import QuerySet
+from nautobot.core.api.filter_backends import NautobotFilterBackend
+from rest_framework.request import Request
+
+from nautobot_fsus.api.pagination import FSUKeysetPagination
+
+
+class FSUFilterBackend(NautobotFilterBackend):
+    """Filter backend that also ignores the keyset pagination query parameter."""
+
+    def get_filterset_kwargs(
+        self, request: Request, queryset: QuerySet, view: Any
+    ) -> dict[str, Any]:
+        """Exclude the keyset pagination cursor from the filterset data."""
+        kwargs: dict[str, Any] = super().get_filterset_kwargs(request, queryset, view)
+        kwargs["data"].pop(FSUKeysetPagination.cursor_query_param, None)
+        return kwargs
@@ -18,11 +18,64 @@
 from typing import Any
 
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
 from nautobot.apps.api import NautobotModelSerializer, TaggedModelSerializerMixin
 from rest_framework import serializers
 from rest_framework.fields import get_error_detail
+from rest_framework.relations import MANY_RELATION_KWARGS
 from rest_framework.validators import UniqueTogetherValidator
 
+from nautobot_fsus.models.mixins import FSUModel
+from nautobot_fsus.utilities.child_assignment import ChildRelation
+
+
+class FSUListSerializer(serializers.ListSerializer):  # pylint: disable=abstract-method
+    """
+    List serializer for FSUs, checking the names of FSUs created in bulk together.
+
+    FSU names are unique per Device and per Location. Instead of each new FSU checking its name
+    with its own query, the names in use are read with one query per parent type for the whole
+    list, which also finds FSUs in the list with the same name as each other.
+    """
+
+    def to_internal_value(self, data: Any) -> list[dict[str, Any]]:
+        """Check that the new FSUs have names unique in their Devices and Locations."""
+        attrs = super().to_internal_value(data)
+        if self.instance is not None:
+            return attrs
+
+        keys = []
+        for fsu_attrs in attrs:
+            parent_field = "device" if fsu_attrs.get("device") else "location"
+            parent = fsu_attrs.get(parent_field)
+            keys.append((parent_field, parent.pk if parent else None, fsu_attrs.get("name")))
+
+        existing = set()
+        for parent_field in ("device", "location"):
+            parent_ids = {key[1] for key in keys if key[0] == parent_field and key[1]}
+            if parent_ids:
+                existing.update(
+                    (parent_field, parent_id, name)
+                    for parent_id, name in self.child.Meta.model.objects.filter(
+                        **{f"{parent_field}_id__in": parent_ids},
+                        name__in={key[2] for key in keys if key[0] == parent_field},
+                    ).values_list(f"{parent_field}_id", "name")
+                )
+
+        errors: list[dict[str, list[str]]] = []
+        for key in keys:
+            if key[1] and key[2] and key in existing:
+                errors.append(
+                    {"non_field_errors": [f"The fields name, {key[0]} must make a unique set."]}
+                )
+            else:
+                errors.append({})
+            existing.add(key)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+
+        return attrs
+
 
 class FSUModelSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
     """Extend the standard Nautobot model serializer with FSU-specific validations."""
@@ -31,12 +84,24 @@ class FSUModelSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
         """FSUModelSerializer model options."""
 
         abstract = True
+        list_serializer_class = FSUListSerializer
         fields = "__all__"
         extra_kwargs = {
             "device": {"required": False, "allow_null": True},
             "location": {"required": False, "allow_null": True},
         }
 
+    def get_field_names(self, declared_fields, info):
+        """Leave child FSU lists off nested serializers, as Nautobot does for many-to-many fields."""
+        fields = list(super().get_field_names(declared_fields, info))
+        if self.is_nested:
+            fields = [
+                field_name
+                for field_name in fields
+                if not isinstance(declared_fields.get(field_name), serializers.ManyRelatedField)
+            ]
+        return fields
+
     def validate(self, data: dict[str, Any]) -> dict[str, Any]:
         """Validate the incoming POST/PUT/PATCH data."""
         # FSUs can be assigned to a Device or Location, but not both.
@@ -72,13 +137,16 @@ class FSUModelSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
             to_validate = value
 
         # Need to filter the unique together validators to use either the device field or
-        # the location field, depending on the parent.
+        # the location field, depending on the parent. FSUs created in bulk have their names
+        # checked together, by FSUListSerializer.
+        bulk_create = isinstance(self.parent, FSUListSerializer) and self.parent.instance is None
         for validator in self.validators:
-            if isinstance(validator, UniqueTogetherValidator):
-                if to_validate.get("device") and "location" in validator.fields:
-                    continue
-                if to_validate.get("location") and "device" in validator.fields:
-                    continue
+            if isinstance(validator, UniqueTogetherValidator) and (
+                bulk_create
+                or (to_validate.get("device") and "location" in validator.fields)
+                or (to_validate.get("location") and "device" in validator.fields)
+            ):
+                continue
             try:
                 if getattr(validator, "requires_context", False):
                     validator(to_validate, self)
@@ -97,6 +165,139 @@ class FSUModelSerializer(NautobotModelSerializer, TaggedModelSerializerMixin):
             raise serializers.ValidationError(errors)
 
 
+class ManyPrimaryKeysField(serializers.ManyRelatedField):
+    """List of primary keys whose objects are all looked up with a single query."""
+
+    def to_internal_value(self, data: Any) -> list[Any]:
+        """Look up the objects of a list of primary keys, in the order they were given."""
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+
+        child: serializers.PrimaryKeyRelatedField = self.child_relation
+        queryset = child.get_queryset()
+        pks = []
+        for value in data:
+            try:
+                if isinstance(value, bool):
+                    raise TypeError
+                pks.append(queryset.model._meta.pk.to_python(value))
+            except (DjangoValidationError, TypeError, ValueError):
+                child.fail("incorrect_type", data_type=type(value).__name__)
+
+        objects = queryset.in_bulk(pks)
+        for pk in pks:
+            if pk not in objects:
+                child.fail("does_not_exist", pk_value=pk)
+
+        return [objects[pk] for pk in pks]
+
+
+class ChildPrimaryKeysField(serializers.PrimaryKeyRelatedField):
+    """Primary key related field that looks up a list of children with a single query."""
+
+    @classmethod
+    def many_init(cls, *args: Any, **kwargs: Any) -> ManyPrimaryKeysField:
+        """Wrap the field in a ManyPrimaryKeysField when `many=True`."""
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key, value in kwargs.items():
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = value
+        return ManyPrimaryKeysField(**list_kwargs)
+
+
+def refresh_slot_count(instance: FSUModel) -> None:
+    """Read back the used slot count of a parent FSU, which its children change in the database."""
+    if slot_count_field := getattr(instance, "slot_count_field", None):
+        instance.refresh_from_db(fields=[slot_count_field])
+
+
+class ParentFSUModelSerializer(FSUModelSerializer):
+    """
+    Base class for serializers of FSUs with children, set from a list of child IDs.
+
+    The children are validated and reassigned as a set by the `child_relation`, so setting any
+    number of children takes a fixed number of queries. When updating a parent FSU, the children
+    are updated as follows:
+    - children not set or null, storage location not set -> no changes
+    - children is an empty list, or storage location set -> clear all the current children
+    - children set and neither device nor instance.device is set -> ValidationError
+    - children set and any child's device is not the device or instance.device -> ValidationError
+    - children set -> assign the listed children to the instance, and clear any current children
+        that are not in the list
+    """
+
+    child_relation: ChildRelation
+
+    class Meta(FSUModelSerializer.Meta):
+        """ParentFSUModelSerializer model options."""
+
+        abstract = True
+
+    def validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Leave the children out of the model validation, they are validated as a set."""
+        field_name = self.child_relation.field_name
+        children = data.pop(field_name, None)
+        super().validate(data)
+        if children is not None:
+            data[field_name] = children
+        return data
+
+    def create(self, validated_data: dict[str, Any]) -> FSUModel:
+        """Create a new parent FSU instance and assign its children."""
+        relation = self.child_relation
+        children = validated_data.pop(relation.field_name, None) or []
+
+        try:
+            with transaction.atomic():
+                if children:
+                    relation.validate(
+                        children, validated_data.get("device", None), validated_data["fsu_type"]
+                    )
+                instance: FSUModel = self.Meta.model.objects.create(**validated_data)
+                if children:
+                    relation.assign(instance, children)
+                    refresh_slot_count(instance)
+
+        except DjangoValidationError as error:
+            raise serializers.ValidationError({relation.field_name: error.messages[0]}) from error
+
+        return instance
+
+    def update(self, instance: FSUModel, validated_data: dict[str, Any]) -> FSUModel:
+        """Update an existing parent FSU instance and reassign its children."""
+        relation = self.child_relation
+        # An empty list of children clears the current children, so keep None for "not set".
+        children = validated_data.pop(relation.field_name, None)
+
+        location = validated_data.get("location", None)
+        parent_device = None if location else validated_data.get("device", instance.device)
+
+        try:
+            with transaction.atomic():
+                # Moving a parent FSU to a storage location clears its children.
+                if (children is not None and len(children) == 0) or location is not None:
+                    relation.assign(instance, [])
+
+                elif children:
+                    relation.validate(
+                        children,
+                        parent_device,
+                        validated_data.get("fsu_type", instance.fsu_type),
+                        parent=instance,
+                    )
+                    relation.assign(instance, children)
+
+                validated_instance: FSUModel = super().update(instance, validated_data)
+                refresh_slot_count(validated_instance)
+
+        except DjangoValidationError as error:
+            raise serializers.ValidationError({relation.field_name: error.messages[0]}) from error
+
+        return validated_instance
+
+
 class FSUTemplateModelSerializer(NautobotModelSerializer):
     """Base class for FSU template serializers."""
 
@@ -117,3 +318,10 @@ class FSUTypeModelSerializer(NautobotModelSerializer, TaggedModelSerializerMixin
 
         abstract = True
         fields = "__all__"
+
+    def get_field_names(self, declared_fields, info):
+        """Include "instance_count" on root serializers only, as nested objects are not annotated."""
+        fields = list(super().get_field_names(declared_fields, info))
+        if self.is_nested and "instance_count" in fields:
+            fields.remove("instance_count")
+        return fields
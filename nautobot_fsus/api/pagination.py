@@ -0,0 +1,178 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Pagination for the FSU API endpoints."""
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+import json
+from typing import Any
+
+from django.db.models import F, Model, OrderBy, Q, QuerySet
+from nautobot.core.api.pagination import OptionalLimitOffsetPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class FSUKeysetPagination(OptionalLimitOffsetPagination):
+    """
+    Limit/offset pagination, with an opt-in keyset (cursor) mode for walking large tables.
+
+    Passing the `cursor` query parameter, empty for the first page, switches to keyset mode.
+    Rows are ordered by the model's default ordering columns plus the primary key, and each page
+    starts from the position of the last row of the previous page rather than an offset, so
+    every page is an index range scan costing the same however deep into the table it is. In
+    keyset mode the response has no `count` or `previous` link, and `next` is `null` on the
+    last page.
+    """
+
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset: QuerySet, request: Request, view: Any = None) -> Any:
+        """Paginate a queryset by offset, or by keyset if a cursor was given."""
+        self.keyset_fields: list[str] = []
+        if self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset(queryset, request, view=view)
+
+        if "text/csv" in request.accepted_media_type:
+            return None
+
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.keyset_fields = self.get_keyset_fields(queryset.model)
+        nullable = {
+            field_name
+            for field_name in self.keyset_fields
+            if queryset.model._meta.get_field(field_name).null
+        }
+        queryset = queryset.order_by(
+            *(
+                OrderBy(F(field_name), nulls_last=True) if field_name in nullable else field_name
+                for field_name in self.keyset_fields
+            )
+        )
+
+        # One extra row is read to find out if there is a next page.
+        wanted = self.limit + 1 if self.limit else None
+        results: list[Model] = []
+        for keyset_filter in self._keyset_filters(self.decode_cursor(request), nullable):
+            rows = queryset.filter(keyset_filter)
+            results.extend(rows if wanted is None else rows[: wanted - len(results)])
+            if wanted is not None and len(results) >= wanted:
+                break
+
+        page = results[: self.limit] if self.limit else results
+        self.next_position = page[-1] if len(page) < len(results) else None
+        return page
+
+    def get_schema_operation_parameters(self, view: Any) -> list[dict[str, Any]]:
+        """Add the cursor query parameter to the OpenAPI schema."""
+        parameters: list[dict[str, Any]] = super().get_schema_operation_parameters(view)
+        parameters.append(
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Keyset pagination cursor, empty for the first page.",
+                "schema": {"type": "string"},
+            }
+        )
+        return parameters
+
+    def get_paginated_response(self, data: Any) -> Response:
+        """Return the page of results, without a count in keyset mode."""
+        if not self.keyset_fields:
+            return super().get_paginated_response(data)
+
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_next_link(self) -> str | None:
+        """Link to the next page, starting after the last row of the current page."""
+        if not self.keyset_fields:
+            return super().get_next_link()
+        if self.next_position is None:
+            return None
+
+        url = remove_query_param(self.request.build_absolute_uri(), self.offset_query_param)
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(self.next_position)
+        )
+
+    @staticmethod
+    def get_keyset_fields(model: type[Model]) -> list[str]:
+        """Get the columns a model is paginated on: its default ordering, plus the primary key."""
+        fields = [
+            model._meta.get_field(field_name.lstrip("-")).attname
+            for field_name in model._meta.ordering
+        ]
+        if model._meta.pk.attname not in fields:
+            fields.append(model._meta.pk.attname)
+        return fields
+
+    def encode_cursor(self, row: Model) -> str:
+        """Encode the position of a row as a cursor."""
+        values = [getattr(row, field_name) for field_name in self.keyset_fields]
+        return urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
+
+    def decode_cursor(self, request: Request) -> list[Any] | None:
+        """Decode the position of the last row of the previous page, if any."""
+        cursor = request.query_params[self.cursor_query_param]
+        if not cursor:
+            return None
+
+        try:
+            values = json.loads(urlsafe_b64decode(cursor.encode()))
+        except (BinasciiError, UnicodeDecodeError, ValueError) as error:
+            raise NotFound(self.invalid_cursor_message) from error
+        if not isinstance(values, list) or len(values) != len(self.keyset_fields):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def _keyset_filters(self, position: list[Any] | None, nullable: set[str]) -> list[Q]:
+        """
+        Build the filters selecting the rows after a position, in order.
+
+        Rows sorting after (a, b, c) are those with a greater `c` and the same `a` and `b`, then
+        those with a greater `b` and the same `a`, and so on. Each filter is an equality match on
+        a prefix of the keyset columns and a range on the next one, which the database can serve
+        from the keyset index; NULLs sort last, so they follow the non-NULL range of a column.
+        """
+        if position is None:
+            return [Q()]
+
+        filters = []
+        for index in range(len(self.keyset_fields) - 1, -1, -1):
+            field_name, value = self.keyset_fields[index], position[index]
+            if value is None:
+                continue
+
+            prefix = Q(
+                *(
+                    Q(**{f"{name}__isnull": True})
+                    if prefix_value is None
+                    else Q(**{name: prefix_value})
+                    for name, prefix_value in zip(
+                        self.keyset_fields[:index], position[:index], strict=True
+                    )
+                )
+            )
+            filters.append(prefix & Q(**{f"{field_name}__gt": value}))
+            if field_name in nullable:
+                filters.append(prefix & Q(**{f"{field_name}__isnull": True}))
+
+        return filters
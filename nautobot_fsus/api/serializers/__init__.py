@@ -15,6 +15,13 @@
 
 """API serializers for Nautobot FSUs app models."""
 
+from nautobot_fsus.api.serializers.all_fsus import AllFSUSerializer
+from nautobot_fsus.api.serializers.bom import BOMPartSerializer, DeviceTypeBOMSerializer
+from nautobot_fsus.api.serializers.compliance import FirmwareComplianceSerializer
+from nautobot_fsus.api.serializers.fsu_imports import (
+    FSUImportSerializer,
+    FSUImportSubmitSerializer,
+)
 from nautobot_fsus.api.serializers.fsu_templates import (
     CPUTemplateSerializer,
     DiskTemplateSerializer,
@@ -54,17 +61,30 @@ from nautobot_fsus.api.serializers.fsus import (
     PSUSerializer,
     RAMModuleSerializer,
 )
+from nautobot_fsus.api.serializers.inventory import DeviceInventorySerializer
+from nautobot_fsus.api.serializers.serial_index import FSUSerialLookupSerializer
+from nautobot_fsus.api.serializers.spares import SpareCountSerializer
+from nautobot_fsus.api.serializers.upsert import FSUUpsertResultSerializer
 
 __all__ = (
+    "AllFSUSerializer",
+    "BOMPartSerializer",
     "CPUSerializer",
     "CPUTemplateSerializer",
     "CPUTypeSerializer",
+    "DeviceInventorySerializer",
+    "DeviceTypeBOMSerializer",
     "DiskSerializer",
     "DiskTemplateSerializer",
     "DiskTypeSerializer",
     "FanSerializer",
     "FanTemplateSerializer",
     "FanTypeSerializer",
+    "FirmwareComplianceSerializer",
+    "FSUImportSerializer",
+    "FSUImportSubmitSerializer",
+    "FSUSerialLookupSerializer",
+    "FSUUpsertResultSerializer",
     "GPUBaseboardSerializer",
     "GPUBaseboardTemplateSerializer",
     "GPUBaseboardTypeSerializer",
@@ -89,4 +109,5 @@ __all__ = (
     "RAMModuleSerializer",
     "RAMModuleTemplateSerializer",
     "RAMModuleTypeSerializer",
+    "SpareCountSerializer",
 )
@@ -0,0 +1,74 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Serializer for the list of FSUs of every type."""
+
+from typing import Any
+
+from nautobot.core.utils.lookup import get_route_for_model
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+
+from nautobot_fsus.models import FSU_MODELS
+
+_FSU_MODELS_BY_NAME = {model._meta.model_name: model for model in FSU_MODELS}
+
+
+class AllFSUSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Read-only serializer for an FSU row of the `AllFSUs` query."""
+
+    id = serializers.UUIDField(read_only=True)
+    fsu_model = serializers.CharField(read_only=True)
+    url = serializers.SerializerMethodField()
+    name = serializers.CharField(read_only=True)
+    fsu_type = serializers.SerializerMethodField()
+    serial_number = serializers.CharField(read_only=True)
+    firmware_version = serializers.CharField(read_only=True)
+    driver_name = serializers.CharField(read_only=True)
+    driver_version = serializers.CharField(read_only=True)
+    asset_tag = serializers.CharField(read_only=True, allow_null=True)
+    status = serializers.CharField(source="status__name", read_only=True)
+    description = serializers.CharField(read_only=True)
+    device = serializers.SerializerMethodField()
+    location = serializers.SerializerMethodField()
+    created = serializers.DateTimeField(read_only=True)
+    last_updated = serializers.DateTimeField(read_only=True)
+
+    def get_url(self, row: dict[str, Any]) -> str:
+        """API URL of the FSU."""
+        route = get_route_for_model(_FSU_MODELS_BY_NAME[row["fsu_model"]], "detail", api=True)
+        return str(reverse(route, kwargs={"pk": row["id"]}, request=self.context.get("request")))
+
+    def get_fsu_type(self, row: dict[str, Any]) -> dict[str, Any]:
+        """ID, name, and manufacturer of the FSU's type."""
+        return {
+            "id": row["fsu_type_id"],
+            "manufacturer": row["fsu_type__manufacturer__name"],
+            "name": row["fsu_type__name"],
+        }
+
+    def get_device(self, row: dict[str, Any]) -> dict[str, Any] | None:
+        """Device the FSU is installed in."""
+        return (
+            None
+            if row["device_id"] is None
+            else {"id": row["device_id"], "name": row["device__name"]}
+        )
+
+    def get_location(self, row: dict[str, Any]) -> dict[str, Any] | None:
+        """Location the FSU is stored in."""
+        if row["location_id"] is None:
+            return None
+        return {"id": row["location_id"], "name": row["location__name"]}
@@ -0,0 +1,74 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Serializer for the DeviceType FSU bill of materials API endpoint."""
+
+from typing import Any
+
+from rest_framework import serializers
+
+from nautobot_fsus.utilities.bom import EXTRA_BOM_FIELDS, BillOfMaterials
+from nautobot_fsus.utilities.instantiation import fsu_model_for_template
+
+
+class BOMPartSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Read-only serializer for the quantity of a part in a bill of materials."""
+
+    fsu_model = serializers.CharField(read_only=True)
+    fsu_type_id = serializers.UUIDField(read_only=True)
+    manufacturer = serializers.CharField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    part_number = serializers.CharField(read_only=True)
+    quantity = serializers.IntegerField(read_only=True)
+
+
+class DeviceTypeBOMSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Read-only serializer for the FSU bill of materials of a DeviceType."""
+
+    id = serializers.UUIDField(source="device_type.pk", read_only=True)
+    manufacturer = serializers.CharField(source="device_type.manufacturer.name", read_only=True)
+    model = serializers.CharField(source="device_type.model", read_only=True)
+    templates = serializers.SerializerMethodField()
+    parts = BOMPartSerializer(many=True, read_only=True)
+
+    def get_templates(self, bom: BillOfMaterials) -> list[dict[str, Any]]:
+        """The FSU templates of the DeviceType, with their FSU type."""
+        templates: list[dict[str, Any]] = []
+        for template_model, model_templates in bom.templates.items():
+            fsu_model_name = fsu_model_for_template(template_model)._meta.model_name
+            extra_fields = [
+                model_field.name
+                for model_field in template_model._meta.concrete_fields
+                if model_field.name in EXTRA_BOM_FIELDS
+            ]
+            for template in model_templates:
+                entry = {
+                    "id": template.pk,
+                    "fsu_model": fsu_model_name,
+                    "name": template.name,
+                    "description": template.description,
+                    "fsu_type": {
+                        "id": template.fsu_type_id,
+                        "manufacturer": template.fsu_type.manufacturer.name,
+                        "name": template.fsu_type.name,
+                        "part_number": template.fsu_type.part_number,
+                    },
+                }
+                entry.update(
+                    {field_name: getattr(template, field_name) for field_name in extra_fields}
+                )
+                templates.append(entry)
+
+        return templates
@@ -0,0 +1,74 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Serializer for the firmware compliance report API endpoint."""
+
+from typing import Any
+
+from rest_framework import serializers
+
+from nautobot_fsus.utilities.compliance import FirmwareCompliance
+
+
+def _versions(target: str, on_target: int | None, compliance: float | None, versions: dict) -> dict:
+    """Target version, compliance, and the number of FSUs on each version, most common first."""
+    return {
+        "target": target,
+        "on_target": on_target,
+        "compliance": compliance,
+        "versions": dict(sorted(versions.items(), key=lambda item: (-item[1], item[0]))),
+    }
+
+
+class FirmwareComplianceSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Read-only serializer for the firmware compliance of an FSU type at a Location."""
+
+    fsu_model = serializers.CharField(source="fsu_model._meta.model_name", read_only=True)
+    fsu_type = serializers.SerializerMethodField()
+    location = serializers.SerializerMethodField()
+    total = serializers.IntegerField(read_only=True)
+    firmware = serializers.SerializerMethodField()
+    driver = serializers.SerializerMethodField()
+
+    def get_fsu_type(self, report: FirmwareCompliance) -> dict[str, Any]:
+        """ID, manufacturer, name, and part number of the FSU type."""
+        return {
+            "id": report.fsu_type.pk,
+            "manufacturer": report.fsu_type.manufacturer.name,
+            "name": report.fsu_type.name,
+            "part_number": report.fsu_type.part_number,
+        }
+
+    def get_location(self, report: FirmwareCompliance) -> dict[str, Any]:
+        """Location the FSUs are installed or stored at."""
+        return {"id": report.location.pk, "name": report.location.name}
+
+    def get_firmware(self, report: FirmwareCompliance) -> dict[str, Any]:
+        """Firmware versions of the FSUs, and how many are on the target version."""
+        return _versions(
+            report.fsu_type.target_firmware_version,
+            report.firmware_on_target,
+            report.firmware_compliance,
+            report.firmware_versions,
+        )
+
+    def get_driver(self, report: FirmwareCompliance) -> dict[str, Any]:
+        """Driver versions of the FSUs, and how many are on the target version."""
+        return _versions(
+            report.fsu_type.target_driver_version,
+            report.driver_on_target,
+            report.driver_compliance,
+            report.driver_versions,
+        )
@@ -0,0 +1,59 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Serializers for the background FSU import API endpoint."""
+
+from nautobot.apps.api import BaseModelSerializer
+from rest_framework import serializers
+
+from nautobot_fsus.models import FSU_MODELS, FSUImport
+
+
+class FSUImportSerializer(BaseModelSerializer):
+    """Read-only serializer for the progress of a background FSU import."""
+
+    fsu_model = serializers.CharField(source="fsu_content_type.model", read_only=True)
+
+    class Meta:
+        """FSUImportSerializer model options."""
+
+        model = FSUImport
+        fields = [
+            "id",
+            "url",
+            "display",
+            "fsu_model",
+            "job_result",
+            "file_name",
+            "checksum",
+            "batch_size",
+            "total_rows",
+            "processed_rows",
+            "created_count",
+            "errors",
+            "completed",
+            "started",
+            "last_updated",
+        ]
+        read_only_fields = fields
+
+
+class FSUImportSubmitSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Input serializer for submitting a file to the Bulk Import FSUs Job."""
+
+    fsu_model = serializers.ChoiceField(choices=[model._meta.model_name for model in FSU_MODELS])
+    import_file = serializers.FileField()
+    batch_size = serializers.IntegerField(min_value=1, default=1000)
+    resume = serializers.BooleanField(default=True)
@@ -0,0 +1,39 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Serializer for the Device FSU inventory API endpoint."""
+
+from typing import Any
+
+from nautobot.dcim.models import Device
+from rest_framework import serializers
+
+
+class DeviceInventorySerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """
+    Read-only serializer for the FSU inventory of a Device.
+
+    The FSUs are not looked up by the serializer, they are read for every Device on the page at
+    once by the view and passed in the `inventories` context, keyed by Device ID.
+    """
+
+    id = serializers.UUIDField(read_only=True)
+    name = serializers.CharField(read_only=True)
+
+    def to_representation(self, instance: Device) -> dict[str, Any]:
+        """Add the FSU inventory of the Device to its ID and name."""
+        data: dict[str, Any] = super().to_representation(instance)
+        data.update(self.context["inventories"][instance.pk])
+        return data
@@ -0,0 +1,56 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Serializer for the FSU serial number lookup API endpoint."""
+
+from typing import Any
+
+from django.db.models import Model
+from nautobot.core.utils.lookup import get_route_for_model
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+
+from nautobot_fsus.models import FSUSerialIndex
+
+
+class FSUSerialLookupSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Read-only serializer for an FSU found in the serial number index."""
+
+    id = serializers.UUIDField(source="fsu_id", read_only=True)
+    fsu_model = serializers.CharField(source="fsu_content_type.model", read_only=True)
+    url = serializers.SerializerMethodField()
+    name = serializers.CharField(read_only=True)
+    serial_number = serializers.CharField(read_only=True)
+    asset_tag = serializers.CharField(read_only=True)
+    device = serializers.SerializerMethodField()
+    location = serializers.SerializerMethodField()
+
+    def get_url(self, entry: FSUSerialIndex) -> str:
+        """API URL of the FSU."""
+        route = get_route_for_model(entry.fsu_content_type.model_class(), "detail", api=True)
+        return str(reverse(route, kwargs={"pk": entry.fsu_id}, request=self.context.get("request")))
+
+    @staticmethod
+    def _parent(parent: Model | None) -> dict[str, Any] | None:
+        """ID and name of the FSU's parent Device or storage Location."""
+        return None if parent is None else {"id": parent.pk, "name": parent.name}
+
+    def get_device(self, entry: FSUSerialIndex) -> dict[str, Any] | None:
+        """Device the FSU is installed in."""
+        return self._parent(entry.device)
+
+    def get_location(self, entry: FSUSerialIndex) -> dict[str, Any] | None:
+        """Location the FSU is stored in."""
+        return self._parent(entry.location)
@@ -0,0 +1,45 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Serializer for the spare FSUs API endpoint."""
+
+from typing import Any
+
+from rest_framework import serializers
+
+from nautobot_fsus.models import FSUSpareCount
+
+
+class SpareCountSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    """Read-only serializer for the spares of an FSU type and Status at or below a Location."""
+
+    location = serializers.SerializerMethodField()
+    fsu_model = serializers.CharField(source="fsu_model._meta.model_name", read_only=True)
+    fsu_type = serializers.SerializerMethodField()
+    status = serializers.CharField(source="status.name", read_only=True)
+    count = serializers.IntegerField(read_only=True)
+
+    def get_location(self, spare_count: FSUSpareCount) -> dict[str, Any]:
+        """Location the spares are stored at or below."""
+        return {"id": spare_count.location.pk, "name": spare_count.location.name}
+
+    def get_fsu_type(self, spare_count: FSUSpareCount) -> dict[str, Any]:
+        """ID, manufacturer, name, and part number of the FSU type."""
+        return {
+            "id": spare_count.fsu_type.pk,
+            "manufacturer": spare_count.fsu_type.manufacturer.name,
+            "name": spare_count.fsu_type.name,
+            "part_number": spare_count.fsu_type.part_number,
+        }
@@ -21,15 +21,22 @@ from nautobot_fsus.api import views
 
 router = OrderedDefaultRouter()
 
+router.register("all-fsus", views.AllFSUsAPIView, basename="all-fsus")
 router.register("cpus", views.CPUAPIView)
 router.register("cpu-templates", views.CPUTemplateAPIView)
 router.register("cpu-types", views.CPUTypeAPIView)
+router.register("devices", views.DeviceInventoryAPIView, basename="device")
+router.register("device-types", views.DeviceTypeBOMAPIView, basename="devicetype")
 router.register("disks", views.DiskAPIView)
 router.register("disk-templates", views.DiskTemplateAPIView)
 router.register("disk-types", views.DiskTypeAPIView)
+router.register("bulk-imports", views.FSUImportAPIView)
 router.register("fans", views.FanAPIView)
 router.register("fan-templates", views.FanTemplateAPIView)
 router.register("fan-types", views.FanTypeAPIView)
+router.register(
+    "firmware-compliance", views.FirmwareComplianceAPIView, basename="firmware-compliance"
+)
 router.register("gpubaseboards", views.GPUBaseboardAPIView)
 router.register("gpubaseboard-templates", views.GPUBaseboardTemplateAPIView)
 router.register("gpubaseboard-types", views.GPUBaseboardTypeAPIView)
@@ -54,6 +61,8 @@ router.register("psu-types", views.PSUTypeAPIView)
 router.register("rammodules", views.RAMModuleAPIView)
 router.register("rammodule-templates", views.RAMModuleTemplateAPIView)
 router.register("rammodule-types", views.RAMModuleTypeAPIView)
+router.register("serial-numbers", views.FSUSerialLookupAPIView, basename="serial-number")
+router.register("spares", views.SparesAPIView, basename="spares")
 
 app_name = "nautobot_fsus-api"
 urlpatterns = router.urls
@@ -15,21 +15,227 @@
 
 """API endpoint views for the Nautobot FSUs app."""
 
-from nautobot.apps.api import NautobotModelViewSet
+from collections import defaultdict
+from typing import Any
+
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+from drf_spectacular.plumbing import build_array_type, build_basic_type
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from nautobot.apps.api import NautobotModelViewSet, ReadOnlyModelViewSet
+from nautobot.apps.models import count_related
+from nautobot.core.api.filter_backends import NautobotOrderingFilter
+from nautobot.core.api.views import NautobotAPIVersionMixin
+from nautobot.core.exceptions import CeleryWorkerNotRunningException
+from nautobot.dcim.filters import DeviceFilterSet
+from nautobot.dcim.models import Device, DeviceType
+from nautobot.extras.api.serializers import (
+    JobResultSerializer,
+    JobRunResponseSerializer,
+    ScheduledJobSerializer,
+)
+from nautobot.extras.choices import JobExecutionType, JobQueueTypeChoices
+from nautobot.extras.models import Job as JobModel
+from nautobot.extras.models import JobResult, ScheduledJob
+from nautobot.extras.utils import get_worker_count
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import MethodNotAllowed, PermissionDenied, ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.viewsets import GenericViewSet
 
 from nautobot_fsus import filters, models
 from nautobot_fsus.api import serializers
-
-
-class CPUAPIView(NautobotModelViewSet):
+from nautobot_fsus.api.filter_backends import FSUFilterBackend
+from nautobot_fsus.api.pagination import FSUKeysetPagination
+from nautobot_fsus.jobs import BulkImportFSUs
+from nautobot_fsus.models.mixins import FSUModel
+from nautobot_fsus.utilities.all_fsus import ALL_FSU_ORDERING, get_all_fsus
+from nautobot_fsus.utilities.bom import get_bill_of_materials
+from nautobot_fsus.utilities.compliance import (
+    compliance_groups,
+    get_firmware_compliance,
+    get_version_counts,
+)
+from nautobot_fsus.utilities.export import EXPORT_FORMATS, streaming_export_response
+from nautobot_fsus.utilities.inventory import get_device_inventories
+from nautobot_fsus.utilities.spares import get_spare_counts, with_fsu_types
+from nautobot_fsus.utilities.upsert import record_row, upsert_fsus
+
+# Relations rendered by every FSU serializer, including the nested representations of `?depth=1`.
+FSU_SELECT_RELATED = ("device__parent_bay", "location", "fsu_type__manufacturer", "status")
+FSU_PREFETCH_RELATED = ("tags",)
+
+
+FSU_MODELS_BY_NAME = {model._meta.model_name: model for model in models.FSU_MODELS}
+
+# Upsert requests are lists of FSU records, with the fields of the FSU model's CSV import.
+UPSERT_REQUEST = {"application/json": build_array_type(build_basic_type(OpenApiTypes.OBJECT))}
+
+
+def upsert_rows(data: Any) -> list[dict[str, str]]:
+    """Read the records of an upsert request into import rows."""
+    if not isinstance(data, list) or not all(isinstance(record, dict) for record in data):
+        raise ValidationError("Expected a list of FSU records.")
+    return [record_row(record) for record in data]
+
+
+def upsert_response(
+    request: Request, records: list[tuple[type[FSUModel], dict[str, str]]]
+) -> Response:
+    """Upsert the FSU records of a request, returning the counts of changes or the errors."""
+    permissions = [
+        f"{model._meta.app_label}.{perm_action}_{model._meta.model_name}"
+        for model in {model for model, _ in records}
+        for perm_action in ("add", "change")
+    ]
+    if not request.user.has_perms(permissions):
+        raise PermissionDenied(
+            "This user does not have permission to create and change these FSUs."
+        )
+
+    result = upsert_fsus(records, user=request.user)
+    if result.errors:
+        return Response(
+            {"errors": [{"row": row, "message": message} for row, message in result.errors]},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return Response(serializers.FSUUpsertResultSerializer(result).data)
+
+
+class KeysetPaginationMixin:
+    """Add the opt-in keyset pagination mode to an API view set."""
+
+    pagination_class = FSUKeysetPagination
+    filter_backends = (FSUFilterBackend, NautobotOrderingFilter)
+
+
+class FSUModelViewSet(KeysetPaginationMixin, NautobotModelViewSet):
+    """
+    Base API view set for FSU models.
+
+    NautobotModelViewSet prefetches the relations in the natural key of the listed FSUs, but not
+    those of the objects nested in them with `?depth=1`, whose `natural_slug` would otherwise be
+    looked up one object at a time. Prefetching also shares one instance of each related object
+    between the FSUs, so each Location's ancestry is only looked up once.
+    """
+
+    nested_natural_key_fields: tuple[str, ...] = ("location",)
+
+    def get_queryset(self) -> QuerySet:
+        """Prefetch the natural key relations of nested objects."""
+        queryset: QuerySet = super().get_queryset()
+        prefetch_fields = set()
+        for field_name in self.nested_natural_key_fields:
+            related_model = queryset.model._meta.get_field(field_name).related_model
+            for lookup in related_model.natural_key_field_lookups:
+                if "__" in lookup:
+                    prefetch_fields.add(f"{field_name}__{lookup.rsplit('__', 1)[0]}")
+
+        return queryset.prefetch_related(*sorted(prefetch_fields))
+
+    @extend_schema(responses={(200, media_type): str for media_type in EXPORT_FORMATS.values()})
+    @action(detail=False, url_path=f"export/(?P<export_format>{'|'.join(EXPORT_FORMATS)})")
+    def export(self, request: Request, export_format: str) -> StreamingHttpResponse:
+        """Stream the filtered list of FSUs as CSV or NDJSON."""
+        return streaming_export_response(self.filter_queryset(self.get_queryset()), export_format)
+
+    @extend_schema(request=UPSERT_REQUEST, responses={200: serializers.FSUUpsertResultSerializer})
+    @action(detail=False, methods=["post"], url_path="upsert")
+    def upsert(self, request: Request) -> Response:
+        """
+        Create or update FSUs from a list of inventory records.
+
+        Each record matches an existing FSU by its serial number, or else by its device and
+        name; matched FSUs are updated with the fields given, and other records create FSUs.
+        """
+        model = self.queryset.model
+        return upsert_response(request, [(model, row) for row in upsert_rows(request.data)])
+
+
+class FSUTemplateModelViewSet(KeysetPaginationMixin, NautobotModelViewSet):
+    """Base API view set for FSU template models."""
+
+
+class FSUTypeModelViewSet(KeysetPaginationMixin, NautobotModelViewSet):
+    """Base API view set for FSU type models."""
+
+
+class AllFSUsAPIView(NautobotAPIVersionMixin, GenericViewSet):
+    """
+    API view set for the FSUs of every type.
+
+    The FSUs are read with a single `UNION ALL` query across the FSU tables, so filtering,
+    ordering, and pagination happen in the database. Any filter of the FSU models can be used,
+    e.g. `?location=<name>&status=Active`, and `?fsu_model=gpu` limits the results to GPUs.
+    Only FSUs the user has permission to view are returned.
+    """
+
+    serializer_class = serializers.AllFSUSerializer
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("fsu_model", str, many=True),
+            OpenApiParameter("sort", str, enum=sorted(ALL_FSU_ORDERING), many=True),
+        ],
+        responses=serializers.AllFSUSerializer(many=True),
+    )
+    def list(self, request: Request) -> Response:
+        """List the FSUs of every type."""
+        all_fsus, errors = get_all_fsus(request.query_params, request.user)
+        if errors:
+            raise ValidationError(errors)
+
+        page = self.paginate_queryset(all_fsus)
+        if page is None:
+            return Response(self.get_serializer(all_fsus, many=True).data)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+    @extend_schema(request=UPSERT_REQUEST, responses={200: serializers.FSUUpsertResultSerializer})
+    @action(detail=False, methods=["post"], url_path="upsert")
+    def upsert(self, request: Request) -> Response:
+        """
+        Create or update FSUs of any type from a list of inventory records.
+
+        Each record gives the type of its FSU in `fsu_model`, e.g. "gpu". The records of all the
+        types are saved in a single transaction, and nothing is saved if any record is invalid.
+        """
+        records = []
+        errors = []
+        for row_number, row in enumerate(upsert_rows(request.data), start=1):
+            model_name = row.pop("fsu_model", "")
+            if model_name in FSU_MODELS_BY_NAME:
+                records.append((FSU_MODELS_BY_NAME[model_name], row))
+            else:
+                errors.append(
+                    {
+                        "row": row_number,
+                        "message": f"fsu_model: {model_name!r} is not an FSU model.",
+                    }
+                )
+
+        if errors:
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+        return upsert_response(request, records)
+
+
+class CPUAPIView(FSUModelViewSet):
     """API view set for CPUs."""
 
-    queryset = models.CPU.objects.all()
+    queryset = models.CPU.objects.select_related(
+        *FSU_SELECT_RELATED, "parent_mainboard"
+    ).prefetch_related(*FSU_PREFETCH_RELATED)
     serializer_class = serializers.CPUSerializer
     filterset_class = filters.CPUFilterSet
+    nested_natural_key_fields = ("location", "parent_mainboard")
 
 
-class CPUTemplateAPIView(NautobotModelViewSet):
+class CPUTemplateAPIView(FSUTemplateModelViewSet):
     """API view set for CPUTemplates."""
 
     queryset = models.CPUTemplate.objects.select_related("device_type__manufacturer")
@@ -37,23 +243,97 @@ class CPUTemplateAPIView(NautobotModelViewSet):
     filterset_class = filters.CPUTemplateFilterSet
 
 
-class CPUTypeAPIView(NautobotModelViewSet):
+class CPUTypeAPIView(FSUTypeModelViewSet):
     """API view set for CPUTypes."""
 
-    queryset = models.CPUType.objects.all()
+    queryset = models.CPUType.objects.annotate(instance_count=count_related(models.CPU, "fsu_type"))
     serializer_class = serializers.CPUTypeSerializer
     filterset_class = filters.CPUTypeFilterSet
 
 
-class DiskAPIView(NautobotModelViewSet):
+class DeviceInventoryAPIView(NautobotAPIVersionMixin, GenericViewSet):
+    """
+    API view set for the FSU inventory of Devices.
+
+    Returns every FSU of every type installed in a Device, with child FSUs nested under their
+    parent FSU, using a fixed number of queries for a whole page of Devices. The Device list can
+    be filtered with any of the Device filters, e.g. `?id=<uuid>&id=<uuid>`.
+    """
+
+    queryset = Device.objects.only("id", "name")
+    serializer_class = serializers.DeviceInventorySerializer
+    filterset_class = DeviceFilterSet
+
+    def get_queryset(self) -> QuerySet:
+        """Restrict the Devices to those the user can view."""
+        queryset: QuerySet = super().get_queryset()
+        return queryset.restrict(self.request.user, "view")
+
+    def _inventory_response(self, devices: list[Device], many: bool) -> Response:
+        """Serialize the FSU inventory of a set of Devices."""
+        serializer = self.get_serializer(
+            devices if many else devices[0],
+            many=many,
+            context={
+                **self.get_serializer_context(),
+                "inventories": get_device_inventories(devices, user=self.request.user),
+            },
+        )
+        return Response(serializer.data)
+
+    @action(detail=True, url_path="inventory", url_name="inventory")
+    def inventory(self, request: Request, pk: str | None = None) -> Response:
+        """Get the FSU inventory of a single Device."""
+        return self._inventory_response([self.get_object()], many=False)
+
+    @extend_schema(operation_id="plugins_fsus_devices_inventory_list")
+    @action(detail=False, url_path="inventory", url_name="inventory-list")
+    def inventory_list(self, request: Request) -> Response:
+        """Get the FSU inventories of a filtered, paginated list of Devices."""
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is None:
+            return self._inventory_response(list(queryset), many=True)
+
+        response = self._inventory_response(page, many=True)
+        return self.get_paginated_response(response.data)
+
+
+class DeviceTypeBOMAPIView(NautobotAPIVersionMixin, GenericViewSet):
+    """
+    API view set for the FSU bill of materials of DeviceTypes.
+
+    Returns the FSU templates of a DeviceType, and the quantity of each FSU type they add up to,
+    read with a single query across the FSU template tables.
+    """
+
+    queryset = DeviceType.objects.select_related("manufacturer")
+    serializer_class = serializers.DeviceTypeBOMSerializer
+
+    def get_queryset(self) -> QuerySet:
+        """Restrict the DeviceTypes to those the user can view."""
+        queryset: QuerySet = super().get_queryset()
+        return queryset.restrict(self.request.user, "view")
+
+    @action(detail=True, url_path="fsu-bom", url_name="fsu-bom")
+    def fsu_bom(self, request: Request, pk: str | None = None) -> Response:
+        """Get the FSU bill of materials of a DeviceType."""
+        bom = get_bill_of_materials(self.get_object(), user=request.user)
+        return Response(self.get_serializer(bom).data)
+
+
+class DiskAPIView(FSUModelViewSet):
     """API view set for Disks."""
 
-    queryset = models.Disk.objects.all()
+    queryset = models.Disk.objects.select_related(
+        *FSU_SELECT_RELATED, "parent_hba"
+    ).prefetch_related(*FSU_PREFETCH_RELATED)
     serializer_class = serializers.DiskSerializer
     filterset_class = filters.DiskFilterSet
+    nested_natural_key_fields = ("location", "parent_hba")
 
 
-class DiskTemplateAPIView(NautobotModelViewSet):
+class DiskTemplateAPIView(FSUTemplateModelViewSet):
     """API view set for DiskTemplates."""
 
     queryset = models.DiskTemplate.objects.select_related("device_type__manufacturer")
@@ -61,23 +341,27 @@ class DiskTemplateAPIView(NautobotModelViewSet):
     filterset_class = filters.DiskTemplateFilterSet
 
 
-class DiskTypeAPIView(NautobotModelViewSet):
+class DiskTypeAPIView(FSUTypeModelViewSet):
     """API view set for DiskTypes."""
 
-    queryset = models.DiskType.objects.all()
+    queryset = models.DiskType.objects.annotate(
+        instance_count=count_related(models.Disk, "fsu_type")
+    )
     serializer_class = serializers.DiskTypeSerializer
     filterset_class = filters.DiskTypeFilterSet
 
 
-class FanAPIView(NautobotModelViewSet):
+class FanAPIView(FSUModelViewSet):
     """API view set for Fans."""
 
-    queryset = models.Fan.objects.all()
+    queryset = models.Fan.objects.select_related(*FSU_SELECT_RELATED).prefetch_related(
+        *FSU_PREFETCH_RELATED
+    )
     serializer_class = serializers.FanSerializer
     filterset_class = filters.FanFilterSet
 
 
-class FanTemplateAPIView(NautobotModelViewSet):
+class FanTemplateAPIView(FSUTemplateModelViewSet):
     """API view set for FanTemplates."""
 
     queryset = models.FanTemplate.objects.select_related("device_type__manufacturer")
@@ -85,31 +369,201 @@ class FanTemplateAPIView(NautobotModelViewSet):
     filterset_class = filters.FanTemplateFilterSet
 
 
-class FanTypeAPIView(NautobotModelViewSet):
+class FanTypeAPIView(FSUTypeModelViewSet):
     """API view set for FanTypes."""
 
-    queryset = models.FanType.objects.all()
+    queryset = models.FanType.objects.annotate(instance_count=count_related(models.Fan, "fsu_type"))
     serializer_class = serializers.FanTypeSerializer
     filterset_class = filters.FanTypeFilterSet
 
 
-class GPUAPIView(NautobotModelViewSet):
+class FirmwareComplianceAPIView(NautobotAPIVersionMixin, GenericViewSet):
+    """
+    API view set for the firmware compliance of FSUs, by FSU type and Location.
+
+    Each result counts the FSUs of one FSU type at one Location on each firmware and driver
+    version, and how many are on the target versions set on the FSU type. FSUs installed in a
+    Device are counted at the Device's Location. Results are read from counts that are kept up to
+    date as FSUs change, so the report does not scan the FSU tables. They can be filtered with
+    `?location=<name or ID>`, `?fsu_model=gpu`, and `?fsu_type_id=<uuid>`.
+    """
+
+    serializer_class = serializers.FirmwareComplianceSerializer
+    filterset_class = filters.FSUVersionCountFilterSet
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self) -> QuerySet:
+        """Limit the counts to the FSU models and Locations the user can view."""
+        return get_version_counts(self.request.user)
+
+    def list(self, request: Request) -> Response:
+        """List the firmware compliance of each FSU type at each Location."""
+        version_counts = self.filter_queryset(self.get_queryset())
+        groups = compliance_groups(version_counts)
+
+        page = self.paginate_queryset(groups)
+        if page is None:
+            reports = get_firmware_compliance(groups, version_counts)
+            return Response(self.get_serializer(reports, many=True).data)
+
+        reports = get_firmware_compliance(page, version_counts)
+        return self.get_paginated_response(self.get_serializer(reports, many=True).data)
+
+
+class FSUImportAPIView(ReadOnlyModelViewSet):
+    """
+    API view set for background FSU imports.
+
+    A POST submits a CSV or NDJSON file to the Bulk Import FSUs Job with the same checks as
+    Nautobot's Job run endpoint, and returns the Job result, or the scheduled Job if the Job
+    requires approval; the progress and errors of each import can then be followed from the
+    list of imports, filtered with `?job_result=<uuid>`.
+    """
+
+    queryset = models.FSUImport.objects.select_related("fsu_content_type")
+    parser_classes = [MultiPartParser]
+    serializer_class = serializers.FSUImportSerializer
+    filterset_class = filters.FSUImportFilterSet
+
+    def get_serializer_class(self) -> type:
+        """Use the input serializer for submitting a file."""
+        if self.action == "create":
+            return serializers.FSUImportSubmitSerializer
+        return super().get_serializer_class()
+
+    @extend_schema(
+        request={"multipart/form-data": serializers.FSUImportSubmitSerializer},
+        responses={201: JobRunResponseSerializer},
+    )
+    def create(self, request: Request) -> Response:
+        """Submit a file to the Bulk Import FSUs Job, as Nautobot's Job run endpoint would."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        fsu_model = serializer.validated_data["fsu_model"]
+        if not request.user.has_perms(["extras.run_job", f"nautobot_fsus.add_{fsu_model}"]):
+            raise PermissionDenied("This user does not have permission to import these FSUs.")
+
+        # The user needs permission to run this Job in particular, not only Jobs in general.
+        job_model = (
+            JobModel.objects.restrict(request.user, "run")
+            .filter(module_name=BulkImportFSUs.__module__, job_class_name=BulkImportFSUs.__name__)
+            .first()
+        )
+        if job_model is None:
+            raise PermissionDenied("This user does not have permission to run the import Job.")
+        if not job_model.enabled:
+            raise PermissionDenied("The Bulk Import FSUs Job is not enabled.")
+        if not job_model.installed or job_model.job_class is None:
+            raise MethodNotAllowed(
+                request.method, detail="The Bulk Import FSUs Job is not installed."
+            )
+
+        job_queue = job_model.default_job_queue
+        if job_queue.queue_type == JobQueueTypeChoices.TYPE_CELERY and not get_worker_count(
+            queue=job_queue.name
+        ):
+            raise CeleryWorkerNotRunningException(queue=job_queue.name)
+
+        job_kwargs = job_model.job_class.serialize_data(serializer.validated_data)
+        data = {"scheduled_job": None, "job_result": None}
+        context = {"request": request}
+        if job_model.approval_required:
+            # The import waits for approval as a scheduled Job, like any other Job run.
+            schedule = ScheduledJob.create_schedule(
+                job_model,
+                request.user,
+                interval=JobExecutionType.TYPE_IMMEDIATELY,
+                approval_required=True,
+                job_queue=job_queue,
+                **job_kwargs,
+            )
+            data["scheduled_job"] = ScheduledJobSerializer(schedule, context=context).data
+        else:
+            job_result = JobResult.enqueue_job(
+                job_model, request.user, job_queue=job_queue, **job_kwargs
+            )
+            data["job_result"] = JobResultSerializer(job_result, context=context).data
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+class FSUSerialLookupAPIView(NautobotAPIVersionMixin, GenericViewSet):
+    """
+    API view set for finding FSUs of any type by serial number or asset tag.
+
+    Lookups use the serial number index, so FSUs of every model are found with a single indexed
+    query, e.g. `?serial_number=<serial>&serial_number=<serial>`. Only FSUs the user has
+    permission to view are returned.
+    """
+
+    queryset = models.FSUSerialIndex.objects.select_related(
+        "fsu_content_type", "device", "location"
+    )
+    serializer_class = serializers.FSUSerialLookupSerializer
+    permission_classes = [IsAuthenticated]
+
+    def _visible(self, entries: list[models.FSUSerialIndex]) -> list[models.FSUSerialIndex]:
+        """Filter index entries to the FSUs the user has permission to view."""
+        user = self.request.user
+        if user.is_superuser:
+            return entries
+
+        ids_by_model: dict[type, set] = defaultdict(set)
+        for entry in entries:
+            ids_by_model[entry.fsu_content_type.model_class()].add(entry.fsu_id)
+        visible = {
+            (model, pk)
+            for model, ids in ids_by_model.items()
+            for pk in model.objects.restrict(user, "view")
+            .filter(pk__in=ids)
+            .values_list("pk", flat=True)
+        }
+        return [
+            entry
+            for entry in entries
+            if (entry.fsu_content_type.model_class(), entry.fsu_id) in visible
+        ]
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("serial_number", str, many=True),
+            OpenApiParameter("asset_tag", str, many=True),
+        ],
+        responses=serializers.FSUSerialLookupSerializer(many=True),
+    )
+    def list(self, request: Request) -> Response:
+        """Find FSUs by serial number or asset tag."""
+        serial_numbers = request.query_params.getlist("serial_number")
+        asset_tags = request.query_params.getlist("asset_tag")
+        if not any(serial_numbers + asset_tags):
+            raise ValidationError("At least one serial_number or asset_tag is required.")
+
+        entries = list(self.get_queryset().lookup(serial_numbers, asset_tags))
+        serializer = self.get_serializer(self._visible(entries), many=True)
+        return Response(serializer.data)
+
+
+class GPUAPIView(FSUModelViewSet):
     """API view set for GPUs."""
 
-    queryset = models.GPU.objects.all()
+    queryset = models.GPU.objects.select_related(
+        *FSU_SELECT_RELATED, "parent_gpubaseboard"
+    ).prefetch_related(*FSU_PREFETCH_RELATED)
     serializer_class = serializers.GPUSerializer
     filterset_class = filters.GPUFilterSet
+    nested_natural_key_fields = ("location", "parent_gpubaseboard")
 
 
-class GPUBaseboardAPIView(NautobotModelViewSet):
+class GPUBaseboardAPIView(FSUModelViewSet):
     """API view set for GPU Baseboards."""
 
-    queryset = models.GPUBaseboard.objects.all()
+    queryset = models.GPUBaseboard.objects.select_related(*FSU_SELECT_RELATED).prefetch_related(
+        *FSU_PREFETCH_RELATED, "gpus"
+    )
     serializer_class = serializers.GPUBaseboardSerializer
     filterset_class = filters.GPUBaseboardFilterSet
 
 
-class GPUBaseboardTemplateAPIView(NautobotModelViewSet):
+class GPUBaseboardTemplateAPIView(FSUTemplateModelViewSet):
     """API view set for GPU Baseboard Templates."""
 
     queryset = models.GPUBaseboardTemplate.objects.select_related("device_type__manufacturer")
@@ -117,15 +571,17 @@ class GPUBaseboardTemplateAPIView(NautobotModelViewSet):
     filterset_class = filters.GPUBaseboardTemplateFilterSet
 
 
-class GPUBaseboardTypeAPIView(NautobotModelViewSet):
+class GPUBaseboardTypeAPIView(FSUTypeModelViewSet):
     """API view set for GPU Baseboard Types."""
 
-    queryset = models.GPUBaseboardType.objects.all()
+    queryset = models.GPUBaseboardType.objects.annotate(
+        instance_count=count_related(models.GPUBaseboard, "fsu_type")
+    )
     serializer_class = serializers.GPUBaseboardTypeSerializer
     filterset_class = filters.GPUBaseboardTypeFilterSet
 
 
-class GPUTemplateAPIView(NautobotModelViewSet):
+class GPUTemplateAPIView(FSUTemplateModelViewSet):
     """API view set for GPUTemplates."""
 
     queryset = models.GPUTemplate.objects.select_related("device_type__manufacturer")
@@ -133,23 +589,25 @@ class GPUTemplateAPIView(NautobotModelViewSet):
     filterset_class = filters.GPUTemplateFilterSet
 
 
-class GPUTypeAPIView(NautobotModelViewSet):
+class GPUTypeAPIView(FSUTypeModelViewSet):
     """API view set for GPUTypes."""
 
-    queryset = models.GPUType.objects.all()
+    queryset = models.GPUType.objects.annotate(instance_count=count_related(models.GPU, "fsu_type"))
     serializer_class = serializers.GPUTypeSerializer
     filterset_class = filters.GPUTypeFilterSet
 
 
-class HBAAPIView(NautobotModelViewSet):
+class HBAAPIView(FSUModelViewSet):
     """API view set for HBAs."""
 
-    queryset = models.HBA.objects.all()
+    queryset = models.HBA.objects.select_related(*FSU_SELECT_RELATED).prefetch_related(
+        *FSU_PREFETCH_RELATED, "disks"
+    )
     serializer_class = serializers.HBASerializer
     filterset_class = filters.HBAFilterSet
 
 
-class HBATemplateAPIView(NautobotModelViewSet):
+class HBATemplateAPIView(FSUTemplateModelViewSet):
     """API view set for HBA Templates."""
 
     queryset = models.HBATemplate.objects.select_related("device_type__manufacturer")
@@ -157,23 +615,25 @@ class HBATemplateAPIView(NautobotModelViewSet):
     filterset_class = filters.HBATemplateFilterSet
 
 
-class HBATypeAPIView(NautobotModelViewSet):
+class HBATypeAPIView(FSUTypeModelViewSet):
     """API view set for HBA Types."""
 
-    queryset = models.HBAType.objects.all()
+    queryset = models.HBAType.objects.annotate(instance_count=count_related(models.HBA, "fsu_type"))
     serializer_class = serializers.HBATypeSerializer
     filterset_class = filters.HBATypeFilterSet
 
 
-class MainboardAPIView(NautobotModelViewSet):
+class MainboardAPIView(FSUModelViewSet):
     """API view set for Mainboards."""
 
-    queryset = models.Mainboard.objects.all()
+    queryset = models.Mainboard.objects.select_related(*FSU_SELECT_RELATED).prefetch_related(
+        *FSU_PREFETCH_RELATED, "cpus"
+    )
     serializer_class = serializers.MainboardSerializer
     filterset_class = filters.MainboardFilterSet
 
 
-class MainboardTemplateAPIView(NautobotModelViewSet):
+class MainboardTemplateAPIView(FSUTemplateModelViewSet):
     """API view set for Mainboard Templates."""
 
     queryset = models.MainboardTemplate.objects.select_related("device_type__manufacturer")
@@ -181,23 +641,27 @@ class MainboardTemplateAPIView(NautobotModelViewSet):
     filterset_class = filters.MainboardTemplateFilterSet
 
 
-class MainboardTypeAPIView(NautobotModelViewSet):
+class MainboardTypeAPIView(FSUTypeModelViewSet):
     """API view set for Mainboard Types."""
 
-    queryset = models.MainboardType.objects.all()
+    queryset = models.MainboardType.objects.annotate(
+        instance_count=count_related(models.Mainboard, "fsu_type")
+    )
     serializer_class = serializers.MainboardTypeSerializer
     filterset_class = filters.MainboardTypeFilterSet
 
 
-class NICAPIView(NautobotModelViewSet):
+class NICAPIView(FSUModelViewSet):
     """API view set for NICs."""
 
-    queryset = models.NIC.objects.all()
+    queryset = models.NIC.objects.select_related(*FSU_SELECT_RELATED).prefetch_related(
+        *FSU_PREFETCH_RELATED, "interfaces"
+    )
     serializer_class = serializers.NICSerializer
     filterset_class = filters.NICFilterSet
 
 
-class NICTemplateAPIView(NautobotModelViewSet):
+class NICTemplateAPIView(FSUTemplateModelViewSet):
     """API view set for NIC Templates."""
 
     queryset = models.NICTemplate.objects.select_related("device_type__manufacturer")
@@ -205,23 +669,25 @@ class NICTemplateAPIView(NautobotModelViewSet):
     filterset_class = filters.NICTemplateFilterSet
 
 
-class NICTypeAPIView(NautobotModelViewSet):
+class NICTypeAPIView(FSUTypeModelViewSet):
     """API view set for NIC Types."""
 
-    queryset = models.NICType.objects.all()
+    queryset = models.NICType.objects.annotate(instance_count=count_related(models.NIC, "fsu_type"))
     serializer_class = serializers.NICTypeSerializer
     filterset_class = filters.NICTypeFilterSet
 
 
-class OtherFSUAPIView(NautobotModelViewSet):
+class OtherFSUAPIView(FSUModelViewSet):
     """API view set for Other FSUs."""
 
-    queryset = models.OtherFSU.objects.all()
+    queryset = models.OtherFSU.objects.select_related(*FSU_SELECT_RELATED).prefetch_related(
+        *FSU_PREFETCH_RELATED
+    )
     serializer_class = serializers.OtherFSUSerializer
     filterset_class = filters.OtherFSUFilterSet
 
 
-class OtherFSUTemplateAPIView(NautobotModelViewSet):
+class OtherFSUTemplateAPIView(FSUTemplateModelViewSet):
     """API view set for Other FSU Templates."""
 
     queryset = models.OtherFSUTemplate.objects.select_related("device_type__manufacturer")
@@ -229,23 +695,27 @@ class OtherFSUTemplateAPIView(NautobotModelViewSet):
     filterset_class = filters.OtherFSUTemplateFilterSet
 
 
-class OtherFSUTypeAPIView(NautobotModelViewSet):
+class OtherFSUTypeAPIView(FSUTypeModelViewSet):
     """API view set for Other FSU Types."""
 
-    queryset = models.OtherFSUType.objects.all()
+    queryset = models.OtherFSUType.objects.annotate(
+        instance_count=count_related(models.OtherFSU, "fsu_type")
+    )
     serializer_class = serializers.OtherFSUTypeSerializer
     filterset_class = filters.OtherFSUTypeFilterSet
 
 
-class PSUAPIView(NautobotModelViewSet):
+class PSUAPIView(FSUModelViewSet):
     """API view set for PSUs."""
 
-    queryset = models.PSU.objects.all()
+    queryset = models.PSU.objects.select_related(*FSU_SELECT_RELATED).prefetch_related(
+        *FSU_PREFETCH_RELATED, "power_ports"
+    )
     serializer_class = serializers.PSUSerializer
     filterset_class = filters.PSUFilterSet
 
 
-class PSUTemplateAPIView(NautobotModelViewSet):
+class PSUTemplateAPIView(FSUTemplateModelViewSet):
     """API view set for PSU Templates."""
 
     queryset = models.PSUTemplate.objects.select_related("device_type__manufacturer")
@@ -253,23 +723,25 @@ class PSUTemplateAPIView(NautobotModelViewSet):
     filterset_class = filters.PSUTemplateFilterSet
 
 
-class PSUTypeAPIView(NautobotModelViewSet):
+class PSUTypeAPIView(FSUTypeModelViewSet):
     """API view set for PSU Types."""
 
-    queryset = models.PSUType.objects.all()
+    queryset = models.PSUType.objects.annotate(instance_count=count_related(models.PSU, "fsu_type"))
     serializer_class = serializers.PSUTypeSerializer
     filterset_class = filters.PSUTypeFilterSet
 
 
-class RAMModuleAPIView(NautobotModelViewSet):
+class RAMModuleAPIView(FSUModelViewSet):
     """API view set for RAM Modules."""
 
-    queryset = models.RAMModule.objects.all()
+    queryset = models.RAMModule.objects.select_related(*FSU_SELECT_RELATED).prefetch_related(
+        *FSU_PREFETCH_RELATED
+    )
     serializer_class = serializers.RAMModuleSerializer
     filterset_class = filters.RAMModuleFilterSet
 
 
-class RAMModuleTemplateAPIView(NautobotModelViewSet):
+class RAMModuleTemplateAPIView(FSUTemplateModelViewSet):
     """API view set for RAM Module Templates."""
 
     queryset = models.RAMModuleTemplate.objects.select_related("device_type__manufacturer")
@@ -277,9 +749,43 @@ class RAMModuleTemplateAPIView(NautobotModelViewSet):
     filterset_class = filters.RAMModuleTemplateFilterSet
 
 
-class RAMModuleTypeAPIView(NautobotModelViewSet):
+class RAMModuleTypeAPIView(FSUTypeModelViewSet):
     """API view set for RAM Module Types."""
 
-    queryset = models.RAMModuleType.objects.all()
+    queryset = models.RAMModuleType.objects.annotate(
+        instance_count=count_related(models.RAMModule, "fsu_type")
+    )
     serializer_class = serializers.RAMModuleTypeSerializer
     filterset_class = filters.RAMModuleTypeFilterSet
+
+
+class SparesAPIView(NautobotAPIVersionMixin, GenericViewSet):
+    """
+    API view set for the spare FSUs on hand, by Location, FSU type, and Status.
+
+    Spares are FSUs stored at a Location rather than installed in a Device. Each result counts the
+    spares of one FSU type and Status at a Location and every Location below it, so the spares of
+    a whole region are a single result. Results are read from counts that are kept up to date as
+    FSUs change, e.g. `?location=EU-West&fsu_type_id=<uuid>&status=Available`, and can also be
+    filtered with `?fsu_model=gpu`.
+    """
+
+    serializer_class = serializers.SpareCountSerializer
+    filterset_class = filters.FSUSpareCountFilterSet
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self) -> QuerySet:
+        """Limit the counts to the FSU models and Locations the user can view."""
+        return get_spare_counts(self.request.user)
+
+    def list(self, request: Request) -> Response:
+        """List the spares of each FSU type and Status at each Location."""
+        spare_counts = self.filter_queryset(self.get_queryset())
+
+        page = self.paginate_queryset(spare_counts)
+        if page is None:
+            return Response(self.get_serializer(with_fsu_types(spare_counts), many=True).data)
+
+        return self.get_paginated_response(
+            self.get_serializer(with_fsu_types(page), many=True).data
+        )
@@ -15,7 +15,12 @@
 
 """Extensions to built-in Nautobot filters."""
 
+from typing import Any
+
 from django import forms
+from django.db.models import QuerySet
+import django_filters
+from django_filters.constants import EMPTY_VALUES
 from nautobot.apps.filters import (
     FilterExtension,
     NaturalKeyOrPKMultipleChoiceFilter,
@@ -24,7 +29,36 @@ from nautobot.apps.filters import (
 from nautobot.apps.forms import StaticSelect2
 from nautobot.core.forms.constants import BOOLEAN_WITH_BLANK_CHOICES
 
-from nautobot_fsus.models import NIC, PSU
+from nautobot_fsus.models import NIC, PSU, FSUSpareCount
+
+
+class AvailableSparesFilter(django_filters.BooleanFilter):
+    """
+    Filter Locations on whether available spares of an FSU model are stored at or below them.
+
+    Spares are FSUs with the "Available" Status stored at a Location rather than installed in a
+    Device. The filter reads the stored spare counts, which are rolled up the Location tree, so a
+    region matches when any Location within it holds an available spare.
+    """
+
+    def __init__(self, *args: Any, fsu_model: str, **kwargs: Any):
+        """Set the model name of the FSUs to look for, e.g. "gpu"."""
+        self.fsu_model = fsu_model
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs: QuerySet, value: bool | None) -> QuerySet:
+        """Filter the Locations on whether they hold available spares."""
+        if value in EMPTY_VALUES:
+            return qs
+
+        spares = FSUSpareCount.objects.filter(
+            fsu_content_type__app_label="nautobot_fsus",
+            fsu_content_type__model=self.fsu_model,
+            status__name="Available",
+        ).values("location")
+        if value:
+            return qs.filter(pk__in=spares)
+        return qs.exclude(pk__in=spares)
 
 
 class DeviceFilterExtension(FilterExtension):  # pylint: disable=too-few-public-methods
@@ -113,48 +147,48 @@ class LocationFilterExtension(FilterExtension):  # pylint: disable=too-few-publi
     model = "dcim.location"
 
     filterset_fields = {
-        "nautobot_fsus_has_available_cpus": RelatedMembershipBooleanFilter(
-            field_name="cpus",
+        "nautobot_fsus_has_available_cpus": AvailableSparesFilter(
+            fsu_model="cpu",
             label="Has available CPUs",
         ),
-        "nautobot_fsus_has_available_disks": RelatedMembershipBooleanFilter(
-            field_name="disks",
+        "nautobot_fsus_has_available_disks": AvailableSparesFilter(
+            fsu_model="disk",
             label="Has available Disks",
         ),
-        "nautobot_fsus_has_available_fans": RelatedMembershipBooleanFilter(
-            field_name="fans",
+        "nautobot_fsus_has_available_fans": AvailableSparesFilter(
+            fsu_model="fan",
             label="Has available Fans",
         ),
-        "nautobot_fsus_has_available_gpus": RelatedMembershipBooleanFilter(
-            field_name="gpus",
+        "nautobot_fsus_has_available_gpus": AvailableSparesFilter(
+            fsu_model="gpu",
             label="Has available GPUs",
         ),
-        "nautobot_fsus_has_available_gpu_baseboards": RelatedMembershipBooleanFilter(
-            field_name="gpubaseboards",
+        "nautobot_fsus_has_available_gpu_baseboards": AvailableSparesFilter(
+            fsu_model="gpubaseboard",
             label="Has available GPU Baseboards",
         ),
-        "nautobot_fsus_has_available_hbas": RelatedMembershipBooleanFilter(
-            field_name="hbas",
+        "nautobot_fsus_has_available_hbas": AvailableSparesFilter(
+            fsu_model="hba",
             label="Has available HBAs",
         ),
-        "nautobot_fsus_has_available_mainboards": RelatedMembershipBooleanFilter(
-            field_name="mainboards",
+        "nautobot_fsus_has_available_mainboards": AvailableSparesFilter(
+            fsu_model="mainboard",
             label="Has available Mainboards",
         ),
-        "nautobot_fsus_has_available_nics": RelatedMembershipBooleanFilter(
-            field_name="nics",
+        "nautobot_fsus_has_available_nics": AvailableSparesFilter(
+            fsu_model="nic",
             label="Has available NICs",
         ),
-        "nautobot_fsus_has_available_otherfsus": RelatedMembershipBooleanFilter(
-            field_name="otherfsus",
+        "nautobot_fsus_has_available_otherfsus": AvailableSparesFilter(
+            fsu_model="otherfsu",
             label="Has available Other FSUs",
         ),
-        "nautobot_fsus_has_available_psus": RelatedMembershipBooleanFilter(
-            field_name="psus",
+        "nautobot_fsus_has_available_psus": AvailableSparesFilter(
+            fsu_model="psu",
             label="Has available PSUs",
         ),
-        "nautobot_fsus_has_available_rammodules": RelatedMembershipBooleanFilter(
-            field_name="rammodules",
+        "nautobot_fsus_has_available_rammodules": AvailableSparesFilter(
+            fsu_model="rammodule",
             label="Has available RAM Modules",
         ),
     }
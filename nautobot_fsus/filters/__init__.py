@@ -15,6 +15,8 @@
 
 """Filters and FilterSets for Nautobot FSUs app models"""
 
+from nautobot_fsus.filters.fsu_imports import FSUImportFilterSet
+from nautobot_fsus.filters.fsu_spare_counts import FSUSpareCountFilterSet
 from nautobot_fsus.filters.fsu_templates import (
     CPUTemplateFilterSet,
     DiskTemplateFilterSet,
@@ -41,6 +43,7 @@ from nautobot_fsus.filters.fsu_types import (
     PSUTypeFilterSet,
     RAMModuleTypeFilterSet,
 )
+from nautobot_fsus.filters.fsu_version_counts import FSUVersionCountFilterSet
 from nautobot_fsus.filters.fsus import (
     CPUFilterSet,
     DiskFilterSet,
@@ -65,6 +68,9 @@ __all__ = (
     "FanFilterSet",
     "FanTemplateFilterSet",
     "FanTypeFilterSet",
+    "FSUImportFilterSet",
+    "FSUSpareCountFilterSet",
+    "FSUVersionCountFilterSet",
     "GPUBaseboardFilterSet",
     "GPUBaseboardTemplateFilterSet",
     "GPUBaseboardTypeFilterSet",
@@ -0,0 +1,41 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""FilterSet for background FSU import progress records."""
+
+from nautobot.apps.filters import BaseFilterSet, MultiValueCharFilter
+
+from nautobot_fsus import models
+
+
+class FSUImportFilterSet(BaseFilterSet):
+    """Filter set for FSUImport."""
+
+    fsu_model = MultiValueCharFilter(
+        field_name="fsu_content_type__model",
+        label="FSU model name, e.g. gpu",
+    )
+
+    class Meta:
+        """FSUImportFilterSet model options."""
+
+        model = models.FSUImport
+        fields = [
+            "id",
+            "job_result",
+            "file_name",
+            "checksum",
+            "completed",
+        ]
@@ -0,0 +1,53 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""FilterSet for the stored counts of spare FSUs."""
+
+from nautobot.apps.filters import (
+    BaseFilterSet,
+    MultiValueCharFilter,
+    NaturalKeyOrPKMultipleChoiceFilter,
+)
+from nautobot.dcim.models import Location
+from nautobot.extras.models import Status
+
+from nautobot_fsus import models
+
+
+class FSUSpareCountFilterSet(BaseFilterSet):
+    """Filter set for FSUSpareCount."""
+
+    fsu_model = MultiValueCharFilter(
+        field_name="fsu_content_type__model",
+        label="FSU model name, e.g. gpu",
+    )
+
+    location = NaturalKeyOrPKMultipleChoiceFilter(
+        queryset=Location.objects.all(),
+        to_field_name="name",
+        label="Location (name or ID)",
+    )
+
+    status = NaturalKeyOrPKMultipleChoiceFilter(
+        queryset=Status.objects.all(),
+        to_field_name="name",
+        label="Status (name or ID)",
+    )
+
+    class Meta:
+        """FSUSpareCountFilterSet model options."""
+
+        model = models.FSUSpareCount
+        fields = ["fsu_type_id"]
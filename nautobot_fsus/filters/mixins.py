@@ -15,7 +15,9 @@
 
 """Mixin classes to support user-definable fields in model filters."""
 
+from django.db.models import QuerySet
 import django_filters
+from django_filters.constants import EMPTY_VALUES
 from nautobot.apps.filters import (
     MultiValueCharFilter,
     MultiValueUUIDFilter,
@@ -25,11 +27,33 @@ from nautobot.apps.filters import (
 )
 from nautobot.dcim.models import Device, DeviceType, Location, Manufacturer
 
+from nautobot_fsus.filters.search import TrigramSearchFilter
+from nautobot_fsus.models.mixins import naturalize_version
+
+
+class VersionFilter(django_filters.CharFilter):
+    """
+    Compare a version field against a version, in version order.
+
+    The comparison is made on the version key stored alongside the field (`field_name`), so
+    `firmware_version__lt=96.00.89` matches "96.00.9" but not "96.00.100". FSUs without a
+    version are never matched.
+    """
+
+    def filter(self, qs: QuerySet, value: str) -> QuerySet:
+        """Filter the queryset on the version key of the given version."""
+        if value in EMPTY_VALUES:
+            return qs
+
+        return qs.exclude(**{self.field_name: ""}).filter(
+            **{f"{self.field_name}__{self.lookup_expr}": naturalize_version(value)}
+        )
+
 
 class FSUModelFilterSetMixin(django_filters.FilterSet):
     """Mixin with the common filter code for FSUs."""
 
-    q = SearchFilter(
+    q = TrigramSearchFilter(
         filter_predicates={
             "name": "icontains",
             "fsu_type__name": "icontains",
@@ -64,6 +88,32 @@ class FSUModelFilterSetMixin(django_filters.FilterSet):
         label="Storage Location (ID)",
     )
 
+    firmware_version__lt = VersionFilter(
+        field_name="_firmware_version", lookup_expr="lt", label="Firmware version older than"
+    )
+    firmware_version__lte = VersionFilter(
+        field_name="_firmware_version", lookup_expr="lte", label="Firmware version up to"
+    )
+    firmware_version__gt = VersionFilter(
+        field_name="_firmware_version", lookup_expr="gt", label="Firmware version newer than"
+    )
+    firmware_version__gte = VersionFilter(
+        field_name="_firmware_version", lookup_expr="gte", label="Firmware version from"
+    )
+
+    driver_version__lt = VersionFilter(
+        field_name="_driver_version", lookup_expr="lt", label="Driver version older than"
+    )
+    driver_version__lte = VersionFilter(
+        field_name="_driver_version", lookup_expr="lte", label="Driver version up to"
+    )
+    driver_version__gt = VersionFilter(
+        field_name="_driver_version", lookup_expr="gt", label="Driver version newer than"
+    )
+    driver_version__gte = VersionFilter(
+        field_name="_driver_version", lookup_expr="gte", label="Driver version from"
+    )
+
 
 class FSUTemplateModelFilterSetMixin(django_filters.FilterSet):
     """Mixin with the common filter code for FSU templates."""
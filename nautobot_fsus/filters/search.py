@@ -0,0 +1,115 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Substring search of FSUs backed by PostgreSQL trigram indexes."""
+
+from uuid import UUID
+
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
+from django_filters.constants import EMPTY_VALUES
+from nautobot.apps.filters import SearchFilter
+
+# Name of the trigram index of an FSU or FSU type table, created by migration 0009 when the
+# pg_trgm extension is available.
+TRIGRAM_INDEX_NAME = "fsus_%s_trgm"
+
+# Whether each table has its trigram index, per database alias.
+_trigram_indexes: dict[tuple[str, str], bool] = {}
+
+
+def trigram_search_available(model: type[Model], using: str) -> bool:
+    """
+    Check whether searches of a model's table can use its trigram index.
+
+    The trigram indexes are only created on PostgreSQL, and only if the `pg_trgm` extension could
+    be enabled, so this checks for the index itself. The result is cached for the process.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return False
+
+    key = (using, model._meta.db_table)
+    if key not in _trigram_indexes:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_indexes WHERE tablename = %s AND indexname = %s",
+                [model._meta.db_table, TRIGRAM_INDEX_NAME % model._meta.model_name],
+            )
+            _trigram_indexes[key] = cursor.fetchone() is not None
+
+    return _trigram_indexes[key]
+
+
+def clear_trigram_search_cache() -> None:
+    """Forget which tables have trigram indexes, e.g. after migrating a database."""
+    _trigram_indexes.clear()
+
+
+class TrigramSearchFilter(SearchFilter):
+    """
+    Search filter that can be served by trigram indexes on PostgreSQL.
+
+    Trigram (`pg_trgm` GIN) indexes on `UPPER(column)` serve the `UPPER(column) LIKE '%...%'`
+    queries that `icontains` runs on PostgreSQL, so a substring search is a few index scans
+    instead of a sequential scan of the table - as long as every predicate that is OR'd
+    together can use an index. When the model's table has a trigram index, the query is built
+    so they can:
+
+    - `id` is only matched exactly, and only when the search term is a UUID.
+    - Predicates on a related model's fields are resolved first, so that the table is filtered
+      on the IDs of the matching related objects, through its foreign key index, rather than
+      through a join.
+    - No `DISTINCT` is needed, as there are no joins to duplicate rows.
+
+    On other databases, or if the trigram indexes are not available, it is a plain `SearchFilter`.
+    """
+
+    def generate_trigram_query(self, model: type[Model], value: str, using: str) -> Q:
+        """Build a query from the filter predicates that trigram and B-tree indexes can serve."""
+        query = Q()
+        for field_name, lookup_expr in self.filter_predicates.items():
+            if field_name == "id":
+                try:
+                    query |= Q(id=UUID(value.strip()))
+                except ValueError:
+                    pass
+                continue
+
+            relation, _, related_field = field_name.partition("__")
+            if not related_field:
+                query |= Q(**{f"{field_name}__{lookup_expr}": value})
+                continue
+
+            related_model = model._meta.get_field(relation).related_model
+            related_ids = list(
+                related_model.objects.using(using)
+                .filter(**{f"{related_field}__{lookup_expr}": value})
+                .values_list("pk", flat=True)
+            )
+            if related_ids:
+                query |= Q(**{f"{relation}__in": related_ids})
+
+        return query
+
+    def filter(self, qs: QuerySet, value: str) -> QuerySet:
+        """Filter the queryset, using the trigram indexes if they are available."""
+        if value in EMPTY_VALUES or not trigram_search_available(qs.model, qs.db):
+            return super().filter(qs, value)
+
+        query = self.generate_trigram_query(qs.model, value, qs.db)
+        self._most_recent_query = query
+        # An empty query would match everything, where no predicate matching means no results.
+        return self.get_method(qs)(query) if query else qs.none()
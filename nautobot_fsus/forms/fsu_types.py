@@ -103,6 +103,8 @@ class CPUTypeForm(FSUTypeModelForm):
             "cpu_speed",
             "cores",
             "pcie_generation",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -124,6 +126,8 @@ class CPUTypeImportForm(FSUTypeImportModelForm):
             "cpu_speed",
             "cores",
             "pcie_generation",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -185,6 +189,8 @@ class DiskTypeForm(FSUTypeModelForm):
             "part_number",
             "disk_type",
             "size",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -204,6 +210,8 @@ class DiskTypeImportForm(FSUTypeImportModelForm):
             "part_number",
             "disk_type",
             "size",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -358,6 +366,8 @@ class GPUBaseboardTypeForm(FSUTypeModelForm):
             "name",
             "part_number",
             "slot_count",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -376,6 +386,8 @@ class GPUBaseboardTypeImportForm(FSUTypeImportModelForm):
             "name",
             "part_number",
             "slot_count",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -479,6 +491,8 @@ class MainboardTypeForm(FSUTypeModelForm):
             "name",
             "part_number",
             "cpu_socket_count",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -497,6 +511,8 @@ class MainboardTypeImportForm(FSUTypeImportModelForm):
             "name",
             "part_number",
             "cpu_socket_count",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -549,6 +565,8 @@ class NICTypeForm(FSUTypeModelForm):
             "name",
             "part_number",
             "interface_count",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -567,6 +585,8 @@ class NICTypeImportForm(FSUTypeImportModelForm):
             "name",
             "part_number",
             "interface_count",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -687,6 +707,8 @@ class PSUTypeForm(FSUTypeModelForm):
             "power_provided",
             "required_voltage",
             "hot_swappable",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -708,6 +730,8 @@ class PSUTypeImportForm(FSUTypeImportModelForm):
             "power_provided",
             "required_voltage",
             "hot_swappable",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -778,6 +802,8 @@ class RAMModuleTypeForm(FSUTypeModelForm):
             "speed",
             "capacity",
             "quantity",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -800,6 +826,8 @@ class RAMModuleTypeImportForm(FSUTypeImportModelForm):
             "speed",
             "capacity",
             "quantity",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
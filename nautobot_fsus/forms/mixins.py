@@ -127,6 +127,8 @@ class FSUTypeModelForm(NautobotModelForm):
             "manufacturer",
             "name",
             "part_number",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
             "tags",
@@ -149,6 +151,8 @@ class FSUTypeImportModelForm(BootstrapMixin, forms.ModelForm):
             "manufacturer",
             "name",
             "part_number",
+            "target_firmware_version",
+            "target_driver_version",
             "description",
             "comments",
         ]
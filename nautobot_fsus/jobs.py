@@ -0,0 +1,244 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Jobs for the Nautobot FSUs app."""
+
+from hashlib import sha256
+from pathlib import PurePath
+from typing import IO
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from nautobot.apps.jobs import (
+    BooleanVar,
+    ChoiceVar,
+    FileVar,
+    IntegerVar,
+    Job,
+    MultiObjectVar,
+    register_jobs,
+)
+from nautobot.dcim.models import Device, DeviceType, Location
+
+from nautobot_fsus.models import FSU_MODELS, FSUImport
+from nautobot_fsus.models.mixins import FSUModel
+from nautobot_fsus.utilities.bulk_import import import_fsus, read_import_data
+from nautobot_fsus.utilities.instantiation import instantiate_fsus
+
+name = "Field Serviceable Units"  # pylint: disable=invalid-name
+
+
+class InstantiateFSUs(Job):
+    """Create FSUs on existing Devices from the FSU templates of their DeviceTypes."""
+
+    devices = MultiObjectVar(
+        model=Device,
+        required=False,
+        description="Devices to create FSUs for.",
+    )
+    device_types = MultiObjectVar(
+        model=DeviceType,
+        required=False,
+        description="Create FSUs for all Devices of these DeviceTypes.",
+    )
+    locations = MultiObjectVar(
+        model=Location,
+        required=False,
+        description="Create FSUs for all Devices in these Locations.",
+    )
+    skip_existing = BooleanVar(
+        default=True,
+        description="Skip FSUs whose name is already in use on the Device.",
+    )
+    batch_size = IntegerVar(
+        default=1000,
+        min_value=1,
+        description="Maximum number of FSUs to create per database query.",
+    )
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Job metadata."""
+
+        name = "Instantiate FSUs from Templates"
+        description = (
+            "Create the FSUs defined by DeviceType FSU templates on existing Devices, "
+            "e.g. Devices that were created in bulk."
+        )
+        has_sensitive_variables = False
+
+    def run(  # pylint: disable=arguments-differ
+        self,
+        *,
+        devices,
+        device_types,
+        locations,
+        skip_existing,
+        batch_size,
+    ) -> None:
+        """Instantiate the FSUs for the selected Devices."""
+        queryset = Device.objects.only("id", "device_type_id")
+        if devices:
+            queryset = queryset.filter(pk__in=devices)
+        if device_types:
+            queryset = queryset.filter(device_type__in=device_types)
+        if locations:
+            queryset = queryset.filter(location__in=locations)
+
+        result = instantiate_fsus(
+            queryset.iterator(),
+            skip_existing=skip_existing,
+            batch_size=batch_size,
+        )
+
+        for verbose_name, count in result.created.items():
+            self.logger.info("Created %d %s", count, verbose_name)
+        if result.skipped:
+            self.logger.info("Skipped %d FSUs that already exist", result.skipped)
+
+        self.logger.info(
+            "Processed %d devices in %.2f seconds (%.1f devices/sec)",
+            result.devices,
+            result.elapsed,
+            result.devices_per_second,
+        )
+
+
+class BulkImportFSUs(Job):
+    """Import FSUs from a CSV or NDJSON file in batches, recording the progress of the import."""
+
+    fsu_model = ChoiceVar(
+        choices=[(model._meta.model_name, model._meta.verbose_name) for model in FSU_MODELS],
+        label="FSU type",
+        description="The type of FSU to import.",
+    )
+    import_file = FileVar(
+        description=(
+            "CSV file with a header line, or NDJSON file with one FSU per line, "
+            "using the columns of the FSU CSV import."
+        ),
+    )
+    batch_size = IntegerVar(
+        default=1000,
+        min_value=1,
+        description="Number of rows to import in each transaction.",
+    )
+    resume = BooleanVar(
+        default=True,
+        description="Continue an unfinished import of the same file after its last committed batch.",
+    )
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """Job metadata."""
+
+        name = "Bulk Import FSUs"
+        description = "Import a large number of FSUs of one type from a CSV or NDJSON file."
+        has_sensitive_variables = False
+
+    def _get_progress(
+        self,
+        fsu_model: type[FSUModel],
+        import_file: IO[bytes],
+        data: bytes,
+        resume: bool,
+    ) -> FSUImport:
+        """Get the unfinished import of the same file to resume, or start a new one."""
+        fsu_content_type = ContentType.objects.get_for_model(fsu_model)
+        checksum = sha256(data).hexdigest()
+        progress = None
+        if resume:
+            progress = (
+                FSUImport.objects.filter(
+                    fsu_content_type=fsu_content_type, checksum=checksum, completed=False
+                )
+                .order_by("-last_updated")
+                .first()
+            )
+        if progress is None:
+            progress = FSUImport(
+                fsu_content_type=fsu_content_type,
+                checksum=checksum,
+                # FileVar files are read from storage, under a path ending in the uploaded file name.
+                file_name=PurePath(getattr(import_file, "name", "") or "").name[-255:],
+            )
+        elif progress.processed_rows:
+            self.logger.info(
+                "Resuming the import after row %d of %d",
+                progress.processed_rows,
+                progress.total_rows,
+            )
+
+        progress.job_result = self.job_result
+        return progress
+
+    def run(  # pylint: disable=arguments-differ
+        self,
+        *,
+        fsu_model,
+        import_file,
+        batch_size,
+        resume,
+    ) -> None:
+        """Import the FSUs, committing each batch along with the import progress."""
+        model = next(model for model in FSU_MODELS if model._meta.model_name == fsu_model)
+        data = import_file.read()
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        rows, first_row = read_import_data(data.decode("utf-8-sig"))
+
+        progress = self._get_progress(model, import_file, data, resume)
+        progress.batch_size = batch_size
+        progress.total_rows = len(rows)
+        progress.save()
+
+        for start in range(progress.processed_rows, len(rows), batch_size):
+            batch = rows[start : start + batch_size]
+            with transaction.atomic():
+                result = import_fsus(
+                    model,
+                    batch,
+                    user=self.user,
+                    batch_size=batch_size,
+                    start_row=first_row + start,
+                    partial=True,
+                )
+                progress.processed_rows = start + len(batch)
+                progress.created_count += result.created
+                progress.errors.extend(result.errors)
+                progress.save()
+
+            for row_number, message in result.errors:
+                self.logger.warning("Row %d: %s", row_number, message)
+            self.logger.info(
+                "Imported rows %d to %d of %d: created %d FSUs (%.1f rows/sec)",
+                start + 1,
+                progress.processed_rows,
+                progress.total_rows,
+                result.created,
+                result.rows_per_second,
+            )
+
+        progress.completed = True
+        progress.save()
+        self.logger.info(
+            "Created %d %s from %d rows, with %d errors",
+            progress.created_count,
+            model._meta.verbose_name_plural,
+            progress.total_rows,
+            len(progress.errors),
+        )
+
+
+jobs = [InstantiateFSUs, BulkImportFSUs]
+register_jobs(*jobs)
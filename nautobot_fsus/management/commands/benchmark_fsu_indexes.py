@@ -0,0 +1,195 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Benchmark the FSU access pattern indexes on a generated dataset."""
+
+import re
+from time import perf_counter
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Count, QuerySet
+
+from nautobot_fsus.models import FSU_MODELS
+from nautobot_fsus.models.mixins import FSUModel
+
+
+class _Rollback(Exception):
+    """Raised to roll back the generated dataset once the benchmark is complete."""
+
+
+def _generate_fsus(model: type[FSUModel], database: str, rows: int) -> None:
+    """
+    Insert generated FSUs into an FSU model's table with a single `INSERT ... SELECT`.
+
+    Nine in ten of the FSUs are installed in a Device, eight to a Device, and the rest are spares
+    spread over 100 Locations. The Devices, Locations, FSU types, and statuses are only referenced
+    by ID: the foreign keys are not checked until the transaction commits, and it never does.
+    """
+    columns = {
+        "id": "gen_random_uuid()",
+        "created": "now()",
+        "last_updated": "now()",
+        "_custom_field_data": "'{}'::jsonb",
+        # The expressions are part of a query with parameters, so "%%" is the modulo operator.
+        "device_id": "CASE WHEN n %% 10 > 0 THEN md5('device' || n / 8)::uuid END",
+        "location_id": "CASE WHEN n %% 10 = 0 THEN md5('location' || n %% 100)::uuid END",
+        "name": "'fsu' || n",
+        "_name": "lpad(n::text, 12, '0')",
+        "firmware_version": "'1.' || n %% 20",
+        "status_id": "md5('status' || n %% 4)::uuid",
+        "fsu_type_id": "md5('type' || n %% 50)::uuid",
+    }
+    for model_field in model._meta.concrete_fields:
+        if model_field.column in columns:
+            continue
+        if model_field.null:
+            columns[model_field.column] = "NULL"
+        elif model_field.get_internal_type() == "BooleanField":
+            columns[model_field.column] = "false"
+        else:
+            columns[model_field.column] = "''"
+
+    with connections[database].cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {model._meta.db_table} ({', '.join(columns)}) "  # noqa: S608
+            f"SELECT {', '.join(columns.values())} FROM generate_series(1, %s) AS n",
+            [rows],
+        )
+        cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+
+def _hot_queries(model: type[FSUModel], database: str) -> dict[str, QuerySet]:
+    """The FSU queries the access pattern indexes are meant for."""
+    fsus = model.objects.using(database)
+    # The related objects of the generated FSUs do not exist, so these are read without joins.
+    sample = (
+        fsus.filter(device_id__isnull=False)
+        .order_by()
+        .values("device_id", "fsu_type_id", "status_id")
+        .first()
+    )
+    spare = (
+        fsus.filter(location_id__isnull=False).order_by().values("location_id", "status_id").first()
+    )
+    return {
+        "FSUs of a Device, by name": fsus.filter(device_id=sample["device_id"]).order_by("_name"),
+        "Spares at a Location with a status, by name": fsus.filter(
+            location_id=spare["location_id"], status_id=spare["status_id"]
+        ).order_by("_name"),
+        "Instances of a type with a status": fsus.filter(
+            fsu_type_id=sample["fsu_type_id"], status_id=sample["status_id"]
+        )
+        .order_by()
+        .values("id"),
+        "Instances of a type, by firmware version": fsus.filter(fsu_type_id=sample["fsu_type_id"])
+        .order_by()
+        .values("firmware_version")
+        .annotate(count=Count("id")),
+    }
+
+
+class Command(BaseCommand):
+    """Publish the command to benchmark the FSU access pattern indexes."""
+
+    help = (
+        "Generate FSUs in a transaction that is rolled back, and compare the query plans and "
+        "timings of the common FSU queries with and without the access pattern indexes. "
+        "PostgreSQL only."
+    )
+
+    def add_arguments(self, parser):
+        """Optional command-line arguments for the handler."""
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=5_000_000,
+            help="Number of FSUs to generate. Defaults to 5,000,000.",
+        )
+        parser.add_argument(
+            "--model",
+            default="gpu",
+            choices=[model._meta.model_name for model in FSU_MODELS],
+            help="FSU model to benchmark. Defaults to gpu.",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Number of times to run each query, keeping the fastest. Defaults to 5.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='The database to use. Defaults to the "default" database.',
+        )
+
+    def _run_queries(
+        self, queries: dict[str, QuerySet], repeat: int
+    ) -> dict[str, tuple[str, float]]:
+        """Run each query with `EXPLAIN ANALYZE`, returning its fastest plan and execution time."""
+        results: dict[str, tuple[str, float]] = {}
+        for title, queryset in queries.items():
+            for _ in range(repeat):
+                plan = queryset.explain(analyze=True)
+                match = re.search(r"Execution Time: ([\d.]+) ms", plan)
+                timing = float(match.group(1)) if match else 0.0
+                if title not in results or timing < results[title][1]:
+                    results[title] = (plan, timing)
+        return results
+
+    def handle(self, *args, **options):
+        """Publish command to benchmark the FSU access pattern indexes."""
+        database = options["database"]
+        if connections[database].vendor != "postgresql":
+            raise CommandError("The index benchmark requires a PostgreSQL database.")
+
+        model = next(model for model in FSU_MODELS if model._meta.model_name == options["model"])
+        # Every index but the keyset pagination index, which predates the access pattern indexes.
+        indexes = [index for index in model._meta.indexes if not index.name.endswith("_ks")]
+
+        try:
+            with (
+                transaction.atomic(using=database),
+                connections[database].schema_editor() as editor,
+            ):
+                self.stdout.write(
+                    f"Generating {options['rows']:,} {model._meta.verbose_name_plural}..."
+                )
+                start = perf_counter()
+                _generate_fsus(model, database, options["rows"])
+                self.stdout.write(f"Generated in {perf_counter() - start:.1f}s.")
+
+                queries = _hot_queries(model, database)
+                after = self._run_queries(queries, options["repeat"])
+                # An index cannot be created on a table with foreign key checks still pending, as
+                # they are for the generated FSUs, so the queries are run with the indexes first.
+                for index in indexes:
+                    editor.remove_index(model, index)
+                # The partial spares index is created by a migration rather than the model.
+                editor.execute(f"DROP INDEX IF EXISTS fsus_{model._meta.model_name}_spares")
+                before = self._run_queries(queries, options["repeat"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        for title, (plan, timing) in before.items():
+            after_plan, after_timing = after[title]
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n{title}"))
+            self.stdout.write(f"Without access pattern indexes: {timing:.3f} ms\n{plan}")
+            self.stdout.write(f"With access pattern indexes: {after_timing:.3f} ms\n{after_plan}")
+            self.stdout.write(
+                self.style.SUCCESS(f"{timing / after_timing if after_timing else 0:.1f}x faster")
+            )
@@ -0,0 +1,73 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Bulk import FSUs from a CSV file."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from nautobot_fsus.models import FSU_MODELS
+from nautobot_fsus.utilities.bulk_import import import_fsus, read_import_data
+
+
+class Command(BaseCommand):
+    """Publish the command to bulk import FSUs."""
+
+    help = "Import FSUs of one type from a CSV or NDJSON file with the same columns as the FSU CSV import."
+
+    def add_arguments(self, parser):
+        """Command-line arguments for the handler."""
+        parser.add_argument(
+            "model",
+            choices=[model._meta.model_name for model in FSU_MODELS],
+            help="The FSU model to import, e.g. gpu.",
+        )
+        parser.add_argument("import_file", help="Path to the CSV or NDJSON file to import.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Maximum number of FSUs to insert per database query.",
+        )
+        parser.add_argument(
+            "--partial",
+            action="store_true",
+            help="Import the valid rows even if other rows have errors.",
+        )
+
+    def handle(self, *args, **options):
+        """Publish command to import FSUs."""
+        model = next(model for model in FSU_MODELS if model._meta.model_name == options["model"])
+        with open(options["import_file"], encoding="utf-8-sig", newline="") as import_file:
+            rows, first_row = read_import_data(import_file.read())
+
+        result = import_fsus(
+            model,
+            rows,
+            batch_size=options["batch_size"],
+            start_row=first_row,
+            partial=options["partial"],
+        )
+        for row_number, message in result.errors:
+            self.stderr.write(f"Row {row_number}: {message}")
+
+        if result.errors and not options["partial"]:
+            raise CommandError(f"{len(result.errors)} errors found, no FSUs were imported.")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result.created} of {result.rows} {model._meta.verbose_name_plural} "
+                f"in {result.elapsed:.2f}s ({result.rows_per_second:.0f} rows/s)."
+            )
+        )
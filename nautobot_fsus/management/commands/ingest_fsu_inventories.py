@@ -0,0 +1,60 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Reconcile the FSU inventory files of a whole fleet of Devices in parallel."""
+
+from nautobot_fsus.management.commands.reconcile_fsus import Command as ReconcileCommand
+from nautobot_fsus.utilities.fleet import reconcile_fleet
+
+
+class Command(ReconcileCommand):
+    """Publish the command to reconcile a fleet's FSU inventories in parallel."""
+
+    help = (
+        "Reconcile the FSUs of a fleet of Devices with directories of inventory files, parsing "
+        "and diffing them in worker processes and writing the changes in batched transactions."
+    )
+
+    def add_arguments(self, parser):
+        """Command-line arguments for the handler."""
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of worker processes parsing and diffing inventories. Defaults to the "
+            "number of CPUs.",
+        )
+
+    def handle(self, *args, **options):
+        """Publish command to reconcile a fleet's FSU inventories."""
+        result = reconcile_fleet(
+            options["paths"],
+            storage_location=self._storage_location(options["storage_location"]),
+            workers=options["workers"],
+            chunk_size=options["chunk_size"],
+            dry_run=options["dry_run"],
+        )
+        self._report(result, options)
+        self.stdout.write(
+            f"Read {result.files} files with {result.workers} workers. Worker time: parse "
+            f"{result.parse_time:.2f}s, diff {result.diff_time:.2f}s. Main process: load "
+            f"{result.load_time:.2f}s, write {result.write_time:.2f}s, with {result.rediffed} "
+            "chunks diffed again after earlier writes."
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{self._summary(result, options)} ({result.devices_per_second:.0f} devices/s)."
+            )
+        )
@@ -0,0 +1,41 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Rebuild the stored per-Device and per-Location FSU counts."""
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from nautobot_fsus.models import FSU_MODELS, FSUCount
+
+
+class Command(BaseCommand):
+    """Publish the command to rebuild the FSU counts."""
+
+    help = "Recalculate the FSU counts shown on the Device and Location FSU tabs."
+
+    def add_arguments(self, parser):
+        """Optional command-line arguments for the handler."""
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='The database to use. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        """Publish command to rebuild the FSU counts."""
+        self.stdout.write("Rebuilding FSU counts...")
+        total = FSUCount.objects.using(options["database"]).rebuild(FSU_MODELS)
+        self.stdout.write(self.style.SUCCESS(f"Stored {total} FSU counts."))
@@ -0,0 +1,41 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Rebuild the stored counts of spare FSUs."""
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from nautobot_fsus.models import FSU_MODELS, FSUSpareCount
+
+
+class Command(BaseCommand):
+    """Publish the command to rebuild the FSU spare counts."""
+
+    help = "Recalculate the counts of spare FSUs rolled up the Location tree."
+
+    def add_arguments(self, parser):
+        """Optional command-line arguments for the handler."""
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='The database to use. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        """Publish command to rebuild the FSU spare counts."""
+        self.stdout.write("Rebuilding FSU spare counts...")
+        total = FSUSpareCount.objects.using(options["database"]).rebuild(FSU_MODELS)
+        self.stdout.write(self.style.SUCCESS(f"Stored {total} FSU spare counts."))
@@ -0,0 +1,55 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Rebuild the stored FSU firmware and driver version keys."""
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+from nautobot_fsus.models import FSU_MODELS
+from nautobot_fsus.models.mixins import rebuild_version_keys
+
+
+class Command(BaseCommand):
+    """Publish the command to rebuild the FSU version keys."""
+
+    help = "Recalculate the keys used to sort and filter FSUs by firmware and driver version."
+
+    def add_arguments(self, parser):
+        """Optional command-line arguments for the handler."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of FSUs to update per query. Defaults to 1000.",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help='The database to use. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        """Publish command to rebuild the FSU version keys."""
+        self.stdout.write("Rebuilding FSU version keys...")
+        total = 0
+        for model in FSU_MODELS:
+            updated = rebuild_version_keys(
+                model.objects.using(options["database"]), batch_size=options["batch_size"]
+            )
+            if updated:
+                self.stdout.write(f"  {model._meta.verbose_name_plural}: {updated}")
+            total += updated
+        self.stdout.write(self.style.SUCCESS(f"Updated the version keys of {total} FSUs."))
@@ -0,0 +1,101 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Reconcile the FSUs of Devices with their observed hardware inventory."""
+
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from nautobot.dcim.models import Location
+
+from nautobot_fsus.utilities.reconcile import (
+    ReconcileResult,
+    read_observed_inventories,
+    reconcile_inventories,
+)
+
+
+class Command(BaseCommand):
+    """Publish the command to reconcile Device FSUs with observed inventories."""
+
+    help = (
+        "Reconcile the FSUs of Devices with observed inventories, read from JSON or NDJSON files "
+        "in the shape of the Device inventory API."
+    )
+
+    def add_arguments(self, parser):
+        """Command-line arguments for the handler."""
+        parser.add_argument(
+            "paths",
+            nargs="+",
+            help="Inventory files, or directories of them, to reconcile.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of Devices to load and update together.",
+        )
+        parser.add_argument(
+            "--storage-location",
+            help="Name of the Location to store FSUs no longer observed in a Device. Defaults "
+            "to the Location of the Device.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the changes without applying them.",
+        )
+
+    def handle(self, *args, **options):
+        """Publish command to reconcile Device FSUs."""
+        result = reconcile_inventories(
+            read_observed_inventories(options["paths"]),
+            storage_location=self._storage_location(options["storage_location"]),
+            chunk_size=options["chunk_size"],
+            dry_run=options["dry_run"],
+        )
+        self._report(result, options)
+        self.stdout.write(self.style.SUCCESS(f"{self._summary(result, options)}."))
+
+    @staticmethod
+    def _storage_location(name: str | None) -> Location | None:
+        """Look up the storage Location by name."""
+        if not name:
+            return None
+        locations = list(Location.objects.filter(name=name)[:2])
+        if len(locations) != 1:
+            problem = "matches more than one Location" if locations else "not found"
+            raise CommandError(f"Storage location {name!r} {problem}.")
+        return locations[0]
+
+    def _report(self, result: ReconcileResult, options: dict[str, Any]) -> None:
+        """Write the changes, at verbosity 2 and above, and the errors."""
+        if options["verbosity"] > 1:
+            for device_name, action, model_name, fsu_name in result.changes:
+                self.stdout.write(f"{device_name}: {action} {model_name} {fsu_name}")
+        for device_ref, message in result.errors:
+            self.stderr.write(f"{device_ref}: {message}")
+
+    @staticmethod
+    def _summary(result: ReconcileResult, options: dict[str, Any]) -> str:
+        """Summarize the changes made."""
+        verb = "Would reconcile" if options["dry_run"] else "Reconciled"
+        return (
+            f"{verb} {result.devices} devices in {result.elapsed:.2f}s: "
+            f"{result.created} created, {result.updated} updated, {result.moved} moved, "
+            f"{result.stored} stored, {result.reparented} reparented, "
+            f"{result.unchanged} unchanged, {len(result.errors)} errors"
+        )
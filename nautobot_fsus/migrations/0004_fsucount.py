@@ -0,0 +1,126 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import uuid
+
+from django.db import migrations, models
+from django.db.models import Count, deletion
+
+FSU_MODEL_NAMES = (
+    "CPU",
+    "Disk",
+    "Fan",
+    "GPU",
+    "GPUBaseboard",
+    "HBA",
+    "Mainboard",
+    "NIC",
+    "OtherFSU",
+    "PSU",
+    "RAMModule",
+)
+
+
+def populate_fsu_counts(apps, *args, **kwargs):
+    """Calculate the initial FSU counts for existing Devices and Locations."""
+    content_type = apps.get_model("contenttypes", "ContentType")
+    fsu_count = apps.get_model("nautobot_fsus", "FSUCount")
+
+    for model_name in FSU_MODEL_NAMES:
+        model = apps.get_model("nautobot_fsus", model_name)
+        if not model.objects.exists():
+            continue
+
+        model_content_type = content_type.objects.get_for_model(model)
+        for field_name in ("device", "location"):
+            counts = (
+                model.objects.filter(**{f"{field_name}__isnull": False})
+                .order_by()
+                .values_list(field_name)
+                .annotate(total=Count("pk"))
+            )
+            fsu_count.objects.bulk_create(
+                [
+                    fsu_count(
+                        **{f"{field_name}_id": pk},
+                        fsu_content_type=model_content_type,
+                        count=total,
+                    )
+                    for pk, total in counts
+                ],
+                batch_size=1000,
+            )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("dcim", "0023_interface_redundancy_group_data_migration"),
+        ("nautobot_fsus", "0003_auto_20240816_2107"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FSUCount",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "device",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=deletion.CASCADE,
+                        related_name="+",
+                        to="dcim.device",
+                    ),
+                ),
+                (
+                    "fsu_content_type",
+                    models.ForeignKey(
+                        on_delete=deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "location",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=deletion.CASCADE,
+                        related_name="+",
+                        to="dcim.location",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {
+                    ("device", "fsu_content_type"),
+                    ("location", "fsu_content_type"),
+                },
+            },
+        ),
+        migrations.RunPython(populate_fsu_counts, migrations.RunPython.noop),
+    ]
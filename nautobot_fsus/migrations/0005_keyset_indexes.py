@@ -0,0 +1,196 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_fsus", "0004_fsucount"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cpu",
+            index=models.Index(fields=["device", "location", "_name", "id"], name="fsus_cpu_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="cputemplate",
+            index=models.Index(fields=["device_type", "_name", "id"], name="fsus_cputemplate_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="cputype",
+            index=models.Index(
+                fields=["manufacturer", "_name", "part_number", "id"], name="fsus_cputype_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="disk",
+            index=models.Index(fields=["device", "location", "_name", "id"], name="fsus_disk_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="disktemplate",
+            index=models.Index(fields=["device_type", "_name", "id"], name="fsus_disktemplate_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="disktype",
+            index=models.Index(
+                fields=["manufacturer", "_name", "part_number", "id"], name="fsus_disktype_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="fan",
+            index=models.Index(fields=["device", "location", "_name", "id"], name="fsus_fan_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="fantemplate",
+            index=models.Index(fields=["device_type", "_name", "id"], name="fsus_fantemplate_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="fantype",
+            index=models.Index(
+                fields=["manufacturer", "_name", "part_number", "id"], name="fsus_fantype_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gpu",
+            index=models.Index(fields=["device", "location", "_name", "id"], name="fsus_gpu_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="gpubaseboard",
+            index=models.Index(
+                fields=["device", "location", "_name", "id"], name="fsus_gpubaseboard_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gpubaseboardtemplate",
+            index=models.Index(
+                fields=["device_type", "_name", "id"], name="fsus_gpubaseboardtemplate_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gpubaseboardtype",
+            index=models.Index(
+                fields=["manufacturer", "_name", "part_number", "id"],
+                name="fsus_gpubaseboardtype_ks",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gputemplate",
+            index=models.Index(fields=["device_type", "_name", "id"], name="fsus_gputemplate_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="gputype",
+            index=models.Index(
+                fields=["manufacturer", "_name", "part_number", "id"], name="fsus_gputype_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="hba",
+            index=models.Index(fields=["device", "location", "_name", "id"], name="fsus_hba_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="hbatemplate",
+            index=models.Index(fields=["device_type", "_name", "id"], name="fsus_hbatemplate_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="hbatype",
+            index=models.Index(
+                fields=["manufacturer", "_name", "part_number", "id"], name="fsus_hbatype_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mainboard",
+            index=models.Index(
+                fields=["device", "location", "_name", "id"], name="fsus_mainboard_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mainboardtemplate",
+            index=models.Index(
+                fields=["device_type", "_name", "id"], name="fsus_mainboardtemplate_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mainboardtype",
+            index=models.Index(
+                fields=["manufacturer", "_name", "part_number", "id"], name="fsus_mainboardtype_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="nic",
+            index=models.Index(fields=["device", "location", "_name", "id"], name="fsus_nic_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="nictemplate",
+            index=models.Index(fields=["device_type", "_name", "id"], name="fsus_nictemplate_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="nictype",
+            index=models.Index(
+                fields=["manufacturer", "_name", "part_number", "id"], name="fsus_nictype_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="otherfsu",
+            index=models.Index(
+                fields=["device", "location", "_name", "id"], name="fsus_otherfsu_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="otherfsutemplate",
+            index=models.Index(
+                fields=["device_type", "_name", "id"], name="fsus_otherfsutemplate_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="otherfsutype",
+            index=models.Index(
+                fields=["manufacturer", "_name", "part_number", "id"], name="fsus_otherfsutype_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="psu",
+            index=models.Index(fields=["device", "location", "_name", "id"], name="fsus_psu_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="psutemplate",
+            index=models.Index(fields=["device_type", "_name", "id"], name="fsus_psutemplate_ks"),
+        ),
+        migrations.AddIndex(
+            model_name="psutype",
+            index=models.Index(
+                fields=["manufacturer", "_name", "part_number", "id"], name="fsus_psutype_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rammodule",
+            index=models.Index(
+                fields=["device", "location", "_name", "id"], name="fsus_rammodule_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rammoduletemplate",
+            index=models.Index(
+                fields=["device_type", "_name", "id"], name="fsus_rammoduletemplate_ks"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rammoduletype",
+            index=models.Index(
+                fields=["manufacturer", "_name", "part_number", "id"], name="fsus_rammoduletype_ks"
+            ),
+        ),
+    ]
@@ -0,0 +1,124 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import uuid
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+FSU_MODEL_NAMES = (
+    "CPU",
+    "Disk",
+    "Fan",
+    "GPU",
+    "GPUBaseboard",
+    "HBA",
+    "Mainboard",
+    "NIC",
+    "OtherFSU",
+    "PSU",
+    "RAMModule",
+)
+INDEXED_FIELDS = ("name", "serial_number", "asset_tag", "device_id", "location_id")
+
+
+def populate_serial_index(apps, *args, **kwargs):
+    """Index the serial numbers and asset tags of existing FSUs."""
+    content_type = apps.get_model("contenttypes", "ContentType")
+    serial_index = apps.get_model("nautobot_fsus", "FSUSerialIndex")
+
+    for model_name in FSU_MODEL_NAMES:
+        model = apps.get_model("nautobot_fsus", model_name)
+        if not model.objects.exists():
+            continue
+
+        model_content_type = content_type.objects.get_for_model(model)
+        serial_index.objects.bulk_create(
+            [
+                serial_index(
+                    fsu_content_type=model_content_type,
+                    fsu_id=fsu_id,
+                    **dict(zip(INDEXED_FIELDS, values, strict=True)),
+                )
+                for fsu_id, *values in model.objects.exclude(serial_number="", asset_tag="")
+                .values_list("pk", *INDEXED_FIELDS)
+                .iterator()
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("dcim", "0023_interface_redundancy_group_data_migration"),
+        ("nautobot_fsus", "0006_fsuimport"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FSUSerialIndex",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("fsu_id", models.UUIDField()),
+                ("name", models.CharField(max_length=100)),
+                ("serial_number", models.CharField(blank=True, db_index=True, max_length=255)),
+                ("asset_tag", models.CharField(blank=True, db_index=True, max_length=255)),
+                (
+                    "device",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="dcim.device",
+                    ),
+                ),
+                (
+                    "fsu_content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "location",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="dcim.location",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "FSU serial index entry",
+                "verbose_name_plural": "FSU serial index entries",
+                "unique_together": {("fsu_content_type", "fsu_id")},
+            },
+        ),
+        migrations.RunPython(populate_serial_index, migrations.RunPython.noop),
+    ]
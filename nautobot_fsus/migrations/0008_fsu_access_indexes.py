@@ -0,0 +1,297 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_fsus", "0007_fsuserialindex"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="cpu",
+            index=models.Index(fields=["device", "_name"], name="fsus_cpu_device"),
+        ),
+        migrations.AddIndex(
+            model_name="cpu",
+            index=models.Index(fields=["location", "_name"], name="fsus_cpu_location"),
+        ),
+        migrations.AddIndex(
+            model_name="cpu",
+            index=models.Index(fields=["fsu_type", "status"], name="fsus_cpu_type_status"),
+        ),
+        migrations.AddIndex(
+            model_name="cpu",
+            index=models.Index(fields=["fsu_type", "firmware_version"], name="fsus_cpu_type_fw"),
+        ),
+        migrations.AddIndex(
+            model_name="cpu",
+            index=models.Index(
+                condition=models.Q(("location__isnull", False)),
+                fields=["location", "status", "_name"],
+                name="fsus_cpu_spares",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="disk",
+            index=models.Index(fields=["device", "_name"], name="fsus_disk_device"),
+        ),
+        migrations.AddIndex(
+            model_name="disk",
+            index=models.Index(fields=["location", "_name"], name="fsus_disk_location"),
+        ),
+        migrations.AddIndex(
+            model_name="disk",
+            index=models.Index(fields=["fsu_type", "status"], name="fsus_disk_type_status"),
+        ),
+        migrations.AddIndex(
+            model_name="disk",
+            index=models.Index(fields=["fsu_type", "firmware_version"], name="fsus_disk_type_fw"),
+        ),
+        migrations.AddIndex(
+            model_name="disk",
+            index=models.Index(
+                condition=models.Q(("location__isnull", False)),
+                fields=["location", "status", "_name"],
+                name="fsus_disk_spares",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="fan",
+            index=models.Index(fields=["device", "_name"], name="fsus_fan_device"),
+        ),
+        migrations.AddIndex(
+            model_name="fan",
+            index=models.Index(fields=["location", "_name"], name="fsus_fan_location"),
+        ),
+        migrations.AddIndex(
+            model_name="fan",
+            index=models.Index(fields=["fsu_type", "status"], name="fsus_fan_type_status"),
+        ),
+        migrations.AddIndex(
+            model_name="fan",
+            index=models.Index(fields=["fsu_type", "firmware_version"], name="fsus_fan_type_fw"),
+        ),
+        migrations.AddIndex(
+            model_name="fan",
+            index=models.Index(
+                condition=models.Q(("location__isnull", False)),
+                fields=["location", "status", "_name"],
+                name="fsus_fan_spares",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gpu",
+            index=models.Index(fields=["device", "_name"], name="fsus_gpu_device"),
+        ),
+        migrations.AddIndex(
+            model_name="gpu",
+            index=models.Index(fields=["location", "_name"], name="fsus_gpu_location"),
+        ),
+        migrations.AddIndex(
+            model_name="gpu",
+            index=models.Index(fields=["fsu_type", "status"], name="fsus_gpu_type_status"),
+        ),
+        migrations.AddIndex(
+            model_name="gpu",
+            index=models.Index(fields=["fsu_type", "firmware_version"], name="fsus_gpu_type_fw"),
+        ),
+        migrations.AddIndex(
+            model_name="gpu",
+            index=models.Index(
+                condition=models.Q(("location__isnull", False)),
+                fields=["location", "status", "_name"],
+                name="fsus_gpu_spares",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gpubaseboard",
+            index=models.Index(fields=["device", "_name"], name="fsus_gpubaseboard_device"),
+        ),
+        migrations.AddIndex(
+            model_name="gpubaseboard",
+            index=models.Index(fields=["location", "_name"], name="fsus_gpubaseboard_location"),
+        ),
+        migrations.AddIndex(
+            model_name="gpubaseboard",
+            index=models.Index(fields=["fsu_type", "status"], name="fsus_gpubaseboard_type_status"),
+        ),
+        migrations.AddIndex(
+            model_name="gpubaseboard",
+            index=models.Index(
+                fields=["fsu_type", "firmware_version"], name="fsus_gpubaseboard_type_fw"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="gpubaseboard",
+            index=models.Index(
+                condition=models.Q(("location__isnull", False)),
+                fields=["location", "status", "_name"],
+                name="fsus_gpubaseboard_spares",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="hba",
+            index=models.Index(fields=["device", "_name"], name="fsus_hba_device"),
+        ),
+        migrations.AddIndex(
+            model_name="hba",
+            index=models.Index(fields=["location", "_name"], name="fsus_hba_location"),
+        ),
+        migrations.AddIndex(
+            model_name="hba",
+            index=models.Index(fields=["fsu_type", "status"], name="fsus_hba_type_status"),
+        ),
+        migrations.AddIndex(
+            model_name="hba",
+            index=models.Index(fields=["fsu_type", "firmware_version"], name="fsus_hba_type_fw"),
+        ),
+        migrations.AddIndex(
+            model_name="hba",
+            index=models.Index(
+                condition=models.Q(("location__isnull", False)),
+                fields=["location", "status", "_name"],
+                name="fsus_hba_spares",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mainboard",
+            index=models.Index(fields=["device", "_name"], name="fsus_mainboard_device"),
+        ),
+        migrations.AddIndex(
+            model_name="mainboard",
+            index=models.Index(fields=["location", "_name"], name="fsus_mainboard_location"),
+        ),
+        migrations.AddIndex(
+            model_name="mainboard",
+            index=models.Index(fields=["fsu_type", "status"], name="fsus_mainboard_type_status"),
+        ),
+        migrations.AddIndex(
+            model_name="mainboard",
+            index=models.Index(
+                fields=["fsu_type", "firmware_version"], name="fsus_mainboard_type_fw"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mainboard",
+            index=models.Index(
+                condition=models.Q(("location__isnull", False)),
+                fields=["location", "status", "_name"],
+                name="fsus_mainboard_spares",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="nic",
+            index=models.Index(fields=["device", "_name"], name="fsus_nic_device"),
+        ),
+        migrations.AddIndex(
+            model_name="nic",
+            index=models.Index(fields=["location", "_name"], name="fsus_nic_location"),
+        ),
+        migrations.AddIndex(
+            model_name="nic",
+            index=models.Index(fields=["fsu_type", "status"], name="fsus_nic_type_status"),
+        ),
+        migrations.AddIndex(
+            model_name="nic",
+            index=models.Index(fields=["fsu_type", "firmware_version"], name="fsus_nic_type_fw"),
+        ),
+        migrations.AddIndex(
+            model_name="nic",
+            index=models.Index(
+                condition=models.Q(("location__isnull", False)),
+                fields=["location", "status", "_name"],
+                name="fsus_nic_spares",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="otherfsu",
+            index=models.Index(fields=["device", "_name"], name="fsus_otherfsu_device"),
+        ),
+        migrations.AddIndex(
+            model_name="otherfsu",
+            index=models.Index(fields=["location", "_name"], name="fsus_otherfsu_location"),
+        ),
+        migrations.AddIndex(
+            model_name="otherfsu",
+            index=models.Index(fields=["fsu_type", "status"], name="fsus_otherfsu_type_status"),
+        ),
+        migrations.AddIndex(
+            model_name="otherfsu",
+            index=models.Index(
+                fields=["fsu_type", "firmware_version"], name="fsus_otherfsu_type_fw"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="otherfsu",
+            index=models.Index(
+                condition=models.Q(("location__isnull", False)),
+                fields=["location", "status", "_name"],
+                name="fsus_otherfsu_spares",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="psu",
+            index=models.Index(fields=["device", "_name"], name="fsus_psu_device"),
+        ),
+        migrations.AddIndex(
+            model_name="psu",
+            index=models.Index(fields=["location", "_name"], name="fsus_psu_location"),
+        ),
+        migrations.AddIndex(
+            model_name="psu",
+            index=models.Index(fields=["fsu_type", "status"], name="fsus_psu_type_status"),
+        ),
+        migrations.AddIndex(
+            model_name="psu",
+            index=models.Index(fields=["fsu_type", "firmware_version"], name="fsus_psu_type_fw"),
+        ),
+        migrations.AddIndex(
+            model_name="psu",
+            index=models.Index(
+                condition=models.Q(("location__isnull", False)),
+                fields=["location", "status", "_name"],
+                name="fsus_psu_spares",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rammodule",
+            index=models.Index(fields=["device", "_name"], name="fsus_rammodule_device"),
+        ),
+        migrations.AddIndex(
+            model_name="rammodule",
+            index=models.Index(fields=["location", "_name"], name="fsus_rammodule_location"),
+        ),
+        migrations.AddIndex(
+            model_name="rammodule",
+            index=models.Index(fields=["fsu_type", "status"], name="fsus_rammodule_type_status"),
+        ),
+        migrations.AddIndex(
+            model_name="rammodule",
+            index=models.Index(
+                fields=["fsu_type", "firmware_version"], name="fsus_rammodule_type_fw"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rammodule",
+            index=models.Index(
+                condition=models.Q(("location__isnull", False)),
+                fields=["location", "status", "_name"],
+                name="fsus_rammodule_spares",
+            ),
+        ),
+    ]
@@ -0,0 +1,78 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import logging
+
+from django.db import DatabaseError, migrations, transaction
+
+logger = logging.getLogger("nautobot.plugin.fsus")
+
+FSU_MODEL_NAMES = [
+    "cpu",
+    "disk",
+    "fan",
+    "gpu",
+    "gpubaseboard",
+    "hba",
+    "mainboard",
+    "nic",
+    "otherfsu",
+    "psu",
+    "rammodule",
+]
+
+# The FSU fields searched by the `q` filter, other than the FSU type name.
+SEARCH_COLUMNS = ["name", "serial_number", "firmware_version", "driver_name", "driver_version"]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Enable pg_trgm, if possible, and index the searched columns of each FSU table."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DatabaseError as error:
+        logger.warning(
+            "Unable to enable the pg_trgm extension, FSU searches will not be indexed: %s", error
+        )
+        return
+
+    columns = ", ".join(f"UPPER({column}) gin_trgm_ops" for column in SEARCH_COLUMNS)
+    for model_name in FSU_MODEL_NAMES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS fsus_{model_name}_trgm "
+            f"ON nautobot_fsus_{model_name} USING gin ({columns})"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """Drop the trigram indexes, leaving the pg_trgm extension in place."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for model_name in FSU_MODEL_NAMES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS fsus_{model_name}_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_fsus", "0008_fsu_access_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,294 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from django.db import migrations
+import nautobot.core.models.fields
+
+import nautobot_fsus.models.mixins
+
+FSU_MODEL_NAMES = (
+    "CPU",
+    "Disk",
+    "Fan",
+    "GPU",
+    "GPUBaseboard",
+    "HBA",
+    "Mainboard",
+    "NIC",
+    "OtherFSU",
+    "PSU",
+    "RAMModule",
+)
+
+
+def populate_version_keys(apps, *args, **kwargs):
+    """Set the version keys of existing FSUs."""
+    for model_name in FSU_MODEL_NAMES:
+        model = apps.get_model("nautobot_fsus", model_name)
+        nautobot_fsus.models.mixins.rebuild_version_keys(
+            model.objects.exclude(firmware_version="", driver_version="")
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_fsus", "0009_fsu_trigram_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cpu",
+            name="_driver_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "driver_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="cpu",
+            name="_firmware_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "firmware_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="disk",
+            name="_driver_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "driver_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="disk",
+            name="_firmware_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "firmware_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="fan",
+            name="_driver_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "driver_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="fan",
+            name="_firmware_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "firmware_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="gpu",
+            name="_driver_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "driver_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="gpu",
+            name="_firmware_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "firmware_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="gpubaseboard",
+            name="_driver_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "driver_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="gpubaseboard",
+            name="_firmware_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "firmware_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="hba",
+            name="_driver_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "driver_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="hba",
+            name="_firmware_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "firmware_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="mainboard",
+            name="_driver_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "driver_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="mainboard",
+            name="_firmware_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "firmware_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="nic",
+            name="_driver_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "driver_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="nic",
+            name="_firmware_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "firmware_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="otherfsu",
+            name="_driver_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "driver_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="otherfsu",
+            name="_firmware_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "firmware_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="psu",
+            name="_driver_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "driver_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="psu",
+            name="_firmware_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "firmware_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="rammodule",
+            name="_driver_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "driver_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.AddField(
+            model_name="rammodule",
+            name="_firmware_version",
+            field=nautobot.core.models.fields.NaturalOrderingField(
+                "firmware_version",
+                blank=True,
+                db_index=True,
+                max_length=255,
+                naturalize_function=nautobot_fsus.models.mixins.naturalize_version,
+            ),
+        ),
+        migrations.RunPython(populate_version_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,235 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import uuid
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+from django.db.models.functions import Coalesce
+
+FSU_MODEL_NAMES = (
+    "CPU",
+    "Disk",
+    "Fan",
+    "GPU",
+    "GPUBaseboard",
+    "HBA",
+    "Mainboard",
+    "NIC",
+    "OtherFSU",
+    "PSU",
+    "RAMModule",
+)
+COUNT_FIELDS = ("fsu_type_id", "location_id", "firmware_version", "driver_version")
+
+
+def populate_version_counts(apps, *args, **kwargs):
+    """Count the firmware and driver versions of existing FSUs."""
+    content_type = apps.get_model("contenttypes", "ContentType")
+    version_count = apps.get_model("nautobot_fsus", "FSUVersionCount")
+
+    for model_name in FSU_MODEL_NAMES:
+        model = apps.get_model("nautobot_fsus", model_name)
+        if not model.objects.exists():
+            continue
+
+        model_content_type = content_type.objects.get_for_model(model)
+        counts = (
+            model.objects.annotate(count_location=Coalesce("device__location_id", "location_id"))
+            .filter(count_location__isnull=False)
+            .order_by()
+            .values_list("fsu_type_id", "count_location", "firmware_version", "driver_version")
+            .annotate(total=Count("pk"))
+        )
+        version_count.objects.bulk_create(
+            [
+                version_count(
+                    fsu_content_type=model_content_type,
+                    count=total,
+                    **dict(zip(COUNT_FIELDS, values, strict=True)),
+                )
+                for *values, total in counts
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("dcim", "0023_interface_redundancy_group_data_migration"),
+        ("nautobot_fsus", "0010_fsu_version_keys"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="cputype",
+            name="target_driver_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="cputype",
+            name="target_firmware_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="disktype",
+            name="target_driver_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="disktype",
+            name="target_firmware_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="fantype",
+            name="target_driver_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="fantype",
+            name="target_firmware_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="gpubaseboardtype",
+            name="target_driver_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="gpubaseboardtype",
+            name="target_firmware_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="gputype",
+            name="target_driver_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="gputype",
+            name="target_firmware_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="hbatype",
+            name="target_driver_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="hbatype",
+            name="target_firmware_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="mainboardtype",
+            name="target_driver_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="mainboardtype",
+            name="target_firmware_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="nictype",
+            name="target_driver_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="nictype",
+            name="target_firmware_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="otherfsutype",
+            name="target_driver_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="otherfsutype",
+            name="target_firmware_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="psutype",
+            name="target_driver_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="psutype",
+            name="target_firmware_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="rammoduletype",
+            name="target_driver_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.AddField(
+            model_name="rammoduletype",
+            name="target_firmware_version",
+            field=models.CharField(blank=True, max_length=32),
+        ),
+        migrations.CreateModel(
+            name="FSUVersionCount",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("fsu_type_id", models.UUIDField()),
+                ("firmware_version", models.CharField(blank=True, max_length=32)),
+                ("driver_version", models.CharField(blank=True, max_length=32)),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "fsu_content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "location",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="dcim.location",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {
+                    (
+                        "fsu_content_type",
+                        "fsu_type_id",
+                        "location",
+                        "firmware_version",
+                        "driver_version",
+                    )
+                },
+            },
+        ),
+        migrations.RunPython(populate_version_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,135 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from collections import Counter
+import uuid
+
+from django.db import migrations, models
+from django.db.models import Count
+import django.db.models.deletion
+
+FSU_MODEL_NAMES = (
+    "CPU",
+    "Disk",
+    "Fan",
+    "GPU",
+    "GPUBaseboard",
+    "HBA",
+    "Mainboard",
+    "NIC",
+    "OtherFSU",
+    "PSU",
+    "RAMModule",
+)
+
+
+def populate_spare_counts(apps, *args, **kwargs):
+    """Count the spares of existing FSUs at their Locations and every Location above them."""
+    content_type = apps.get_model("contenttypes", "ContentType")
+    location = apps.get_model("dcim", "Location")
+    spare_count = apps.get_model("nautobot_fsus", "FSUSpareCount")
+    parents = None
+
+    for model_name in FSU_MODEL_NAMES:
+        model = apps.get_model("nautobot_fsus", model_name)
+        spares = (
+            model.objects.filter(device__isnull=True, location__isnull=False)
+            .order_by()
+            .values_list("location_id", "fsu_type_id", "status_id")
+            .annotate(total=Count("pk"))
+        )
+        if not spares.exists():
+            continue
+
+        if parents is None:
+            parents = dict(location.objects.values_list("pk", "parent_id"))
+        rollup = Counter()
+        for location_id, fsu_type_id, status_id, total in spares:
+            ancestor_id = location_id
+            while ancestor_id is not None:
+                rollup[(ancestor_id, fsu_type_id, status_id)] += total
+                ancestor_id = parents.get(ancestor_id)
+
+        model_content_type = content_type.objects.get_for_model(model)
+        spare_count.objects.bulk_create(
+            [
+                spare_count(
+                    location_id=location_id,
+                    fsu_content_type=model_content_type,
+                    fsu_type_id=fsu_type_id,
+                    status_id=status_id,
+                    count=total,
+                )
+                for (location_id, fsu_type_id, status_id), total in rollup.items()
+            ],
+            batch_size=1000,
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("dcim", "0023_interface_redundancy_group_data_migration"),
+        ("extras", "0058_jobresult_add_time_status_idxs"),
+        ("nautobot_fsus", "0011_fsu_firmware_compliance"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FSUSpareCount",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        unique=True,
+                    ),
+                ),
+                ("fsu_type_id", models.UUIDField()),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "fsu_content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+                (
+                    "location",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="dcim.location",
+                    ),
+                ),
+                (
+                    "status",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="extras.status",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("location", "fsu_content_type", "fsu_type_id", "status")},
+            },
+        ),
+        migrations.RunPython(populate_spare_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,59 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+# Parent FSU models with a used slot count, their count field, and their children.
+SLOT_COUNTS = (
+    ("GPUBaseboard", "gpu_count", "GPU", "parent_gpubaseboard"),
+    ("Mainboard", "cpu_count", "CPU", "parent_mainboard"),
+)
+
+
+def populate_slot_counts(apps, *args, **kwargs):
+    """Count the children already assigned to each GPU Baseboard and Mainboard."""
+    for parent_name, count_field, child_name, parent_field in SLOT_COUNTS:
+        parent_model = apps.get_model("nautobot_fsus", parent_name)
+        child_model = apps.get_model("nautobot_fsus", child_name)
+        counts = (
+            child_model.objects.filter(**{parent_field: OuterRef("pk")})
+            .order_by()
+            .values(parent_field)
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        parent_model.objects.update(**{count_field: Coalesce(Subquery(counts), 0)})
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_fsus", "0012_fsu_spare_counts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="gpubaseboard",
+            name="gpu_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="mainboard",
+            name="cpu_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_slot_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from django.db import migrations
+
+import nautobot_fsus.models.mixins
+
+FSU_MODEL_NAMES = (
+    "CPU",
+    "Disk",
+    "Fan",
+    "GPU",
+    "GPUBaseboard",
+    "HBA",
+    "Mainboard",
+    "NIC",
+    "OtherFSU",
+    "PSU",
+    "RAMModule",
+)
+
+
+def rebuild_version_keys(apps, *args, **kwargs):
+    """Rebuild the version keys of existing FSUs with length-prefixed numeric components."""
+    for model_name in FSU_MODEL_NAMES:
+        model = apps.get_model("nautobot_fsus", model_name)
+        nautobot_fsus.models.mixins.rebuild_version_keys(
+            model.objects.exclude(firmware_version="", driver_version="")
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_fsus", "0013_fsu_slot_counts"),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_version_keys, migrations.RunPython.noop),
+    ]
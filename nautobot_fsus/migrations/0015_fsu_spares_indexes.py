@@ -0,0 +1,69 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from django.db import migrations
+
+FSU_MODEL_NAMES = [
+    "cpu",
+    "disk",
+    "fan",
+    "gpu",
+    "gpubaseboard",
+    "hba",
+    "mainboard",
+    "nic",
+    "otherfsu",
+    "psu",
+    "rammodule",
+]
+
+
+def create_spares_indexes(apps, schema_editor):
+    """Index the spares of each FSU table, FSUs stored at a Location, on PostgreSQL."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for model_name in FSU_MODEL_NAMES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS fsus_{model_name}_spares "
+            f"ON nautobot_fsus_{model_name} (location_id, status_id, _name) "
+            "WHERE location_id IS NOT NULL"
+        )
+
+
+def drop_spares_indexes(apps, schema_editor):
+    """Drop the spares indexes."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for model_name in FSU_MODEL_NAMES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS fsus_{model_name}_spares")
+
+
+# Databases without partial indexes, such as MySQL, ignore the condition of an index in the model
+# Meta, creating a near duplicate of the location index and failing system check models.W037. The
+# spares indexes are dropped from every database and recreated on PostgreSQL only.
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_fsus", "0014_fsu_version_key_lengths"),
+    ]
+
+    operations = [
+        *(
+            migrations.RemoveIndex(model_name=model_name, name=f"fsus_{model_name}_spares")
+            for model_name in FSU_MODEL_NAMES
+        ),
+        migrations.RunPython(create_spares_indexes, drop_spares_indexes),
+    ]
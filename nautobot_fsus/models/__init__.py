@@ -15,6 +15,10 @@
 
 """Object models for Nautobot FSUS."""
 
+from nautobot_fsus.models.fsu_counts import FSUCount
+from nautobot_fsus.models.fsu_imports import FSUImport
+from nautobot_fsus.models.fsu_serial_index import FSUSerialIndex
+from nautobot_fsus.models.fsu_spare_counts import FSUSpareCount
 from nautobot_fsus.models.fsu_templates import (
     CPUTemplate,
     DiskTemplate,
@@ -41,6 +45,7 @@ from nautobot_fsus.models.fsu_types import (
     PSUType,
     RAMModuleType,
 )
+from nautobot_fsus.models.fsu_version_counts import FSUVersionCount
 from nautobot_fsus.models.fsus import (
     CPU,
     GPU,
@@ -55,6 +60,22 @@ from nautobot_fsus.models.fsus import (
     RAMModule,
 )
 
+# Concrete FSU and FSU template models, for code that needs to operate on every kind of FSU.
+FSU_MODELS = (CPU, Disk, Fan, GPU, GPUBaseboard, HBA, Mainboard, NIC, OtherFSU, PSU, RAMModule)
+FSU_TEMPLATE_MODELS = (
+    CPUTemplate,
+    DiskTemplate,
+    FanTemplate,
+    GPUTemplate,
+    GPUBaseboardTemplate,
+    HBATemplate,
+    MainboardTemplate,
+    NICTemplate,
+    OtherFSUTemplate,
+    PSUTemplate,
+    RAMModuleTemplate,
+)
+
 __all__ = (
     "CPU",
     "CPUTemplate",
@@ -65,6 +86,13 @@ __all__ = (
     "Fan",
     "FanTemplate",
     "FanType",
+    "FSU_MODELS",
+    "FSU_TEMPLATE_MODELS",
+    "FSUCount",
+    "FSUImport",
+    "FSUSerialIndex",
+    "FSUSpareCount",
+    "FSUVersionCount",
     "GPUBaseboard",
     "GPUBaseboardTemplate",
     "GPUBaseboardType",
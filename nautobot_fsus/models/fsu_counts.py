@@ -0,0 +1,197 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Denormalized per-parent FSU counts."""
+
+from typing import Iterable
+from uuid import UUID
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, models, transaction
+from django.db.models import Count, ForeignKey
+from nautobot.core.models.generics import BaseModel
+from nautobot.core.models.managers import BaseManager
+from nautobot.core.models.querysets import RestrictedQuerySet
+from nautobot.dcim.models import Device, Location
+
+from nautobot_fsus.models.mixins import FSUModel
+
+
+class FSUCountQuerySet(RestrictedQuerySet):
+    """QuerySet with helpers for reading and maintaining FSU counts."""
+
+    def for_parent(self, parent: Device | Location) -> dict[str, int]:
+        """
+        Return the FSU counts for a Device or Location in a single query.
+
+        Counts are keyed by the related name of the FSU model on the parent, e.g. "cpus".
+        FSU models with no instances on the parent are omitted.
+        """
+        parent_field = "device" if isinstance(parent, Device) else "location"
+        return {
+            f"{model_name}s": count
+            for model_name, count in self.filter(**{parent_field: parent}).values_list(
+                "fsu_content_type__model", "count"
+            )
+        }
+
+    def refresh(
+        self,
+        model: type[FSUModel],
+        device_ids: Iterable[UUID | None] = (),
+        location_ids: Iterable[UUID | None] = (),
+    ) -> None:
+        """
+        Recalculate the counts of an FSU model for the given parent Devices and Locations.
+
+        Uses one aggregate query and one upsert per parent type, so it is suitable for
+        refreshing after bulk operations as well as after a single FSU is saved.
+        """
+        fsu_content_type = ContentType.objects.get_for_model(model)
+
+        for field_name, parent_ids in (("device", device_ids), ("location", location_ids)):
+            pks = {pk for pk in parent_ids if pk is not None}
+            if not pks:
+                continue
+
+            counts: dict[UUID, int] = dict(
+                model.objects.filter(**{f"{field_name}__in": pks})
+                .order_by()
+                .values_list(field_name)
+                .annotate(total=Count("pk"))
+            )
+
+            with transaction.atomic(using=self.db):
+                self.set_counts(model, field_name, counts)
+                if empty := pks - counts.keys():
+                    self.filter(
+                        **{f"{field_name}__in": empty},
+                        fsu_content_type=fsu_content_type,
+                    ).delete()
+
+    def set_counts(self, model: type[FSUModel], field_name: str, counts: dict[UUID, int]) -> None:
+        """
+        Store known counts of an FSU model, without recalculating them.
+
+        Args:
+            model: The FSU model being counted.
+            field_name: Either "device" or "location", the parent type the counts are for.
+            counts: Number of FSUs, keyed by the Device or Location ID.
+        """
+        if not counts:
+            return
+
+        fsu_content_type = ContentType.objects.get_for_model(model)
+        self._upsert(
+            [
+                FSUCount(
+                    **{f"{field_name}_id": pk},
+                    fsu_content_type=fsu_content_type,
+                    count=total,
+                )
+                for pk, total in counts.items()
+            ],
+            unique_fields=[field_name, "fsu_content_type"],
+        )
+
+    def rebuild(self, fsu_models: Iterable[type[FSUModel]], batch_size: int = 1000) -> int:
+        """Discard all stored counts and rebuild them from the FSU tables."""
+        total = 0
+        with transaction.atomic(using=self.db):
+            self.all().delete()
+            for model in fsu_models:
+                fsu_content_type = ContentType.objects.get_for_model(model)
+                for field_name in ("device", "location"):
+                    counts = (
+                        model.objects.filter(**{f"{field_name}__isnull": False})
+                        .order_by()
+                        .values_list(field_name)
+                        .annotate(total=Count("pk"))
+                    )
+                    created = self.bulk_create(
+                        [
+                            FSUCount(
+                                **{f"{field_name}_id": pk},
+                                fsu_content_type=fsu_content_type,
+                                count=count,
+                            )
+                            for pk, count in counts
+                        ],
+                        batch_size=batch_size,
+                    )
+                    total += len(created)
+
+        return total
+
+    def _upsert(self, counts: list["FSUCount"], unique_fields: list[str]) -> None:
+        """Insert new count rows, updating the count of rows that already exist."""
+        # MySQL resolves conflicts against any unique key and rejects an explicit target.
+        if not connections[self.db].features.supports_update_conflicts_with_target:
+            unique_fields = []
+
+        self.bulk_create(
+            counts,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=["count"],
+        )
+
+
+class FSUCount(BaseModel):
+    """
+    Number of FSUs of a single model installed in a Device or stored at a Location.
+
+    The Device and Location FSU tabs need the per-model FSU counts for every page view; reading
+    them from this table takes a single query instead of one COUNT() per FSU model. Rows are
+    maintained by signal handlers on the FSU models, and can be recreated from scratch with the
+    `rebuild_fsu_counts` management command.
+    """
+
+    device: ForeignKey = models.ForeignKey(
+        to="dcim.Device",
+        on_delete=models.CASCADE,
+        related_name="+",
+        blank=True,
+        null=True,
+    )
+
+    location: ForeignKey = models.ForeignKey(
+        to="dcim.Location",
+        on_delete=models.CASCADE,
+        related_name="+",
+        blank=True,
+        null=True,
+    )
+
+    fsu_content_type: ForeignKey = models.ForeignKey(
+        to="contenttypes.ContentType",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    count = models.PositiveIntegerField(default=0)
+
+    objects = BaseManager.from_queryset(FSUCountQuerySet)()
+
+    natural_key_field_names = ["pk"]
+
+    class Meta:
+        """Metaclass attributes."""
+
+        unique_together = [["device", "fsu_content_type"], ["location", "fsu_content_type"]]
+
+    def __str__(self) -> str:
+        """String representation of an FSU count."""
+        return f"{self.device or self.location}: {self.count} {self.fsu_content_type.model}"
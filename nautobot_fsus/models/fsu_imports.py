@@ -0,0 +1,74 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Progress records for background FSU imports."""
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import ForeignKey
+from nautobot.core.models.generics import BaseModel
+from nautobot.core.models.managers import BaseManager
+from nautobot.core.models.querysets import RestrictedQuerySet
+
+
+class FSUImport(BaseModel):
+    """
+    Progress of a background bulk import of FSUs from a file.
+
+    The import Job processes a file in batches, and updates this record in the same transaction
+    as each batch of FSUs is created. If the Job is interrupted, running it again with the same
+    file finds the unfinished record by the file's checksum and continues after the last
+    committed batch.
+    """
+
+    fsu_content_type: ForeignKey = models.ForeignKey(
+        to="contenttypes.ContentType",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    job_result: ForeignKey = models.ForeignKey(
+        to="extras.JobResult",
+        on_delete=models.SET_NULL,
+        related_name="+",
+        blank=True,
+        null=True,
+    )
+
+    file_name = models.CharField(max_length=255, blank=True)
+    checksum = models.CharField(max_length=64, db_index=True)
+    batch_size = models.PositiveIntegerField()
+    total_rows = models.PositiveIntegerField(default=0)
+    processed_rows = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, encoder=DjangoJSONEncoder)
+    completed = models.BooleanField(default=False)
+    started = models.DateTimeField(auto_now_add=True)
+    last_updated = models.DateTimeField(auto_now=True)
+
+    objects = BaseManager.from_queryset(RestrictedQuerySet)()
+
+    natural_key_field_names = ["pk"]
+
+    class Meta:
+        """Metaclass attributes."""
+
+        ordering = ["-started"]
+
+    def __str__(self) -> str:
+        """String representation of an FSU import."""
+        return (
+            f"{self.file_name or self.checksum[:12]}: {self.processed_rows}/{self.total_rows} rows"
+        )
@@ -0,0 +1,182 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Global index of FSU serial numbers and asset tags across all FSU models."""
+
+from typing import Iterable
+from uuid import UUID
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, models, transaction
+from django.db.models import ForeignKey, Q
+from nautobot.core.models.generics import BaseModel
+from nautobot.core.models.managers import BaseManager
+from nautobot.core.models.querysets import RestrictedQuerySet
+
+from nautobot_fsus.models.mixins import FSUModel
+
+# FSU fields copied into the index.
+INDEXED_FIELDS = ("name", "serial_number", "asset_tag", "device_id", "location_id")
+
+
+class FSUSerialIndexQuerySet(RestrictedQuerySet):
+    """QuerySet with helpers for looking up and maintaining the FSU serial number index."""
+
+    def lookup(
+        self,
+        serial_numbers: Iterable[str] = (),
+        asset_tags: Iterable[str] = (),
+    ) -> "FSUSerialIndexQuerySet":
+        """Find the index entries of FSUs of any model by serial number or asset tag."""
+        return self.filter(
+            Q(serial_number__in=set(serial_numbers) - {""})
+            | Q(asset_tag__in=set(asset_tags) - {""})
+        )
+
+    def _entries(self, model: type[FSUModel], queryset: models.QuerySet) -> list["FSUSerialIndex"]:
+        """Build index entries for the FSUs in a queryset that have a serial number or asset tag."""
+        fsu_content_type = ContentType.objects.get_for_model(model)
+        return [
+            FSUSerialIndex(
+                fsu_content_type=fsu_content_type,
+                fsu_id=fsu_id,
+                **dict(zip(INDEXED_FIELDS, values, strict=True)),
+            )
+            for fsu_id, *values in queryset.exclude(serial_number="", asset_tag="")
+            .order_by()
+            .values_list("pk", *INDEXED_FIELDS)
+            .iterator()
+        ]
+
+    def refresh(self, model: type[FSUModel], fsu_ids: Iterable[UUID]) -> None:
+        """
+        Update the index entries of a set of FSUs of one model from the FSU table.
+
+        Uses one query to read the FSUs, one upsert, and one delete for FSUs that no longer
+        exist or have no serial number or asset tag, so it is suitable for refreshing after bulk
+        operations as well as after a single FSU is saved.
+        """
+        fsu_ids = set(fsu_ids)
+        if not fsu_ids:
+            return
+
+        entries = self._entries(model, model.objects.filter(pk__in=fsu_ids))
+        with transaction.atomic(using=self.db):
+            self._upsert(entries)
+            if removed := fsu_ids - {entry.fsu_id for entry in entries}:
+                self.filter(
+                    fsu_content_type=ContentType.objects.get_for_model(model),
+                    fsu_id__in=removed,
+                ).delete()
+
+    def update_fsu(self, fsu: FSUModel) -> None:
+        """Update the index entry of a single saved FSU, without reading it back."""
+        fsu_content_type = ContentType.objects.get_for_model(fsu)
+        if not (fsu.serial_number or fsu.asset_tag):
+            self.filter(fsu_content_type=fsu_content_type, fsu_id=fsu.pk).delete()
+            return
+
+        self._upsert(
+            [
+                FSUSerialIndex(
+                    fsu_content_type=fsu_content_type,
+                    fsu_id=fsu.pk,
+                    **{field_name: getattr(fsu, field_name) for field_name in INDEXED_FIELDS},
+                )
+            ]
+        )
+
+    def rebuild(self, fsu_models: Iterable[type[FSUModel]], batch_size: int = 1000) -> int:
+        """Discard the whole index and rebuild it from the FSU tables."""
+        total = 0
+        with transaction.atomic(using=self.db):
+            self.all().delete()
+            for model in fsu_models:
+                created = self.bulk_create(
+                    self._entries(model, model.objects.all()), batch_size=batch_size
+                )
+                total += len(created)
+
+        return total
+
+    def _upsert(self, entries: list["FSUSerialIndex"]) -> None:
+        """Insert new index entries, updating the entries of FSUs that are already indexed."""
+        if not entries:
+            return
+
+        # MySQL resolves conflicts against any unique key and rejects an explicit target.
+        unique_fields = ["fsu_content_type", "fsu_id"]
+        if not connections[self.db].features.supports_update_conflicts_with_target:
+            unique_fields = []
+
+        self.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=["name", "serial_number", "asset_tag", "device", "location"],
+        )
+
+
+class FSUSerialIndex(BaseModel):
+    """
+    Serial number and asset tag of an FSU of any model, with the FSU's parent.
+
+    Each FSU model has its own table, so finding an FSU by serial number would otherwise take
+    a query per FSU model. Entries are only kept for FSUs with a serial number or asset tag, are
+    maintained by signal handlers on the FSU models, and can be recreated from scratch with the
+    `rebuild_fsu_serial_index` management command.
+    """
+
+    fsu_content_type: ForeignKey = models.ForeignKey(
+        to="contenttypes.ContentType",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    fsu_id = models.UUIDField()
+    name = models.CharField(max_length=100)
+    serial_number = models.CharField(max_length=255, blank=True, db_index=True)
+    asset_tag = models.CharField(max_length=255, blank=True, db_index=True)
+
+    device: ForeignKey = models.ForeignKey(
+        to="dcim.Device",
+        on_delete=models.CASCADE,
+        related_name="+",
+        blank=True,
+        null=True,
+    )
+
+    location: ForeignKey = models.ForeignKey(
+        to="dcim.Location",
+        on_delete=models.CASCADE,
+        related_name="+",
+        blank=True,
+        null=True,
+    )
+
+    objects = BaseManager.from_queryset(FSUSerialIndexQuerySet)()
+
+    natural_key_field_names = ["pk"]
+
+    class Meta:
+        """Metaclass attributes."""
+
+        unique_together = [["fsu_content_type", "fsu_id"]]
+        verbose_name = "FSU serial index entry"
+        verbose_name_plural = "FSU serial index entries"
+
+    def __str__(self) -> str:
+        """String representation of an FSU serial index entry."""
+        return f"{self.serial_number or self.asset_tag}: {self.fsu_content_type.model} {self.name}"
@@ -0,0 +1,244 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Denormalized counts of spare FSUs, rolled up the Location tree."""
+
+from collections import Counter, defaultdict
+from typing import Iterable, Mapping
+from uuid import UUID
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import Count, F, ForeignKey
+from nautobot.core.models.generics import BaseModel
+from nautobot.core.models.managers import BaseManager
+from nautobot.core.models.querysets import RestrictedQuerySet
+from nautobot.dcim.models import Location
+
+from nautobot_fsus.models.mixins import FSUModel
+
+# The Location an FSU is stored at, its FSU type, and its Status, identifying a single count.
+SpareCountKey = tuple[UUID, UUID, UUID]
+
+
+def spare_count_key(fsu: FSUModel) -> SpareCountKey | None:
+    """Return the key of the spare count an FSU is counted in, or None if it is installed."""
+    if fsu.device_id is not None or fsu.location_id is None:
+        return None
+
+    return fsu.location_id, fsu.fsu_type_id, fsu.status_id
+
+
+class FSUSpareCountQuerySet(RestrictedQuerySet):
+    """QuerySet with helpers for maintaining the FSU spare counts."""
+
+    def ancestor_ids(self, location_ids: Iterable[UUID]) -> dict[UUID, list[UUID]]:
+        """
+        Look up the IDs of the Locations that each Location is in, including itself.
+
+        The parents of all the Locations are read together, one level of the tree at a time, so
+        this takes one query per level rather than one per Location.
+        """
+        location_ids = {location_id for location_id in location_ids if location_id is not None}
+        parents: dict[UUID, UUID | None] = {}
+        pending = set(location_ids)
+        while pending:
+            level = dict(
+                Location.objects.using(self.db)
+                .filter(pk__in=pending)
+                .values_list("pk", "parent_id")
+            )
+            parents.update(level)
+            pending = {parent_id for parent_id in level.values() if parent_id is not None}
+            pending.difference_update(parents)
+
+        ancestors: dict[UUID, list[UUID]] = {}
+        for location_id in location_ids:
+            path = []
+            ancestor_id = location_id
+            while ancestor_id in parents:
+                path.append(ancestor_id)
+                ancestor_id = parents[ancestor_id]
+            if path:
+                ancestors[location_id] = path
+
+        return ancestors
+
+    def adjust(self, model: type[FSUModel], deltas: Mapping[SpareCountKey, int]) -> None:
+        """
+        Add to, or subtract from, the spare counts of an FSU model, up the Location tree.
+
+        Each change is applied to the count at the given Location and at every Location above
+        it. Changes are summed per count first, so moving an FSU within a region leaves the
+        region's count alone. Missing counts are inserted with a single `INSERT` that ignores
+        the counts that already exist, and counts are then changed with one
+        `UPDATE ... SET count = count + n` for each FSU type, Status, and change, covering all
+        the Locations it applies to. Counts that drop to zero are removed.
+
+        Args:
+            model: The FSU model being counted.
+            deltas: The change to each count, keyed by Location, FSU type, and Status.
+        """
+        ancestors = self.ancestor_ids(key[0] for key, delta in deltas.items() if delta)
+        rollup: Counter = Counter()
+        for (location_id, fsu_type_id, status_id), delta in deltas.items():
+            for ancestor_id in ancestors.get(location_id, []):
+                rollup[(ancestor_id, fsu_type_id, status_id)] += delta
+
+        locations: dict[tuple[UUID, UUID, int], list[UUID]] = defaultdict(list)
+        for (location_id, fsu_type_id, status_id), delta in rollup.items():
+            if delta:
+                locations[(fsu_type_id, status_id, delta)].append(location_id)
+        if not locations:
+            return
+
+        fsu_content_type = ContentType.objects.get_for_model(model)
+        with transaction.atomic(using=self.db):
+            self.bulk_create(
+                [
+                    FSUSpareCount(
+                        location_id=location_id,
+                        fsu_content_type=fsu_content_type,
+                        fsu_type_id=fsu_type_id,
+                        status_id=status_id,
+                    )
+                    for (fsu_type_id, status_id, delta), location_ids in locations.items()
+                    if delta > 0
+                    for location_id in location_ids
+                ],
+                ignore_conflicts=True,
+            )
+            for (fsu_type_id, status_id, delta), location_ids in locations.items():
+                counts = self.filter(
+                    location_id__in=location_ids,
+                    fsu_content_type=fsu_content_type,
+                    fsu_type_id=fsu_type_id,
+                    status_id=status_id,
+                )
+                if delta < 0:
+                    counts.filter(count__lte=-delta).delete()
+                counts.update(count=F("count") + delta)
+
+    def add_fsus(self, model: type[FSUModel], fsus: Iterable[FSUModel]) -> None:
+        """Count newly created FSUs, such as those created with `bulk_create()`."""
+        self.adjust(
+            model, Counter(key for fsu in fsus if (key := spare_count_key(fsu)) is not None)
+        )
+
+    def move_location(
+        self, location_id: UUID, prior_parent_id: UUID | None, parent_id: UUID | None
+    ) -> None:
+        """
+        Move the spares stored under a Location from one parent Location to another.
+
+        The Location's own counts already cover everything stored under it, so they are
+        subtracted from the prior parent and its ancestors, and added to the new ones.
+        """
+        by_model: dict[int, Counter] = defaultdict(Counter)
+        for content_type_id, fsu_type_id, status_id, count in self.filter(
+            location_id=location_id
+        ).values_list("fsu_content_type", "fsu_type_id", "status", "count"):
+            deltas = by_model[content_type_id]
+            if prior_parent_id is not None:
+                deltas[(prior_parent_id, fsu_type_id, status_id)] -= count
+            if parent_id is not None:
+                deltas[(parent_id, fsu_type_id, status_id)] += count
+
+        for content_type_id, deltas in by_model.items():
+            self.adjust(ContentType.objects.get_for_id(content_type_id).model_class(), deltas)
+
+    def rebuild(self, fsu_models: Iterable[type[FSUModel]], batch_size: int = 1000) -> int:
+        """Discard all stored spare counts and rebuild them from the FSU tables."""
+        parents = dict(Location.objects.using(self.db).values_list("pk", "parent_id"))
+        total = 0
+        with transaction.atomic(using=self.db):
+            self.all().delete()
+            for model in fsu_models:
+                fsu_content_type = ContentType.objects.get_for_model(model)
+                rollup: Counter = Counter()
+                for location_id, fsu_type_id, status_id, count in (
+                    model.objects.filter(device__isnull=True, location__isnull=False)
+                    .order_by()
+                    .values_list("location_id", "fsu_type_id", "status_id")
+                    .annotate(total=Count("pk"))
+                ):
+                    ancestor_id = location_id
+                    while ancestor_id is not None:
+                        rollup[(ancestor_id, fsu_type_id, status_id)] += count
+                        ancestor_id = parents.get(ancestor_id)
+
+                created = self.bulk_create(
+                    [
+                        FSUSpareCount(
+                            location_id=location_id,
+                            fsu_content_type=fsu_content_type,
+                            fsu_type_id=fsu_type_id,
+                            status_id=status_id,
+                            count=count,
+                        )
+                        for (location_id, fsu_type_id, status_id), count in rollup.items()
+                    ],
+                    batch_size=batch_size,
+                )
+                total += len(created)
+
+        return total
+
+
+class FSUSpareCount(BaseModel):
+    """
+    Number of spare FSUs of a single FSU type and Status stored at or below a Location.
+
+    Spares are FSUs stored at a Location rather than installed in a Device. Each FSU is counted
+    at its own Location and at every Location above it, so the spares of a whole region are read
+    from a single row. Rows are maintained incrementally by signal handlers on the FSU models
+    and on Locations, and can be recreated from scratch with the `rebuild_fsu_spare_counts`
+    management command.
+    """
+
+    location: ForeignKey = models.ForeignKey(
+        to="dcim.Location",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    fsu_content_type: ForeignKey = models.ForeignKey(
+        to="contenttypes.ContentType",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    fsu_type_id = models.UUIDField()
+
+    status: ForeignKey = models.ForeignKey(
+        to="extras.Status",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    count = models.PositiveIntegerField(default=0)
+
+    objects = BaseManager.from_queryset(FSUSpareCountQuerySet)()
+
+    natural_key_field_names = ["pk"]
+
+    class Meta:
+        """Metaclass attributes."""
+
+        unique_together = [["location", "fsu_content_type", "fsu_type_id", "status"]]
+
+    def __str__(self) -> str:
+        """String representation of an FSU spare count."""
+        return f"{self.location}: {self.count} {self.status} {self.fsu_content_type.model}"
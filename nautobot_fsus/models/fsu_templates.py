@@ -15,6 +15,8 @@
 
 """Template versions of Field Serviceable Units, to be associated with DeviceTypes."""
 
+from typing import Any
+
 from django.db import models
 from django.db.models import ForeignKey
 from nautobot.dcim.models import Device
@@ -53,9 +55,9 @@ class CPUTemplate(FSUTemplateModel):
         verbose_name = "CPU Template"
         verbose_name_plural = "CPU Templates"
 
-    def instantiate(self, device: Device) -> CPU:
+    def instantiate(self, device: Device, **kwargs: Any) -> CPU:
         """Instantiate a new CPU on a Device."""
-        return self._instantiate_model(model=CPU, device=device)
+        return self._instantiate_model(model=CPU, device=device, **kwargs)
 
 
 @extras_features("custom_fields", "custom_links", "custom_validators", "relationships")
@@ -75,9 +77,9 @@ class DiskTemplate(FSUTemplateModel):
         verbose_name = "Disk Template"
         verbose_name_plural = "Disk Templates"
 
-    def instantiate(self, device: Device) -> Disk:
+    def instantiate(self, device: Device, **kwargs: Any) -> Disk:
         """Instantiate a new Disk on a Device."""
-        return self._instantiate_model(model=Disk, device=device)
+        return self._instantiate_model(model=Disk, device=device, **kwargs)
 
 
 @extras_features("custom_fields", "custom_links", "custom_validators", "relationships")
@@ -97,9 +99,9 @@ class FanTemplate(FSUTemplateModel):
         verbose_name = "Fan Template"
         verbose_name_plural = "Fan Templates"
 
-    def instantiate(self, device: Device) -> Fan:
+    def instantiate(self, device: Device, **kwargs: Any) -> Fan:
         """Instantiate a new Fan on a Device."""
-        return self._instantiate_model(model=Fan, device=device)
+        return self._instantiate_model(model=Fan, device=device, **kwargs)
 
 
 @extras_features("custom_fields", "custom_links", "custom_validators", "relationships")
@@ -119,9 +121,9 @@ class GPUBaseboardTemplate(FSUTemplateModel):
         verbose_name = "GPU Baseboard Template"
         verbose_name_plural = "GPU Baseboard Templates"
 
-    def instantiate(self, device: Device) -> GPUBaseboard:
+    def instantiate(self, device: Device, **kwargs: Any) -> GPUBaseboard:
         """Instantiate a new GPU Baseboard on a Device."""
-        return self._instantiate_model(model=GPUBaseboard, device=device)
+        return self._instantiate_model(model=GPUBaseboard, device=device, **kwargs)
 
 
 @extras_features("custom_fields", "custom_links", "custom_validators", "relationships")
@@ -143,9 +145,14 @@ class GPUTemplate(FSUTemplateModel):
         verbose_name = "GPU Template"
         verbose_name_plural = "GPU Templates"
 
-    def instantiate(self, device: Device) -> GPU:
+    def instantiate(self, device: Device, **kwargs: Any) -> GPU:
         """Instantiate a new GPU on a Device."""
-        return self._instantiate_model(model=GPU, device=device, pci_slot_id=self.pci_slot_id)
+        return self._instantiate_model(
+            model=GPU,
+            device=device,
+            pci_slot_id=self.pci_slot_id,
+            **kwargs,
+        )
 
 
 @extras_features("custom_fields", "custom_links", "custom_validators", "relationships")
@@ -167,9 +174,14 @@ class HBATemplate(FSUTemplateModel):
         verbose_name = "HBA Template"
         verbose_name_plural = "HBA Templates"
 
-    def instantiate(self, device: Device) -> HBA:
+    def instantiate(self, device: Device, **kwargs: Any) -> HBA:
         """Instantiate a new HBA on a Device."""
-        return self._instantiate_model(model=HBA, device=device, pci_slot_id=self.pci_slot_id)
+        return self._instantiate_model(
+            model=HBA,
+            device=device,
+            pci_slot_id=self.pci_slot_id,
+            **kwargs,
+        )
 
 
 @extras_features("custom_fields", "custom_links", "custom_validators", "relationships")
@@ -189,9 +201,9 @@ class MainboardTemplate(FSUTemplateModel):
         verbose_name = "Mainboard Template"
         verbose_name_plural = "Mainboard Templates"
 
-    def instantiate(self, device: Device) -> Mainboard:
+    def instantiate(self, device: Device, **kwargs: Any) -> Mainboard:
         """Instantiate a new Mainboard on a Device."""
-        return self._instantiate_model(model=Mainboard, device=device)
+        return self._instantiate_model(model=Mainboard, device=device, **kwargs)
 
 
 @extras_features("custom_fields", "custom_links", "custom_validators", "relationships")
@@ -213,9 +225,14 @@ class NICTemplate(FSUTemplateModel):
         verbose_name = "NIC Template"
         verbose_name_plural = "NIC Templates"
 
-    def instantiate(self, device: Device) -> NIC:
+    def instantiate(self, device: Device, **kwargs: Any) -> NIC:
         """Instantiate a new NIC on a Device."""
-        return self._instantiate_model(model=NIC, device=device, pci_slot_id=self.pci_slot_id)
+        return self._instantiate_model(
+            model=NIC,
+            device=device,
+            pci_slot_id=self.pci_slot_id,
+            **kwargs,
+        )
 
 
 @extras_features("custom_fields", "custom_links", "custom_validators", "relationships")
@@ -235,9 +252,9 @@ class OtherFSUTemplate(FSUTemplateModel):
         verbose_name = "OtherFSU Template"
         verbose_name_plural = "OtherFSU Templates"
 
-    def instantiate(self, device: Device) -> OtherFSU:
+    def instantiate(self, device: Device, **kwargs: Any) -> OtherFSU:
         """Instantiate a new generic FSU on a Device."""
-        return self._instantiate_model(model=OtherFSU, device=device)
+        return self._instantiate_model(model=OtherFSU, device=device, **kwargs)
 
 
 @extras_features("custom_fields", "custom_links", "custom_validators", "relationships")
@@ -259,9 +276,9 @@ class PSUTemplate(FSUTemplateModel):
         verbose_name = "PSU Template"
         verbose_name_plural = "PSU Templates"
 
-    def instantiate(self, device: Device) -> PSU:
+    def instantiate(self, device: Device, **kwargs: Any) -> PSU:
         """Instantiate a new PSU on a Device."""
-        return self._instantiate_model(model=PSU, device=device, redundant=self.redundant)
+        return self._instantiate_model(model=PSU, device=device, redundant=self.redundant, **kwargs)
 
 
 @extras_features("custom_fields", "custom_links", "custom_validators", "relationships")
@@ -283,6 +300,11 @@ class RAMModuleTemplate(FSUTemplateModel):
         verbose_name = "RAM Module Template"
         verbose_name_plural = "RAM Module Templates"
 
-    def instantiate(self, device: Device) -> RAMModule:
+    def instantiate(self, device: Device, **kwargs: Any) -> RAMModule:
         """Instantiate a new RAM Module on a Device."""
-        return self._instantiate_model(model=RAMModule, device=device, slot_id=self.slot_id)
+        return self._instantiate_model(
+            model=RAMModule,
+            device=device,
+            slot_id=self.slot_id,
+            **kwargs,
+        )
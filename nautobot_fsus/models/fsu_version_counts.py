@@ -0,0 +1,227 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Denormalized FSU firmware and driver version counts, for the firmware compliance report."""
+
+from collections import Counter
+from typing import Iterable, Mapping
+from uuid import UUID
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.db.models import Count, F, ForeignKey
+from django.db.models.functions import Coalesce
+from nautobot.core.models.generics import BaseModel
+from nautobot.core.models.managers import BaseManager
+from nautobot.core.models.querysets import RestrictedQuerySet
+from nautobot.dcim.models import Device
+
+from nautobot_fsus.models.mixins import FSUModel
+
+# An FSU type, Location, firmware version, and driver version, identifying a single count.
+VersionCountKey = tuple[UUID, UUID | None, str, str]
+
+
+def version_count_key(
+    fsu: FSUModel, device_locations: Mapping[UUID, UUID] | None = None
+) -> VersionCountKey:
+    """
+    Return the key of the version count an FSU is counted in.
+
+    Installed FSUs are counted at the Location of their Device. The Device's Location is read
+    from `device_locations` when it is given, rather than from the Device itself.
+    """
+    if fsu.device_id is None:
+        location_id = fsu.location_id
+    elif device_locations is not None:
+        location_id = device_locations.get(fsu.device_id)
+    else:
+        location_id = fsu.device.location_id
+
+    return fsu.fsu_type_id, location_id, fsu.firmware_version, fsu.driver_version
+
+
+class FSUVersionCountQuerySet(RestrictedQuerySet):
+    """QuerySet with helpers for maintaining the FSU version counts."""
+
+    def adjust(self, model: type[FSUModel], deltas: Mapping[VersionCountKey, int]) -> None:
+        """
+        Add to, or subtract from, the stored version counts of an FSU model.
+
+        Any missing counts are inserted first, with a single `INSERT` that ignores the counts
+        that already exist. Each count is then changed with an `UPDATE ... SET count = count + n`,
+        so concurrent changes to the same count do not overwrite each other. Counts that drop to
+        zero are removed.
+
+        Args:
+            model: The FSU model being counted.
+            deltas: The change to each count, keyed by FSU type, Location, and versions.
+        """
+        fsu_content_type = ContentType.objects.get_for_model(model)
+        keys = {
+            key: {
+                "fsu_content_type": fsu_content_type,
+                "fsu_type_id": key[0],
+                "location_id": key[1],
+                "firmware_version": key[2],
+                "driver_version": key[3],
+            }
+            for key, delta in deltas.items()
+            if delta and key[1] is not None
+        }
+        if not keys:
+            return
+
+        with transaction.atomic(using=self.db):
+            self.bulk_create(
+                [FSUVersionCount(**fields) for key, fields in keys.items() if deltas[key] > 0],
+                ignore_conflicts=True,
+            )
+            for key, fields in keys.items():
+                delta = deltas[key]
+                counts = self.filter(**fields)
+                if delta < 0:
+                    counts.filter(count__lte=-delta).delete()
+                counts.update(count=F("count") + delta)
+
+    def add_fsus(self, model: type[FSUModel], fsus: Iterable[FSUModel]) -> None:
+        """
+        Count newly created FSUs, such as those created with `bulk_create()`.
+
+        The Locations of the FSUs' Devices are read with a single query.
+        """
+        fsus = list(fsus)
+        device_ids = {fsu.device_id for fsu in fsus if fsu.device_id is not None}
+        device_locations = dict(
+            Device.objects.using(self.db).filter(pk__in=device_ids).values_list("pk", "location_id")
+        )
+        self.adjust(model, Counter(version_count_key(fsu, device_locations) for fsu in fsus))
+
+    @staticmethod
+    def count_device_fsus(
+        device_id: UUID, fsu_models: Iterable[type[FSUModel]]
+    ) -> dict[type[FSUModel], Counter[tuple[UUID, str, str]]]:
+        """
+        Count the FSUs installed in a Device by FSU type, firmware version, and driver version.
+
+        Used to move the counts of a Device's FSUs when the Device moves or is deleted.
+        """
+        device_counts = {}
+        for model in fsu_models:
+            counts = Counter(
+                {
+                    (fsu_type_id, firmware, driver): total
+                    for fsu_type_id, firmware, driver, total in model.objects.filter(
+                        device_id=device_id
+                    )
+                    .order_by()
+                    .values_list("fsu_type_id", "firmware_version", "driver_version")
+                    .annotate(total=Count("pk"))
+                }
+            )
+            if counts:
+                device_counts[model] = counts
+
+        return device_counts
+
+    def rebuild(self, fsu_models: Iterable[type[FSUModel]], batch_size: int = 1000) -> int:
+        """Discard all stored version counts and rebuild them from the FSU tables."""
+        total = 0
+        with transaction.atomic(using=self.db):
+            self.all().delete()
+            for model in fsu_models:
+                fsu_content_type = ContentType.objects.get_for_model(model)
+                counts = (
+                    model.objects.annotate(
+                        count_location=Coalesce("device__location_id", "location_id")
+                    )
+                    .filter(count_location__isnull=False)
+                    .order_by()
+                    .values_list(
+                        "fsu_type_id", "count_location", "firmware_version", "driver_version"
+                    )
+                    .annotate(total=Count("pk"))
+                )
+                created = self.bulk_create(
+                    [
+                        FSUVersionCount(
+                            fsu_content_type=fsu_content_type,
+                            fsu_type_id=fsu_type_id,
+                            location_id=location_id,
+                            firmware_version=firmware,
+                            driver_version=driver,
+                            count=count,
+                        )
+                        for fsu_type_id, location_id, firmware, driver, count in counts
+                    ],
+                    batch_size=batch_size,
+                )
+                total += len(created)
+
+        return total
+
+
+class FSUVersionCount(BaseModel):
+    """
+    Number of FSUs of a single FSU type at a Location running a firmware and driver version.
+
+    These counts are the rollup behind the firmware compliance report, which would otherwise
+    have to group every FSU table on each request. FSUs installed in a Device are counted at the
+    Device's Location. Rows are maintained incrementally by signal handlers on the FSU models
+    and on Devices, and can be recreated from scratch with the `rebuild_fsu_version_counts`
+    management command.
+    """
+
+    fsu_content_type: ForeignKey = models.ForeignKey(
+        to="contenttypes.ContentType",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    fsu_type_id = models.UUIDField()
+
+    location: ForeignKey = models.ForeignKey(
+        to="dcim.Location",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+
+    firmware_version = models.CharField(max_length=32, blank=True)
+    driver_version = models.CharField(max_length=32, blank=True)
+    count = models.PositiveIntegerField(default=0)
+
+    objects = BaseManager.from_queryset(FSUVersionCountQuerySet)()
+
+    natural_key_field_names = ["pk"]
+
+    class Meta:
+        """Metaclass attributes."""
+
+        unique_together = [
+            [
+                "fsu_content_type",
+                "fsu_type_id",
+                "location",
+                "firmware_version",
+                "driver_version",
+            ]
+        ]
+
+    def __str__(self) -> str:
+        """String representation of an FSU version count."""
+        return (
+            f"{self.location}: {self.count} {self.fsu_content_type.model} "
+            f"{self.firmware_version or '-'}/{self.driver_version or '-'}"
+        )
@@ -23,11 +23,17 @@ or available for use in a Location.
 from copy import copy
 
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.db.models import ForeignKey, ManyToManyField
+from nautobot.core.models.managers import BaseManager
 from nautobot.extras.utils import extras_features
 
-from nautobot_fsus.models.mixins import FSUModel, PCIFSUModel
+from nautobot_fsus.models.mixins import (
+    FSUModel,
+    PCIFSUModel,
+    SlottedFSUModel,
+    SlottedFSUQuerySet,
+)
 from nautobot_fsus.utilities import validate_parent_device
 
 EXTRAS_FEATURES = (
@@ -42,6 +48,60 @@ EXTRAS_FEATURES = (
 )
 
 
+def has_free_slot(child: FSUModel, parent_field: str, parent: FSUModel) -> bool:
+    """
+    Whether a parent FSU has a free slot for a child FSU, from the parent's used slot count.
+
+    A full parent still has room for a child that is already assigned to it, which is only
+    looked up when the parent is full.
+    """
+    capacity = getattr(parent.fsu_type, parent.slot_capacity_field)
+    if not capacity or getattr(parent, parent.slot_count_field) < capacity:
+        return True
+
+    return (
+        not child._state.adding
+        and type(child).objects.filter(pk=child.pk, **{f"{parent_field}_id": parent.pk}).exists()
+    )
+
+
+def move_parent_slot(child: FSUModel, parent_field: str) -> None:
+    """
+    Take a slot on a child FSU's parent and free the slot on its prior parent, if it has moved.
+
+    This must be called within the transaction that saves the child, the new parent is locked
+    until it commits.
+
+    Raises:
+        ValidationError: If the new parent has no free slot for the child.
+    """
+    parent_id = getattr(child, f"{parent_field}_id")
+    prior_id = None
+    if not child._state.adding:
+        # Lock the child too, so concurrent moves of the same child free its prior slot once.
+        prior_id = (
+            type(child)
+            .objects.select_for_update()
+            .filter(pk=child.pk)
+            .order_by()
+            .values_list(f"{parent_field}_id", flat=True)
+            .first()
+        )
+    if prior_id == parent_id:
+        return
+
+    field = child._meta.get_field(parent_field)
+    try:
+        field.related_model.objects.adjust_slots({parent_id: 1, prior_id: -1})
+    except ValidationError as error:
+        raise ValidationError({parent_field: error.error_list}) from error
+
+    # Keep a loaded parent in step, for validating further children against it.
+    if parent_id is not None and field.is_cached(child):
+        parent = getattr(child, parent_field)
+        setattr(parent, parent.slot_count_field, getattr(parent, parent.slot_count_field) + 1)
+
+
 @extras_features(*EXTRAS_FEATURES)
 class CPU(FSUModel):
     """Represents an individual CPU component in a device or storage location."""
@@ -80,17 +140,21 @@ class CPU(FSUModel):
             except ValidationError as error:
                 errors["parent_mainboard"] = error.error_list
 
-            if socket_count := parent_mainboard.fsu_type.cpu_socket_count:
-                cpu_count = parent_mainboard.cpus.count()
-                if self not in parent_mainboard.cpus.all() and cpu_count >= socket_count:
-                    errors.setdefault("parent_mainboard", [])
-                    errors["parent_mainboard"].extend(
-                        ValidationError("Mainboard has no available CPU sockets.").error_list
-                    )
+            if not has_free_slot(self, "parent_mainboard", parent_mainboard):
+                errors.setdefault("parent_mainboard", [])
+                errors["parent_mainboard"].extend(
+                    ValidationError(Mainboard.slot_full_message).error_list
+                )
 
             if errors:
                 raise ValidationError(errors)
 
+    def save(self, *args, **kwargs) -> None:
+        """Save the CPU, moving it between the used socket counts of its Mainboards."""
+        with transaction.atomic():
+            move_parent_slot(self, "parent_mainboard")
+            super().save(*args, **kwargs)
+
 
 @extras_features(*EXTRAS_FEATURES)
 class Disk(FSUModel):
@@ -176,7 +240,6 @@ class GPU(PCIFSUModel):
         """Validate the parent Device against the parent GPU Baseboard."""
         super().clean_fields(exclude=exclude)
 
-        # if self.parent_gpubaseboard is not None:
         parent_gpubaseboard: GPUBaseboard
         if parent_gpubaseboard := copy(self.parent_gpubaseboard):
             errors = {}
@@ -186,20 +249,24 @@ class GPU(PCIFSUModel):
             except ValidationError as error:
                 errors["parent_gpubaseboard"] = error.error_list
 
-            if slot_count := parent_gpubaseboard.fsu_type.slot_count:
-                gpu_count = parent_gpubaseboard.gpus.count()
-                if self not in parent_gpubaseboard.gpus.all() and gpu_count >= slot_count:
-                    errors.setdefault("parent_gpubaseboard", [])
-                    errors["parent_gpubaseboard"].extend(
-                        ValidationError("GPU Baseboard has no available slots.").error_list
-                    )
+            if not has_free_slot(self, "parent_gpubaseboard", parent_gpubaseboard):
+                errors.setdefault("parent_gpubaseboard", [])
+                errors["parent_gpubaseboard"].extend(
+                    ValidationError(GPUBaseboard.slot_full_message).error_list
+                )
 
             if errors:
                 raise ValidationError(errors)
 
+    def save(self, *args, **kwargs) -> None:
+        """Save the GPU, moving it between the used slot counts of its GPU Baseboards."""
+        with transaction.atomic():
+            move_parent_slot(self, "parent_gpubaseboard")
+            super().save(*args, **kwargs)
+
 
 @extras_features(*EXTRAS_FEATURES)
-class GPUBaseboard(FSUModel):
+class GPUBaseboard(SlottedFSUModel):
     """Represents an individual GPU Baseboard component in a device or storage location."""
 
     fsu_type: ForeignKey = models.ForeignKey(
@@ -209,7 +276,20 @@ class GPUBaseboard(FSUModel):
         verbose_name="GPU Baseboard Type",
     )
 
-    class Meta(FSUModel.Meta):
+    gpu_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of GPUs assigned to the GPU Baseboard.",
+    )
+
+    objects = BaseManager.from_queryset(SlottedFSUQuerySet)()
+
+    slot_count_field = "gpu_count"
+    slot_capacity_field = "slot_count"
+    slot_children = "gpus"
+    slot_full_message = "GPU Baseboard has no available slots."
+
+    class Meta(SlottedFSUModel.Meta):
         """Metaclass attributes."""
 
         verbose_name = "GPU Baseboard"
@@ -235,7 +315,7 @@ class HBA(PCIFSUModel):
 
 
 @extras_features(*EXTRAS_FEATURES)
-class Mainboard(FSUModel):
+class Mainboard(SlottedFSUModel):
     """Represents an individual Mainboard component in a device or storage location."""
 
     fsu_type: ForeignKey = models.ForeignKey(
@@ -245,7 +325,20 @@ class Mainboard(FSUModel):
         verbose_name="Mainboard Type",
     )
 
-    class Meta(FSUModel.Meta):
+    cpu_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of CPUs assigned to the Mainboard.",
+    )
+
+    objects = BaseManager.from_queryset(SlottedFSUQuerySet)()
+
+    slot_count_field = "cpu_count"
+    slot_capacity_field = "cpu_socket_count"
+    slot_children = "cpus"
+    slot_full_message = "Mainboard has no available CPU sockets."
+
+    class Meta(SlottedFSUModel.Meta):
         """Metaclass attributes."""
 
         verbose_name = "Mainboard"
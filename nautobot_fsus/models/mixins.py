@@ -15,15 +15,20 @@
 
 """Base classes for object models."""
 
+from collections import defaultdict
 import logging
-from typing import Any
+import re
+from typing import Any, Mapping
+from uuid import UUID
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import ForeignKey
+from django.db.models import Count, F, ForeignKey, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
 from nautobot.core.models.fields import NaturalOrderingField
 from nautobot.core.models.generics import BaseModel, PrimaryModel
+from nautobot.core.models.querysets import RestrictedQuerySet
 from nautobot.dcim.models import Device, Location
 from nautobot.extras.models import (
     CustomField,
@@ -36,6 +41,81 @@ from nautobot.extras.models.change_logging import ChangeLoggedModel, ObjectChang
 
 logger = logging.getLogger("nautobot.plugin.fsus")
 
+# Width of the length prefix of each numeric component of a version in its version key, enough
+# for any component that fits in a 255 character version.
+VERSION_KEY_DIGITS = 3
+
+# Stored version keys, and the version fields they are derived from.
+VERSION_KEY_FIELDS = {"_firmware_version": "firmware_version", "_driver_version": "driver_version"}
+
+
+def naturalize_version(value: str, max_length: int = 255) -> str:
+    """
+    Return a key for a version string that sorts in version order.
+
+    Each run of digits in the version has its leading zeros removed and is prefixed with its
+    zero-padded length, so longer numbers sort after shorter ones whatever their size. Each run
+    of letters is lower-cased, and the components are joined with dots, so "96.00.89" becomes
+    "00296.000.00289" and sorts before "96.00.100". Any other characters only separate
+    components, and a leading "v" is ignored.
+
+    Args:
+        value (str): The version string to naturalize.
+        max_length (int): Maximum length of the returned key.
+    """
+    components = re.findall(r"\d+|[a-z]+", (value or "").lower())
+    if len(components) > 1 and components[0] == "v" and components[1].isdigit():
+        components = components[1:]
+
+    return ".".join(
+        _naturalize_number(component) if component.isdigit() else component
+        for component in components
+    )[:max_length]
+
+
+def _naturalize_number(digits: str) -> str:
+    """Return a run of digits without leading zeros, prefixed with its length."""
+    digits = digits.lstrip("0")
+    return f"{len(digits):0{VERSION_KEY_DIGITS}d}{digits}"
+
+
+def rebuild_version_keys(queryset: models.QuerySet, batch_size: int = 1000) -> int:
+    """
+    Recalculate the stored version keys of the FSUs in a queryset.
+
+    Version keys are set whenever an FSU is saved, but not by `QuerySet.update()` or
+    `bulk_update()`, so this catches up any FSUs changed that way.
+
+    Args:
+        queryset (QuerySet): The FSUs to update.
+        batch_size (int): Number of FSUs written per query.
+
+    Returns:
+        int: The number of FSUs whose version keys were out of date.
+    """
+    model = queryset.model
+    key_fields = list(VERSION_KEY_FIELDS)
+    rows = (
+        queryset.order_by()
+        .values_list("pk", *VERSION_KEY_FIELDS.values(), *key_fields)
+        .iterator(chunk_size=batch_size)
+    )
+
+    stale: list[models.Model] = []
+    total = 0
+    for pk, *values in rows:
+        keys = [naturalize_version(value) for value in values[: len(key_fields)]]
+        if keys != values[len(key_fields) :]:
+            stale.append(model(pk=pk, **dict(zip(key_fields, keys, strict=True))))
+        if len(stale) >= batch_size:
+            total += model.objects.using(queryset.db).bulk_update(stale, key_fields)
+            stale = []
+
+    if stale:
+        total += model.objects.using(queryset.db).bulk_update(stale, key_fields)
+
+    return total
+
 
 class FSUModel(PrimaryModel):
     """
@@ -85,12 +165,26 @@ class FSUModel(PrimaryModel):
         blank=True,
         verbose_name="Firmware version",
     )
+    _firmware_version = NaturalOrderingField(
+        target_field="firmware_version",
+        naturalize_function=naturalize_version,
+        max_length=255,
+        blank=True,
+        db_index=True,
+    )
 
     driver_version = models.CharField(
         max_length=32,
         blank=True,
         verbose_name="Driver version",
     )
+    _driver_version = NaturalOrderingField(
+        target_field="driver_version",
+        naturalize_function=naturalize_version,
+        max_length=255,
+        blank=True,
+        db_index=True,
+    )
 
     driver_name = models.CharField(
         max_length=100,
@@ -129,6 +223,18 @@ class FSUModel(PrimaryModel):
         abstract = True
         ordering = ["device", "location", "_name"]
         unique_together = [["name", "device"], ["name", "location"]]
+        indexes = [
+            # Serves the keyset pagination of the API, which walks the ordering plus the primary key.
+            models.Index(fields=["device", "location", "_name", "id"], name="fsus_%(class)s_ks"),
+            # The FSUs of a Device or Location, in name order.
+            models.Index(fields=["device", "_name"], name="fsus_%(class)s_device"),
+            models.Index(fields=["location", "_name"], name="fsus_%(class)s_location"),
+            # Instances of an FSU type, by status and by firmware version.
+            models.Index(fields=["fsu_type", "status"], name="fsus_%(class)s_type_status"),
+            models.Index(fields=["fsu_type", "firmware_version"], name="fsus_%(class)s_type_fw"),
+            # The partial index of spares, FSUs stored at a Location, is created by migration 0015
+            # on PostgreSQL only, as other databases would ignore its condition.
+        ]
 
     def __str__(self) -> str:
         """Default string representation of the FSU."""
@@ -172,6 +278,105 @@ class FSUModel(PrimaryModel):
         super().save(*args, **kwargs)
 
 
+class SlottedFSUQuerySet(RestrictedQuerySet):
+    """
+    QuerySet for parent FSUs with a limited number of slots for their child FSUs.
+
+    The parent model stores the number of slots in use in its `slot_count_field`, limited by the
+    `slot_capacity_field` of its FSU type, and names its children in `slot_children`. The counts
+    are adjusted with F() expressions as children are attached and detached, with the parents
+    locked while their free slots are checked, so concurrent writers cannot overfill a parent.
+    """
+
+    def adjust_slots(self, deltas: Mapping[UUID | None, int]) -> None:
+        """
+        Adjust the used slot counts of parent FSUs.
+
+        Parents taking slots are locked with `select_for_update()` until the end of the
+        transaction, so this must be called within `transaction.atomic()`.
+
+        Args:
+            deltas: Change in the used slot count, keyed by parent FSU ID. None keys, for children
+                without a parent, are ignored.
+
+        Raises:
+            ValidationError: If a parent has no room for the slots being taken.
+        """
+        model = self.model
+        count_field: str = model.slot_count_field
+        deltas = {pk: delta for pk, delta in deltas.items() if pk is not None and delta}
+
+        taken = [pk for pk, delta in deltas.items() if delta > 0]
+        if taken:
+            # Lock in primary key order, so writers taking slots on several parents can't deadlock.
+            for parent in (
+                model.objects.using(self.db)
+                .select_for_update(of=("self",))
+                .select_related("fsu_type")
+                .filter(pk__in=taken)
+                .order_by("pk")
+            ):
+                capacity = getattr(parent.fsu_type, model.slot_capacity_field)
+                if capacity and getattr(parent, count_field) + deltas[parent.pk] > capacity:
+                    raise ValidationError(model.slot_full_message)
+
+        by_delta: dict[int, list[UUID]] = defaultdict(list)
+        for pk, delta in deltas.items():
+            by_delta[delta].append(pk)
+        for delta, pks in by_delta.items():
+            model.objects.using(self.db).filter(pk__in=pks).update(
+                **{count_field: Greatest(F(count_field) + delta, 0)}
+            )
+
+    def rebuild_slots(self) -> int:
+        """
+        Recount the used slots of the parent FSUs in this queryset from their children.
+
+        Returns:
+            int: Number of parent FSUs updated.
+        """
+        children = self.model._meta.get_field(self.model.slot_children)
+        counts = (
+            children.related_model.objects.filter(**{children.field.name: OuterRef("pk")})
+            .order_by()
+            .values(children.field.name)
+            .annotate(count=Count("pk"))
+            .values("count")
+        )
+        return self.update(**{self.model.slot_count_field: Coalesce(Subquery(counts), 0)})
+
+
+class SlottedFSUModel(FSUModel):
+    """
+    Abstract base class for a parent FSU with a limited number of slots for its child FSUs.
+
+    The used slot count is only ever changed by `SlottedFSUQuerySet`, with F() expressions, so
+    saving a parent FSU leaves it out rather than writing back a count loaded before its
+    children last moved.
+    """
+
+    class Meta(FSUModel.Meta):
+        """Metaclass attributes."""
+
+        abstract = True
+
+    def save(self, *args, **kwargs) -> None:
+        """Save the parent FSU, without its used slot count unless it is being created."""
+        if not self._state.adding and not kwargs.get("force_insert"):
+            update_fields = kwargs.get("update_fields")
+            if update_fields is None:
+                update_fields = [
+                    model_field.name
+                    for model_field in self._meta.concrete_fields
+                    if not model_field.primary_key
+                ]
+            kwargs["update_fields"] = [
+                name for name in update_fields if name != self.slot_count_field
+            ]
+
+        super().save(*args, **kwargs)
+
+
 class FSUTemplateModel(BaseModel, ChangeLoggedModel, CustomFieldModel, RelationshipModel):
     """
     Abstract base model for FSU templates.
@@ -199,32 +404,50 @@ class FSUTemplateModel(BaseModel, ChangeLoggedModel, CustomFieldModel, Relations
         abstract = True
         ordering = ["device_type", "_name"]
         unique_together = ["name", "device_type"]
+        indexes = [models.Index(fields=["device_type", "_name", "id"], name="fsus_%(class)s_ks")]
 
     def __str__(self) -> str:
         """Default string representation for the FSU template."""
         return str(self.name)
 
-    def _instantiate_model(self, model: type[FSUModel], device: Device, **kwargs: Any) -> FSUModel:
-        """Helper method for `self.instantiate()`."""
-        # Handle any custom fields assigned to the model first.
-        custom_field_data: dict[str, Any] = {}
-        content_type = ContentType.objects.get_for_model(model)
-        cf_fields = CustomField.objects.filter(content_types=content_type)
-        for field in cf_fields:
-            custom_field_data[field.key] = field.default
+    def _instantiate_model(
+        self,
+        model: type[FSUModel],
+        device: Device,
+        status: Status | None = None,
+        custom_field_data: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> FSUModel:
+        """
+        Helper method for `self.instantiate()`.
+
+        The status and custom field defaults are looked up when they are not provided - callers
+        instantiating many FSUs at once should resolve them once and pass them in.
+        """
+        if custom_field_data is None:
+            # Handle any custom fields assigned to the model first.
+            custom_field_data = {}
+            content_type = ContentType.objects.get_for_model(model)
+            cf_fields = CustomField.objects.filter(content_types=content_type)
+            for field in cf_fields:
+                custom_field_data[field.key] = field.default
 
         return model(  # pylint: disable=not-callable
-            fsu_type=self.fsu_type,
+            fsu_type_id=self.fsu_type_id,
             device=device,
             name=self.name,
             description=self.description,
-            status=Status.objects.get(name="Active"),
-            _custom_field_data=custom_field_data,
+            status=status or Status.objects.get(name="Active"),
+            _custom_field_data=dict(custom_field_data),
             **kwargs,
         )
 
-    def instantiate(self, device: Device) -> FSUModel:
-        """Instantiate a new FSU on a Device."""
+    def instantiate(self, device: Device, **kwargs: Any) -> FSUModel:
+        """
+        Instantiate a new FSU on a Device.
+
+        Keyword arguments are passed through to `self._instantiate_model()`.
+        """
         raise NotImplementedError
 
     def to_objectchange(self, action: str, **kwargs: Any) -> ObjectChange:
@@ -250,11 +473,31 @@ class FSUTypeModel(PrimaryModel):
     name = models.CharField(max_length=100, verbose_name="Model Name")
     _name = NaturalOrderingField(target_field="name", max_length=255, blank=True, db_index=True)
     part_number = models.CharField(max_length=100, verbose_name="Part Number")
+    target_firmware_version = models.CharField(
+        max_length=32,
+        blank=True,
+        verbose_name="Target firmware version",
+        help_text="Firmware version instances of this type are expected to run.",
+    )
+    target_driver_version = models.CharField(
+        max_length=32,
+        blank=True,
+        verbose_name="Target driver version",
+        help_text="Driver version instances of this type are expected to run.",
+    )
     description = models.CharField(max_length=255, blank=True)
     comments = models.TextField(blank=True)
 
     clone_fields = ["manufacturer", "name"]
-    csv_headers = ["manufacturer", "name", "part_number", "description", "comments"]
+    csv_headers = [
+        "manufacturer",
+        "name",
+        "part_number",
+        "target_firmware_version",
+        "target_driver_version",
+        "description",
+        "comments",
+    ]
 
     class Meta:
         """Metaclass attributes."""
@@ -262,6 +505,11 @@ class FSUTypeModel(PrimaryModel):
         abstract = True
         ordering = ["manufacturer", "_name", "part_number"]
         unique_together = ["part_number", "manufacturer"]
+        indexes = [
+            models.Index(
+                fields=["manufacturer", "_name", "part_number", "id"], name="fsus_%(class)s_ks"
+            ),
+        ]
 
     def __str__(self) -> str:
         """String representation of the FSU type."""
@@ -274,9 +522,21 @@ class FSUTypeModel(PrimaryModel):
 
     @property
     def instance_count(self) -> int:
-        """Calculate the number of child FSU instances."""
+        """
+        Number of child FSU instances.
+
+        List views annotate their querysets with the count, which is used when present;
+        otherwise the instances are counted with an extra query.
+        """
+        if (count := getattr(self, "_instance_count", None)) is not None:
+            return int(count)
         return int(self.instances.all().count())
 
+    @instance_count.setter
+    def instance_count(self, value: int) -> None:
+        """Store the count annotated on the queryset."""
+        self._instance_count = value
+
 
 class PCIFSUModel(FSUModel):
     """Abstract base class for an FSU that occupies a PCI slot."""
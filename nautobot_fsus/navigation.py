@@ -53,6 +53,11 @@ menu_items = (
             NavMenuGroup(
                 name="Field Serviceable Units",
                 items=[
+                    NavMenuItem(
+                        link="plugins:nautobot_fsus:all_fsus",
+                        name="All FSUs",
+                        permissions=[],
+                    ),
                     NavMenuItem(
                         link="plugins:nautobot_fsus:cpu_list",
                         name="CPUs",
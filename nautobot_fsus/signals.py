@@ -15,43 +15,53 @@
 
 """Signal handlers for Nautobot FSUs app."""
 
+from collections import Counter, defaultdict
 import logging
 from typing import Any
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models.signals import post_save
+from django.db.models import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
-from nautobot.dcim.models import Device
-from nautobot.extras.models import Status
+from nautobot.dcim.models import Device, Location
+from nautobot.extras.models import CustomField, Status
 
 from nautobot_fsus.models import (
-    CPU,
-    GPU,
-    HBA,
-    NIC,
-    PSU,
-    Disk,
-    Fan,
+    FSU_MODELS,
+    FSU_TEMPLATE_MODELS,
+    FSUCount,
+    FSUSerialIndex,
+    FSUSpareCount,
+    FSUVersionCount,
     GPUBaseboard,
     Mainboard,
-    OtherFSU,
-    RAMModule,
 )
+from nautobot_fsus.models.fsu_spare_counts import spare_count_key
+from nautobot_fsus.models.fsu_version_counts import version_count_key
+from nautobot_fsus.models.mixins import FSUModel
+from nautobot_fsus.utilities.instantiation import instantiate_fsus, invalidate_instantiation_plans
 
 logger = logging.getLogger("rq.worker")
 
+# Foreign keys of child FSUs to the parent FSUs that count their used slots.
+SLOT_PARENT_FIELDS = {
+    children.related_model: children.field
+    for children in (
+        parent_model._meta.get_field(parent_model.slot_children)
+        for parent_model in (GPUBaseboard, Mainboard)
+    )
+}
+
 
 def post_migrate_create_defaults(*args, **kwargs):  # pylint: disable=unused-argument
     """Callback function for post_migrate() -- create default Statuses."""
     statuses = ["Active", "Available", "Maintenance", "Offline"]
 
-    fsu_models = [CPU, Disk, Fan, GPU, GPUBaseboard, HBA, Mainboard, NIC, OtherFSU, PSU, RAMModule]
-
     print("  Adding FSU models to Statuses")
     logger.info("Adding FSU models to Statuses")
     status = ""
     try:
-        for model in fsu_models:
+        for model in FSU_MODELS:
             for status in statuses:
                 logger.debug("Adding %s to %s", model.__name__, status)
                 Status.objects.get(name=status).content_types.add(
@@ -73,6 +83,9 @@ def create_fsus_for_new_devices(
     """
     Watch for new Device creation and instantiate any associated FSUs from the DeviceType.
 
+    FSUs are built from the DeviceType's cached instantiation plan, so when the plan is cached
+    this costs one `bulk_create()` per FSU model and no other lookups.
+
     Args:
         sender: The model class of the sender (filtered for Device by the receiver wrapper).
         instance: The Device instance being saved.
@@ -84,19 +97,440 @@ def create_fsus_for_new_devices(
     if not created:
         return
 
-    fsu_models = [
-        (CPU, instance.device_type.cputemplates.all()),
-        (Disk, instance.device_type.disktemplates.all()),
-        (Fan, instance.device_type.fantemplates.all()),
-        (GPU, instance.device_type.gputemplates.all()),
-        (GPUBaseboard, instance.device_type.gpubaseboardtemplates.all()),
-        (HBA, instance.device_type.hbatemplates.all()),
-        (Mainboard, instance.device_type.mainboardtemplates.all()),
-        (NIC, instance.device_type.nictemplates.all()),
-        (OtherFSU, instance.device_type.otherfsutemplates.all()),
-        (PSU, instance.device_type.psutemplates.all()),
-        (RAMModule, instance.device_type.rammoduletemplates.all()),
-    ]
-
-    for model, templates in fsu_models:
-        model.objects.bulk_create([fsu.instantiate(device=instance) for fsu in templates])
+    instantiate_fsus([instance], new_devices=True)
+
+
+def snapshot_fsu_parent(
+    sender: type[FSUModel],
+    instance: FSUModel,
+    raw: bool = False,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Record the parent and the count keys of an existing FSU before it is saved."""
+    instance._fsu_prior_parent = (None, None)  # pylint: disable=protected-access
+    instance._fsu_prior_version_key = None  # pylint: disable=protected-access
+    instance._fsu_prior_spare_key = None  # pylint: disable=protected-access
+    if raw or instance._state.adding:  # pylint: disable=protected-access
+        return
+
+    prior = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list(
+            "device_id",
+            "location_id",
+            "device__location_id",
+            "fsu_type_id",
+            "firmware_version",
+            "driver_version",
+            "status_id",
+        )
+        .first()
+    )
+    if prior is not None:
+        device_id, location_id, device_location_id, fsu_type_id, firmware, driver, status_id = prior
+        instance._fsu_prior_parent = (device_id, location_id)  # pylint: disable=protected-access
+        instance._fsu_prior_version_key = (  # pylint: disable=protected-access
+            fsu_type_id,
+            device_location_id if device_id else location_id,
+            firmware,
+            driver,
+        )
+        if device_id is None and location_id is not None:
+            instance._fsu_prior_spare_key = (  # pylint: disable=protected-access
+                location_id,
+                fsu_type_id,
+                status_id,
+            )
+
+
+def update_fsu_counts_on_save(
+    sender: type[FSUModel],
+    instance: FSUModel,
+    created: bool,
+    raw: bool = False,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Update the stored FSU counts when an FSU is created or moved to a different parent."""
+    if raw:
+        return
+
+    prior_device, prior_location = getattr(instance, "_fsu_prior_parent", (None, None))
+    if not created and (prior_device, prior_location) == (instance.device_id, instance.location_id):
+        return
+
+    FSUCount.objects.refresh(
+        sender,
+        device_ids={prior_device, instance.device_id},
+        location_ids={prior_location, instance.location_id},
+    )
+
+
+def _deleted_with_parent(origin: Any) -> bool:
+    """Whether an FSU is being deleted because its parent Device or Location is deleted."""
+    parent_models = (Device, Location)
+    return isinstance(origin, parent_models) or (
+        isinstance(origin, QuerySet) and issubclass(origin.model, parent_models)
+    )
+
+
+def update_fsu_counts_on_delete(
+    sender: type[FSUModel],
+    instance: FSUModel,
+    origin: Any = None,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Update the stored FSU counts when an FSU is deleted."""
+    # Deleting a Device or Location cascades to its FSUs and to its counts at the same time.
+    if _deleted_with_parent(origin):
+        return
+
+    FSUCount.objects.refresh(
+        sender,
+        device_ids=[instance.device_id],
+        location_ids=[instance.location_id],
+    )
+
+
+def update_version_counts_on_save(
+    sender: type[FSUModel],
+    instance: FSUModel,
+    created: bool,
+    raw: bool = False,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Move an FSU between version counts when its type, versions, or Location change."""
+    if raw:
+        return
+
+    prior_key = getattr(instance, "_fsu_prior_version_key", None)
+    key = version_count_key(instance)
+    if not created and prior_key == key:
+        return
+
+    deltas: Counter = Counter({key: 1})
+    if prior_key is not None:
+        deltas[prior_key] -= 1
+    FSUVersionCount.objects.adjust(sender, deltas)
+
+
+def update_version_counts_on_delete(
+    sender: type[FSUModel],
+    instance: FSUModel,
+    origin: Any = None,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Remove a deleted FSU from its version count."""
+    # Deleting a Location cascades to its version counts, and the version counts of a deleted
+    # Device's FSUs are updated once for the whole Device.
+    if _deleted_with_parent(origin):
+        return
+
+    FSUVersionCount.objects.adjust(sender, {version_count_key(instance): -1})
+
+
+def update_spare_counts_on_save(
+    sender: type[FSUModel],
+    instance: FSUModel,
+    created: bool,
+    raw: bool = False,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Move an FSU between spare counts when it is stored, installed, moved, or changes Status."""
+    if raw:
+        return
+
+    prior_key = getattr(instance, "_fsu_prior_spare_key", None)
+    key = spare_count_key(instance)
+    if not created and prior_key == key:
+        return
+
+    deltas: Counter = Counter()
+    if key is not None:
+        deltas[key] += 1
+    if prior_key is not None:
+        deltas[prior_key] -= 1
+    FSUSpareCount.objects.adjust(sender, deltas)
+
+
+def update_spare_counts_on_delete(
+    sender: type[FSUModel],
+    instance: FSUModel,
+    origin: Any = None,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Remove a deleted spare FSU from the spare counts."""
+    # Spares are only stored at a Location, and the Location's deletion handles its counts.
+    if _deleted_with_parent(origin) or (key := spare_count_key(instance)) is None:
+        return
+
+    FSUSpareCount.objects.adjust(sender, {key: -1})
+
+
+def update_serial_index_on_save(
+    sender: type[FSUModel],  # pylint: disable=unused-argument
+    instance: FSUModel,
+    raw: bool = False,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Update the serial number index entry of an FSU when it is saved."""
+    if raw:
+        return
+
+    FSUSerialIndex.objects.update_fsu(instance)
+
+
+def update_serial_index_on_delete(
+    sender: type[FSUModel],
+    instance: FSUModel,
+    origin: Any = None,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Remove the serial number index entry of an FSU when it is deleted."""
+    # Index entries are deleted along with their parent Device or Location.
+    if _deleted_with_parent(origin):
+        return
+
+    FSUSerialIndex.objects.filter(
+        fsu_content_type=ContentType.objects.get_for_model(sender),
+        fsu_id=instance.pk,
+    ).delete()
+
+
+def free_parent_slot_on_delete(
+    sender: type[FSUModel],
+    instance: FSUModel,
+    origin: Any = None,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Free the slot of a deleted child FSU on its parent FSU."""
+    # A parent FSU is deleted along with its children when their Device is deleted.
+    parent_field = SLOT_PARENT_FIELDS[sender]
+    if (
+        _deleted_with_parent(origin)
+        or (parent_id := getattr(instance, parent_field.attname)) is None
+    ):
+        return
+
+    parent_field.related_model.objects.adjust_slots({parent_id: -1})
+
+
+for fsu_model in FSU_MODELS:
+    pre_save.connect(
+        snapshot_fsu_parent,
+        sender=fsu_model,
+        dispatch_uid=f"{fsu_model._meta.model_name}_snapshot_fsu_parent",
+    )
+    post_save.connect(
+        update_fsu_counts_on_save,
+        sender=fsu_model,
+        dispatch_uid=f"{fsu_model._meta.model_name}_update_fsu_counts_on_save",
+    )
+    post_delete.connect(
+        update_fsu_counts_on_delete,
+        sender=fsu_model,
+        dispatch_uid=f"{fsu_model._meta.model_name}_update_fsu_counts_on_delete",
+    )
+    post_save.connect(
+        update_version_counts_on_save,
+        sender=fsu_model,
+        dispatch_uid=f"{fsu_model._meta.model_name}_update_version_counts_on_save",
+    )
+    post_delete.connect(
+        update_version_counts_on_delete,
+        sender=fsu_model,
+        dispatch_uid=f"{fsu_model._meta.model_name}_update_version_counts_on_delete",
+    )
+    post_save.connect(
+        update_spare_counts_on_save,
+        sender=fsu_model,
+        dispatch_uid=f"{fsu_model._meta.model_name}_update_spare_counts_on_save",
+    )
+    post_delete.connect(
+        update_spare_counts_on_delete,
+        sender=fsu_model,
+        dispatch_uid=f"{fsu_model._meta.model_name}_update_spare_counts_on_delete",
+    )
+    post_save.connect(
+        update_serial_index_on_save,
+        sender=fsu_model,
+        dispatch_uid=f"{fsu_model._meta.model_name}_update_serial_index_on_save",
+    )
+    post_delete.connect(
+        update_serial_index_on_delete,
+        sender=fsu_model,
+        dispatch_uid=f"{fsu_model._meta.model_name}_update_serial_index_on_delete",
+    )
+
+for child_model in SLOT_PARENT_FIELDS:
+    post_delete.connect(
+        free_parent_slot_on_delete,
+        sender=child_model,
+        dispatch_uid=f"{child_model._meta.model_name}_free_parent_slot_on_delete",
+    )
+
+
+@receiver(pre_save, sender=Device, dispatch_uid="device_snapshot_location_fsu_signal")
+def snapshot_device_location(
+    sender: type[Device],
+    instance: Device,
+    raw: bool = False,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Record the Location of an existing Device before it is saved."""
+    instance._fsu_prior_location = None  # pylint: disable=protected-access
+    if raw or instance._state.adding:  # pylint: disable=protected-access
+        return
+
+    instance._fsu_prior_location = (  # pylint: disable=protected-access
+        sender.objects.filter(pk=instance.pk).values_list("location_id", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Device, dispatch_uid="device_move_version_counts_fsu_signal")
+def move_version_counts_with_device(
+    sender: type[Device],  # pylint: disable=unused-argument
+    instance: Device,
+    created: bool,
+    raw: bool = False,
+    **kwargs: Any,
+) -> None:
+    """Move the version counts of a Device's FSUs when the Device moves to another Location."""
+    prior_location = getattr(instance, "_fsu_prior_location", None)
+    if raw or created or prior_location in (None, instance.location_id):
+        return
+
+    device_counts = FSUVersionCount.objects.count_device_fsus(instance.pk, FSU_MODELS)
+    for model, counts in device_counts.items():
+        deltas: Counter = Counter()
+        for (fsu_type_id, firmware, driver), total in counts.items():
+            deltas[(fsu_type_id, prior_location, firmware, driver)] -= total
+            deltas[(fsu_type_id, instance.location_id, firmware, driver)] += total
+        FSUVersionCount.objects.adjust(model, deltas)
+
+
+@receiver(pre_delete, sender=Device, dispatch_uid="device_snapshot_version_counts_fsu_signal")
+def snapshot_device_version_counts(
+    sender: type[Device],  # pylint: disable=unused-argument
+    instance: Device,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Count the FSUs of a Device before it, and its FSUs, are deleted."""
+    device_counts = FSUVersionCount.objects.count_device_fsus(instance.pk, FSU_MODELS)
+    instance._fsu_version_counts = device_counts  # pylint: disable=protected-access
+
+
+@receiver(post_delete, sender=Device, dispatch_uid="device_delete_version_counts_fsu_signal")
+def remove_device_version_counts(
+    sender: type[Device],  # pylint: disable=unused-argument
+    instance: Device,
+    origin: Any = None,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Remove the FSUs of a deleted Device from the version counts."""
+    # Deleting a Location cascades to its version counts.
+    if isinstance(origin, Location) or (
+        isinstance(origin, QuerySet) and issubclass(origin.model, Location)
+    ):
+        return
+
+    device_counts = getattr(instance, "_fsu_version_counts", {})
+    for model, counts in device_counts.items():
+        FSUVersionCount.objects.adjust(
+            model,
+            {
+                (fsu_type_id, instance.location_id, firmware, driver): -total
+                for (fsu_type_id, firmware, driver), total in counts.items()
+            },
+        )
+
+
+@receiver(pre_save, sender=Location, dispatch_uid="location_snapshot_parent_fsu_signal")
+def snapshot_location_parent(
+    sender: type[Location],
+    instance: Location,
+    raw: bool = False,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Record the parent of an existing Location before it is saved."""
+    instance._fsu_prior_parent = None  # pylint: disable=protected-access
+    if raw or instance._state.adding:  # pylint: disable=protected-access
+        return
+
+    instance._fsu_prior_parent = (  # pylint: disable=protected-access
+        sender.objects.filter(pk=instance.pk).values_list("parent_id", flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Location, dispatch_uid="location_move_spare_counts_fsu_signal")
+def move_spare_counts_with_location(
+    sender: type[Location],  # pylint: disable=unused-argument
+    instance: Location,
+    created: bool,
+    raw: bool = False,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Move the spares stored under a Location when it moves to another parent Location."""
+    prior_parent = getattr(instance, "_fsu_prior_parent", None)
+    if raw or created or prior_parent == instance.parent_id:
+        return
+
+    FSUSpareCount.objects.move_location(instance.pk, prior_parent, instance.parent_id)
+
+
+@receiver(pre_delete, sender=Location, dispatch_uid="location_snapshot_spare_counts_fsu_signal")
+def snapshot_location_spare_counts(
+    sender: type[Location],  # pylint: disable=unused-argument
+    instance: Location,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Record the spare counts of a Location before it, and its counts, are deleted."""
+    instance._fsu_spare_counts = list(  # pylint: disable=protected-access
+        FSUSpareCount.objects.filter(location=instance).values_list(
+            "fsu_content_type", "fsu_type_id", "status", "count"
+        )
+    )
+
+
+@receiver(post_delete, sender=Location, dispatch_uid="location_delete_spare_counts_fsu_signal")
+def remove_location_spare_counts(
+    sender: type[Location],
+    instance: Location,
+    **kwargs: Any,  # pylint: disable=unused-argument
+) -> None:
+    """Remove the spares of a deleted Location from the counts of the Locations above it."""
+    # When the parent is deleted along with the Location, its counts are already gone.
+    spare_counts = getattr(instance, "_fsu_spare_counts", [])
+    if not spare_counts or not sender.objects.filter(pk=instance.parent_id).exists():
+        return
+
+    by_model: dict[int, Counter] = defaultdict(Counter)
+    for content_type_id, fsu_type_id, status_id, count in spare_counts:
+        by_model[content_type_id][(instance.parent_id, fsu_type_id, status_id)] -= count
+    for content_type_id, deltas in by_model.items():
+        FSUSpareCount.objects.adjust(
+            ContentType.objects.get_for_id(content_type_id).model_class(), deltas
+        )
+
+
+def invalidate_plans_on_change(**kwargs: Any) -> None:  # pylint: disable=unused-argument
+    """Discard cached instantiation plans when the data they are compiled from changes."""
+    invalidate_instantiation_plans()
+
+
+for plan_source in (*FSU_TEMPLATE_MODELS, CustomField, Status):
+    post_save.connect(
+        invalidate_plans_on_change,
+        sender=plan_source,
+        dispatch_uid=f"{plan_source._meta.model_name}_invalidate_plans_on_save",
+    )
+    post_delete.connect(
+        invalidate_plans_on_change,
+        sender=plan_source,
+        dispatch_uid=f"{plan_source._meta.model_name}_invalidate_plans_on_delete",
+    )
+
+m2m_changed.connect(
+    invalidate_plans_on_change,
+    sender=CustomField.content_types.through,
+    dispatch_uid="customfield_content_types_invalidate_plans",
+)
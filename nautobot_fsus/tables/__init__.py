@@ -15,6 +15,7 @@
 
 """Table definitions for the Nautobot FSUs app."""
 
+from nautobot_fsus.tables.all_fsus import AllFSUsTable
 from nautobot_fsus.tables.fsu_templates import (
     CPUTemplateTable,
     DiskTemplateTable,
@@ -67,6 +68,7 @@ from nautobot_fsus.tables.fsus import (
 )
 
 __all__ = (
+    "AllFSUsTable",
     "CPUImportTable",
     "CPUTable",
     "CPUTemplateTable",
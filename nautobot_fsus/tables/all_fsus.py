@@ -0,0 +1,95 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Table for the list of FSUs of every type."""
+
+from typing import Any
+
+from django.urls import reverse
+from django.utils.html import format_html
+import django_tables2 as tables
+from nautobot.apps.tables import BaseTable
+from nautobot.core.templatetags.helpers import fgcolor
+
+from nautobot_fsus.models import FSU_MODELS
+from nautobot_fsus.utilities.all_fsus import DEFAULT_ALL_FSU_ORDERING
+
+_FSU_MODELS_BY_NAME = {model._meta.model_name: model for model in FSU_MODELS}
+
+
+def _link(url: str, text: Any) -> str:
+    """Render a link, or a placeholder if there is no text."""
+    return format_html('<a href="{}">{}</a>', url, text) if text else "—"
+
+
+class AllFSUsTable(tables.Table):
+    """Table of FSU rows of the `AllFSUs` query."""
+
+    fsu_model = tables.Column(verbose_name="Category")
+    name = tables.Column()
+    fsu_type = tables.Column(accessor="fsu_type__name", verbose_name="Type", order_by=("fsu_type",))
+    manufacturer = tables.Column(
+        accessor="fsu_type__manufacturer__name", order_by=("manufacturer",)
+    )
+    device = tables.Column(accessor="device__name", order_by=("device",))
+    location = tables.Column(accessor="location__name", order_by=("location",))
+    serial_number = tables.Column()
+    asset_tag = tables.Column()
+    status = tables.Column(accessor="status__name", order_by=("status",))
+
+    class Meta:  # pylint: disable=too-few-public-methods
+        """AllFSUsTable options."""
+
+        attrs = BaseTable.Meta.attrs
+        order_by = DEFAULT_ALL_FSU_ORDERING
+        order_by_field = "sort"
+
+    def render_fsu_model(self, value: str) -> str:
+        """Name of the FSU model, e.g. "GPU"."""
+        return str(_FSU_MODELS_BY_NAME[value]._meta.verbose_name)
+
+    def render_name(self, value: str, record: dict[str, Any]) -> str:
+        """Link to the FSU."""
+        return _link(
+            reverse(f"plugins:nautobot_fsus:{record['fsu_model']}", kwargs={"pk": record["id"]}),
+            value,
+        )
+
+    def render_fsu_type(self, value: str, record: dict[str, Any]) -> str:
+        """Link to the FSU type."""
+        return _link(
+            reverse(
+                f"plugins:nautobot_fsus:{record['fsu_model']}type",
+                kwargs={"pk": record["fsu_type_id"]},
+            ),
+            value,
+        )
+
+    def render_device(self, value: str, record: dict[str, Any]) -> str:
+        """Link to the Device the FSU is installed in."""
+        return _link(reverse("dcim:device", kwargs={"pk": record["device_id"]}), value)
+
+    def render_location(self, value: str, record: dict[str, Any]) -> str:
+        """Link to the Location the FSU is stored in."""
+        return _link(reverse("dcim:location", kwargs={"pk": record["location_id"]}), value)
+
+    def render_status(self, value: str, record: dict[str, Any]) -> str:
+        """Status label, in the color of the Status."""
+        return format_html(
+            '<span class="label" style="color: {}; background-color: #{}">{}</span>',
+            fgcolor(record["status__color"]),
+            record["status__color"],
+            value,
+        )
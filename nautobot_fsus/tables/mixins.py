@@ -15,7 +15,10 @@
 
 """Table mixins and base classes to handle user-definable fields for FSU and FSUTypes models."""
 
+from dataclasses import dataclass
+
 import django_tables2 as tables
+from django_tables2.data import TableQuerysetData
 from nautobot.apps.tables import (
     BaseTable,
     ButtonsColumn,
@@ -24,17 +27,71 @@ from nautobot.apps.tables import (
     TagColumn,
     ToggleColumn,
 )
+from nautobot.core.utils.querysets import maybe_prefetch_related, maybe_select_related
+
+
+@dataclass(frozen=True)
+class ColumnRelations:
+    """Related objects a table column reads to render each row."""
+
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[str, ...] = ()
+
+
+class RelatedColumnsTable(BaseTable):
+    """
+    Base class for tables that load the related objects of their visible columns up front.
+
+    Nautobot follows the accessor of each visible column to select the related objects it
+    needs, but cannot see through properties such as `FSUModel.parent`, or through the
+    relations a column reads when it renders its value. Those are declared per column in
+    `column_relations`, and are added to the table's queryset when the column is shown, so
+    a page of the table takes the same number of queries however many rows it has.
+    """
 
+    column_relations: dict[str, ColumnRelations] = {}
 
-class FSUModelTable(StatusTableMixin, BaseTable):
+    def __init__(self, *args, **kwargs):
+        """Add the related objects of the visible columns to the table's queryset."""
+        super().__init__(*args, **kwargs)
+
+        if not isinstance(self.data, TableQuerysetData):
+            return
+
+        select_fields: list[str] = []
+        prefetch_fields: list[str] = []
+        for column in self.columns:
+            if column.visible and (relations := self.column_relations.get(column.name)):
+                select_fields.extend(relations.select_related)
+                prefetch_fields.extend(relations.prefetch_related)
+
+        queryset = self.data.data
+        if select_fields:
+            queryset = maybe_select_related(queryset, select_fields)
+        if prefetch_fields:
+            queryset = maybe_prefetch_related(queryset, prefetch_fields)
+        self.data.data = queryset
+
+
+class FSUModelTable(StatusTableMixin, RelatedColumnsTable):
     """Base class for FSU tables."""
 
     pk = ToggleColumn()
     name = tables.Column(linkify=True)
-    parent = tables.TemplateColumn("{{ record.parent }}", linkify=True)
+    parent = tables.Column(
+        linkify=lambda value: value.get_absolute_url(),
+        order_by=("device___name", "location___name"),
+    )
+    firmware_version = tables.Column(order_by=("_firmware_version",))
+    driver_version = tables.Column(order_by=("_driver_version",))
     actions: ButtonsColumn
     tags: TagColumn
 
+    column_relations = {
+        "parent": ColumnRelations(select_related=("device", "location")),
+        "fsu_type": ColumnRelations(select_related=("fsu_type__manufacturer",)),
+    }
+
     class Meta(BaseTable.Meta):  # pylint: disable=too-few-public-methods
         """FSUModelTable model options."""
 
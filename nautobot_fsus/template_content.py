@@ -20,15 +20,24 @@ from uuid import UUID
 
 from django.urls import reverse
 from nautobot.apps.ui import TemplateExtension
+from nautobot.dcim.models import Device, Location
 from nautobot.users.models import User
 
 from nautobot_fsus import models, tables
-from nautobot_fsus.models.mixins import FSUTemplateModel
 from nautobot_fsus.tables.mixins import FSUTemplateModelTable
+from nautobot_fsus.utilities.bom import get_bill_of_materials
+from nautobot_fsus.utilities.instantiation import fsu_model_for_template
 
 # pylint: disable=abstract-method
 
 
+def _fsu_counts(parent: Device | Location) -> dict[str, int]:
+    """Get the number of each kind of FSU in a Device or Location, using the stored counts."""
+    fsus = {f"{model._meta.model_name}s": 0 for model in models.FSU_MODELS}
+    fsus.update(models.FSUCount.objects.for_parent(parent))
+    return fsus
+
+
 class FSUsTabContentTemplate(TemplateExtension):
     """Extend the template for a Nautobot model."""
 
@@ -36,6 +45,7 @@ class FSUsTabContentTemplate(TemplateExtension):
     obj_pk: UUID
     fsu_count: int
     parent_type: str
+    has_spares: bool = False
 
     def buttons(self) -> str:
         """Add button with menu for adding FSUs."""
@@ -147,7 +157,7 @@ class FSUsTabContentTemplate(TemplateExtension):
         """Add a tab for displaying child FSUs."""
         tabs: list[dict[str, Any]] = []
 
-        if self.fsu_count > 0:
+        if self.fsu_count > 0 or self.has_spares:
             tabs.append(
                 {
                     "title": self.render(
@@ -176,19 +186,7 @@ class DeviceFSUsTabContent(FSUsTabContentTemplate):
         self.obj_pk = self.context["object"].pk
         self.parent_type = "device"
 
-        fsus = {
-            "cpus": models.CPU.objects.filter(device__pk=self.obj_pk).count(),
-            "disks": models.Disk.objects.filter(device__pk=self.obj_pk).count(),
-            "fans": models.Fan.objects.filter(device__pk=self.obj_pk).count(),
-            "gpus": models.GPU.objects.filter(device__pk=self.obj_pk).count(),
-            "gpubaseboards": models.GPUBaseboard.objects.filter(device__pk=self.obj_pk).count(),
-            "hbas": models.HBA.objects.filter(device__pk=self.obj_pk).count(),
-            "mainboards": models.Mainboard.objects.filter(device__pk=self.obj_pk).count(),
-            "nics": models.NIC.objects.filter(device__pk=self.obj_pk).count(),
-            "otherfsus": models.OtherFSU.objects.filter(device__pk=self.obj_pk).count(),
-            "psus": models.PSU.objects.filter(device__pk=self.obj_pk).count(),
-            "rammodules": models.RAMModule.objects.filter(device__pk=self.obj_pk).count(),
-        }
+        fsus = _fsu_counts(self.context["object"])
         self.fsu_count = sum(fsus.values())
         self.context["fsus"] = fsus
         self.context["parent_type"] = self.parent_type
@@ -309,76 +307,23 @@ class DeviceTypeFSUsContent(TemplateExtension):
         return "\n".join(buttons)
 
     def full_width_page(self) -> str:
-        """Add tables for FSU templates."""
-
-        def _fsu_table(
-            table: Type[FSUTemplateModelTable],
-            fsu: Type[FSUTemplateModel],
-        ) -> FSUTemplateModelTable:
-            """Helper method to setup the table for an FSU template."""
-            fsu_table: FSUTemplateModelTable = table(
-                fsu.objects.filter(device_type__pk=self.obj_pk)
-            )
-            fsu_table.columns.hide("device_type")
-            return fsu_table
-
+        """Add tables for FSU templates, from the DeviceType's bill of materials."""
         user: User | None = getattr(self.context["request"], "user", None)
 
-        self.context["cpu_table"] = _fsu_table(tables.CPUTemplateTable, models.CPUTemplate)
-        if user is not None and user.has_perm("nautobot_fsus.change_cputemplate"):
-            self.context["cpu_table"].columns.show("pk")
-
-        self.context["disk_table"] = _fsu_table(tables.DiskTemplateTable, models.DiskTemplate)
-        if user is not None and user.has_perm("nautobot_fsus.change_disktemplate"):
-            self.context["disk_table"].columns.show("pk")
-
-        self.context["fan_table"] = _fsu_table(tables.FanTemplateTable, models.FanTemplate)
-        if user is not None and user.has_perm("nautobot_fsus.change_fantemplate"):
-            self.context["fan_table"].columns.show("pk")
-
-        self.context["gpu_table"] = _fsu_table(tables.GPUTemplateTable, models.GPUTemplate)
-        if user is not None and user.has_perm("nautobot_fsus.change_gputemplate"):
-            self.context["gpu_table"].columns.show("pk")
-
-        self.context["gpubaseboard_table"] = _fsu_table(
-            tables.GPUBaseboardTemplateTable,
-            models.GPUBaseboardTemplate,
-        )
-        if user is not None and user.has_perm("nautobot_fsus.change_gpubaseboardtemplate"):
-            self.context["gpubaseboard_table"].columns.show("pk")
-
-        self.context["hba_table"] = _fsu_table(tables.HBATemplateTable, models.HBATemplate)
-        if user is not None and user.has_perm("nautobot_fsus.change_hbatemplate"):
-            self.context["hba_table"].columns.show("pk")
-
-        self.context["mainboard_table"] = _fsu_table(
-            tables.MainboardTemplateTable,
-            models.MainboardTemplate,
-        )
-        if user is not None and user.has_perm("nautobot_fsus.change_mainboardtemplate"):
-            self.context["mainboard_table"].columns.show("pk")
-
-        self.context["nic_table"] = _fsu_table(tables.NICTemplateTable, models.NICTemplate)
-        if user is not None and user.has_perm("nautobot_fsus.change_nictemplate"):
-            self.context["nic_table"].columns.show("pk")
-
-        self.context["otherfsu_table"] = _fsu_table(
-            tables.OtherFSUTemplateTable,
-            models.OtherFSUTemplate,
-        )
-        if user is not None and user.has_perm("nautobot_fsus.change_otherfsutemplate"):
-            self.context["otherfsu_table"].columns.show("pk")
-
-        self.context["psu_table"] = _fsu_table(tables.PSUTemplateTable, models.PSUTemplate)
-        if user is not None and user.has_perm("nautobot_fsus.change_psutemplate"):
-            self.context["psu_table"].columns.show("pk")
-
-        self.context["rammodule_table"] = _fsu_table(
-            tables.RAMModuleTemplateTable,
-            models.RAMModuleTemplate,
-        )
-        if user is not None and user.has_perm("nautobot_fsus.change_rammoduletemplate"):
-            self.context["rammodule_table"].columns.show("pk")
+        bom = get_bill_of_materials(self.context["object"])
+        for template_model, templates in bom.templates.items():
+            table_class: Type[FSUTemplateModelTable] = getattr(
+                tables, f"{template_model.__name__}Table"
+            )
+            fsu_table = table_class(templates)
+            fsu_table.columns.hide("device_type")
+            if user is not None and user.has_perm(
+                f"nautobot_fsus.change_{template_model._meta.model_name}"
+            ):
+                fsu_table.columns.show("pk")
+            self.context[f"{fsu_model_for_template(template_model)._meta.model_name}_table"] = (
+                fsu_table
+            )
 
         rendered: str = self.render("nautobot_fsus/inc/devicetype_fsus.html")
         return rendered
@@ -410,23 +355,17 @@ class LocationFSUTabContent(FSUsTabContentTemplate):
         self.obj_pk = self.context["object"].pk
         self.parent_type = "location"
 
-        fsus = {
-            "cpus": models.CPU.objects.filter(location__pk=self.obj_pk).count(),
-            "disks": models.Disk.objects.filter(location__pk=self.obj_pk).count(),
-            "fans": models.Fan.objects.filter(location__pk=self.obj_pk).count(),
-            "gpus": models.GPU.objects.filter(location__pk=self.obj_pk).count(),
-            "gpubaseboards": models.GPUBaseboard.objects.filter(location__pk=self.obj_pk).count(),
-            "hbas": models.HBA.objects.filter(location__pk=self.obj_pk).count(),
-            "mainboards": models.Mainboard.objects.filter(location__pk=self.obj_pk).count(),
-            "nics": models.NIC.objects.filter(location__pk=self.obj_pk).count(),
-            "otherfsus": models.OtherFSU.objects.filter(location__pk=self.obj_pk).count(),
-            "psus": models.PSU.objects.filter(location__pk=self.obj_pk).count(),
-            "rammodules": models.RAMModule.objects.filter(location__pk=self.obj_pk).count(),
-        }
+        fsus = _fsu_counts(self.context["object"])
         self.fsu_count = sum(fsus.values())
         self.context["fsus"] = fsus
         self.context["parent_type"] = self.parent_type
 
+        # A region holds no FSUs itself, but the tab still shows the spares stored within it.
+        if not self.fsu_count:
+            self.has_spares = models.FSUSpareCount.objects.filter(
+                location=self.context["object"]
+            ).exists()
+
 
 class PowerPortParentPSUContent(TemplateExtension):
     """Extend the template for a Power Port."""
@@ -77,6 +77,70 @@ class CPUTestCase(NautobotFSUModelTestCases.FSUTestCase):
         error = context.exception
         self.assertEqual(error.messages[0], "Mainboard has no available CPU sockets.")
 
+    def test_parent_socket_counter(self):
+        """Test that the Mainboard used socket count follows its CPUs."""
+        parent_type = models.MainboardType.objects.create(
+            manufacturer=self.manufacturer,
+            name="Test Mainboard",
+            part_number="x1",
+            cpu_socket_count=1,
+        )
+        parent = models.Mainboard.objects.create(
+            fsu_type=parent_type,
+            device=self.device,
+            name="Test Mainboard",
+            status=self.status,
+        )
+        other = models.Mainboard.objects.create(
+            fsu_type=parent_type,
+            device=self.device,
+            name="Other Mainboard",
+            status=self.status,
+        )
+
+        cpu = models.CPU.objects.create(
+            fsu_type=self.fsu_type,
+            device=self.device,
+            name="cpu_0",
+            status=self.status,
+            parent_mainboard=parent,
+        )
+        parent.refresh_from_db()
+        self.assertEqual(parent.cpu_count, 1)
+
+        # A CPU that is already in a full Mainboard is still valid.
+        cpu = models.CPU.objects.get(pk=cpu.pk)
+        cpu.validated_save()
+
+        # Saving skips the model validation, the locked count still refuses a full Mainboard.
+        with self.assertRaises(ValidationError) as context:
+            models.CPU.objects.create(
+                fsu_type=self.fsu_type,
+                device=self.device,
+                name="cpu_1",
+                status=self.status,
+                parent_mainboard_id=parent.pk,
+            )
+        self.assertEqual(
+            context.exception.message_dict["parent_mainboard"],
+            ["Mainboard has no available CPU sockets."],
+        )
+
+        cpu.parent_mainboard = other
+        cpu.save()
+        parent.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual((parent.cpu_count, other.cpu_count), (0, 1))
+
+        cpu.delete()
+        other.refresh_from_db()
+        self.assertEqual(other.cpu_count, 0)
+
+        models.Mainboard.objects.filter(pk=other.pk).update(cpu_count=5)
+        models.Mainboard.objects.filter(pk=other.pk).rebuild_slots()
+        other.refresh_from_db()
+        self.assertEqual(other.cpu_count, 0)
+
 
 class DiskTestCase(NautobotFSUModelTestCases.FSUTestCase):
     """Tests for the Disk model."""
@@ -149,6 +213,39 @@ class GPUTestCase(NautobotFSUModelTestCases.FSUTestCase):
         error = context.exception
         self.assertEqual(error.messages[0], "GPU Baseboard has no available slots.")
 
+    def test_parent_slot_counter(self):
+        """Test that the GPU Baseboard used slot count follows its GPUs."""
+        parent_type = models.GPUBaseboardType.objects.create(
+            manufacturer=self.manufacturer,
+            name="Test Baseboard",
+            part_number="x1",
+            slot_count=2,
+        )
+        parent = models.GPUBaseboard.objects.create(
+            fsu_type=parent_type,
+            device=self.device,
+            name="Test Baseboard",
+            status=self.status,
+        )
+        gpus = [
+            models.GPU.objects.create(
+                fsu_type=self.fsu_type,
+                device=self.device,
+                name=f"gpu_{num}",
+                status=self.status,
+                parent_gpubaseboard_id=parent.pk,
+            )
+            for num in range(2)
+        ]
+        parent.refresh_from_db()
+        self.assertEqual(parent.gpu_count, 2)
+
+        gpus[0].parent_gpubaseboard = None
+        gpus[0].save()
+        models.GPU.objects.filter(pk=gpus[1].pk).delete()
+        parent.refresh_from_db()
+        self.assertEqual(parent.gpu_count, 0)
+
 
 class GPUBaseboardTestCase(NautobotFSUModelTestCases.FSUTestCase):
     """Tests for the GPUBaseboard model."""
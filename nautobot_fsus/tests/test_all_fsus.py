@@ -0,0 +1,154 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for the list of FSUs of every type."""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from nautobot.core.testing import APITestCase
+from nautobot.dcim.models import Device, DeviceType, Location, Manufacturer
+from nautobot.extras.models import Role, Status
+
+from nautobot_fsus import models
+from nautobot_fsus.utilities.all_fsus import AllFSUs
+
+
+class AllFSUsTestCase(APITestCase):
+    """Test the `AllFSUs` query, and the API and UI lists built on it."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a Device with a GPU, a CPU, and a Fan, and a spare PSU at a new Location."""
+        manufacturer = Manufacturer.objects.first()
+        device_location = Location.objects.filter(location_type__content_types__model="device")[0]
+        cls.location = Location.objects.create(
+            location_type=device_location.location_type,
+            name="All FSUs",
+            status=Status.objects.get_for_model(Location).first(),
+        )
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="All FSUs")
+        cls.device = Device.objects.create(
+            device_type=device_type,
+            role=Role.objects.get_for_model(Device).first(),
+            status=Status.objects.get_for_model(Device).first(),
+            location=cls.location,
+            name="all-fsus",
+        )
+        cls.fsus = {}
+        for fsu_model, name in (
+            (models.GPU, "b-gpu"),
+            (models.CPU, "c-cpu"),
+            (models.Fan, "a-fan"),
+            (models.PSU, "d-psu"),
+        ):
+            type_model = fsu_model._meta.get_field("fsu_type").related_model
+            cls.fsus[fsu_model] = fsu_model.objects.create(
+                fsu_type=type_model.objects.create(
+                    manufacturer=manufacturer,
+                    name=f"All {fsu_model.__name__}",
+                    part_number=f"all_{fsu_model._meta.model_name}",
+                ),
+                device=None if fsu_model is models.PSU else cls.device,
+                location=cls.location if fsu_model is models.PSU else None,
+                status=Status.objects.get(
+                    name="Available" if fsu_model is models.PSU else "Active"
+                ),
+                name=name,
+                serial_number=f"SN-ALL-{fsu_model.__name__}",
+            )
+        cls.url = reverse("plugins-api:nautobot_fsus-api:all-fsus-list")
+
+    def test_union_query(self):
+        """Verify FSUs of every model are filtered, ordered, counted, and sliced in the database."""
+        all_fsus = AllFSUs().filter(device=self.device).order_by("name")
+        with self.assertNumQueries(1):
+            self.assertEqual(all_fsus.count(), 3)
+        with self.assertNumQueries(1):
+            rows = all_fsus[0:2]
+        self.assertEqual(
+            [(row["fsu_model"], row["name"]) for row in rows], [("fan", "a-fan"), ("gpu", "b-gpu")]
+        )
+        self.assertEqual(
+            [row["name"] for row in AllFSUs().filter(device=self.device).order_by("-fsu_model")],
+            ["b-gpu", "a-fan", "c-cpu"],
+        )
+        with self.assertRaises(ValueError):
+            all_fsus.order_by("parent")
+
+    def test_filter_params(self):
+        """Verify the FilterSet of each FSU model is applied to its own FSUs."""
+        all_fsus, errors = AllFSUs().filter_params({"location_id": [self.location.pk]})
+        self.assertEqual(errors, {})
+        self.assertEqual([row["name"] for row in all_fsus], ["d-psu"])
+
+        all_fsus, errors = AllFSUs().filter_params({"q": "SN-ALL-"})
+        self.assertEqual(errors, {})
+        self.assertEqual(all_fsus.count(), 4)
+
+        all_fsus, errors = AllFSUs().filter_params({"status": ["no-such-status"]})
+        self.assertIn("status", errors)
+
+    def test_api_list(self):
+        """Verify the API lists FSUs of every type with one query for the page."""
+        self.user.is_superuser = True
+        self.user.save()
+        url = f"{self.url}?device_id={self.device.pk}&sort=-name&limit=2"
+        self.client.get(url, **self.header)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(len([query for query in queries if "UNION ALL" in query["sql"]]), 2)
+
+        data = response.json()
+        self.assertEqual(data["count"], 3)
+        self.assertEqual([result["name"] for result in data["results"]], ["c-cpu", "b-gpu"])
+        cpu = data["results"][0]
+        self.assertEqual(cpu["fsu_model"], "cpu")
+        self.assertEqual(cpu["device"]["name"], self.device.name)
+        self.assertEqual(cpu["fsu_type"]["name"], "All CPU")
+        self.assertTrue(cpu["url"].endswith(f"/cpus/{self.fsus[models.CPU].pk}/"))
+
+        response = self.client.get(
+            f"{self.url}?serial_number=SN-ALL-GPU&serial_number=SN-ALL-PSU&fsu_model=psu",
+            **self.header,
+        )
+        self.assertEqual([result["name"] for result in response.json()["results"]], ["d-psu"])
+
+        response = self.client.get(f"{self.url}?sort=parent", **self.header)
+        self.assertHttpStatus(response, 400)
+
+    def test_api_list_permissions(self):
+        """Verify only FSUs of the models the user can view are listed."""
+        self.add_permissions("nautobot_fsus.view_gpu", "nautobot_fsus.view_fan")
+        response = self.client.get(f"{self.url}?device_id={self.device.pk}", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(
+            [result["name"] for result in response.json()["results"]], ["a-fan", "b-gpu"]
+        )
+
+    def test_ui_list(self):
+        """Verify the UI list renders FSUs of every type."""
+        self.add_permissions("nautobot_fsus.view_gpu", "nautobot_fsus.view_psu")
+        self.client.force_login(self.user)
+        response = self.client.get(
+            f"{reverse('plugins:nautobot_fsus:all_fsus')}?q=SN-ALL-&sort=name"
+        )
+        self.assertHttpStatus(response, 200)
+        content = response.content.decode()
+        gpu_url = reverse("plugins:nautobot_fsus:gpu", kwargs={"pk": self.fsus[models.GPU].pk})
+        self.assertIn(f'href="{gpu_url}"', content)
+        self.assertLess(content.index("b-gpu"), content.index("d-psu"))
+        self.assertNotIn("c-cpu", content)
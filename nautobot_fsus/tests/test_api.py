@@ -16,9 +16,14 @@
 """Tests for API endpoints defined in the Nautobot FSUs app."""
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.models import F
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from nautobot.dcim.models import Device, Interface, PowerPort
-from nautobot.extras.models import Status
+from nautobot.core.testing import APITestCase
+from nautobot.dcim.models import Device, DeviceType, Interface, Location, Manufacturer, PowerPort
+from nautobot.extras.models import Role, Status
 from rest_framework import status
 
 from nautobot_fsus import models
@@ -263,6 +268,42 @@ class GPUBaseboardAPITestCase(FSUAPITestCases.ParentFSUAPIViewTestCase):
             str(error_message),
         )
 
+    @override_settings(EXEMPT_VIEW_PERMISSIONS=["*"])
+    def test_update_baseboard_keeps_gpu_count(self):
+        """Test the used slot count of a GPUBaseboard follows its GPUs through updates."""
+        self.children[0].device = Device.objects.last()
+        self.children[0].validated_save()
+        data = self.create_data[0]
+        data.pop("gpus", None)
+
+        self.add_permissions("nautobot_fsus.add_gpubaseboard", "nautobot_fsus.change_gpubaseboard")
+        url = reverse("plugins-api:nautobot_fsus-api:gpubaseboard-list")
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+        baseboard = models.GPUBaseboard.objects.get(id=response.data["id"])
+        self.assertEqual(baseboard.gpu_count, 0)
+
+        detail_url = reverse(
+            "plugins-api:nautobot_fsus-api:gpubaseboard-detail", kwargs={"pk": baseboard.pk}
+        )
+        response = self.client.patch(
+            detail_url, {"gpus": [str(x.pk) for x in self.children]}, format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["gpu_count"], 2)
+        baseboard.refresh_from_db()
+        self.assertEqual(baseboard.gpu_count, baseboard.gpus.count())
+        self.assertEqual(baseboard.gpu_count, 2)
+
+        # Saving the baseboard again leaves the count kept by its GPUs.
+        response = self.client.patch(
+            detail_url, {"description": "Updated"}, format="json", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        baseboard.refresh_from_db()
+        self.assertEqual(baseboard.gpu_count, baseboard.gpus.count())
+        self.assertEqual(baseboard.gpu_count, 2)
+
 
 class GPUBaseboardTemplateTestCase(FSUAPITestCases.FSUTemplateAPIViewTestCase):
     """Test the API views for the GPUBaseboard template."""
@@ -704,3 +745,217 @@ class RAMModuleTypeAPITestCase(FSUAPITestCases.FSUTypeAPIViewTestCase):
             i["capacity"] = 64
             i["module_type"] = "l"
             i["technology"] = "ddr5"
+
+
+class DeviceInventoryAPITestCase(APITestCase):
+    """Test the cross-type FSU inventory API endpoint for Devices."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create Devices with GPUs, a GPU Baseboard, and a NIC."""
+        manufacturer = Manufacturer.objects.first()
+        location = Location.objects.filter(location_type__content_types__model="device")[0]
+        device_status = Status.objects.get_for_model(Device).first()
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Inventory")
+        cls.devices = [
+            Device.objects.create(
+                device_type=device_type,
+                role=Role.objects.get_for_model(Device).first(),
+                status=device_status,
+                location=location,
+                name=f"inventory-{num}",
+            )
+            for num in range(3)
+        ]
+
+        fsu_status = Status.objects.get(name="Active")
+        baseboard_type = models.GPUBaseboardType.objects.create(
+            manufacturer=manufacturer, name="Baseboard", part_number="bb_inv"
+        )
+        gpu_type = models.GPUType.objects.create(
+            manufacturer=manufacturer, name="GPU", part_number="gpu_inv"
+        )
+        nic_type = models.NICType.objects.create(
+            manufacturer=manufacturer, name="NIC", part_number="nic_inv"
+        )
+
+        cls.baseboard = models.GPUBaseboard.objects.create(
+            fsu_type=baseboard_type, device=cls.devices[0], status=fsu_status, name="baseboard"
+        )
+        for num in range(2):
+            models.GPU.objects.create(
+                fsu_type=gpu_type,
+                device=cls.devices[0],
+                parent_gpubaseboard=cls.baseboard,
+                status=fsu_status,
+                name=f"gpu{num}",
+            )
+        models.GPU.objects.create(
+            fsu_type=gpu_type, device=cls.devices[0], status=fsu_status, name="gpu-spare"
+        )
+
+        cls.interface = Interface.objects.create(
+            device=cls.devices[1], name="eth0", status=device_status, type="1000base-t"
+        )
+        nic = models.NIC.objects.create(
+            fsu_type=nic_type, device=cls.devices[1], status=fsu_status, name="nic0"
+        )
+        nic.interfaces.add(cls.interface)
+
+    def setUp(self):
+        """Allow the test user to view Devices."""
+        super().setUp()
+        self.add_permissions("dcim.view_device")
+
+    def test_device_inventory(self):
+        """Verify child FSUs are nested under their parent FSU."""
+        self.add_permissions("nautobot_fsus.view_gpu", "nautobot_fsus.view_gpubaseboard")
+        url = reverse(
+            "plugins-api:nautobot_fsus-api:device-inventory", kwargs={"pk": self.devices[0].pk}
+        )
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        data = response.json()
+        self.assertEqual(data["id"], str(self.devices[0].pk))
+        self.assertEqual(len(data["gpubaseboards"]), 1)
+        self.assertEqual(
+            [gpu["name"] for gpu in data["gpubaseboards"][0]["gpus"]], ["gpu0", "gpu1"]
+        )
+        self.assertEqual([gpu["name"] for gpu in data["gpus"]], ["gpu-spare"])
+        self.assertEqual(data["gpus"][0]["fsu_type"]["part_number"], "gpu_inv")
+        self.assertEqual(data["nics"], [])
+
+    def test_device_inventory_permissions(self):
+        """Verify FSUs the user cannot view are left out of the inventory."""
+        self.add_permissions("nautobot_fsus.view_gpu")
+        url = reverse(
+            "plugins-api:nautobot_fsus-api:device-inventory", kwargs={"pk": self.devices[0].pk}
+        )
+        data = self.client.get(url, **self.header).json()
+        self.assertEqual(data["gpubaseboards"], [])
+        self.assertEqual(len(data["gpus"]), 3)
+
+    def test_device_inventory_list(self):
+        """Verify the inventory list can be filtered by Device ID and includes NIC interfaces."""
+        self.add_permissions("nautobot_fsus.view_nic", "dcim.view_interface")
+        url = reverse("plugins-api:nautobot_fsus-api:device-inventory-list")
+        response = self.client.get(
+            f"{url}?id={self.devices[1].pk}&id={self.devices[2].pk}", **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        results = {result["name"]: result for result in response.json()["results"]}
+        self.assertEqual(set(results), {"inventory-1", "inventory-2"})
+        self.assertEqual(
+            results["inventory-1"]["nics"][0]["interfaces"],
+            [{"id": str(self.interface.pk), "name": "eth0"}],
+        )
+        self.assertEqual(results["inventory-2"]["nics"], [])
+
+    def test_device_inventory_query_count(self):
+        """Verify the number of queries does not depend on the number of Devices."""
+        self.user.is_superuser = True
+        self.user.save()
+        url = reverse("plugins-api:nautobot_fsus-api:device-inventory-list")
+
+        query_counts = []
+        # The first request also populates per-process caches.
+        for devices in (self.devices[1:2], self.devices[1:2], self.devices):
+            query_string = "&".join(f"id={device.pk}" for device in devices)
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(f"{url}?{query_string}", **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            query_counts.append(len(queries))
+
+        self.assertEqual(query_counts[1], query_counts[2])
+
+
+class FSUKeysetPaginationTestCase(APITestCase):
+    """Test the opt-in keyset pagination of the FSU API list endpoints."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create GPUs in Devices and in storage Locations."""
+        manufacturer = Manufacturer.objects.first()
+        gpu_type = models.GPUType.objects.create(
+            manufacturer=manufacturer, name="Keyset GPU", part_number="gpu_keyset"
+        )
+        fsu_status = Status.objects.get(name="Active")
+        devices = Device.objects.all()[:2]
+        locations = Location.objects.filter(location_type__content_types__model="device")[:2]
+        for num in range(5):
+            for device in devices:
+                models.GPU.objects.create(
+                    fsu_type=gpu_type, device=device, status=fsu_status, name=f"keyset{num}"
+                )
+            for location in locations:
+                models.GPU.objects.create(
+                    fsu_type=gpu_type, location=location, status=fsu_status, name=f"keyset{num}"
+                )
+
+    def setUp(self):
+        """Make the test user a superuser."""
+        super().setUp()
+        self.user.is_superuser = True
+        self.user.save()
+
+    def _walk(self, url: str) -> list[str]:
+        """Follow the next links from a URL, returning the IDs of every result."""
+        ids = []
+        while url:
+            response = self.client.get(url, **self.header)
+            self.assertHttpStatus(response, status.HTTP_200_OK)
+            self.assertNotIn("count", response.data)
+            ids.extend(str(result["id"]) for result in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_keyset_walk(self):
+        """Verify walking the pages returns every FSU once, in the keyset order."""
+        url = reverse("plugins-api:nautobot_fsus-api:gpu-list")
+        expected = [
+            str(pk)
+            for pk in models.GPU.objects.order_by(
+                F("device_id").asc(nulls_last=True),
+                F("location_id").asc(nulls_last=True),
+                "_name",
+                "id",
+            ).values_list("id", flat=True)
+        ]
+        self.assertEqual(self._walk(f"{url}?cursor=&limit=3"), expected)
+
+    def test_keyset_walk_filtered(self):
+        """Verify the keyset pages honor the list filters."""
+        url = reverse("plugins-api:nautobot_fsus-api:gpu-list")
+        ids = self._walk(f"{url}?cursor=&limit=4&name=keyset1&name=keyset3")
+        self.assertEqual(
+            set(ids),
+            {
+                str(pk)
+                for pk in models.GPU.objects.filter(name__in=["keyset1", "keyset3"]).values_list(
+                    "id", flat=True
+                )
+            },
+        )
+        self.assertEqual(len(ids), 8)
+
+    def test_keyset_walk_types(self):
+        """Verify FSU types can also be paginated by keyset."""
+        url = reverse("plugins-api:nautobot_fsus-api:gputype-list")
+        ids = self._walk(f"{url}?cursor=&limit=2")
+        self.assertEqual(len(ids), models.GPUType.objects.count())
+        self.assertEqual(len(set(ids)), len(ids))
+
+    def test_offset_pagination_unchanged(self):
+        """Verify offset pagination is still the default."""
+        url = reverse("plugins-api:nautobot_fsus-api:gpu-list")
+        response = self.client.get(f"{url}?limit=3&offset=3", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], models.GPU.objects.count())
+
+    def test_invalid_cursor(self):
+        """Verify an invalid cursor is rejected."""
+        url = reverse("plugins-api:nautobot_fsus-api:gpu-list")
+        response = self.client.get(f"{url}?cursor=not-a-cursor", **self.header)
+        self.assertHttpStatus(response, status.HTTP_404_NOT_FOUND)
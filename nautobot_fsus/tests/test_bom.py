@@ -0,0 +1,131 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for the DeviceType FSU bill of materials."""
+
+from django.urls import reverse
+from nautobot.core.testing import APITestCase
+from nautobot.dcim.models import DeviceType, Manufacturer
+
+from nautobot_fsus import models
+from nautobot_fsus.utilities.bom import get_bill_of_materials
+
+
+class BillOfMaterialsTestCase(APITestCase):
+    """Test the bill of materials service, API endpoint, and DeviceType page."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a DeviceType with GPU, PSU, NIC, and Fan templates."""
+        manufacturer = Manufacturer.objects.first()
+        cls.device_type = DeviceType.objects.create(manufacturer=manufacturer, model="BOM")
+        fsu_types = {
+            fsu_model: fsu_model._meta.get_field("fsu_type").related_model.objects.create(
+                manufacturer=manufacturer,
+                name=f"BOM {fsu_model.__name__}",
+                part_number=f"bom_{fsu_model._meta.model_name}",
+            )
+            for fsu_model in (models.GPU, models.PSU, models.NIC, models.Fan)
+        }
+        for num in range(4):
+            models.GPUTemplate.objects.create(
+                device_type=cls.device_type,
+                fsu_type=fsu_types[models.GPU],
+                name=f"gpu{num}",
+                pci_slot_id=f"0000:{num:02}:00.0",
+            )
+        for num in range(2):
+            models.PSUTemplate.objects.create(
+                device_type=cls.device_type,
+                fsu_type=fsu_types[models.PSU],
+                name=f"psu{num}",
+                redundant=True,
+            )
+        models.NICTemplate.objects.create(
+            device_type=cls.device_type,
+            fsu_type=fsu_types[models.NIC],
+            name="nic0",
+            pci_slot_id="0000:80:00.0",
+        )
+        models.FanTemplate.objects.create(
+            device_type=cls.device_type, fsu_type=fsu_types[models.Fan], name="fan0"
+        )
+
+    def test_bill_of_materials(self):
+        """Verify the templates of every model are read with one query, with their FSU types."""
+        with self.assertNumQueries(1):
+            bom = get_bill_of_materials(self.device_type)
+            gpus = bom.templates[models.GPUTemplate]
+            self.assertEqual([gpu.name for gpu in gpus], ["gpu0", "gpu1", "gpu2", "gpu3"])
+            self.assertEqual(gpus[3].pci_slot_id, "0000:03:00.0")
+            self.assertEqual(
+                gpus[0].fsu_type.display, f"{self.device_type.manufacturer.name} BOM GPU [bom_gpu]"
+            )
+            self.assertEqual(gpus[0].device_type, self.device_type)
+            self.assertTrue(bom.templates[models.PSUTemplate][0].redundant)
+            self.assertEqual(bom.templates[models.CPUTemplate], [])
+            self.assertEqual(
+                [(part.fsu_model, part.part_number, part.quantity) for part in bom.parts],
+                [
+                    ("fan", "bom_fan", 1),
+                    ("gpu", "bom_gpu", 4),
+                    ("nic", "bom_nic", 1),
+                    ("psu", "bom_psu", 2),
+                ],
+            )
+
+    def test_api(self):
+        """Verify the API returns the templates and part quantities the user can view."""
+        self.add_permissions(
+            "dcim.view_devicetype",
+            "nautobot_fsus.view_gputemplate",
+            "nautobot_fsus.view_psutemplate",
+        )
+        url = reverse(
+            "plugins-api:nautobot_fsus-api:devicetype-fsu-bom", kwargs={"pk": self.device_type.pk}
+        )
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 200)
+        data = response.json()
+        self.assertEqual(data["model"], "BOM")
+        self.assertEqual(
+            [(part["part_number"], part["quantity"]) for part in data["parts"]],
+            [("bom_gpu", 4), ("bom_psu", 2)],
+        )
+        gpu = next(template for template in data["templates"] if template["name"] == "gpu1")
+        self.assertEqual(gpu["fsu_model"], "gpu")
+        self.assertEqual(gpu["pci_slot_id"], "0000:01:00.0")
+        self.assertEqual(gpu["fsu_type"]["part_number"], "bom_gpu")
+        self.assertNotIn("redundant", gpu)
+
+        self.remove_permissions("dcim.view_devicetype")
+        response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 403)
+
+    def test_device_type_page(self):
+        """Verify the DeviceType page lists the FSU templates from the bill of materials."""
+        self.add_permissions("dcim.view_devicetype")
+        self.client.force_login(self.user)
+        response = self.client.get(self.device_type.get_absolute_url())
+        self.assertHttpStatus(response, 200)
+        content = response.content.decode()
+        self.assertIn(
+            reverse(
+                "plugins:nautobot_fsus:gputemplate",
+                kwargs={"pk": self.device_type.gputemplates.first().pk},
+            ),
+            content,
+        )
+        self.assertIn("0000:80:00.0", content)
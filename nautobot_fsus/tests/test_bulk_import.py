@@ -0,0 +1,360 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for the bulk FSU import engine."""
+
+from hashlib import sha256
+from io import StringIO
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from nautobot.core.testing import APITestCase, TestCase, run_job_for_testing
+from nautobot.dcim.models import Device, DeviceType, Location, Manufacturer
+from nautobot.extras.models import Job as JobModel
+from nautobot.extras.models import JobResult, ObjectChange, Role, ScheduledJob, Status
+from nautobot.users.models import ObjectPermission
+
+from nautobot_fsus import models
+from nautobot_fsus.jobs import BulkImportFSUs
+from nautobot_fsus.utilities.bulk_import import import_fsus, read_csv
+from nautobot_fsus.utilities.export import get_export_columns, iter_csv
+
+
+class BulkImportTestCase(TestCase):
+    """Test the set-based FSU import engine and the command that wraps it."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a Device, a GPU Baseboard with two slots, and a GPU type."""
+        manufacturer = Manufacturer.objects.first()
+        cls.location = Location.objects.filter(location_type__content_types__model="device")[0]
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Import")
+        cls.device = Device.objects.create(
+            device_type=device_type,
+            role=Role.objects.get_for_model(Device).first(),
+            status=Status.objects.get_for_model(Device).first(),
+            location=cls.location,
+            name="import-device",
+        )
+        cls.gpu_type = models.GPUType.objects.create(
+            manufacturer=manufacturer, name="Import GPU", part_number="gpu_import"
+        )
+        baseboard_type = models.GPUBaseboardType.objects.create(
+            manufacturer=manufacturer,
+            name="Import Baseboard",
+            part_number="baseboard_import",
+            slot_count=2,
+        )
+        cls.baseboard = models.GPUBaseboard.objects.create(
+            fsu_type=baseboard_type,
+            device=cls.device,
+            status=Status.objects.get(name="Active"),
+            name="baseboard0",
+        )
+
+    def _rows(self, count: int, **values) -> list[dict[str, str]]:
+        """Build import rows for spare GPUs in the storage Location."""
+        return [
+            {
+                "location": self.location.name,
+                "name": f"spare{num}",
+                "fsu_type": self.gpu_type.name,
+                "serial_number": f"SN-IMPORT-{num}",
+                "status": "Available",
+                **values,
+            }
+            for num in range(count)
+        ]
+
+    def _count_queries(self, rows: list[dict[str, str]]) -> int:
+        """Import rows and return the number of database queries it ran."""
+        with CaptureQueriesContext(connection) as queries:
+            result = import_fsus(models.GPU, rows)
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.created, len(rows))
+        return len(queries)
+
+    def test_import_query_count(self):
+        """Verify the number of queries does not depend on the number of rows."""
+        small = self._count_queries(self._rows(5, location=str(self.location.pk)))
+        models.GPU.objects.filter(fsu_type=self.gpu_type).delete()
+        # The test data may already have GPUs stored in the Location.
+        existing = models.FSUCount.objects.for_parent(self.location).get(
+            f"{models.GPU._meta.model_name}s", 0
+        )
+        large = self._count_queries(self._rows(500))
+        self.assertEqual(small, large)
+
+        gpu = models.GPU.objects.get(name="spare42")
+        self.assertEqual(gpu.location, self.location)
+        self.assertEqual(gpu.serial_number, "SN-IMPORT-42")
+        self.assertEqual(gpu.status.name, "Available")
+        self.assertEqual(
+            models.FSUCount.objects.for_parent(self.location)[f"{models.GPU._meta.model_name}s"],
+            existing + 500,
+        )
+
+    def test_import_errors(self):
+        """Verify invalid rows are reported by row number, and nothing is created by default."""
+        models.GPU.objects.create(
+            fsu_type=self.gpu_type,
+            location=self.location,
+            status=Status.objects.get(name="Active"),
+            name="spare1",
+        )
+        rows = self._rows(4)
+        rows[0]["fsu_type"] = "No Such GPU"
+        rows[2]["location"] = ""
+        rows[3]["name"] = "spare0"
+
+        result = import_fsus(models.GPU, rows, start_row=2)
+        self.assertEqual(result.created, 0)
+        self.assertEqual(
+            result.errors,
+            [
+                (2, "fsu_type: 'No Such GPU' not found."),
+                (3, "name: 'spare1' is already in use in the location."),
+                (4, "A device or a storage location is required."),
+            ],
+        )
+        self.assertEqual(models.GPU.objects.filter(fsu_type=self.gpu_type).count(), 1)
+
+        # With a partial import the valid rows are created, and names are unique within the file.
+        rows[0]["fsu_type"] = self.gpu_type.name
+        result = import_fsus(models.GPU, rows, partial=True)
+        self.assertEqual(result.created, 1)
+        self.assertEqual(
+            result.errors[-1], (4, "name: 'spare0' is already in use in the location.")
+        )
+
+    def test_import_parent_capacity(self):
+        """Verify child FSUs are checked against the free slots of their parent FSU."""
+        rows = self._rows(3, location="", device=self.device.name, parent_gpubaseboard="baseboard0")
+        result = import_fsus(models.GPU, rows)
+        self.assertEqual(result.errors, [(3, "parent_gpubaseboard: baseboard0 has no free slots.")])
+
+        result = import_fsus(models.GPU, rows[:2])
+        self.assertEqual(result.created, 2)
+        self.assertEqual(self.baseboard.gpus.count(), 2)
+
+    def test_export_roundtrip(self):
+        """Verify a CSV export can be imported again with the management command."""
+        import_fsus(models.GPU, self._rows(10))
+        queryset = models.GPU.objects.filter(fsu_type=self.gpu_type)
+        exported = "".join(iter_csv(queryset, get_export_columns(models.GPU)))
+        serial_numbers = sorted(row["serial_number"] for row in read_csv(StringIO(exported)))
+        queryset.delete()
+
+        with TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / "gpus.csv"
+            csv_path.write_text(exported, encoding="utf-8")
+            out = StringIO()
+            call_command("import_fsus", "gpu", str(csv_path), stdout=out)
+            self.assertIn("Imported 10 of 10", out.getvalue())
+            self.assertEqual(
+                sorted(queryset.values_list("serial_number", flat=True)), serial_numbers
+            )
+
+            # Every name is now in use, so importing the file again fails as a whole.
+            with self.assertRaises(CommandError):
+                call_command("import_fsus", "gpu", str(csv_path), stdout=out, stderr=out)
+        self.assertEqual(queryset.count(), 10)
+
+
+class BulkImportJobTestCase(APITestCase):
+    """Test the background bulk import Job and the API endpoint that submits it."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a GPU type, and NDJSON data for 25 spare GPUs with one invalid row."""
+        cls.location = Location.objects.filter(location_type__content_types__model="device")[0]
+        cls.gpu_type = models.GPUType.objects.create(
+            manufacturer=Manufacturer.objects.first(), name="Job GPU", part_number="gpu_job"
+        )
+        rows = [
+            {
+                "location": cls.location.name,
+                "name": f"job{num:02}",
+                "fsu_type": cls.gpu_type.name,
+                "status": "Available",
+                "serial_number": None,
+            }
+            for num in range(25)
+        ]
+        rows[12]["status"] = "No Such Status"
+        cls.data = "".join(f"{json.dumps(row)}\n" for row in rows).encode()
+        cls.job_model = JobModel.objects.get(
+            module_name=BulkImportFSUs.__module__, job_class_name=BulkImportFSUs.__name__
+        )
+
+    def _run_job(self, **kwargs) -> JobResult:
+        """Run the Job with the NDJSON data, in batches of 10 rows."""
+        job_kwargs = BulkImportFSUs.serialize_data(
+            {"import_file": SimpleUploadedFile("gpus.ndjson", self.data)}
+        )
+        return run_job_for_testing(
+            self.job_model,
+            fsu_model="gpu",
+            batch_size=10,
+            resume=True,
+            **job_kwargs,
+            **kwargs,
+        )
+
+    def test_job_batches(self):
+        """Verify the Job imports the valid rows and records the progress and errors."""
+        job_result = self._run_job()
+        self.assertEqual(job_result.status, "SUCCESS")
+
+        progress = models.FSUImport.objects.get(job_result=job_result)
+        self.assertTrue(progress.completed)
+        self.assertEqual(progress.total_rows, 25)
+        self.assertEqual(progress.processed_rows, 25)
+        self.assertEqual(progress.created_count, 24)
+        self.assertEqual(progress.errors, [[13, "status: 'No Such Status' not found."]])
+        self.assertEqual(models.GPU.objects.filter(fsu_type=self.gpu_type).count(), 24)
+        self.assertEqual(
+            ObjectChange.objects.filter(
+                changed_object_type=ContentType.objects.get_for_model(models.GPU),
+                changed_object_id__in=models.GPU.objects.filter(fsu_type=self.gpu_type).values(
+                    "pk"
+                ),
+                action="create",
+                change_context_detail=job_result.job_model.class_path,
+            ).count(),
+            24,
+        )
+
+    def test_job_resume(self):
+        """Verify the Job continues an interrupted import of the same file after its last batch."""
+        models.FSUImport.objects.create(
+            fsu_content_type=ContentType.objects.get_for_model(models.GPU),
+            checksum=sha256(self.data).hexdigest(),
+            batch_size=10,
+            total_rows=25,
+            processed_rows=20,
+            created_count=19,
+            errors=[[13, "status: 'No Such Status' not found."]],
+        )
+        job_result = self._run_job()
+
+        progress = models.FSUImport.objects.get(job_result=job_result)
+        self.assertTrue(progress.completed)
+        self.assertEqual(progress.created_count, 24)
+        self.assertEqual(len(progress.errors), 1)
+        self.assertEqual(
+            sorted(
+                models.GPU.objects.filter(fsu_type=self.gpu_type).values_list("name", flat=True)
+            ),
+            [f"job{num:02}" for num in range(20, 25)],
+        )
+
+    def test_api_submit(self):
+        """Verify a file submitted to the API is imported by the Job."""
+        url = reverse("plugins-api:nautobot_fsus-api:fsuimport-list")
+        data = {"fsu_model": "gpu", "batch_size": 10}
+
+        self.add_permissions("nautobot_fsus.add_fsuimport", "nautobot_fsus.view_fsuimport")
+        response = self.client.post(
+            url,
+            {**data, "import_file": SimpleUploadedFile("gpus.ndjson", self.data)},
+            format="multipart",
+            **self.header,
+        )
+        self.assertHttpStatus(response, 403)
+
+        # Related objects are only resolved if the user can view them.
+        self.add_permissions(
+            "extras.run_job",
+            "nautobot_fsus.add_gpu",
+            "nautobot_fsus.view_gputype",
+            "dcim.view_location",
+        )
+        self.job_model.enabled = True
+        self.job_model.save()
+        # The Job is sent to the (eager) worker once the request's transaction commits.
+        with (
+            mock.patch("nautobot_fsus.api.views.get_worker_count", return_value=1),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = self.client.post(
+                url,
+                {**data, "import_file": SimpleUploadedFile("gpus.ndjson", self.data)},
+                format="multipart",
+                **self.header,
+            )
+        self.assertHttpStatus(response, 201)
+        self.assertIsNone(response.json()["scheduled_job"])
+
+        job_result_id = response.json()["job_result"]["id"]
+        response = self.client.get(f"{url}?job_result={job_result_id}", **self.header)
+        self.assertHttpStatus(response, 200)
+        progress = response.json()["results"][0]
+        self.assertEqual(progress["fsu_model"], "gpu")
+        self.assertEqual(progress["file_name"], "gpus.ndjson")
+        self.assertEqual(progress["created_count"], 24)
+        self.assertTrue(progress["completed"])
+
+    @mock.patch("nautobot_fsus.api.views.get_worker_count", return_value=1)
+    def test_api_submit_job_checks(self, _get_worker_count):
+        """Verify the API checks the Job itself, as Nautobot's Job run endpoint does."""
+        url = reverse("plugins-api:nautobot_fsus-api:fsuimport-list")
+        self.add_permissions("nautobot_fsus.add_fsuimport", "nautobot_fsus.add_gpu")
+        self.job_model.enabled = True
+        self.job_model.save()
+
+        def submit():
+            return self.client.post(
+                url,
+                {
+                    "fsu_model": "gpu",
+                    "import_file": SimpleUploadedFile("gpus.ndjson", self.data),
+                },
+                format="multipart",
+                **self.header,
+            )
+
+        # Permission to run only other Jobs does not extend to this one.
+        permission = ObjectPermission.objects.create(
+            name="Run other Jobs", actions=["run"], constraints={"enabled": False}
+        )
+        permission.object_types.add(ContentType.objects.get_for_model(JobModel))
+        permission.users.add(self.user)
+        response = submit()
+        self.assertHttpStatus(response, 403)
+        self.assertEqual(
+            response.json()["detail"], "This user does not have permission to run the import Job."
+        )
+
+        permission.constraints = {"pk": str(self.job_model.pk)}
+        permission.save()
+        self.job_model.approval_required = True
+        self.job_model.save()
+        job_results = JobResult.objects.count()
+        response = submit()
+        self.assertHttpStatus(response, 201)
+        self.assertIsNone(response.json()["job_result"])
+        scheduled_job = ScheduledJob.objects.get(pk=response.json()["scheduled_job"]["id"])
+        self.assertTrue(scheduled_job.approval_required)
+        self.assertEqual(JobResult.objects.count(), job_results)
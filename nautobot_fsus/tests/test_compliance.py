@@ -0,0 +1,189 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for the FSU version counts and the firmware compliance report."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from nautobot.core.testing import APITestCase
+from nautobot.dcim.models import Device, DeviceType, Location, Manufacturer
+from nautobot.extras.models import Role, Status
+
+from nautobot_fsus import models
+from nautobot_fsus.utilities.bulk_import import import_fsus
+
+
+class FirmwareComplianceTestCase(APITestCase):
+    """Test the maintenance of the version counts and the firmware compliance API endpoint."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a Device with GPUs on mixed firmware, and spare GPUs at another Location."""
+        manufacturer = Manufacturer.objects.first()
+        cls.locations = Location.objects.filter(
+            location_type__content_types__model="device"
+        ).order_by("name")[:2]
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Compliance")
+        cls.device = Device.objects.create(
+            device_type=device_type,
+            role=Role.objects.get_for_model(Device).first(),
+            status=Status.objects.get_for_model(Device).first(),
+            location=cls.locations[0],
+            name="compliance",
+        )
+        cls.gpu_type = models.GPUType.objects.create(
+            manufacturer=manufacturer,
+            name="Compliance GPU",
+            part_number="compliance_gpu",
+            target_firmware_version="96.00.89",
+            target_driver_version="535.104.05",
+        )
+        status = Status.objects.get(name="Active")
+        for num, firmware in enumerate(["96.00.89", "96.00.89", "96.00.89", "96.00.61"]):
+            models.GPU.objects.create(
+                fsu_type=cls.gpu_type,
+                device=cls.device,
+                status=status,
+                name=f"gpu{num}",
+                firmware_version=firmware,
+                driver_version="535.104.05",
+            )
+        for num in range(2):
+            models.GPU.objects.create(
+                fsu_type=cls.gpu_type,
+                location=cls.locations[1],
+                status=status,
+                name=f"spare{num}",
+                firmware_version="96.0.89",
+            )
+        cls.url = reverse("plugins-api:nautobot_fsus-api:firmware-compliance-list")
+
+    def _counts(self) -> dict[tuple, int]:
+        """Stored version counts of the test GPU type."""
+        return {
+            (location_id, firmware, driver): count
+            for location_id, firmware, driver, count in models.FSUVersionCount.objects.filter(
+                fsu_type_id=self.gpu_type.pk
+            ).values_list("location", "firmware_version", "driver_version", "count")
+        }
+
+    def test_counts_follow_changes(self):
+        """Verify the version counts follow FSU and Device changes, and match a rebuild."""
+        site, store = (location.pk for location in self.locations)
+        self.assertEqual(
+            self._counts(),
+            {
+                (site, "96.00.89", "535.104.05"): 3,
+                (site, "96.00.61", "535.104.05"): 1,
+                (store, "96.0.89", ""): 2,
+            },
+        )
+
+        gpu = models.GPU.objects.get(name="gpu3")
+        gpu.firmware_version = "96.00.89"
+        gpu.save()
+        models.GPU.objects.get(name="spare0").delete()
+        self.assertEqual(
+            self._counts(),
+            {(site, "96.00.89", "535.104.05"): 4, (store, "96.0.89", ""): 1},
+        )
+
+        self.device.location = self.locations[1]
+        self.device.save()
+        self.assertEqual(
+            self._counts(),
+            {(store, "96.00.89", "535.104.05"): 4, (store, "96.0.89", ""): 1},
+        )
+
+        import_fsus(
+            models.GPU,
+            [
+                {
+                    "location": self.locations[0].name,
+                    "name": "spare9",
+                    "fsu_type": "Compliance GPU",
+                    "status": "Available",
+                }
+            ],
+        )
+        expected = {
+            (store, "96.00.89", "535.104.05"): 4,
+            (store, "96.0.89", ""): 1,
+            (site, "", ""): 1,
+        }
+        self.assertEqual(self._counts(), expected)
+
+        out = StringIO()
+        call_command("rebuild_fsu_version_counts", stdout=out)
+        self.assertIn("Stored", out.getvalue())
+        self.assertEqual(self._counts(), expected)
+
+        self.device.delete()
+        self.assertEqual(self._counts(), {(store, "96.0.89", ""): 1, (site, "", ""): 1})
+
+    def test_api_compliance(self):
+        """Verify the report counts versions, and compliance with the FSU type's targets."""
+        self.user.is_superuser = True
+        self.user.save()
+        response = self.client.get(f"{self.url}?fsu_type_id={self.gpu_type.pk}", **self.header)
+        self.assertHttpStatus(response, 200)
+        results = response.json()["results"]
+        self.assertEqual(
+            [result["location"]["id"] for result in results],
+            [str(location.pk) for location in self.locations],
+        )
+
+        site, store = results
+        self.assertEqual(site["fsu_model"], "gpu")
+        self.assertEqual(site["fsu_type"]["part_number"], "compliance_gpu")
+        self.assertEqual(site["total"], 4)
+        self.assertEqual(
+            site["firmware"],
+            {
+                "target": "96.00.89",
+                "on_target": 3,
+                "compliance": 75.0,
+                "versions": {"96.00.89": 3, "96.00.61": 1},
+            },
+        )
+        self.assertEqual(site["driver"]["compliance"], 100.0)
+        # Versions are compared in version order, so "96.0.89" is on the target "96.00.89".
+        self.assertEqual(store["firmware"]["on_target"], 2)
+        self.assertEqual(store["driver"]["on_target"], 0)
+
+        self.gpu_type.target_firmware_version = ""
+        self.gpu_type.save()
+        response = self.client.get(
+            f"{self.url}?fsu_model=gpu&location={self.locations[1].name}", **self.header
+        )
+        result = next(
+            result
+            for result in response.json()["results"]
+            if result["fsu_type"]["id"] == str(self.gpu_type.pk)
+        )
+        self.assertEqual(result["total"], 2)
+        self.assertIsNone(result["firmware"]["compliance"])
+
+    def test_api_compliance_permissions(self):
+        """Verify only FSU models and Locations the user can view are reported."""
+        response = self.client.get(f"{self.url}?fsu_type_id={self.gpu_type.pk}", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.json()["count"], 0)
+
+        self.add_permissions("nautobot_fsus.view_gpu", "dcim.view_location")
+        response = self.client.get(f"{self.url}?fsu_type_id={self.gpu_type.pk}", **self.header)
+        self.assertEqual(response.json()["count"], 2)
@@ -0,0 +1,106 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for the streaming FSU export."""
+
+import csv
+from io import StringIO
+import json
+
+from django.urls import reverse
+from nautobot.core.testing import APITestCase
+from nautobot.dcim.models import Device, DeviceType, Location, Manufacturer
+from nautobot.extras.models import Role, Status
+
+from nautobot_fsus import models
+from nautobot_fsus.utilities.export import get_export_columns
+
+
+class StreamingExportTestCase(APITestCase):
+    """Test the streaming CSV and NDJSON export of the FSU list views and API."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create GPUs in a Device and in a storage Location."""
+        manufacturer = Manufacturer.objects.first()
+        cls.location = Location.objects.filter(location_type__content_types__model="device")[0]
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Export")
+        cls.device = Device.objects.create(
+            device_type=device_type,
+            role=Role.objects.get_for_model(Device).first(),
+            status=Status.objects.get_for_model(Device).first(),
+            location=cls.location,
+            name="export-device",
+        )
+        gpu_type = models.GPUType.objects.create(
+            manufacturer=manufacturer, name="Export GPU", part_number="gpu_export"
+        )
+        status = Status.objects.get(name="Active")
+        for num in range(5):
+            models.GPU.objects.create(
+                fsu_type=gpu_type,
+                device=cls.device,
+                status=status,
+                name=f"export{num}",
+                serial_number=f"SN-EXPORT-{num}",
+            )
+        models.GPU.objects.create(
+            fsu_type=gpu_type, location=cls.location, status=status, name="export-spare"
+        )
+
+    def test_ui_csv_export(self):
+        """Verify the UI export streams the import form columns for the filtered FSUs."""
+        self.add_permissions("nautobot_fsus.view_gpu")
+        self.client.force_login(self.user)
+        url = reverse("plugins:nautobot_fsus:gpu_export", kwargs={"export_format": "csv"})
+        response = self.client.get(f"{url}?device_id={self.device.pk}")
+        self.assertHttpStatus(response, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv")
+
+        rows = list(csv.DictReader(StringIO(b"".join(response.streaming_content).decode())))
+        self.assertEqual(list(rows[0]), [header for header, _ in get_export_columns(models.GPU)])
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(
+            {(row["device"], row["location"], row["fsu_type"]) for row in rows},
+            {("export-device", "", "Export GPU")},
+        )
+        self.assertIn("SN-EXPORT-0", {row["serial_number"] for row in rows})
+
+    def test_ui_export_permission(self):
+        """Verify users without permission to view FSUs cannot export them."""
+        self.client.force_login(self.user)
+        url = reverse("plugins:nautobot_fsus:gpu_export", kwargs={"export_format": "csv"})
+        response = self.client.get(url)
+        self.assertHttpStatus(response, 403)
+
+    def test_api_ndjson_export(self):
+        """Verify the API export streams one JSON object per filtered FSU."""
+        self.add_permissions("nautobot_fsus.view_gpu")
+        url = reverse(
+            "plugins-api:nautobot_fsus-api:gpu-export", kwargs={"export_format": "ndjson"}
+        )
+        response = self.client.get(
+            f"{url}?location_id={self.location.pk}&name=export-spare", **self.header
+        )
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 1)
+        record = json.loads(lines[0])
+        self.assertEqual(record["name"], "export-spare")
+        self.assertEqual(record["location"], self.location.name)
+        self.assertIsNone(record["device"])
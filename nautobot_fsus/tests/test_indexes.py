@@ -0,0 +1,66 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for the FSU access pattern indexes."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+from nautobot_fsus import models
+
+
+class FSUIndexBenchmarkTestCase(TestCase):
+    """Test the access pattern index benchmark command."""
+
+    def test_benchmark(self):
+        """Verify the benchmark compares each query, and rolls back its data and index changes."""
+        count = models.GPU.objects.count()
+        out = StringIO()
+        call_command("benchmark_fsu_indexes", "--rows", "2000", "--repeat", "1", stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("Generating 2,000 GPUs", output)
+        for title in (
+            "FSUs of a Device, by name",
+            "Spares at a Location with a status, by name",
+            "Instances of a type with a status",
+            "Instances of a type, by firmware version",
+        ):
+            self.assertIn(title, output)
+        self.assertEqual(output.count("Without access pattern indexes:"), 4)
+        self.assertEqual(output.count("With access pattern indexes:"), 4)
+
+        self.assertEqual(models.GPU.objects.count(), count)
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, models.GPU._meta.db_table
+            )
+        for index in models.GPU._meta.indexes:
+            self.assertIn(index.name, constraints)
+        self.assertIn("fsus_gpu_spares", constraints)
+
+    def test_spares_index(self):
+        """Verify the spares index is a partial index, and not part of the model."""
+        self.assertNotIn("fsus_gpu_spares", [index.name for index in models.GPU._meta.indexes])
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexdef FROM pg_indexes WHERE indexname = %s", ["fsus_gpu_spares"]
+            )
+            (definition,) = cursor.fetchone()
+        self.assertIn("(location_id, status_id, _name)", definition)
+        self.assertIn("WHERE (location_id IS NOT NULL)", definition)
@@ -0,0 +1,214 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for bulk instantiation of FSUs from FSU templates."""
+
+from dataclasses import FrozenInstanceError
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from nautobot.core.testing import TestCase
+from nautobot.dcim.models import Device, DeviceType, Location, Manufacturer
+from nautobot.extras.choices import CustomFieldTypeChoices
+from nautobot.extras.models import CustomField, Role, Status
+
+from nautobot_fsus import models
+from nautobot_fsus.jobs import InstantiateFSUs
+from nautobot_fsus.utilities.instantiation import (
+    compile_instantiation_plans,
+    get_instantiation_plans,
+    instantiate_fsus,
+)
+
+
+class InstantiateFSUsTestCase(TestCase):
+    """Test the set-based FSU instantiation engine and the Job that wraps it."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a DeviceType with FSU templates."""
+        manufacturer = Manufacturer.objects.first()
+        cls.device_type = DeviceType.objects.create(manufacturer=manufacturer, model="GPU Server")
+        cls.location = Location.objects.filter(location_type__content_types__model="device")[0]
+        cls.role = Role.objects.get_for_model(Device).first()
+        cls.status = Status.objects.get_for_model(Device).first()
+
+        gpu_type = models.GPUType.objects.create(
+            manufacturer=manufacturer, name="Test GPU", part_number="gpu_test"
+        )
+        psu_type = models.PSUType.objects.create(
+            manufacturer=manufacturer, name="Test PSU", part_number="psu_test"
+        )
+        for num in range(8):
+            models.GPUTemplate.objects.create(
+                device_type=cls.device_type,
+                fsu_type=gpu_type,
+                name=f"gpu{num}",
+                pci_slot_id=f"0000:{num:02}:00.0",
+            )
+        for num in range(2):
+            models.PSUTemplate.objects.create(
+                device_type=cls.device_type,
+                fsu_type=psu_type,
+                name=f"psu{num}",
+                redundant=True,
+            )
+
+    def _bulk_create_devices(self, count: int, prefix: str = "server") -> list[Device]:
+        """Create Devices with bulk_create(), which does not trigger FSU instantiation."""
+        return Device.objects.bulk_create(
+            [
+                Device(
+                    device_type=self.device_type,
+                    role=self.role,
+                    status=self.status,
+                    location=self.location,
+                    name=f"{prefix}-{num}",
+                )
+                for num in range(count)
+            ]
+        )
+
+    def test_instantiate_bulk_created_devices(self):
+        """Verify FSUs are created for Devices created with bulk_create()."""
+        devices = self._bulk_create_devices(5)
+        self.assertFalse(models.GPU.objects.filter(device__in=devices).exists())
+
+        result = instantiate_fsus(devices)
+
+        self.assertEqual(result.devices, 5)
+        self.assertEqual(result.created, {"GPUs": 40, "PSUs": 10})
+        self.assertGreater(result.devices_per_second, 0)
+
+        gpu = models.GPU.objects.get(device=devices[0], name="gpu3")
+        self.assertEqual(gpu.pci_slot_id, "0000:03:00.0")
+        self.assertEqual(gpu.status.name, "Active")
+        self.assertTrue(models.PSU.objects.get(device=devices[0], name="psu1").redundant)
+        self.assertEqual(models.FSUCount.objects.for_parent(devices[0]), {"gpus": 8, "psus": 2})
+
+        # Repeating the instantiation only creates FSUs that are missing.
+        models.GPU.objects.filter(device=devices[0], name="gpu3").delete()
+        result = instantiate_fsus(devices)
+        self.assertEqual(result.created, {"GPUs": 1})
+        self.assertEqual(result.skipped, 49)
+
+    def test_query_count_independent_of_device_count(self):
+        """Verify the number of queries does not grow with the number of Devices."""
+        with CaptureQueriesContext(connection) as few:
+            instantiate_fsus(self._bulk_create_devices(2, prefix="few"))
+        with CaptureQueriesContext(connection) as many:
+            instantiate_fsus(self._bulk_create_devices(50, prefix="many"))
+
+        self.assertEqual(len(few), len(many))
+
+    def test_instantiate_fsus_job(self):
+        """Verify the Job instantiates FSUs for the Devices of a DeviceType."""
+        devices = self._bulk_create_devices(3)
+
+        InstantiateFSUs().run(
+            devices=None,
+            device_types=[self.device_type],
+            locations=None,
+            skip_existing=True,
+            batch_size=1000,
+        )
+
+        self.assertEqual(models.GPU.objects.filter(device__in=devices).count(), 24)
+        self.assertEqual(models.PSU.objects.filter(device__in=devices).count(), 6)
+
+
+class InstantiationPlanTestCase(TestCase):
+    """Test the cached per-DeviceType instantiation plans."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a DeviceType with FSU templates."""
+        manufacturer = Manufacturer.objects.first()
+        cls.device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Plan Server")
+        cls.location = Location.objects.filter(location_type__content_types__model="device")[0]
+        cls.role = Role.objects.get_for_model(Device).first()
+        cls.status = Status.objects.get_for_model(Device).first()
+
+        cls.fan_type = models.FanType.objects.create(
+            manufacturer=manufacturer, name="Test Fan", part_number="fan_test"
+        )
+        for num in range(4):
+            models.FanTemplate.objects.create(
+                device_type=cls.device_type, fsu_type=cls.fan_type, name=f"fan{num}"
+            )
+
+    def _create_device(self, name: str) -> Device:
+        """Create a Device, caching the instantiation plans compiled for it."""
+        with self.captureOnCommitCallbacks(execute=True):
+            return Device.objects.create(
+                device_type=self.device_type,
+                role=self.role,
+                status=self.status,
+                location=self.location,
+                name=name,
+            )
+
+    def test_cached_plan_needs_no_lookups(self):
+        """Verify creating a Device with a cached plan does not query templates or defaults."""
+        self._create_device("plan-1")
+
+        with CaptureQueriesContext(connection) as queries:
+            device = self._create_device("plan-2")
+
+        sql = " ".join(query["sql"] for query in queries.captured_queries)
+        self.assertNotIn("nautobot_fsus_fantemplate", sql)
+        self.assertNotIn("extras_customfield", sql)
+        self.assertEqual(sql.count('INSERT INTO "nautobot_fsus_fan"'), 1)
+        self.assertEqual(models.Fan.objects.filter(device=device).count(), 4)
+        self.assertEqual(models.FSUCount.objects.for_parent(device), {"fans": 4})
+
+    def test_template_change_invalidates_plan(self):
+        """Verify a template change moves to a new plan version with the updated templates."""
+        plan = get_instantiation_plans([self.device_type.pk])[self.device_type.pk]
+        self.assertEqual(len(plan.steps[0].fsus), 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            models.FanTemplate.objects.create(
+                device_type=self.device_type, fsu_type=self.fan_type, name="fan4"
+            )
+
+        new_plan = get_instantiation_plans([self.device_type.pk])[self.device_type.pk]
+        self.assertNotEqual(plan.version, new_plan.version)
+        self.assertEqual(len(new_plan.steps[0].fsus), 5)
+
+        device = self._create_device("plan-3")
+        self.assertEqual(models.Fan.objects.filter(device=device).count(), 5)
+
+    def test_custom_field_change_invalidates_plan(self):
+        """Verify new custom field defaults are used by the plan."""
+        self._create_device("plan-4")
+
+        custom_field = CustomField.objects.create(
+            label="Fan Zone", key="fan_zone", type=CustomFieldTypeChoices.TYPE_TEXT, default="A"
+        )
+        custom_field.content_types.set([ContentType.objects.get_for_model(models.Fan)])
+
+        device = self._create_device("plan-5")
+        self.assertEqual(models.Fan.objects.filter(device=device).first().cf["fan_zone"], "A")
+
+    def test_plan_is_immutable(self):
+        """Verify compiled plans cannot be modified."""
+        plan = compile_instantiation_plans([self.device_type.pk])[self.device_type.pk]
+
+        with self.assertRaises(FrozenInstanceError):
+            plan.status_id = None
+        with self.assertRaises(FrozenInstanceError):
+            plan.steps[0].fsus = ()
@@ -0,0 +1,503 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests that list views and API endpoints run a constant number of queries."""
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from nautobot.core.testing import APITestCase
+from nautobot.dcim.models import (
+    Device,
+    DeviceType,
+    Interface,
+    Location,
+    Manufacturer,
+    PowerPort,
+)
+from nautobot.extras.context_managers import web_request_context
+from nautobot.extras.models import ObjectChange, Role, Status, Tag, TaggedItem
+
+from nautobot_fsus import models
+from nautobot_fsus.api.serializers import GPUBaseboardSerializer, NICSerializer
+
+
+class FSUTypeListQueryCountTestCase(APITestCase):
+    """Test that FSU type lists do not run a query per row for the instance count."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create 1,000 GPU types, a few of which have GPU instances."""
+        manufacturer = Manufacturer.objects.first()
+        cls.gpu_types = models.GPUType.objects.bulk_create(
+            [
+                models.GPUType(
+                    manufacturer=manufacturer,
+                    name=f"GPU {num:04}",
+                    _name=f"GPU {num:04}",
+                    part_number=f"count_gpu_{num:04}",
+                )
+                for num in range(1000)
+            ]
+        )
+
+        location = Location.objects.filter(location_type__content_types__model="device")[0]
+        status = Status.objects.get(name="Active")
+        models.GPU.objects.bulk_create(
+            [
+                models.GPU(
+                    fsu_type=cls.gpu_types[0],
+                    location=location,
+                    status=status,
+                    name=f"gpu{num}",
+                )
+                for num in range(3)
+            ]
+        )
+
+    def setUp(self):
+        """Make the test user a superuser, so no permission queries vary per request."""
+        super().setUp()
+        self.user.is_superuser = True
+        self.user.save()
+        self.client.force_login(self.user)
+
+    def _count_queries(self, url: str, **headers) -> int:
+        """Request a URL and return the number of database queries it ran."""
+        # The first request of a test also populates per-process caches, so tests warm up first.
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, **headers)
+        self.assertHttpStatus(response, 200)
+        return len(queries)
+
+    def test_api_list_instance_count(self):
+        """Verify the API type list is O(1) in queries and reports the instance count."""
+        url = reverse("plugins-api:nautobot_fsus-api:gputype-list")
+        self._count_queries(f"{url}?limit=1", **self.header)
+        small = self._count_queries(f"{url}?limit=10", **self.header)
+        large = self._count_queries(f"{url}?limit=1000", **self.header)
+        self.assertEqual(small, large)
+
+        response = self.client.get(f"{url}?part_number=count_gpu_0000", **self.header)
+        self.assertEqual(response.json()["results"][0]["instance_count"], 3)
+
+    def test_ui_list_instance_count(self):
+        """Verify the UI type list is O(1) in queries."""
+        url = reverse("plugins:nautobot_fsus:gputype_list")
+        self._count_queries(f"{url}?per_page=1")
+        small = self._count_queries(f"{url}?per_page=10")
+        large = self._count_queries(f"{url}?per_page=1000")
+        self.assertEqual(small, large)
+
+    def test_instance_count_fallback(self):
+        """Verify the instance count is still available without the annotation."""
+        gpu_type = models.GPUType.objects.get(pk=self.gpu_types[0].pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(gpu_type.instance_count, 3)
+
+        gpu_type.instance_count = 7
+        with self.assertNumQueries(0):
+            self.assertEqual(gpu_type.instance_count, 7)
+
+
+class FSUAPIListQueryCountTestCase(APITestCase):
+    """Test that the FSU API list endpoints run a fixed number of queries per page."""
+
+    # Maximum number of queries allowed to serve a single page of any FSU list endpoint.
+    query_budget = 25
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create 1,000 instances of each FSU model, with parent and child relations and tags."""
+        manufacturer = Manufacturer.objects.first()
+        cls.location = Location.objects.filter(location_type__content_types__model="device")[0]
+        cls.status = Status.objects.get(name="Active")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Query Count")
+        device = Device.objects.create(
+            device_type=device_type,
+            role=Role.objects.get_for_model(Device).first(),
+            status=Status.objects.get_for_model(Device).first(),
+            location=cls.location,
+            name="query-count",
+        )
+        tag = Tag.objects.create(name="Query Count")
+        tag.content_types.set(ContentType.objects.get_for_models(*models.FSU_MODELS).values())
+
+        fsus: dict[type, list] = {}
+        for fsu_model in models.FSU_MODELS:
+            type_model = fsu_model._meta.get_field("fsu_type").related_model
+            fsu_type = type_model.objects.create(
+                manufacturer=manufacturer,
+                name=f"Query Count {fsu_model.__name__}",
+                part_number=f"qc_{fsu_model._meta.model_name}",
+            )
+            fsus[fsu_model] = fsu_model.objects.bulk_create(
+                [
+                    fsu_model(
+                        fsu_type=fsu_type,
+                        device=device if num % 2 else None,
+                        location=None if num % 2 else cls.location,
+                        status=cls.status,
+                        name=f"{fsu_model._meta.model_name}{num:04}",
+                        _name=f"{fsu_model._meta.model_name}{num:04}",
+                    )
+                    for num in range(1000)
+                ]
+            )
+            TaggedItem.objects.bulk_create(
+                [
+                    TaggedItem(
+                        content_object=fsu,
+                        tag=tag,
+                    )
+                    for fsu in fsus[fsu_model]
+                ]
+            )
+
+        # Pair each child FSU with a parent FSU.
+        for child_model, parent_model, field_name in (
+            (models.CPU, models.Mainboard, "parent_mainboard"),
+            (models.Disk, models.HBA, "parent_hba"),
+            (models.GPU, models.GPUBaseboard, "parent_gpubaseboard"),
+        ):
+            for child, parent in zip(fsus[child_model], fsus[parent_model], strict=True):
+                setattr(child, f"{field_name}_id", parent.pk)
+            child_model.objects.bulk_update(fsus[child_model], [field_name])
+
+        interfaces = Interface.objects.bulk_create(
+            [
+                Interface(device=device, name=f"eth{num}", status=cls.status, type="1000base-t")
+                for num in range(1000)
+            ]
+        )
+        models.NIC.interfaces.through.objects.bulk_create(
+            [
+                models.NIC.interfaces.through(nic=nic, interface=interface)
+                for nic, interface in zip(fsus[models.NIC], interfaces, strict=True)
+            ]
+        )
+        power_ports = PowerPort.objects.bulk_create(
+            [PowerPort(device=device, name=f"psu{num}") for num in range(1000)]
+        )
+        models.PSU.power_ports.through.objects.bulk_create(
+            [
+                models.PSU.power_ports.through(psu=psu, powerport=power_port)
+                for psu, power_port in zip(fsus[models.PSU], power_ports, strict=True)
+            ]
+        )
+
+    def setUp(self):
+        """Make the test user a superuser, so no permission queries vary per request."""
+        super().setUp()
+        self.user.is_superuser = True
+        self.user.save()
+
+    def _count_queries(self, url: str) -> int:
+        """Request a URL and return the number of database queries it ran."""
+        # The query log is capped, and this test runs enough queries to fill it.
+        connection.queries_log.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, **self.header)
+        self.assertHttpStatus(response, 200)
+        return len(queries)
+
+    def test_list_query_budget(self):
+        """Verify pages of 50 and 1,000 FSUs are served within a fixed query budget."""
+        for fsu_model in models.FSU_MODELS:
+            url = reverse(f"plugins-api:nautobot_fsus-api:{fsu_model._meta.model_name}-list")
+            # The first requests also populate per-process caches.
+            self._count_queries(f"{url}?limit=1")
+            self._count_queries(f"{url}?limit=1&depth=1")
+            for query_string in ("limit=50", "limit=1000", "limit=50&depth=1"):
+                with self.subTest(model=fsu_model.__name__, query=query_string):
+                    self.assertLessEqual(
+                        self._count_queries(f"{url}?{query_string}"), self.query_budget
+                    )
+
+
+class FSUListTableQueryCountTestCase(APITestCase):
+    """Test that the FSU list tables load the related objects of their columns up front."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create 500 tagged GPUs, half in a Device and half in a Location."""
+        manufacturer = Manufacturer.objects.first()
+        location = Location.objects.filter(location_type__content_types__model="device")[0]
+        status = Status.objects.get(name="Active")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Table Count")
+        devices = [
+            Device.objects.create(
+                device_type=device_type,
+                role=Role.objects.get_for_model(Device).first(),
+                status=Status.objects.get_for_model(Device).first(),
+                location=location,
+                name=f"table-count-{num}",
+            )
+            for num in range(5)
+        ]
+        gpu_types = [
+            models.GPUType.objects.create(
+                manufacturer=manufacturer, name=f"Table Count {num}", part_number=f"tc_{num}"
+            )
+            for num in range(5)
+        ]
+        tag = Tag.objects.create(name="Table Count")
+        tag.content_types.add(ContentType.objects.get_for_model(models.GPU))
+
+        gpus = models.GPU.objects.bulk_create(
+            [
+                models.GPU(
+                    fsu_type=gpu_types[num % 5],
+                    device=devices[num % 5] if num % 2 else None,
+                    location=None if num % 2 else location,
+                    status=status,
+                    name=f"tc{num:04}",
+                    _name=f"tc{num:04}",
+                )
+                for num in range(500)
+            ]
+        )
+        TaggedItem.objects.bulk_create([TaggedItem(content_object=gpu, tag=tag) for gpu in gpus])
+
+    def setUp(self):
+        """Make the test user a superuser, and show every column of the GPU table."""
+        super().setUp()
+        self.user.is_superuser = True
+        self.user.set_config(
+            "tables.GPUTable.columns",
+            ["name", "parent", "fsu_type", "serial_number", "status", "tags"],
+            commit=True,
+        )
+        self.client.force_login(self.user)
+
+    def _count_queries(self, url: str) -> int:
+        """Request a URL and return the number of database queries it ran."""
+        connection.queries_log.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertHttpStatus(response, 200)
+        return len(queries)
+
+    def test_ui_list_related_columns(self):
+        """Verify a page of 500 GPUs runs as many queries as a page of 10."""
+        url = reverse("plugins:nautobot_fsus:gpu_list")
+        self._count_queries(f"{url}?name__isw=tc&per_page=1")
+        small = self._count_queries(f"{url}?name__isw=tc&per_page=10")
+        large = self._count_queries(f"{url}?name__isw=tc&per_page=500")
+        self.assertEqual(small, large)
+
+    def test_parent_column(self):
+        """Verify the parent column links to the Device or Location of each GPU."""
+        gpu = models.GPU.objects.filter(name="tc0001").select_related("device").get()
+        url = reverse("plugins:nautobot_fsus:gpu_list")
+        response = self.client.get(f"{url}?name=tc0001")
+        self.assertContains(response, f'<a href="{gpu.device.get_absolute_url()}">{gpu.device}</a>')
+
+
+class ChildAssignmentQueryCountTestCase(APITestCase):
+    """Test that parent FSU children are validated and assigned as a set."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a Device with 8 GPUs and 8 Interfaces, and GPU Baseboard and NIC types."""
+        manufacturer = Manufacturer.objects.first()
+        location = Location.objects.filter(location_type__content_types__model="device")[0]
+        cls.status = Status.objects.get(name="Active")
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Child Count")
+        cls.device = Device.objects.create(
+            device_type=device_type,
+            role=Role.objects.get_for_model(Device).first(),
+            status=Status.objects.get_for_model(Device).first(),
+            location=location,
+            name="child-count",
+        )
+        cls.baseboard_type = models.GPUBaseboardType.objects.create(
+            manufacturer=manufacturer, name="Child Count", part_number="cc_baseboard", slot_count=8
+        )
+        cls.nic_type = models.NICType.objects.create(
+            manufacturer=manufacturer, name="Child Count", part_number="cc_nic", interface_count=8
+        )
+        gpu_type = models.GPUType.objects.create(
+            manufacturer=manufacturer, name="Child Count", part_number="cc_gpu"
+        )
+        cls.gpus = [
+            models.GPU.objects.create(
+                fsu_type=gpu_type, device=cls.device, status=cls.status, name=f"cc_gpu{num}"
+            )
+            for num in range(8)
+        ]
+        cls.interfaces = [
+            Interface.objects.create(
+                device=cls.device, name=f"cc_eth{num}", status=cls.status, type="1000base-t"
+            )
+            for num in range(8)
+        ]
+
+    def setUp(self):
+        """Make the test user a superuser, so no permission queries vary per request."""
+        super().setUp()
+        self.user.is_superuser = True
+        self.user.save()
+
+    def _assign_queries(self, serializer_class, parent, children) -> int:
+        """Validate and assign the children of a parent FSU, and return the queries it ran."""
+        relation = serializer_class.child_relation
+        children = list(
+            relation.child_model.objects.filter(
+                pk__in=[child.pk for child in children]
+            ).select_related("device")
+        )
+        with CaptureQueriesContext(connection) as queries:
+            relation.validate(children, parent.device, parent.fsu_type, parent=parent)
+            relation.assign(parent, children)
+        return len(queries)
+
+    def test_assign_gpus(self):
+        """Verify assigning 8 GPUs to a GPU Baseboard runs as many queries as assigning 2."""
+        baseboard = models.GPUBaseboard.objects.create(
+            fsu_type=self.baseboard_type, device=self.device, status=self.status, name="assign"
+        )
+        small = self._assign_queries(GPUBaseboardSerializer, baseboard, self.gpus[2:4])
+        large = self._assign_queries(GPUBaseboardSerializer, baseboard, self.gpus)
+        self.assertEqual(small, large)
+        self.assertEqual(set(baseboard.gpus.all()), set(self.gpus))
+
+        # Detaching runs no more queries than attaching.
+        self.assertLessEqual(
+            self._assign_queries(GPUBaseboardSerializer, baseboard, self.gpus[:1]), large
+        )
+        self.assertEqual(list(baseboard.gpus.all()), self.gpus[:1])
+        baseboard.refresh_from_db()
+        self.assertEqual(baseboard.gpu_count, 1)
+
+    def test_assign_interfaces(self):
+        """Verify assigning 8 Interfaces to a NIC runs as many queries as assigning 2."""
+        nic = models.NIC.objects.create(
+            fsu_type=self.nic_type, device=self.device, status=self.status, name="assign"
+        )
+        small = self._assign_queries(NICSerializer, nic, self.interfaces[2:4])
+        large = self._assign_queries(NICSerializer, nic, self.interfaces)
+        self.assertEqual(small, large)
+        self.assertEqual(set(nic.interfaces.all()), set(self.interfaces))
+
+    def _create_data(self, fsu_type, name: str, **children) -> dict:
+        """Build the POST data for a parent FSU in the test Device."""
+        return {
+            "fsu_type": fsu_type.pk,
+            "device": self.device.pk,
+            "status": self.status.pk,
+            "name": name,
+            **{field: [child.pk for child in values] for field, values in children.items()},
+        }
+
+    def test_api_change_log(self):
+        """Verify GPUs assigned and removed through the API are recorded in the change log."""
+        gpu_changes = ObjectChange.objects.filter(
+            changed_object_type=ContentType.objects.get_for_model(models.GPU),
+            changed_object_id__in=[gpu.pk for gpu in self.gpus],
+            action="update",
+        )
+        response = self.client.post(
+            reverse("plugins-api:nautobot_fsus-api:gpubaseboard-list"),
+            self._create_data(self.baseboard_type, "change_log", gpus=self.gpus),
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, 201)
+        baseboard = models.GPUBaseboard.objects.get(name="change_log")
+        self.assertEqual(set(baseboard.gpus.all()), set(self.gpus))
+        self.assertEqual(gpu_changes.count(), 8)
+        self.assertEqual(gpu_changes.first().object_data["parent_gpubaseboard"], str(baseboard.pk))
+
+        response = self.client.patch(
+            reverse(
+                "plugins-api:nautobot_fsus-api:gpubaseboard-detail", kwargs={"pk": baseboard.pk}
+            ),
+            {"gpus": [self.gpus[0].pk]},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(list(baseboard.gpus.all()), self.gpus[:1])
+        self.assertEqual(gpu_changes.count(), 15)
+
+    def test_api_nic_change_log(self):
+        """Verify the NIC side of Interfaces assigned through the API is recorded in the change log."""
+        response = self.client.post(
+            reverse("plugins-api:nautobot_fsus-api:nic-list"),
+            self._create_data(self.nic_type, "change_log", interfaces=self.interfaces[:2]),
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, 201)
+        nic = models.NIC.objects.get(name="change_log")
+        nic_changes = ObjectChange.objects.filter(
+            changed_object_type=ContentType.objects.get_for_model(models.NIC),
+            changed_object_id=nic.pk,
+        )
+        self.assertEqual(nic_changes.count(), 1)
+        self.assertEqual(
+            set(nic_changes.get().object_data["interfaces"]),
+            {str(interface.pk) for interface in self.interfaces[:2]},
+        )
+
+        response = self.client.patch(
+            reverse("plugins-api:nautobot_fsus-api:nic-detail", kwargs={"pk": nic.pk}),
+            {"interfaces": [self.interfaces[2].pk]},
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(nic_changes.count(), 2)
+        self.assertEqual(
+            nic_changes.order_by("-time").first().object_data["interfaces"],
+            [str(self.interfaces[2].pk)],
+        )
+
+    def test_change_log_refreshed(self):
+        """Verify a child changed twice in one change context keeps one up-to-date entry."""
+        baseboard = models.GPUBaseboard.objects.create(
+            fsu_type=self.baseboard_type, device=self.device, status=self.status, name="refresh"
+        )
+        relation = GPUBaseboardSerializer.child_relation
+        with web_request_context(self.user):
+            relation.assign(baseboard, self.gpus[:2])
+            relation.assign(baseboard, self.gpus[2:4])
+
+        gpu_changes = ObjectChange.objects.filter(
+            changed_object_type=ContentType.objects.get_for_model(models.GPU),
+            changed_object_id=self.gpus[0].pk,
+        )
+        self.assertEqual(gpu_changes.count(), 1)
+        self.assertIsNone(gpu_changes.get().object_data["parent_gpubaseboard"])
+
+    def test_already_assigned(self):
+        """Verify children of another parent are rejected with the first one named."""
+        other = models.GPUBaseboard.objects.create(
+            fsu_type=self.baseboard_type, device=self.device, status=self.status, name="other"
+        )
+        models.GPU.objects.filter(pk=self.gpus[1].pk).update(parent_gpubaseboard=other)
+        response = self.client.post(
+            reverse("plugins-api:nautobot_fsus-api:gpubaseboard-list"),
+            self._create_data(self.baseboard_type, "taken", gpus=self.gpus[:3]),
+            format="json",
+            **self.header,
+        )
+        self.assertHttpStatus(response, 400)
+        self.assertEqual(
+            response.json()["gpus"], f"GPU {self.gpus[1].name} is already assigned to other"
+        )
+        self.assertFalse(models.GPUBaseboard.objects.filter(name="taken").exists())
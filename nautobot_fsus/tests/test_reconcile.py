@@ -0,0 +1,290 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for the reconciliation of Device FSUs with observed inventories."""
+
+from io import StringIO
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from nautobot.core.testing import TestCase
+from nautobot.dcim.models import Device, DeviceType, Location, Manufacturer
+from nautobot.extras.models import Role, Status
+
+from nautobot_fsus import models
+from nautobot_fsus.utilities.fleet import reconcile_fleet
+from nautobot_fsus.utilities.inventory import get_device_inventories
+from nautobot_fsus.utilities.reconcile import reconcile_inventories
+
+
+class ReconcileTestCase(TestCase):
+    """Test the reconciliation engine and management command."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create two Devices, a GPU Baseboard type with two slots, and a GPU type."""
+        manufacturer = Manufacturer.objects.first()
+        cls.location = Location.objects.filter(location_type__content_types__model="device")[0]
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Reconcile")
+        cls.devices = [
+            Device.objects.create(
+                device_type=device_type,
+                role=Role.objects.get_for_model(Device).first(),
+                status=Status.objects.get_for_model(Device).first(),
+                location=cls.location,
+                name=f"reconcile-{num}",
+            )
+            for num in range(2)
+        ]
+        cls.gpu_type = models.GPUType.objects.create(
+            manufacturer=manufacturer, name="Reconcile GPU", part_number="gpu_reconcile"
+        )
+        cls.baseboard_type = models.GPUBaseboardType.objects.create(
+            manufacturer=manufacturer,
+            name="Reconcile Baseboard",
+            part_number="baseboard_reconcile",
+            slot_count=2,
+        )
+
+    def _inventory(self, device: Device, *gpus: dict, baseboard: str = "SN-BB-0") -> dict:
+        """Build an observed inventory of a baseboard and GPUs, in the inventory API shape."""
+        return {
+            "name": device.name,
+            "gpubaseboards": [
+                {
+                    "name": "baseboard0",
+                    "serial_number": baseboard,
+                    "fsu_type": {"part_number": self.baseboard_type.part_number},
+                    "gpus": list(gpus),
+                }
+            ],
+        }
+
+    def _gpu(self, num: int, serial: str | None = None, **values) -> dict:
+        """Build an observed GPU in PCI slot `num`."""
+        return {
+            "name": f"gpu{num}",
+            "serial_number": serial or f"SN-GPU-{num}",
+            "pci_slot_id": f"0000:0{num}:00.0",
+            "fsu_type": self.gpu_type.name,
+            **values,
+        }
+
+    def _reconcile(self, *inventories: dict, **kwargs):
+        """Reconcile inventories, expecting no errors."""
+        result = reconcile_inventories(inventories, **kwargs)
+        self.assertEqual(result.errors, [])
+        return result
+
+    def test_create_and_update(self):
+        """New FSUs are created and nested, and only changed FSUs are updated."""
+        inventory = self._inventory(self.devices[0], self._gpu(0), self._gpu(1))
+        result = self._reconcile(inventory)
+        self.assertEqual((result.devices, result.created, result.unchanged), (1, 3, 0))
+
+        baseboard = models.GPUBaseboard.objects.get(device=self.devices[0])
+        self.assertEqual(baseboard.gpu_count, 2)
+        self.assertEqual(baseboard.gpus.filter(status__name="Active").count(), 2)
+
+        inventory["gpubaseboards"][0]["gpus"][1]["firmware_version"] = "2.0"
+        result = self._reconcile(inventory)
+        self.assertEqual((result.created, result.updated, result.unchanged), (0, 1, 2))
+        self.assertEqual(result.changes, [(self.devices[0].name, "update", "GPU", "gpu1")])
+        self.assertEqual(models.GPU.objects.get(name="gpu1").firmware_version, "2.0")
+
+        # The inventory API output reconciles without changes.
+        api_inventory = get_device_inventories([self.devices[0]])[self.devices[0].pk]
+        result = self._reconcile({"id": str(self.devices[0].pk), **api_inventory})
+        self.assertEqual((result.created, result.updated, result.unchanged), (0, 0, 3))
+
+    def test_replacement_is_stored(self):
+        """A GPU with a new serial number in a slot replaces the GPU there, which is stored."""
+        self._reconcile(self._inventory(self.devices[0], self._gpu(0), self._gpu(1)))
+
+        storage = Location.objects.filter(location_type__content_types__model="device").exclude(
+            pk=self.location.pk
+        )[0]
+        result = self._reconcile(
+            self._inventory(self.devices[0], self._gpu(0, "SN-NEW"), self._gpu(1)),
+            storage_location=storage,
+        )
+        self.assertEqual((result.created, result.stored, result.unchanged), (1, 1, 2))
+
+        old = models.GPU.objects.get(serial_number="SN-GPU-0")
+        self.assertIsNone(old.device)
+        self.assertIsNone(old.parent_gpubaseboard)
+        self.assertEqual(old.location, storage)
+        new = models.GPU.objects.get(serial_number="SN-NEW")
+        self.assertEqual((new.device, new.name), (self.devices[0], "gpu0"))
+        self.assertEqual(models.GPUBaseboard.objects.get(device=self.devices[0]).gpu_count, 2)
+
+    def test_move_and_reparent(self):
+        """FSUs are followed by serial number to other Devices and parent FSUs."""
+        self._reconcile(
+            self._inventory(self.devices[0], self._gpu(0), self._gpu(1)),
+            self._inventory(self.devices[1], baseboard="SN-BB-1"),
+        )
+
+        # GPU 1 moves to the baseboard of the other Device, and GPU 0 to a new baseboard.
+        inventory = self._inventory(self.devices[0])
+        new_baseboard = self._inventory(self.devices[0], self._gpu(0), baseboard="SN-BB-2")
+        inventory["gpubaseboards"].append(
+            {**new_baseboard["gpubaseboards"][0], "name": "baseboard1"}
+        )
+        result = self._reconcile(
+            inventory, self._inventory(self.devices[1], self._gpu(1), baseboard="SN-BB-1")
+        )
+        self.assertEqual(
+            (result.moved, result.reparented, result.stored, result.created), (1, 1, 0, 1)
+        )
+
+        gpu0, gpu1 = models.GPU.objects.filter(serial_number__startswith="SN-GPU").order_by("name")
+        self.assertEqual(gpu0.device, self.devices[0])
+        self.assertEqual(gpu0.parent_gpubaseboard.serial_number, "SN-BB-2")
+        self.assertEqual(gpu1.device, self.devices[1])
+        self.assertEqual(gpu1.parent_gpubaseboard.serial_number, "SN-BB-1")
+        self.assertEqual(
+            dict(
+                models.GPUBaseboard.objects.filter(serial_number__startswith="SN-BB").values_list(
+                    "serial_number", "gpu_count"
+                )
+            ),
+            {"SN-BB-0": 0, "SN-BB-1": 1, "SN-BB-2": 1},
+        )
+
+    def test_dry_run(self):
+        """A dry run reports the changes without applying them."""
+        result = self._reconcile(self._inventory(self.devices[0], self._gpu(0)), dry_run=True)
+        self.assertEqual(result.created, 2)
+        self.assertFalse(models.GPUBaseboard.objects.filter(device=self.devices[0]).exists())
+        self.assertFalse(models.GPU.objects.filter(device=self.devices[0]).exists())
+
+    def test_device_errors(self):
+        """Devices with errors are left unchanged, without holding up other Devices."""
+        result = reconcile_inventories(
+            [
+                {"name": "no-such-device"},
+                self._inventory(self.devices[1], self._gpu(3, fsu_type="No Such GPU")),
+                self._inventory(self.devices[0], self._gpu(0), self._gpu(1), self._gpu(2)),
+                self._inventory(self.devices[1], self._gpu(3), baseboard="SN-BB-1"),
+            ],
+            chunk_size=2,
+        )
+        self.assertEqual(
+            result.errors,
+            [
+                ("no-such-device", "Device 'no-such-device' not found."),
+                (self.devices[1].name, "GPU 'gpu3': fsu_type: 'No Such GPU' not found."),
+                (
+                    self.devices[0].name,
+                    "GPU Baseboard 'baseboard0': 3 GPUs observed, but it only has 2 slots.",
+                ),
+            ],
+        )
+        self.assertEqual((result.devices, result.created), (1, 2))
+        self.assertEqual(models.GPU.objects.get(serial_number="SN-GPU-3").device, self.devices[1])
+        self.assertFalse(models.GPU.objects.filter(device=self.devices[0]).exists())
+
+    def test_query_count(self):
+        """The number of queries does not depend on the number of Devices in a chunk."""
+        device_type = self.devices[0].device_type
+        devices = [
+            Device.objects.create(
+                device_type=device_type,
+                role=self.devices[0].role,
+                status=self.devices[0].status,
+                location=self.location,
+                name=f"reconcile-count-{num}",
+            )
+            for num in range(7)
+        ]
+
+        def reconcile(devices: list[Device], firmware: str) -> int:
+            inventories = [
+                self._inventory(
+                    device,
+                    self._gpu(0, f"{device.name}-0", firmware_version=firmware),
+                    self._gpu(1, f"{device.name}-1", firmware_version=firmware),
+                    baseboard=device.name,
+                )
+                for device in devices
+            ]
+            with CaptureQueriesContext(connection) as queries:
+                self._reconcile(*inventories)
+            return len(queries)
+
+        self.assertEqual(reconcile(devices[:2], "1.0"), reconcile(devices[2:6], "1.0"))
+        # The last Device keeps the old version count in use, so no count is emptied.
+        reconcile(devices[6:], "1.0")
+        self.assertEqual(reconcile(devices[:2], "2.0"), reconcile(devices[2:6], "3.0"))
+
+    def test_command(self):
+        """The management command reconciles inventories read from an NDJSON file."""
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir, "inventories.ndjson")
+            path.write_text(
+                "\n".join(
+                    json.dumps(self._inventory(device, self._gpu(num), baseboard=device.name))
+                    for num, device in enumerate(self.devices)
+                ),
+                encoding="utf-8",
+            )
+
+            out = StringIO()
+            call_command("reconcile_fsus", str(path), "--dry-run", stdout=out)
+            self.assertIn("Would reconcile 2 devices", out.getvalue())
+            self.assertFalse(models.GPU.objects.filter(device__in=self.devices).exists())
+
+            out = StringIO()
+            call_command("reconcile_fsus", temp_dir, verbosity=2, stdout=out)
+        self.assertIn(f"{self.devices[1].name}: create GPU gpu1", out.getvalue())
+        self.assertIn("4 created", out.getvalue())
+        self.assertEqual(models.GPU.objects.filter(device__in=self.devices).count(), 2)
+
+    def test_fleet(self):
+        """Inventory files are parsed and diffed by worker processes, and written in order."""
+        with TemporaryDirectory() as temp_dir:
+            inventories = {
+                "a-first.json": self._inventory(self.devices[0], self._gpu(0), self._gpu(1)),
+                "b-other.json": self._inventory(self.devices[1], self._gpu(2), baseboard="SN-BB-1"),
+                "c-later.json": self._inventory(
+                    self.devices[0], self._gpu(0), self._gpu(1, firmware_version="2.0")
+                ),
+            }
+            for file_name, inventory in inventories.items():
+                Path(temp_dir, file_name).write_text(json.dumps(inventory), encoding="utf-8")
+
+            # The later inventory of the first Device is loaded before the first is written,
+            # so it is diffed again against the FSUs the first created.
+            result = reconcile_fleet([temp_dir], workers=2, chunk_size=1)
+            self.assertEqual(result.errors, [])
+            self.assertEqual((result.files, result.devices, result.rediffed), (3, 3, 1))
+            self.assertEqual((result.created, result.updated, result.unchanged), (5, 1, 2))
+            self.assertEqual(
+                models.GPU.objects.get(serial_number="SN-GPU-1").firmware_version, "2.0"
+            )
+
+            out = StringIO()
+            call_command(
+                "ingest_fsu_inventories", temp_dir, "--workers=2", "--chunk-size=1", stdout=out
+            )
+        self.assertIn("Read 3 files with 2 workers", out.getvalue())
+        self.assertIn("Reconciled 3 devices", out.getvalue())
+        self.assertIn("8 unchanged, 0 errors", out.getvalue())
+        self.assertIn("devices/s", out.getvalue())
@@ -0,0 +1,155 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for the global FSU serial number index."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from nautobot.core.testing import APITestCase
+from nautobot.dcim.models import Device, DeviceType, Location, Manufacturer
+from nautobot.extras.models import Role, Status
+
+from nautobot_fsus import models
+from nautobot_fsus.utilities.bulk_import import import_fsus
+
+
+class FSUSerialIndexTestCase(APITestCase):
+    """Test the maintenance of the serial number index and the lookup API endpoint."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a Device, and a GPU, PSU, and Fan with serial numbers."""
+        manufacturer = Manufacturer.objects.first()
+        cls.location = Location.objects.filter(location_type__content_types__model="device")[0]
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Serial Index")
+        cls.device = Device.objects.create(
+            device_type=device_type,
+            role=Role.objects.get_for_model(Device).first(),
+            status=Status.objects.get_for_model(Device).first(),
+            location=cls.location,
+            name="serial-index",
+        )
+        cls.status = Status.objects.get(name="Active")
+        cls.fsus = {}
+        for fsu_model in (models.GPU, models.PSU, models.Fan):
+            type_model = fsu_model._meta.get_field("fsu_type").related_model
+            cls.fsus[fsu_model] = fsu_model.objects.create(
+                fsu_type=type_model.objects.create(
+                    manufacturer=manufacturer,
+                    name=f"Serial {fsu_model.__name__}",
+                    part_number=f"serial_{fsu_model._meta.model_name}",
+                ),
+                device=cls.device,
+                status=cls.status,
+                name=f"{fsu_model._meta.model_name}0",
+                serial_number=f"SN-INDEX-{fsu_model.__name__}",
+            )
+        cls.url = reverse("plugins-api:nautobot_fsus-api:serial-number-list")
+
+    def _entry(self, fsu: models.GPU) -> models.FSUSerialIndex | None:
+        """Get the index entry of an FSU."""
+        return models.FSUSerialIndex.objects.filter(fsu_id=fsu.pk).first()
+
+    def test_index_signals(self):
+        """Verify the index follows changes to an FSU's serial number, asset tag, and parent."""
+        gpu = self.fsus[models.GPU]
+        self.assertEqual(self._entry(gpu).device, self.device)
+
+        gpu.device = None
+        gpu.location = self.location
+        gpu.serial_number = "SN-INDEX-MOVED"
+        gpu.save()
+        entry = self._entry(gpu)
+        self.assertEqual(
+            (entry.serial_number, entry.device, entry.location),
+            ("SN-INDEX-MOVED", None, self.location),
+        )
+
+        gpu.serial_number = ""
+        gpu.save()
+        self.assertIsNone(self._entry(gpu))
+
+        gpu.asset_tag = "A-INDEX-1"
+        gpu.save()
+        self.assertEqual(self._entry(gpu).asset_tag, "A-INDEX-1")
+
+        gpu.delete()
+        self.assertIsNone(self._entry(gpu))
+
+    def test_bulk_import_and_rebuild(self):
+        """Verify bulk imported FSUs are indexed, and the index can be rebuilt."""
+        import_fsus(
+            models.GPU,
+            [
+                {
+                    "location": self.location.name,
+                    "name": f"spare{num}",
+                    "fsu_type": "Serial GPU",
+                    "serial_number": f"SN-INDEX-SPARE-{num}",
+                    "status": "Available",
+                }
+                for num in range(3)
+            ],
+        )
+        self.assertEqual(
+            models.FSUSerialIndex.objects.lookup(serial_numbers=["SN-INDEX-SPARE-2"]).get().name,
+            "spare2",
+        )
+
+        expected = set(models.FSUSerialIndex.objects.values_list("fsu_id", "serial_number"))
+        models.FSUSerialIndex.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_fsu_serial_index", stdout=out)
+        self.assertIn(f"Indexed {len(expected)} FSUs", out.getvalue())
+        self.assertEqual(
+            set(models.FSUSerialIndex.objects.values_list("fsu_id", "serial_number")), expected
+        )
+
+    def test_api_lookup(self):
+        """Verify FSUs of several models are found with a single query on the index."""
+        self.user.is_superuser = True
+        self.user.save()
+        query_string = "&".join(
+            f"serial_number=SN-INDEX-{fsu_model.__name__}" for fsu_model in self.fsus
+        )
+        self.client.get(f"{self.url}?{query_string}", **self.header)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f"{self.url}?{query_string}", **self.header)
+        self.assertHttpStatus(response, 200)
+        lookups = [query for query in queries if "fsuserialindex" in query["sql"]]
+        self.assertEqual(len(lookups), 1)
+
+        results = {result["fsu_model"]: result for result in response.json()}
+        self.assertEqual(set(results), {"gpu", "psu", "fan"})
+        self.assertEqual(results["psu"]["id"], str(self.fsus[models.PSU].pk))
+        self.assertEqual(results["psu"]["device"]["name"], self.device.name)
+        self.assertIsNone(results["psu"]["location"])
+        self.assertTrue(results["psu"]["url"].endswith(f"/psus/{self.fsus[models.PSU].pk}/"))
+
+    def test_api_lookup_permissions(self):
+        """Verify only FSUs the user can view are returned, and a search term is required."""
+        self.add_permissions("nautobot_fsus.view_gpu")
+        response = self.client.get(
+            f"{self.url}?serial_number=SN-INDEX-GPU&serial_number=SN-INDEX-PSU", **self.header
+        )
+        self.assertHttpStatus(response, 200)
+        self.assertEqual([result["fsu_model"] for result in response.json()], ["gpu"])
+
+        response = self.client.get(self.url, **self.header)
+        self.assertHttpStatus(response, 400)
@@ -0,0 +1,235 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for the spare FSU counts rolled up the Location tree."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.urls import reverse
+from nautobot.core.testing import APITestCase
+from nautobot.dcim.filters import LocationFilterSet
+from nautobot.dcim.models import Device, DeviceType, Location, LocationType, Manufacturer
+from nautobot.extras.models import Role, Status
+
+from nautobot_fsus import models
+from nautobot_fsus.utilities.bulk_import import import_fsus
+
+
+class SparesTestCase(APITestCase):
+    """Test the maintenance of the spare counts, the spares API endpoint, and the filters."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a region with two sites in a sub-region and one site of its own."""
+        location_status = Status.objects.get_for_model(Location).first()
+        region_type = LocationType.objects.create(name="Spares Region", nestable=True)
+        site_type = LocationType.objects.create(name="Spares Site", parent=region_type)
+
+        def location(name, location_type, parent=None):
+            return Location.objects.create(
+                name=name, location_type=location_type, parent=parent, status=location_status
+            )
+
+        cls.region = location("Spares EU", region_type)
+        cls.west = location("Spares EU-West", region_type, cls.region)
+        cls.site_a = location("Spares Site A", site_type, cls.west)
+        cls.site_b = location("Spares Site B", site_type, cls.west)
+        cls.site_c = location("Spares Site C", site_type, cls.region)
+
+        manufacturer = Manufacturer.objects.first()
+        cls.gpu_type = models.GPUType.objects.create(
+            manufacturer=manufacturer, name="Spares GPU", part_number="spares_gpu"
+        )
+        cls.available = Status.objects.get(name="Available")
+        cls.active = Status.objects.get(name="Active")
+        for name, location_, status in [
+            ("gpu0", cls.site_a, cls.available),
+            ("gpu1", cls.site_a, cls.available),
+            ("gpu2", cls.site_a, cls.active),
+            ("gpu3", cls.site_b, cls.available),
+        ]:
+            models.GPU.objects.create(
+                fsu_type=cls.gpu_type, location=location_, status=status, name=name
+            )
+        cls.device = Device.objects.create(
+            device_type=DeviceType.objects.create(manufacturer=manufacturer, model="Spares"),
+            role=Role.objects.get_for_model(Device).first(),
+            status=Status.objects.get_for_model(Device).first(),
+            location=cls.site_a,
+            name="spares",
+        )
+        models.GPU.objects.create(
+            fsu_type=cls.gpu_type, device=cls.device, status=cls.available, name="installed"
+        )
+        cls.url = reverse("plugins-api:nautobot_fsus-api:spares-list")
+
+    def _counts(self) -> dict[tuple, int]:
+        """Stored spare counts of the test GPU type, by Location name and Status name."""
+        return {
+            (location, status): count
+            for location, status, count in models.FSUSpareCount.objects.filter(
+                fsu_type_id=self.gpu_type.pk
+            ).values_list("location__name", "status__name", "count")
+        }
+
+    def test_counts_roll_up(self):
+        """Verify spares are counted at their Location and every Location above it."""
+        self.assertEqual(
+            self._counts(),
+            {
+                ("Spares Site A", "Available"): 2,
+                ("Spares Site A", "Active"): 1,
+                ("Spares Site B", "Available"): 1,
+                ("Spares EU-West", "Available"): 3,
+                ("Spares EU-West", "Active"): 1,
+                ("Spares EU", "Available"): 3,
+                ("Spares EU", "Active"): 1,
+            },
+        )
+
+    def test_counts_follow_fsu_changes(self):
+        """Verify the spare counts follow FSU changes, and match a rebuild."""
+        gpu = models.GPU.objects.get(name="gpu0")
+        gpu.location = self.site_c
+        gpu.save()
+        gpu = models.GPU.objects.get(name="gpu2")
+        gpu.status = self.available
+        gpu.save()
+        gpu = models.GPU.objects.get(name="gpu3")
+        gpu.device = self.device
+        gpu.save()
+        models.GPU.objects.get(name="gpu1").delete()
+        gpu = models.GPU.objects.get(name="installed")
+        gpu.device = None
+        gpu.location = self.site_b
+        gpu.save()
+        expected = {
+            ("Spares Site A", "Available"): 1,
+            ("Spares Site B", "Available"): 1,
+            ("Spares Site C", "Available"): 1,
+            ("Spares EU-West", "Available"): 2,
+            ("Spares EU", "Available"): 3,
+        }
+        self.assertEqual(self._counts(), expected)
+
+        import_fsus(
+            models.GPU,
+            [
+                {
+                    "location": self.site_c.name,
+                    "name": "gpu9",
+                    "fsu_type": "Spares GPU",
+                    "status": "Available",
+                }
+            ],
+        )
+        expected[("Spares Site C", "Available")] += 1
+        expected[("Spares EU", "Available")] += 1
+        self.assertEqual(self._counts(), expected)
+
+        out = StringIO()
+        call_command("rebuild_fsu_spare_counts", stdout=out)
+        self.assertIn("Stored", out.getvalue())
+        self.assertEqual(self._counts(), expected)
+
+    def test_counts_follow_location_changes(self):
+        """Verify the spare counts follow Locations that move or are deleted."""
+        self.site_a.parent = self.region
+        self.site_a.save()
+        self.assertEqual(
+            self._counts(),
+            {
+                ("Spares Site A", "Available"): 2,
+                ("Spares Site A", "Active"): 1,
+                ("Spares Site B", "Available"): 1,
+                ("Spares EU-West", "Available"): 1,
+                ("Spares EU", "Available"): 3,
+                ("Spares EU", "Active"): 1,
+            },
+        )
+
+        self.site_b.delete()
+        self.assertEqual(
+            self._counts(),
+            {
+                ("Spares Site A", "Available"): 2,
+                ("Spares Site A", "Active"): 1,
+                ("Spares EU", "Available"): 2,
+                ("Spares EU", "Active"): 1,
+            },
+        )
+
+    def test_has_available_filter(self):
+        """Verify Locations are filtered on the available spares stored within them."""
+        locations = Location.objects.filter(name__startswith="Spares")
+        filterset = LocationFilterSet({"nautobot_fsus_has_available_gpus": True}, locations)
+        self.assertEqual(
+            sorted(filterset.qs.values_list("name", flat=True)),
+            ["Spares EU", "Spares EU-West", "Spares Site A", "Spares Site B"],
+        )
+        filterset = LocationFilterSet({"nautobot_fsus_has_available_gpus": False}, locations)
+        self.assertEqual(list(filterset.qs.values_list("name", flat=True)), ["Spares Site C"])
+        filterset = LocationFilterSet({"nautobot_fsus_has_available_cpus": True}, locations)
+        self.assertFalse(filterset.qs.exists())
+
+    def test_api_spares(self):
+        """Verify the spares of a region are read from a single result."""
+        self.user.is_superuser = True
+        self.user.save()
+        response = self.client.get(
+            f"{self.url}?location={self.region.name}&fsu_type_id={self.gpu_type.pk}"
+            "&status=Available",
+            **self.header,
+        )
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {
+                    "location": {"id": str(self.region.pk), "name": "Spares EU"},
+                    "fsu_model": "gpu",
+                    "fsu_type": {
+                        "id": str(self.gpu_type.pk),
+                        "manufacturer": self.gpu_type.manufacturer.name,
+                        "name": "Spares GPU",
+                        "part_number": "spares_gpu",
+                    },
+                    "status": "Available",
+                    "count": 3,
+                }
+            ],
+        )
+
+    def test_api_spares_permissions(self):
+        """Verify only FSU models and Locations the user can view are counted."""
+        response = self.client.get(f"{self.url}?fsu_type_id={self.gpu_type.pk}", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.json()["count"], 0)
+
+        self.add_permissions("nautobot_fsus.view_gpu", "dcim.view_location")
+        response = self.client.get(f"{self.url}?fsu_type_id={self.gpu_type.pk}", **self.header)
+        self.assertEqual(response.json()["count"], 7)
+
+    def test_location_tab(self):
+        """Verify the FSUs tab of a region shows the spares stored within it."""
+        self.user.is_superuser = True
+        self.user.save()
+        self.client.force_login(self.user)
+        response = self.client.get(
+            reverse("plugins:nautobot_fsus:location_fsus_tab", kwargs={"pk": self.region.pk})
+        )
+        self.assertHttpStatus(response, 200)
+        self.assertContains(response, "Spares GPU")
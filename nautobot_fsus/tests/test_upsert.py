@@ -0,0 +1,369 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for the bulk FSU upsert engine and API endpoints."""
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from nautobot.core.testing import APITestCase, TestCase
+from nautobot.dcim.models import Device, DeviceType, Location, Manufacturer
+from nautobot.extras.models import ObjectChange, Role, Status
+
+from nautobot_fsus import models
+from nautobot_fsus.utilities.bulk_import import import_fsus
+from nautobot_fsus.utilities.upsert import upsert_fsus
+
+
+class UpsertTestCase(TestCase):
+    """Test the FSU upsert engine."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a Device, a GPU Baseboard with two slots, and a GPU type."""
+        manufacturer = Manufacturer.objects.first()
+        cls.location = Location.objects.filter(location_type__content_types__model="device")[0]
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="Upsert")
+        cls.device = Device.objects.create(
+            device_type=device_type,
+            role=Role.objects.get_for_model(Device).first(),
+            status=Status.objects.get_for_model(Device).first(),
+            location=cls.location,
+            name="upsert-device",
+        )
+        cls.gpu_type = models.GPUType.objects.create(
+            manufacturer=manufacturer, name="Upsert GPU", part_number="gpu_upsert"
+        )
+        baseboard_type = models.GPUBaseboardType.objects.create(
+            manufacturer=manufacturer,
+            name="Upsert Baseboard",
+            part_number="baseboard_upsert",
+            slot_count=2,
+        )
+        cls.baseboard = models.GPUBaseboard.objects.create(
+            fsu_type=baseboard_type,
+            device=cls.device,
+            status=Status.objects.get(name="Active"),
+            name="baseboard0",
+        )
+
+    def _rows(self, count: int, **values) -> list[dict[str, str]]:
+        """Build records for spare GPUs in the storage Location."""
+        return [
+            {
+                "location": self.location.name,
+                "name": f"spare{num}",
+                "fsu_type": self.gpu_type.name,
+                "serial_number": f"SN-UPSERT-{num}",
+                "status": "Available",
+                **values,
+            }
+            for num in range(count)
+        ]
+
+    def _upsert(self, rows: list[dict[str, str]]):
+        """Upsert GPU records, expecting no errors."""
+        result = upsert_fsus((models.GPU, row) for row in rows)
+        self.assertEqual(result.errors, [])
+        return result
+
+    def test_upsert_idempotent(self):
+        """Verify records create FSUs once, and then only update what they change."""
+        rows = self._rows(3)
+        result = self._upsert(rows)
+        self.assertEqual((result.created, result.updated, result.unchanged), (3, 0, 0))
+
+        result = self._upsert(rows)
+        self.assertEqual((result.created, result.updated, result.unchanged), (0, 0, 3))
+
+        rows[1]["firmware_version"] = "2.10"
+        result = self._upsert(rows)
+        self.assertEqual((result.created, result.updated, result.unchanged), (0, 1, 2))
+        gpu = models.GPU.objects.get(name="spare1")
+        self.assertEqual(gpu.firmware_version, "2.10")
+        self.assertEqual(
+            gpu._firmware_version,
+            models.GPU._meta.get_field("_firmware_version").naturalize_function("2.10", 255),
+        )
+        self.assertTrue(
+            models.FSUVersionCount.objects.filter(
+                fsu_type_id=self.gpu_type.pk,
+                location=self.location,
+                firmware_version="2.10",
+                count=1,
+            ).exists()
+        )
+
+    def test_upsert_match_serial_number(self):
+        """Verify a record matching by serial number moves and renames the FSU."""
+        self._upsert(self._rows(1))
+        spares = models.FSUSpareCount.objects.filter(
+            location=self.location, fsu_type_id=self.gpu_type.pk
+        )
+        self.assertEqual(spares.get().count, 1)
+
+        # Only the columns given are changed, and a Device replaces the storage Location.
+        self._upsert(
+            [
+                {
+                    "serial_number": "SN-UPSERT-0",
+                    "device": self.device.name,
+                    "name": "gpu0",
+                    "parent_gpubaseboard": "baseboard0",
+                }
+            ]
+        )
+        gpu = models.GPU.objects.get(serial_number="SN-UPSERT-0")
+        self.assertEqual((gpu.name, gpu.device, gpu.location), ("gpu0", self.device, None))
+        self.assertEqual(gpu.status.name, "Available")
+        self.assertEqual(gpu.parent_gpubaseboard, self.baseboard)
+        self.assertFalse(spares.exists())
+        self.baseboard.refresh_from_db()
+        self.assertEqual(self.baseboard.gpu_count, 1)
+        self.assertEqual(models.FSUCount.objects.for_parent(self.device)["gpus"], 1)
+
+        # Records without a serial number match by Device and name.
+        result = self._upsert([{"device": self.device.name, "name": "gpu0", "comments": "Moved"}])
+        self.assertEqual(result.updated, 1)
+        gpu.refresh_from_db()
+        self.assertEqual(gpu.comments, "Moved")
+
+        # Back into storage, leaving the GPU Baseboard.
+        self._upsert(
+            [
+                {
+                    "serial_number": "SN-UPSERT-0",
+                    "location": self.location.name,
+                    "parent_gpubaseboard": "",
+                }
+            ]
+        )
+        gpu.refresh_from_db()
+        self.assertEqual((gpu.device, gpu.location), (None, self.location))
+        self.baseboard.refresh_from_db()
+        self.assertEqual(self.baseboard.gpu_count, 0)
+        self.assertEqual(spares.get().count, 1)
+
+    def test_upsert_errors(self):
+        """Verify invalid records are reported by record number, and nothing is saved."""
+        self._upsert(self._rows(2))
+        rows = [
+            *self._rows(2, firmware_version="3.0"),
+            self._rows(1)[0],
+            {**self._rows(3)[2], "status": "No Such Status"},
+        ]
+        result = upsert_fsus((models.GPU, row) for row in rows)
+        self.assertEqual(
+            result.errors,
+            [
+                (3, "Another record in this request matches the same FSU."),
+                (3, "name: 'spare0' is already in use in the location."),
+                (4, "status: 'No Such Status' not found."),
+            ],
+        )
+        self.assertEqual(
+            models.GPU.objects.filter(fsu_type=self.gpu_type, firmware_version="3.0").count(), 0
+        )
+
+    def test_upsert_slots(self):
+        """Verify FSUs already in a parent FSU keep their slot, and new ones need a free slot."""
+        rows = self._rows(2, location="", device=self.device.name, parent_gpubaseboard="baseboard0")
+        self._upsert(rows)
+        rows[0]["firmware_version"] = "1.1"
+        self.assertEqual(self._upsert(rows).updated, 1)
+
+        result = upsert_fsus(
+            (models.GPU, row)
+            for row in self._rows(
+                3, location="", device=self.device.name, parent_gpubaseboard="baseboard0"
+            )
+        )
+        self.assertEqual(result.errors, [(3, "parent_gpubaseboard: baseboard0 has no free slots.")])
+
+    def _count_queries(self, count: int) -> int:
+        """Upsert records updating half of `count` spare GPUs and creating the other half."""
+        import_fsus(models.GPU, self._rows(count // 2))
+        rows = self._rows(count, firmware_version=f"{count}.0")
+        with CaptureQueriesContext(connection) as queries:
+            result = self._upsert(rows)
+        self.assertEqual((result.created, result.updated), (count - count // 2, count // 2))
+        models.GPU.objects.filter(fsu_type=self.gpu_type).delete()
+        return len(queries)
+
+    def test_upsert_query_count(self):
+        """Verify the number of queries does not depend on the number of records."""
+        self._count_queries(10)
+        self.assertEqual(self._count_queries(10), self._count_queries(100))
+
+
+class UpsertAPITestCase(APITestCase):
+    """Test the FSU upsert API endpoints and the bulk create name checks."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create GPU and CPU types."""
+        manufacturer = Manufacturer.objects.first()
+        cls.location = Location.objects.filter(location_type__content_types__model="device")[0]
+        cls.gpu_type = models.GPUType.objects.create(
+            manufacturer=manufacturer, name="API Upsert GPU", part_number="gpu_api_upsert"
+        )
+        cls.cpu_type = models.CPUType.objects.create(
+            manufacturer=manufacturer, name="API Upsert CPU", part_number="cpu_api_upsert"
+        )
+
+    def _record(self, name: str, fsu_type: models.GPUType, **values) -> dict:
+        """Build a JSON record for a spare FSU."""
+        return {
+            "location": str(self.location.pk),
+            "name": name,
+            "fsu_type": fsu_type.name,
+            "status": "Available",
+            "serial_number": None,
+            **values,
+        }
+
+    def test_upsert(self):
+        """Verify the upsert endpoint of an FSU model creates, then updates, FSUs."""
+        url = reverse("plugins-api:nautobot_fsus-api:gpu-upsert")
+        records = [self._record(f"api{num}", self.gpu_type) for num in range(3)]
+
+        self.add_permissions("nautobot_fsus.add_gpu")
+        response = self.client.post(url, records, format="json", **self.header)
+        self.assertHttpStatus(response, 403)
+
+        self.add_permissions(
+            "nautobot_fsus.change_gpu", "nautobot_fsus.view_gputype", "dcim.view_location"
+        )
+        response = self.client.post(url, records, format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.json(), {"created": 3, "updated": 0, "unchanged": 0})
+        gpus = models.GPU.objects.filter(fsu_type=self.gpu_type)
+        changes = ObjectChange.objects.filter(
+            changed_object_type=ContentType.objects.get_for_model(models.GPU),
+            changed_object_id__in=gpus.values("pk"),
+        )
+        self.assertEqual(changes.filter(action="create").count(), 3)
+
+        records[0]["description"] = "Upserted"
+        response = self.client.post(url, records, format="json", **self.header)
+        self.assertEqual(response.json(), {"created": 0, "updated": 1, "unchanged": 2})
+        self.assertEqual(gpus.get(name="api0").description, "Upserted")
+        self.assertEqual(changes.filter(action="update").count(), 1)
+
+        records[1]["status"] = "No Such Status"
+        response = self.client.post(url, records, format="json", **self.header)
+        self.assertHttpStatus(response, 400)
+        self.assertEqual(
+            response.json(),
+            {"errors": [{"row": 2, "message": "status: 'No Such Status' not found."}]},
+        )
+
+        response = self.client.post(url, {"name": "api0"}, format="json", **self.header)
+        self.assertHttpStatus(response, 400)
+
+    def test_upsert_all_fsus(self):
+        """Verify the all FSUs upsert endpoint handles records of several types together."""
+        url = reverse("plugins-api:nautobot_fsus-api:all-fsus-upsert")
+        records = [
+            {"fsu_model": "gpu", **self._record("mixed0", self.gpu_type)},
+            {"fsu_model": "cpu", **self._record("mixed0", self.cpu_type)},
+            {"fsu_model": "cpu", **self._record("mixed1", self.cpu_type)},
+        ]
+        self.add_permissions(
+            "nautobot_fsus.add_gpu",
+            "nautobot_fsus.change_gpu",
+            "nautobot_fsus.view_gputype",
+            "dcim.view_location",
+        )
+        response = self.client.post(url, records, format="json", **self.header)
+        self.assertHttpStatus(response, 403)
+
+        self.add_permissions(
+            "nautobot_fsus.add_cpu", "nautobot_fsus.change_cpu", "nautobot_fsus.view_cputype"
+        )
+        response = self.client.post(
+            url, [*records, {"fsu_model": "fsu"}], format="json", **self.header
+        )
+        self.assertHttpStatus(response, 400)
+        self.assertEqual(
+            response.json(),
+            {"errors": [{"row": 4, "message": "fsu_model: 'fsu' is not an FSU model."}]},
+        )
+
+        response = self.client.post(url, records, format="json", **self.header)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(response.json(), {"created": 3, "updated": 0, "unchanged": 0})
+        self.assertEqual(models.CPU.objects.filter(fsu_type=self.cpu_type).count(), 2)
+
+        # Nothing is saved if a record of any type is invalid.
+        records[0]["description"] = "Mixed"
+        records[2]["fsu_type"] = "No Such CPU"
+        response = self.client.post(url, records, format="json", **self.header)
+        self.assertEqual(response.json()["errors"][0]["row"], 3)
+        self.assertEqual(models.GPU.objects.get(fsu_type=self.gpu_type).description, "")
+
+    def test_bulk_create_names(self):
+        """Verify FSUs created in bulk have their names checked together."""
+        url = reverse("plugins-api:nautobot_fsus-api:gpu-list")
+        self.add_permissions(
+            "nautobot_fsus.add_gpu",
+            "nautobot_fsus.view_gputype",
+            "dcim.view_location",
+            "extras.view_status",
+        )
+        status = Status.objects.get(name="Available")
+        models.GPU.objects.create(
+            fsu_type=self.gpu_type, location=self.location, status=status, name="taken"
+        )
+
+        def data(name):
+            return {
+                "fsu_type": str(self.gpu_type.pk),
+                "location": str(self.location.pk),
+                "status": str(status.pk),
+                "name": name,
+            }
+
+        response = self.client.post(
+            url, [data("bulk0"), data("taken")], format="json", **self.header
+        )
+        self.assertHttpStatus(response, 400)
+        self.assertEqual(
+            response.json(), [{}, {"__all__": ["GPU with this Name and Location already exists."]}]
+        )
+
+        # FSUs with the same name as each other are found before any are saved.
+        response = self.client.post(
+            url, [data("bulk0"), data("bulk1"), data("bulk0")], format="json", **self.header
+        )
+        self.assertHttpStatus(response, 400)
+        self.assertEqual(
+            response.json(),
+            [{}, {}, {"non_field_errors": ["The fields name, location must make a unique set."]}],
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                url, [data(f"bulk{num}") for num in range(20)], format="json", **self.header
+            )
+        self.assertHttpStatus(response, 201)
+        # Only the model validation of each FSU checks its name on its own.
+        self.assertEqual(
+            sum(
+                '"nautobot_fsus_gpu"."name" =' in query["sql"] for query in queries.captured_queries
+            ),
+            20,
+        )
@@ -0,0 +1,107 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for the sortable FSU firmware and driver version keys."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from nautobot.dcim.models import Location, Manufacturer
+from nautobot.extras.models import Status
+
+from nautobot_fsus import models
+from nautobot_fsus.models.mixins import naturalize_version
+
+
+class NaturalizeVersionTestCase(SimpleTestCase):
+    """Test the conversion of version strings to version keys."""
+
+    def test_naturalize_version(self):
+        """Verify numeric components are prefixed with their length, and letters lower-cased."""
+        self.assertEqual(naturalize_version("96.00.89"), "00296.000.00289")
+        self.assertEqual(naturalize_version("v2.1-RC1"), "0012.0011.rc.0011")
+        self.assertEqual(naturalize_version("535.104.05"), naturalize_version("V535_104_5"))
+        self.assertEqual(naturalize_version(""), "")
+        self.assertEqual(naturalize_version("1.2.3", max_length=10), "0011.0012.")
+
+    def test_version_order(self):
+        """Verify version keys sort in version order."""
+        versions = [
+            "1",
+            "1.2",
+            "1.2.1",
+            "1.10",
+            "2.0",
+            "10.0",
+            "96.00.89",
+            "96.00.100",
+            "96.99999999",
+            "96.100000000",
+        ]
+        self.assertEqual(sorted(versions, key=naturalize_version), versions)
+
+
+class FSUVersionKeyTestCase(TestCase):
+    """Test the maintenance of the stored version keys."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create GPUs with a range of firmware versions."""
+        fsu_type = models.GPUType.objects.create(
+            manufacturer=Manufacturer.objects.first(), name="Version Key GPU"
+        )
+        cls.gpus = [
+            models.GPU.objects.create(
+                fsu_type=fsu_type,
+                location=Location.objects.first(),
+                status=Status.objects.get(name="Available"),
+                name=f"version-key-{index}",
+                firmware_version=version,
+                driver_version="535.104.05",
+            )
+            for index, version in enumerate(["96.00.9", "96.00.89", "96.00.100"])
+        ]
+
+    def test_keys_set_on_save(self):
+        """Verify the version keys are set when an FSU is saved."""
+        gpu = self.gpus[0]
+        self.assertEqual(gpu._firmware_version, "00296.000.0019")
+        self.assertEqual(gpu._driver_version, "003535.003104.0015")
+
+        gpu.firmware_version = "97.0"
+        gpu.save()
+        gpu.refresh_from_db()
+        self.assertEqual(gpu._firmware_version, "00297.000")
+
+        queryset = models.GPU.objects.filter(fsu_type=gpu.fsu_type).order_by("_firmware_version")
+        self.assertEqual(list(queryset), [*self.gpus[1:], gpu])
+
+    def test_rebuild_command(self):
+        """Verify the command updates version keys left stale by a queryset update."""
+        queryset = models.GPU.objects.filter(pk__in=[gpu.pk for gpu in self.gpus])
+        queryset.filter(pk=self.gpus[0].pk).update(firmware_version="96.01.0")
+
+        out = StringIO()
+        call_command("rebuild_fsu_version_keys", stdout=out)
+        self.assertIn("GPUs: 1", out.getvalue())
+        self.assertEqual(
+            list(queryset.filter(_firmware_version__gt=naturalize_version("96.00.100"))),
+            [self.gpus[0]],
+        )
+
+        out = StringIO()
+        call_command("rebuild_fsu_version_keys", stdout=out)
+        self.assertIn("Updated the version keys of 0 FSUs.", out.getvalue())
@@ -0,0 +1,107 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Tests for the FSU tabs of Devices and Locations."""
+
+from django.urls import reverse
+from nautobot.core.testing import TestCase
+from nautobot.dcim.models import Device, DeviceType, Location, Manufacturer
+from nautobot.extras.models import Role, Status
+
+from nautobot_fsus import models
+
+
+class FSUParentViewTabTestCase(TestCase):
+    """Test that the FSU tabs only load the tables of the FSU types a parent has."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create a Device with 30 Disks and a Fan."""
+        manufacturer = Manufacturer.objects.first()
+        cls.location = Location.objects.filter(location_type__content_types__model="device")[0]
+        device_type = DeviceType.objects.create(manufacturer=manufacturer, model="FSU Tab")
+        cls.device = Device.objects.create(
+            device_type=device_type,
+            role=Role.objects.get_for_model(Device).first(),
+            status=Status.objects.get_for_model(Device).first(),
+            location=cls.location,
+            name="fsu-tab",
+        )
+        status = Status.objects.get(name="Active")
+        disk_type = models.DiskType.objects.create(
+            manufacturer=manufacturer, name="Tab Disk", part_number="tab_disk"
+        )
+        for num in range(30):
+            models.Disk.objects.create(
+                fsu_type=disk_type, device=cls.device, status=status, name=f"disk{num:02}"
+            )
+        models.Fan.objects.create(
+            fsu_type=models.FanType.objects.create(
+                manufacturer=manufacturer, name="Tab Fan", part_number="tab_fan"
+            ),
+            device=cls.device,
+            status=status,
+            name="fan0",
+        )
+        cls.url = reverse("plugins:nautobot_fsus:device_fsus_tab", kwargs={"pk": cls.device.pk})
+
+    def setUp(self):
+        """Give the test user permission to view the Device and its FSUs."""
+        super().setUp()
+        self.add_permissions(
+            "dcim.view_device", "nautobot_fsus.view_disk", "nautobot_fsus.view_fan"
+        )
+
+    def test_tab_skeleton(self):
+        """Verify the tab lists the FSU types with FSUs, without rendering their tables."""
+        response = self.client.get(self.url)
+        self.assertHttpStatus(response, 200)
+        self.assertEqual(
+            [
+                (fsu_table["fsu_model"], fsu_table["count"])
+                for fsu_table in response.context["fsu_tables"]
+            ],
+            [("disk", 30), ("fan", 1)],
+        )
+        content = response.content.decode()
+        self.assertIn('data-fsu-model="disk"', content)
+        self.assertNotIn('data-fsu-model="gpu"', content)
+        self.assertNotIn("disk00", content)
+
+    def test_tab_table(self):
+        """Verify the table of one FSU type is paginated."""
+        response = self.client.get(f"{self.url}?fsu_model=disk&per_page=25&sort=name")
+        self.assertHttpStatus(response, 200)
+        content = response.content.decode()
+        self.assertIn("disk24", content)
+        self.assertNotIn("disk25", content)
+        self.assertNotIn("fan0", content)
+        self.assertIn("Showing 1-25 of 30", content)
+
+        response = self.client.get(f"{self.url}?fsu_model=disk&per_page=25&sort=name&page=2")
+        self.assertIn("disk29", response.content.decode())
+
+    def test_tab_table_permissions(self):
+        """Verify FSU tables are restricted to what the user can view, and to known FSU types."""
+        response = self.client.get(f"{self.url}?fsu_model=gpu")
+        self.assertHttpStatus(response, 200)
+        self.assertNotIn("disk00", response.content.decode())
+
+        self.assertHttpStatus(self.client.get(f"{self.url}?fsu_model=device"), 404)
+
+        location_url = reverse(
+            "plugins:nautobot_fsus:location_fsus_tab", kwargs={"pk": self.location.pk}
+        )
+        self.assertHttpStatus(self.client.get(f"{location_url}?fsu_model=disk"), 403)
@@ -58,6 +58,7 @@ router.register("rammodule-templates", views.RAMModuleTemplateUIViewSet)
 router.register("rammodule-types", views.RAMModuleTypeUIViewSet)
 
 urlpatterns = [
+    path("all-fsus/", views.AllFSUsListView.as_view(), name="all_fsus"),
     path("cpus/rename/", views.CPUBulkRenameView.as_view(), name="cpu_bulk_rename"),
     path("devices/<uuid:pk>/fsus/", views.DeviceFSUViewTab.as_view(), name="device_fsus_tab"),
     path("docs/", RedirectView.as_view(url=static("nautobot_fsus/docs/index.html")), name="docs"),
@@ -0,0 +1,252 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Read-only query over the FSUs of every FSU model, combined in the database."""
+
+from typing import Any, Iterable, Iterator, Mapping
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.db.models import CharField, QuerySet, Value
+from django.http import QueryDict
+from nautobot.core.api.constants import NON_FILTER_QUERY_PARAMS
+
+from nautobot_fsus import filters
+from nautobot_fsus.models import FSU_MODELS
+from nautobot_fsus.models.mixins import FSUModel
+
+# Columns shared by every FSU model, read from each FSU table.
+ALL_FSU_FIELDS = (
+    "id",
+    "name",
+    "_name",
+    "serial_number",
+    "firmware_version",
+    "driver_name",
+    "driver_version",
+    "asset_tag",
+    "description",
+    "device_id",
+    "device__name",
+    "location_id",
+    "location__name",
+    "status__name",
+    "status__color",
+    "fsu_type_id",
+    "fsu_type__name",
+    "fsu_type__manufacturer__name",
+    "created",
+    "last_updated",
+)
+
+# Sort keys accepted by `AllFSUs.order_by()`, and the column each one sorts on.
+ALL_FSU_ORDERING = {
+    "fsu_model": "fsu_model",
+    "name": "_name",
+    "serial_number": "serial_number",
+    "asset_tag": "asset_tag",
+    "device": "device__name",
+    "location": "location__name",
+    "status": "status__name",
+    "fsu_type": "fsu_type__name",
+    "manufacturer": "fsu_type__manufacturer__name",
+    "created": "created",
+    "last_updated": "last_updated",
+}
+
+DEFAULT_ALL_FSU_ORDERING = ("device", "location", "name", "fsu_model")
+
+# Query parameters that select, order, or paginate the FSUs, rather than filter them.
+ALL_FSU_NON_FILTER_PARAMS = {*NON_FILTER_QUERY_PARAMS, "cursor", "fsu_model", "page", "per_page"}
+
+
+class AllFSUs:
+    """
+    Read-only, queryset-like view of the FSUs of every model.
+
+    The common columns of each FSU table are combined with a single `UNION ALL` query, so
+    filtering, ordering, counting, and slicing all happen in the database - a page of FSUs of any
+    type takes one query, and counting them another. Filters are applied to each FSU table before
+    the tables are combined, so they can use the indexes of each table. Rows are dictionaries of
+    the `ALL_FSU_FIELDS` columns, plus the `fsu_model` name of the FSU, e.g. "gpu".
+
+    AllFSUs supports `count()`, slicing, and iteration, so it can be paginated like a queryset.
+    """
+
+    ordered = True
+
+    def __init__(
+        self,
+        querysets: Mapping[type[FSUModel], QuerySet] | None = None,
+        ordering: Iterable[str] = DEFAULT_ALL_FSU_ORDERING,
+    ):
+        """Combine the given FSU querysets, or all FSUs of every model by default."""
+        self.querysets: dict[type[FSUModel], QuerySet] = (
+            {model: model.objects.all() for model in FSU_MODELS}
+            if querysets is None
+            else dict(querysets)
+        )
+        self.ordering = tuple(ordering)
+
+    def _clone(self, querysets: Mapping[type[FSUModel], QuerySet]) -> "AllFSUs":
+        """Copy with a new set of FSU querysets."""
+        return AllFSUs(querysets, ordering=self.ordering)
+
+    def filter(self, *args: Any, **kwargs: Any) -> "AllFSUs":
+        """Filter the FSUs of every model with the same lookups."""
+        return self._clone(
+            {model: queryset.filter(*args, **kwargs) for model, queryset in self.querysets.items()}
+        )
+
+    def for_models(self, model_names: Iterable[str]) -> "AllFSUs":
+        """Limit the FSUs to those of the given models, by model name, e.g. "gpu"."""
+        model_names = set(model_names)
+        return self._clone(
+            {
+                model: queryset
+                for model, queryset in self.querysets.items()
+                if model._meta.model_name in model_names
+            }
+        )
+
+    def restrict(self, user: AbstractBaseUser, action: str = "view") -> "AllFSUs":
+        """Limit the FSUs to those a user has permission for, leaving out models they cannot access."""
+        return self._clone(
+            {
+                model: queryset.restrict(user, action)
+                for model, queryset in self.querysets.items()
+                if user.has_perm(f"{model._meta.app_label}.{action}_{model._meta.model_name}")
+            }
+        )
+
+    def filter_params(self, params: Mapping[str, Any]) -> tuple["AllFSUs", dict[str, list[str]]]:
+        """
+        Filter the FSUs with the FilterSet of each FSU model.
+
+        Filters that only apply to some FSU models, e.g. `parent_hba` or an FSU type name, limit
+        the results to the FSUs of the models they are valid for.
+
+        Returns:
+            tuple: The filtered FSUs, and the errors found if the filters are not valid for any
+                FSU model.
+        """
+        if not params:
+            return self, {}
+
+        querysets: dict[type[FSUModel], QuerySet] = {}
+        errors: dict[str, list[str]] = {}
+        for model, queryset in self.querysets.items():
+            filterset = getattr(filters, f"{model.__name__}FilterSet")(params, queryset=queryset)
+            if filterset.is_valid():
+                querysets[model] = filterset.qs
+            else:
+                for field_name, messages in filterset.errors.items():
+                    field_errors = errors.setdefault(field_name, [])
+                    field_errors.extend(
+                        [message for message in messages if message not in field_errors]
+                    )
+
+        return self._clone(querysets), {} if querysets or not self.querysets else errors
+
+    def order_by(self, *fields: str) -> "AllFSUs":
+        """
+        Order the FSUs by the given `ALL_FSU_ORDERING` keys, prefixed with "-" for descending order.
+
+        Raises:
+            ValueError: If a key is not one of the sortable columns.
+        """
+        for field_name in fields:
+            if field_name.lstrip("-") not in ALL_FSU_ORDERING:
+                raise ValueError(f"FSUs cannot be sorted by {field_name}.")
+        return AllFSUs(self.querysets, ordering=fields or DEFAULT_ALL_FSU_ORDERING)
+
+    def query(self) -> QuerySet | None:
+        """Build the combined `UNION ALL` query, or None if there are no FSU models to query."""
+        parts = [
+            queryset.order_by()
+            .annotate(fsu_model=Value(model._meta.model_name, output_field=CharField()))
+            .values(*ALL_FSU_FIELDS, "fsu_model")
+            for model, queryset in self.querysets.items()
+        ]
+        if not parts:
+            return None
+
+        ordering = [
+            f"{'-' if field_name.startswith('-') else ''}{ALL_FSU_ORDERING[field_name.lstrip('-')]}"
+            for field_name in self.ordering
+        ]
+        combined = parts[0].union(*parts[1:], all=True) if len(parts) > 1 else parts[0]
+        return combined.order_by(*ordering, "id")
+
+    def count(self) -> int:
+        """Count the FSUs in a single query."""
+        query = self.query()
+        return 0 if query is None else query.count()
+
+    def __len__(self) -> int:
+        """Number of FSUs."""
+        return self.count()
+
+    def __getitem__(self, key: int | slice) -> Any:
+        """Get a single FSU, or a list of FSUs for a slice, with one query."""
+        query = self.query()
+        if query is None:
+            if isinstance(key, slice):
+                return []
+            raise IndexError("AllFSUs index out of range")
+        if isinstance(key, slice):
+            return list(query[key])
+        return query[key]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over all of the FSUs."""
+        query = self.query()
+        return iter(()) if query is None else iter(query)
+
+
+def get_all_fsus(
+    params: QueryDict,
+    user: AbstractBaseUser,
+) -> tuple[AllFSUs, dict[str, list[str]]]:
+    """
+    Get the FSUs of every model a user can view, selected and filtered by request query parameters.
+
+    `fsu_model` limits the FSUs to the given models, e.g. `?fsu_model=gpu&fsu_model=cpu`, `sort`
+    orders them by any of the `ALL_FSU_ORDERING` keys, and any other parameter is passed to the
+    FilterSet of each FSU model, e.g. `?location=<name>&status=Active`.
+
+    Returns:
+        tuple: The FSUs, and the errors found in the query parameters.
+    """
+    all_fsus = AllFSUs().restrict(user, "view")
+    if model_names := params.getlist("fsu_model"):
+        all_fsus = all_fsus.for_models(model_names)
+
+    filter_params = params.copy()
+    for param in ALL_FSU_NON_FILTER_PARAMS:
+        filter_params.pop(param, None)
+    all_fsus, errors = all_fsus.filter_params(filter_params)
+
+    if sort := [
+        field_name
+        for value in params.getlist("sort")
+        for field_name in value.split(",")
+        if field_name
+    ]:
+        try:
+            all_fsus = all_fsus.order_by(*sort)
+        except ValueError as error:
+            errors["sort"] = [str(error)]
+
+    return all_fsus, errors
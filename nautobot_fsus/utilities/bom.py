@@ -0,0 +1,226 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""FSU bill of materials of DeviceTypes, from their FSU templates."""
+
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.db.models import BooleanField, CharField, F, Model, QuerySet, Value
+from django.db.models.functions import Cast
+from nautobot.dcim.models import DeviceType, Manufacturer
+
+from nautobot_fsus.models import FSU_TEMPLATE_MODELS
+from nautobot_fsus.models.mixins import FSUTemplateModel
+from nautobot_fsus.utilities.instantiation import fsu_model_for_template
+
+# Fields shared by every FSU template model.
+BOM_TEMPLATE_FIELDS = (
+    "id",
+    "created",
+    "last_updated",
+    "_custom_field_data",
+    "device_type_id",
+    "name",
+    "_name",
+    "description",
+    "fsu_type_id",
+)
+
+BOM_FSU_TYPE_FIELDS = (
+    "fsu_type__name",
+    "fsu_type__part_number",
+    "fsu_type__manufacturer_id",
+    "fsu_type__manufacturer__name",
+)
+
+# Type-specific FSU template fields, with their field type for the models that do not have them.
+EXTRA_BOM_FIELDS = {
+    "pci_slot_id": CharField,
+    "redundant": BooleanField,
+    "slot_id": CharField,
+}
+
+
+@dataclass
+class BOMPart:
+    """A part in a DeviceType's bill of materials, with the number of FSUs of it in each Device."""
+
+    fsu_model: str
+    fsu_type_id: UUID
+    manufacturer: str
+    name: str
+    part_number: str
+    quantity: int = 0
+
+
+@dataclass
+class BillOfMaterials:
+    """The FSU templates of a DeviceType, and the parts they add up to."""
+
+    device_type: DeviceType
+    templates: dict[type[FSUTemplateModel], list[FSUTemplateModel]] = field(default_factory=dict)
+
+    @property
+    def parts(self) -> list[BOMPart]:
+        """Quantity of each FSU type in the DeviceType, in manufacturer and part number order."""
+        parts: dict[tuple[type[FSUTemplateModel], UUID], BOMPart] = {}
+        for template_model, templates in self.templates.items():
+            fsu_model_name = fsu_model_for_template(template_model)._meta.model_name
+            for template in templates:
+                part = parts.setdefault(
+                    (template_model, template.fsu_type_id),
+                    BOMPart(
+                        fsu_model=fsu_model_name,
+                        fsu_type_id=template.fsu_type_id,
+                        manufacturer=template.fsu_type.manufacturer.name,
+                        name=template.fsu_type.name,
+                        part_number=template.fsu_type.part_number,
+                    ),
+                )
+                part.quantity += 1
+
+        return sorted(
+            parts.values(), key=lambda part: (part.manufacturer, part.part_number, part.fsu_model)
+        )
+
+
+def _template_query(
+    template_model: type[FSUTemplateModel],
+    device_type: DeviceType,
+    user: AbstractBaseUser | None,
+) -> QuerySet:
+    """Query for the BOM fields of the templates of one FSU template model for a DeviceType."""
+    model_fields = {model_field.name for model_field in template_model._meta.concrete_fields}
+    queryset = (
+        template_model.objects.all()
+        if user is None
+        else template_model.objects.restrict(user, "view")
+    )
+
+    # Every column is an annotation, in the same order in each part of the union, so that the
+    # columns of each part line up - Django selects plain fields ahead of annotations, which
+    # would mix up the keys of the union's rows. Fields a model does not have are typed NULLs.
+    annotations = {
+        "bom_template_model": Value(template_model._meta.model_name, output_field=CharField()),
+        **{f"bom_{field_name}": F(field_name) for field_name in BOM_TEMPLATE_FIELDS},
+        **{f"bom_{field_name}": F(field_name) for field_name in BOM_FSU_TYPE_FIELDS},
+        **{
+            f"bom_{field_name}": (
+                F(field_name) if field_name in model_fields else Cast(Value(None), field_type())
+            )
+            for field_name, field_type in EXTRA_BOM_FIELDS.items()
+        },
+    }
+    return (
+        queryset.filter(device_type=device_type)
+        .order_by()
+        .annotate(**annotations)
+        .values(*annotations)
+    )
+
+
+def _from_db(model: type[Model], db: str, values: dict[str, Any]) -> Model:
+    """Build a model instance from some of its field values, leaving the other fields deferred."""
+    # from_db() takes the values of a subset of fields in the model's concrete field order.
+    field_names = [
+        model_field.attname
+        for model_field in model._meta.concrete_fields
+        if model_field.attname in values
+    ]
+    return model.from_db(db, field_names, [values[field_name] for field_name in field_names])
+
+
+def get_bill_of_materials(
+    device_type: DeviceType,
+    user: AbstractBaseUser | None = None,
+) -> BillOfMaterials:
+    """
+    Get the FSU templates of a DeviceType, and the FSU parts they add up to.
+
+    The templates of every FSU template model are read with a single `UNION ALL` query, with
+    their FSU type and its manufacturer joined in, so building the bill of materials takes one
+    query however many FSU templates the DeviceType has. The templates are returned as model
+    instances with their `device_type`, `fsu_type`, and `fsu_type.manufacturer` already set.
+
+    Args:
+        device_type: DeviceType to get the bill of materials for.
+        user: If set, only FSU templates the user has permission to view are included.
+
+    Returns:
+        BillOfMaterials: The templates of each FSU template model, in name order.
+    """
+    bom = BillOfMaterials(
+        device_type=device_type, templates={model: [] for model in FSU_TEMPLATE_MODELS}
+    )
+    queries = [
+        _template_query(model, device_type, user)
+        for model in FSU_TEMPLATE_MODELS
+        if user is None or user.has_perm(f"{model._meta.app_label}.view_{model._meta.model_name}")
+    ]
+    if not queries:
+        return bom
+
+    template_models = {model._meta.model_name: model for model in FSU_TEMPLATE_MODELS}
+    fsu_types: dict[UUID, Any] = {}
+    manufacturers: dict[UUID, Manufacturer] = {}
+    db = device_type._state.db
+    extra_fields = {
+        model: [
+            model_field.name
+            for model_field in model._meta.concrete_fields
+            if model_field.name in EXTRA_BOM_FIELDS
+        ]
+        for model in FSU_TEMPLATE_MODELS
+    }
+
+    for row in queries[0].union(*queries[1:], all=True).order_by("bom__name"):
+        template_model = template_models[row["bom_template_model"]]
+        values = {field_name: row[f"bom_{field_name}"] for field_name in BOM_TEMPLATE_FIELDS}
+        values.update(
+            {field_name: row[f"bom_{field_name}"] for field_name in extra_fields[template_model]}
+        )
+        template = _from_db(template_model, db, values)
+
+        if (fsu_type := fsu_types.get(values["fsu_type_id"])) is None:
+            manufacturer_id = row["bom_fsu_type__manufacturer_id"]
+            if (manufacturer := manufacturers.get(manufacturer_id)) is None:
+                manufacturer = _from_db(
+                    Manufacturer,
+                    db,
+                    {"id": manufacturer_id, "name": row["bom_fsu_type__manufacturer__name"]},
+                )
+                manufacturers[manufacturer_id] = manufacturer
+            type_model = template_model._meta.get_field("fsu_type").related_model
+            fsu_type = _from_db(
+                type_model,
+                db,
+                {
+                    "id": values["fsu_type_id"],
+                    "manufacturer_id": manufacturer_id,
+                    "name": row["bom_fsu_type__name"],
+                    "part_number": row["bom_fsu_type__part_number"],
+                },
+            )
+            fsu_type.manufacturer = manufacturer
+            fsu_types[values["fsu_type_id"]] = fsu_type
+
+        template.device_type = device_type
+        template.fsu_type = fsu_type
+        bom.templates[template_model].append(template)
+
+    return bom
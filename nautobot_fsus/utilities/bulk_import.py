@@ -0,0 +1,429 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Set-based bulk import of FSUs from CSV or NDJSON data."""
+
+from collections import Counter, defaultdict
+import csv
+from dataclasses import dataclass, field
+from io import StringIO
+import json
+from time import perf_counter
+from typing import IO, Any, Iterable
+from uuid import UUID
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import models, transaction
+from django.db.models import ForeignKey, Q
+from nautobot.core.utils.data import is_uuid
+from nautobot.extras.choices import ObjectChangeActionChoices
+from nautobot.extras.models import Status
+
+from nautobot_fsus import forms
+from nautobot_fsus.models import (
+    FSUCount,
+    FSUSerialIndex,
+    FSUSpareCount,
+    FSUVersionCount,
+)
+from nautobot_fsus.models.mixins import FSUModel
+from nautobot_fsus.utilities.child_assignment import log_bulk_changes
+from nautobot_fsus.utilities.instantiation import custom_field_defaults
+from nautobot_fsus.utilities.inventory import CHILD_FSU_FIELDS
+
+
+@dataclass
+class ImportResult:
+    """Summary of a bulk FSU import."""
+
+    rows: int = 0
+    created: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Import throughput."""
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+
+def read_csv(csv_file: IO[str]) -> list[dict[str, str]]:
+    """Read the rows of a CSV file with a header line into dictionaries."""
+    return list(csv.DictReader(csv_file))
+
+
+def read_ndjson(ndjson_file: IO[str]) -> list[dict[str, str]]:
+    """Read the rows of an NDJSON file, with one JSON object per line, into dictionaries."""
+    return [
+        {key: "" if value is None else str(value) for key, value in json.loads(line).items()}
+        for line in ndjson_file
+        if line.strip()
+    ]
+
+
+def read_import_data(data: str) -> tuple[list[dict[str, str]], int]:
+    """
+    Read CSV or NDJSON import data, detecting the format from the first character.
+
+    Returns:
+        tuple: The rows, and the line number of the first row in the data, for error messages.
+    """
+    if data.lstrip().startswith("{"):
+        return read_ndjson(StringIO(data)), 1
+    # The header line is line 1 of a CSV file.
+    return read_csv(StringIO(data)), 2
+
+
+class FSUImporter:
+    """
+    Validate and create FSUs of one model from rows of import data.
+
+    Rows use the columns of the model's import form. Related objects are given by name, or by
+    ID; parent FSUs can also be given by name, when they are in the same Device. Every related
+    object referenced by a set of rows is resolved with one `IN` query per related model, and
+    the rows are then validated in memory - including name uniqueness and parent FSU capacity -
+    so the number of queries does not depend on the number of rows.
+    """
+
+    def __init__(self, model: type[FSUModel], user: AbstractBaseUser | None = None):
+        """Get the columns and custom field defaults for the FSU model."""
+        self.model = model
+        self.user = user
+        form_class = getattr(forms, f"{model.__name__}ImportForm")
+        self.fields: list[str] = list(form_class._meta.fields)
+        self.related_fields: dict[str, ForeignKey] = {
+            field_name: model._meta.get_field(field_name)
+            for field_name in self.fields
+            if isinstance(model._meta.get_field(field_name), ForeignKey)
+        }
+        self.parent_field = CHILD_FSU_FIELDS[model][0] if model in CHILD_FSU_FIELDS else None
+        self.custom_field_data = custom_field_defaults([model])[model]
+
+    def _restrict(self, queryset: models.QuerySet, action: str = "view") -> models.QuerySet:
+        """Restrict a queryset to the objects the importing user has permission for."""
+        return queryset if self.user is None else queryset.restrict(self.user, action)
+
+    @staticmethod
+    def _values(rows: list[dict[str, str]], field_name: str) -> tuple[set[str], set[str]]:
+        """Get the distinct names and IDs given in a column."""
+        values = {(row.get(field_name) or "").strip() for row in rows} - {""}
+        ids = {value for value in values if is_uuid(value)}
+        return values - ids, ids
+
+    def _resolve(self, rows: list[dict[str, str]]) -> dict[str, dict[Any, list[models.Model]]]:
+        """Look up the related objects referenced by the rows, with one query per column."""
+        resolved: dict[str, dict[Any, list[models.Model]]] = {}
+        for field_name, model_field in self.related_fields.items():
+            if field_name == self.parent_field:
+                continue
+
+            names, ids = self._values(rows, field_name)
+            if field_name == "status":
+                queryset = Status.objects.get_for_model(self.model)
+            else:
+                queryset = self._restrict(model_field.related_model.objects.all())
+
+            lookup: dict[Any, list[models.Model]] = defaultdict(list)
+            if names or ids:
+                for obj in queryset.filter(Q(name__in=names) | Q(pk__in=ids)):
+                    lookup[str(obj.pk)].append(obj)
+                    lookup[obj.name].append(obj)
+            resolved[field_name] = lookup
+
+        if self.parent_field:
+            device_ids = {device.pk for objs in resolved["device"].values() for device in objs}
+            resolved[self.parent_field] = self._resolve_parents(rows, device_ids)
+
+        return resolved
+
+    def _resolve_parents(
+        self, rows: list[dict[str, str]], device_ids: set[UUID]
+    ) -> dict[Any, list[models.Model]]:
+        """Look up the parent FSUs referenced by the rows, by ID or by name in the given Devices."""
+        # Parent FSUs are named uniquely per Device, so names are resolved per Device.
+        names, ids = self._values(rows, self.parent_field)
+        parent_model = self.related_fields[self.parent_field].related_model
+        lookup: dict[Any, list[models.Model]] = defaultdict(list)
+        if names or ids:
+            for parent in self._restrict(parent_model.objects.select_related("fsu_type")).filter(
+                Q(pk__in=ids) | Q(device_id__in=device_ids, name__in=names)
+            ):
+                lookup[str(parent.pk)].append(parent)
+                lookup[(parent.device_id, parent.name)].append(parent)
+        return lookup
+
+    def _slot_count_field(self) -> str | None:
+        """Field of the parent FSU model counting its used slots, if it has limited slots."""
+        if not self.parent_field:
+            return None
+        return getattr(
+            self.related_fields[self.parent_field].related_model, "slot_count_field", None
+        )
+
+    def _existing_names(self, instances: list[FSUModel]) -> set[tuple[str, UUID, str]]:
+        """Get the names already in use in the Devices and Locations of the new FSUs."""
+        existing: set[tuple[str, UUID, str]] = set()
+        for parent_field in ("device", "location"):
+            parent_ids = {getattr(instance, f"{parent_field}_id") for instance in instances}
+            parent_ids.discard(None)
+            if parent_ids:
+                existing.update(
+                    (parent_field, parent_id, name)
+                    for parent_id, name in self.model.objects.filter(
+                        **{f"{parent_field}_id__in": parent_ids}
+                    ).values_list(f"{parent_field}_id", "name")
+                )
+        return existing
+
+    def _set_related(
+        self,
+        instance: FSUModel,
+        field_name: str,
+        value: str,
+        resolved: dict[str, dict[Any, list[models.Model]]],
+    ) -> str | None:
+        """Set a related object of an FSU from its resolved name or ID, or return the error."""
+        if not value:
+            setattr(instance, field_name, None)
+            return None
+        key: Any = value
+        if field_name == self.parent_field and not is_uuid(value):
+            key = (instance.device_id, value)
+        matches = resolved[field_name].get(key, [])
+        if len(matches) != 1:
+            problem = "matches more than one object" if matches else "not found"
+            return f"{field_name}: {value!r} {problem}."
+        setattr(instance, field_name, matches[0])
+        return None
+
+    def _build(
+        self,
+        row: dict[str, str],
+        resolved: dict[str, dict[Any, list[models.Model]]],
+        instance: FSUModel | None = None,
+    ) -> tuple[FSUModel, list[str]]:
+        """
+        Build an unsaved FSU from a row, with any errors found in the row.
+
+        If an existing FSU is given, only the columns present in the row are applied to it.
+        """
+        errors: list[str] = []
+        unresolved: set[str] = set()
+        update = instance is not None
+        instance = instance or self.model(_custom_field_data=dict(self.custom_field_data))
+        for field_name in self.fields:
+            if update and field_name not in row:
+                continue
+            value = (row.get(field_name) or "").strip()
+            if field_name in self.related_fields:
+                if error := self._set_related(instance, field_name, value, resolved):
+                    errors.append(error)
+                    unresolved.add(field_name)
+                continue
+
+            model_field = self.model._meta.get_field(field_name)
+            try:
+                setattr(
+                    instance,
+                    field_name,
+                    model_field.to_python(value) if value else model_field.get_default(),
+                )
+            except ValidationError as error:
+                errors.extend(f"{field_name}: {message}" for message in error.messages)
+
+        if instance.device_id and instance.location_id:
+            # An FSU installed in a Device has no storage Location, as in FSUModel.save(),
+            # unless an update moves an installed FSU into storage.
+            if update and (row.get("location") or "").strip() and "device" not in row:
+                instance.device = None
+            else:
+                instance.location = None
+        if not (instance.device_id or instance.location_id or {"device", "location"} & unresolved):
+            errors.append("A device or a storage location is required.")
+        for field_name in ("fsu_type", "status"):
+            if getattr(instance, f"{field_name}_id") is None and field_name not in unresolved:
+                errors.append(f"{field_name}: This field is required.")
+
+        try:
+            # Related objects have already been resolved, the remaining fields need no queries.
+            models.Model.clean_fields(instance, exclude=[*self.related_fields, "_name"])
+        except ValidationError as error:
+            errors.extend(
+                f"{field_name}: {message}"
+                for field_name, messages in error.message_dict.items()
+                for message in messages
+            )
+
+        return instance, errors
+
+    def validate(
+        self,
+        rows: Iterable[dict[str, str]],
+        start_row: int = 1,
+    ) -> tuple[list[FSUModel], list[tuple[int, str]]]:
+        """
+        Build and validate the FSUs for a set of rows, without saving them.
+
+        Args:
+            rows: Import data, keyed by column name.
+            start_row: Number of the first row, used in error messages.
+
+        Returns:
+            tuple: The valid FSUs, and the (row number, message) of each error found.
+        """
+        rows = list(rows)
+        resolved = self._resolve(rows)
+        built = [self._build(row, resolved) for row in rows]
+        existing = self._existing_names([instance for instance, _ in built])
+        return self._check(built, existing, range(start_row, start_row + len(rows)))
+
+    def _check(
+        self,
+        built: list[tuple[FSUModel, list[str]]],
+        existing: set[tuple[str, UUID, str]],
+        row_numbers: Iterable[int],
+        prior_parents: dict[UUID, UUID | None] | None = None,
+    ) -> tuple[list[FSUModel], list[tuple[int, str]]]:
+        """
+        Check built FSUs against each other and the existing FSUs, in memory.
+
+        Args:
+            built: FSUs with the errors already found in their rows.
+            existing: Names in use in the Devices and Locations of the FSUs.
+            row_numbers: Row number of each FSU, used in error messages.
+            prior_parents: Current parent FSU of each existing FSU being updated, which already
+                holds a slot in that parent.
+
+        Returns:
+            tuple: The valid FSUs, and the (row number, message) of each error found.
+        """
+        prior_parents = prior_parents or {}
+        count_field = self._slot_count_field()
+        children: dict[UUID, int] = {}
+
+        valid: list[FSUModel] = []
+        errors: list[tuple[int, str]] = []
+        for row_number, (instance, row_errors) in zip(row_numbers, built, strict=True):
+            parent_field = "device" if instance.device_id else "location"
+            name_key = (parent_field, getattr(instance, f"{parent_field}_id"), instance.name)
+            if instance.name and name_key[1] and name_key in existing:
+                row_errors.append(
+                    f"name: {instance.name!r} is already in use in the {parent_field}."
+                )
+
+            parent = getattr(instance, self.parent_field) if self.parent_field else None
+            takes_slot = bool(
+                count_field and parent and prior_parents.get(instance.pk) != parent.pk
+            )
+            if parent:
+                if parent.device_id is None or parent.device_id != instance.device_id:
+                    row_errors.append(
+                        f"{self.parent_field}: {parent.name} is not in the same device."
+                    )
+                if takes_slot:
+                    count = children.setdefault(parent.pk, getattr(parent, count_field))
+                    limit = getattr(parent.fsu_type, parent.slot_capacity_field)
+                    if limit and count >= limit:
+                        row_errors.append(f"{self.parent_field}: {parent.name} has no free slots.")
+
+            if row_errors:
+                errors.extend((row_number, message) for message in row_errors)
+                continue
+
+            existing.add(name_key)
+            if takes_slot:
+                children[parent.pk] += 1
+            valid.append(instance)
+
+        return valid, errors
+
+    def save(self, instances: list[FSUModel], batch_size: int = 1000) -> list[FSUModel]:
+        """
+        Create validated FSUs with `bulk_create()` in batches, in a single transaction.
+
+        Raises:
+            PermissionDenied: If the importing user is not permitted to add all of the FSUs.
+        """
+        with transaction.atomic():
+            created = self.model.objects.bulk_create(instances, batch_size=batch_size)
+            if self.user is not None:
+                permitted = (
+                    self._restrict(self.model.objects.all(), "add")
+                    .filter(pk__in=[instance.pk for instance in created])
+                    .count()
+                )
+                if permitted != len(created):
+                    raise PermissionDenied("Not permitted to add some of the imported FSUs.")
+
+            # bulk_create() bypasses the FSU save signals, so the counts, the serial number
+            # index, and the version and spare counts are updated here.
+            FSUCount.objects.refresh(
+                self.model,
+                device_ids={instance.device_id for instance in created},
+                location_ids={instance.location_id for instance in created},
+            )
+            FSUSerialIndex.objects.refresh(self.model, [instance.pk for instance in created])
+            FSUVersionCount.objects.add_fsus(self.model, created)
+            FSUSpareCount.objects.add_fsus(self.model, created)
+            if self._slot_count_field():
+                parent_model = self.related_fields[self.parent_field].related_model
+                parent_model.objects.adjust_slots(
+                    Counter(getattr(instance, f"{self.parent_field}_id") for instance in created)
+                )
+
+        return created
+
+
+def import_fsus(  # noqa: PLR0913
+    model: type[FSUModel],
+    rows: Iterable[dict[str, str]],
+    *,
+    user: AbstractBaseUser | None = None,
+    batch_size: int = 1000,
+    start_row: int = 1,
+    partial: bool = False,
+) -> ImportResult:
+    """
+    Import FSUs of one model from rows of CSV data.
+
+    Within a change context, such as a Job, the created FSUs are recorded in the change log.
+
+    Args:
+        model: FSU model to import.
+        rows: Import data, keyed by the column names of the model's import form.
+        user: If set, related objects must be visible to the user, who must also have
+            permission to add the new FSUs.
+        batch_size: Maximum number of FSUs to insert per database query.
+        start_row: Number of the first row, used in error messages.
+        partial: Create the valid rows even if other rows have errors. By default nothing is
+            created unless every row is valid.
+
+    Returns:
+        ImportResult: Number of rows read and FSUs created, and any errors by row number.
+    """
+    start = perf_counter()
+    rows = list(rows)
+    importer = FSUImporter(model, user=user)
+    instances, errors = importer.validate(rows, start_row=start_row)
+
+    result = ImportResult(rows=len(rows), errors=errors)
+    if instances and (partial or not errors):
+        created = importer.save(instances, batch_size=batch_size)
+        log_bulk_changes(created, ObjectChangeActionChoices.ACTION_CREATE)
+        result.created = len(created)
+
+    result.elapsed = perf_counter() - start
+    return result
@@ -0,0 +1,290 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Set-based assignment of child FSUs and Device components to their parent FSUs."""
+
+from dataclasses import dataclass
+from typing import Any, Iterable
+from uuid import UUID
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
+from django.utils import timezone
+from django.utils.text import capfirst
+from nautobot.dcim.models import Device
+from nautobot.extras.choices import ObjectChangeActionChoices
+from nautobot.extras.constants import CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
+from nautobot.extras.models import ObjectChange
+from nautobot.extras.signals import change_context_state
+
+from nautobot_fsus.models.mixins import FSUModel, FSUTypeModel
+from nautobot_fsus.utilities import validate_parent_device
+
+
+def _refresh_object_changes(change_context: Any, instances: list[models.Model]) -> None:
+    """
+    Update the change log entries of objects already logged in the current change context.
+
+    As Nautobot does for an object saved twice in one request, the latest entry of each object
+    takes its current data, rather than a second entry being made. The entries are read with one
+    query and updated with one `bulk_update()`.
+    """
+    if change_context.defer_object_changes or not instances:
+        return
+
+    by_key = {
+        (ContentType.objects.get_for_model(instance).pk, instance.pk): instance
+        for instance in instances
+    }
+    latest: dict[tuple[int, UUID], ObjectChange] = {}
+    for object_change in ObjectChange.objects.filter(
+        changed_object_type__in={content_type_id for content_type_id, _ in by_key},
+        changed_object_id__in={pk for _, pk in by_key},
+        request_id=change_context.change_id,
+    ).order_by("time"):
+        latest[(object_change.changed_object_type_id, object_change.changed_object_id)] = (
+            object_change
+        )
+
+    refreshed = []
+    for key, object_change in latest.items():
+        instance = by_key.get(key)
+        if instance is None or object_change.user_id != getattr(
+            change_context.get_user(instance), "pk", None
+        ):
+            continue
+        current = instance.to_objectchange(ObjectChangeActionChoices.ACTION_UPDATE)
+        if current is None:
+            continue
+        if object_change.action == ObjectChangeActionChoices.ACTION_DELETE:
+            object_change.action = ObjectChangeActionChoices.ACTION_UPDATE
+        object_change.object_data = current.object_data
+        object_change.object_data_v2 = current.object_data_v2
+        refreshed.append(object_change)
+
+    ObjectChange.objects.bulk_update(refreshed, ["action", "object_data", "object_data_v2"])
+
+
+def log_bulk_changes(
+    instances: Iterable[models.Model],
+    action: str = ObjectChangeActionChoices.ACTION_UPDATE,
+) -> None:
+    """
+    Record change log entries for objects created or changed in bulk.
+
+    `bulk_create()`, `bulk_update()`, and queryset updates do not send the save signals that
+    change logging relies on, so the entries are created here, all with a single `bulk_create()`.
+    This does nothing outside of a change context, such as a request or a Job. Objects already
+    logged in the current change context have their existing entry updated instead, as Nautobot
+    does for objects saved more than once.
+    """
+    change_context = change_context_state.get()
+    if change_context is None:
+        return
+
+    object_changes = []
+    logged = []
+    for instance in instances:
+        user = change_context.get_user(instance)
+        content_type = ContentType.objects.get_for_model(instance)
+        change_key = f"{content_type.pk}__{instance.pk}"
+        if user is not None:
+            change_key = f"{change_key}__{user.pk}"
+        if change_key in change_context.deferred_object_changes:
+            logged.append(instance)
+            continue
+
+        change_context.deferred_object_changes[change_key] = [
+            {"action": action, "instance": instance, "user": user}
+        ]
+        if change_context.defer_object_changes:
+            continue
+
+        object_change = instance.to_objectchange(action)
+        if object_change is not None:
+            object_change.user = user
+            object_change.request_id = change_context.change_id
+            object_change.change_context = change_context.context
+            object_change.change_context_detail = change_context.context_detail[
+                :CHANGELOG_MAX_CHANGE_CONTEXT_DETAIL
+            ]
+            object_changes.append(object_change)
+
+    _refresh_object_changes(change_context, logged)
+    ObjectChange.objects.bulk_create(object_changes)
+
+
+@dataclass(frozen=True)
+class ChildRelation:
+    """
+    The children of a parent FSU model, and how many of them its FSU type has room for.
+
+    Children are either FSUs with a foreign key to their parent, such as the GPUs of a GPU
+    Baseboard, or Device components in a many-to-many field of the parent, such as the Interfaces
+    of a NIC. Either way, the children of a parent are validated and reassigned as a set, with
+    a fixed number of queries however many children there are.
+
+    Attributes:
+        parent_model: The parent FSU model.
+        field_name: The name of the children on the parent model, e.g. "gpus".
+        child_label: The children in error messages, e.g. "GPUs".
+        parent_label: The parent in error messages, e.g. "Baseboard".
+        capacity_field: The field of the parent's FSU type with the number of children it has
+            room for, e.g. "slot_count", if the number of children is limited.
+        capacity_label: What the children occupy in error messages, e.g. "slots".
+    """
+
+    parent_model: type[FSUModel]
+    field_name: str
+    child_label: str
+    parent_label: str
+    capacity_field: str | None = None
+    capacity_label: str = ""
+
+    @property
+    def field(self) -> models.Field | models.ForeignObjectRel:
+        """The field, or reverse relation, of the children on the parent model."""
+        return self.parent_model._meta.get_field(self.field_name)
+
+    @property
+    def child_model(self) -> type[models.Model]:
+        """The model of the children."""
+        return self.field.related_model
+
+    def _parent_ids(self, child_ids: Iterable[UUID]) -> models.QuerySet:
+        """(child ID, parent ID) pairs of the given children that have a parent."""
+        field = self.field
+        if field.many_to_many:
+            child_name = field.m2m_reverse_field_name()
+            return field.remote_field.through.objects.filter(
+                **{f"{child_name}__in": child_ids}
+            ).values_list(child_name, field.m2m_field_name())
+
+        parent_name = field.field.name
+        return self.child_model.objects.filter(
+            pk__in=child_ids, **{f"{parent_name}__isnull": False}
+        ).values_list("pk", parent_name)
+
+    def check_capacity(self, fsu_type: FSUTypeModel, count: int) -> None:
+        """Raise a ValidationError if the FSU type has no room for `count` children."""
+        if self.capacity_field is None:
+            return
+
+        capacity = getattr(fsu_type, self.capacity_field)
+        if capacity is not None and count > capacity:
+            raise ValidationError(
+                f"Number of {self.child_label} being added to {self.parent_label} ({count}) is "
+                f"greater than the number of available {self.capacity_label} ({capacity})"
+            )
+
+    def validate(
+        self,
+        children: list[models.Model],
+        parent_device: Device | None,
+        fsu_type: FSUTypeModel,
+        parent: FSUModel | None = None,
+    ) -> None:
+        """
+        Check that a set of children can be assigned to a parent FSU.
+
+        The children must be in the parent's Device, fit in the parent's FSU type, and not be
+        assigned to another parent. Parents the children are assigned to are looked up with a
+        single query.
+
+        Args:
+            children: The children to assign, with their Devices loaded.
+            parent_device: The Device the parent is, or will be, installed in.
+            fsu_type: The FSU type of the parent.
+            parent: The parent, or None if it is being created.
+
+        Raises:
+            ValidationError: If any of the children cannot be assigned to the parent.
+        """
+        validate_parent_device(children, parent_device)
+        self.check_capacity(fsu_type, len(children))
+
+        assigned = {
+            child_id: parent_id
+            for child_id, parent_id in self._parent_ids([child.pk for child in children])
+            if parent is None or parent_id != parent.pk
+        }
+        taken = next((child for child in children if child.pk in assigned), None)
+        if taken is not None:
+            other_parent = self.parent_model.objects.get(pk=assigned[taken.pk])
+            raise ValidationError(
+                f"{capfirst(taken._meta.verbose_name)} {taken.name} is already assigned to "
+                f"{other_parent.name}"
+            )
+
+    def assign(self, parent: FSUModel, children: list[models.Model]) -> None:
+        """
+        Make `children` the only children of `parent`.
+
+        Children that are not already assigned are attached, and current children that are not
+        in the list are detached, each with a single `UPDATE ... WHERE id IN (...)`, or a single
+        `INSERT` and `DELETE` for many-to-many children. The parent is locked while its children
+        are changed, and its used slot count, if it keeps one, is adjusted with the difference.
+        The changed children are recorded in the change log in bulk. The children must have been
+        checked with `validate()` first.
+        """
+        with transaction.atomic():
+            self._assign(parent, children)
+
+    def _assign(self, parent: FSUModel, children: list[models.Model]) -> None:
+        """Reassign the children of a parent FSU, within a transaction."""
+        field = self.field
+        # Lock the parent, concurrent assignments to it would each miss the other's new children.
+        locked = self.parent_model.objects.select_for_update().filter(pk=parent.pk).order_by()
+        locked.values_list("pk", flat=True).first()
+        child_ids = {child.pk for child in children}
+        current = list(getattr(parent, self.field_name).select_related("device"))
+        current_ids = {child.pk for child in current}
+        attached = [child for child in children if child.pk not in current_ids]
+        detached = [child for child in current if child.pk not in child_ids]
+        if not attached and not detached:
+            return
+
+        if getattr(self.parent_model, "slot_count_field", None):
+            self.parent_model.objects.adjust_slots({parent.pk: len(attached) - len(detached)})
+
+        if field.many_to_many:
+            through = field.remote_field.through
+            parent_name, child_name = field.m2m_field_name(), field.m2m_reverse_field_name()
+            if detached:
+                through.objects.filter(
+                    **{parent_name: parent, f"{child_name}__in": [child.pk for child in detached]}
+                ).delete()
+            through.objects.bulk_create(
+                [through(**{parent_name: parent, child_name: child}) for child in attached]
+            )
+        else:
+            parent_name = field.field.name
+            last_updated = timezone.now()
+            for changed, value in ((attached, parent), (detached, None)):
+                if not changed:
+                    continue
+                self.child_model.objects.filter(pk__in=[child.pk for child in changed]).update(
+                    **{parent_name: value, "last_updated": last_updated}
+                )
+                for child in changed:
+                    setattr(child, parent_name, value)
+                    child.last_updated = last_updated
+
+        # Drop any children prefetched before the change, so the parent is logged as it is now.
+        getattr(parent, "_prefetched_objects_cache", {}).pop(self.field_name, None)
+        # The through rows are written directly, without m2m_changed, so the parent's side of
+        # the change is logged here too.
+        log_bulk_changes([*attached, *detached, *([parent] if field.many_to_many else [])])
@@ -0,0 +1,158 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Fleet firmware compliance, read from the stored FSU version counts."""
+
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.db.models import QuerySet, Sum
+from nautobot.dcim.models import Location
+
+from nautobot_fsus.models import FSUVersionCount
+from nautobot_fsus.models.mixins import FSUModel, FSUTypeModel, naturalize_version
+from nautobot_fsus.utilities.fsu_types import get_fsu_types, get_visible_content_types
+
+
+def _on_target(versions: dict[str, int], target: str) -> int | None:
+    """Number of FSUs running the target version, or None if there is no target."""
+    if not target:
+        return None
+
+    target_key = naturalize_version(target)
+    return sum(
+        count for version, count in versions.items() if naturalize_version(version) == target_key
+    )
+
+
+def _percentage(count: int | None, total: int) -> float | None:
+    """Percentage of the total, rounded to one decimal place."""
+    if count is None or not total:
+        return None
+    return round(100 * count / total, 1)
+
+
+@dataclass
+class FirmwareCompliance:
+    """Firmware and driver versions of the FSUs of one FSU type at one Location."""
+
+    fsu_model: type[FSUModel]
+    fsu_type: FSUTypeModel
+    location: Location
+    total: int = 0
+    firmware_versions: dict[str, int] = field(default_factory=dict)
+    driver_versions: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def firmware_on_target(self) -> int | None:
+        """Number of FSUs on the FSU type's target firmware version."""
+        return _on_target(self.firmware_versions, self.fsu_type.target_firmware_version)
+
+    @property
+    def firmware_compliance(self) -> float | None:
+        """Percentage of FSUs on the FSU type's target firmware version."""
+        return _percentage(self.firmware_on_target, self.total)
+
+    @property
+    def driver_on_target(self) -> int | None:
+        """Number of FSUs on the FSU type's target driver version."""
+        return _on_target(self.driver_versions, self.fsu_type.target_driver_version)
+
+    @property
+    def driver_compliance(self) -> float | None:
+        """Percentage of FSUs on the FSU type's target driver version."""
+        return _percentage(self.driver_on_target, self.total)
+
+
+def get_version_counts(user: AbstractBaseUser | None = None) -> QuerySet:
+    """
+    Get the stored FSU version counts, optionally limited to those a user may view.
+
+    Counts are included for the FSU models the user has permission to view, at the Locations the
+    user has permission to view.
+    """
+    queryset = FSUVersionCount.objects.all()
+    if user is None:
+        return queryset
+
+    return queryset.filter(
+        fsu_content_type__in=get_visible_content_types(user),
+        location__in=Location.objects.restrict(user, "view"),
+    )
+
+
+def compliance_groups(version_counts: QuerySet) -> QuerySet:
+    """
+    Group version counts into one row per FSU model, FSU type, and Location.
+
+    Each row has the `fsu_content_type`, `fsu_type_id`, and `location` it is for, and the `total`
+    number of FSUs. The grouping is done in the database, so the rows can be counted and
+    paginated before `get_firmware_compliance()` reads the versions of a page of them.
+    """
+    return (
+        version_counts.order_by()
+        .values("fsu_content_type", "fsu_type_id", "location")
+        .annotate(total=Sum("count"))
+        .order_by("location__name", "fsu_content_type__model", "fsu_type_id")
+    )
+
+
+def get_firmware_compliance(
+    groups: Iterable[dict[str, Any]], version_counts: QuerySet
+) -> list[FirmwareCompliance]:
+    """
+    Get the firmware compliance of groups of FSUs returned by `compliance_groups()`.
+
+    Takes one query for the versions of all the groups, one for their Locations, and one per FSU
+    model for their FSU types, however many FSUs the groups count.
+
+    Args:
+        groups: Rows of `compliance_groups()`, such as a page of them.
+        version_counts: The version counts the groups were built from.
+
+    Returns:
+        list[FirmwareCompliance]: The compliance of each group, in the order of the groups.
+    """
+    groups = list(groups)
+    if not groups:
+        return []
+
+    fsu_types = get_fsu_types((group["fsu_content_type"], group["fsu_type_id"]) for group in groups)
+    locations = Location.objects.in_bulk({group["location"] for group in groups})
+    reports: dict[tuple, FirmwareCompliance] = {}
+    for group in groups:
+        key = (group["fsu_content_type"], group["fsu_type_id"], group["location"])
+        if (fsu_type := fsu_types.get(key[:2])) is None or key[2] not in locations:
+            continue
+        reports[key] = FirmwareCompliance(
+            fsu_model=fsu_type[0],
+            fsu_type=fsu_type[1],
+            location=locations[key[2]],
+            total=group["total"],
+        )
+
+    for *key, firmware, driver, count in version_counts.filter(
+        fsu_type_id__in={group["fsu_type_id"] for group in groups},
+        location__in=locations.keys(),
+    ).values_list(
+        "fsu_content_type", "fsu_type_id", "location", "firmware_version", "driver_version", "count"
+    ):
+        if (report := reports.get(tuple(key))) is None:
+            continue
+        report.firmware_versions[firmware] = report.firmware_versions.get(firmware, 0) + count
+        report.driver_versions[driver] = report.driver_versions.get(driver, 0) + count
+
+    return list(reports.values())
@@ -0,0 +1,114 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Streaming CSV and NDJSON export of FSUs."""
+
+import csv
+import json
+from typing import Any, Iterator
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.forms import ModelChoiceField
+from django.http import StreamingHttpResponse
+
+from nautobot_fsus import forms
+from nautobot_fsus.models.mixins import FSUModel
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+# Number of rows read from the database cursor at a time.
+EXPORT_CHUNK_SIZE = 2000
+
+
+class _Echo:
+    """File-like object that returns what is written to it, for streaming `csv.writer` output."""
+
+    def write(self, value: str) -> str:
+        """Return the value instead of buffering it."""
+        return value
+
+
+def get_export_columns(model: type[FSUModel]) -> list[tuple[str, str]]:
+    """
+    Get the columns exported for an FSU model, as (header, lookup) pairs.
+
+    The columns are the fields of the model's import form, and related objects are exported
+    the way the import form looks them up, e.g. the Device by name, so an export can be
+    imported again.
+    """
+    form_class = getattr(forms, f"{model.__name__}ImportForm")
+    columns = []
+    for field_name in form_class._meta.fields:
+        form_field = form_class.base_fields[field_name]
+        if isinstance(form_field, ModelChoiceField):
+            lookup = f"{field_name}__{form_field.to_field_name or 'pk'}"
+        else:
+            lookup = field_name
+        columns.append((field_name, lookup))
+
+    return columns
+
+
+def _iter_rows(queryset: QuerySet, lookups: list[str]) -> Iterator[tuple[Any, ...]]:
+    """Read the exported values with a database cursor, a chunk at a time."""
+    return (
+        queryset.select_related(None)
+        .prefetch_related(None)
+        .values_list(*lookups)
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+
+def iter_csv(queryset: QuerySet, columns: list[tuple[str, str]]) -> Iterator[str]:
+    """Generate the lines of a CSV export, starting with the header."""
+    writer = csv.writer(_Echo())
+    yield writer.writerow([header for header, _ in columns])
+    for row in _iter_rows(queryset, [lookup for _, lookup in columns]):
+        yield writer.writerow(["" if value is None else value for value in row])
+
+
+def iter_ndjson(queryset: QuerySet, columns: list[tuple[str, str]]) -> Iterator[str]:
+    """Generate the lines of an NDJSON export, one JSON object per FSU."""
+    headers = [header for header, _ in columns]
+    for row in _iter_rows(queryset, [lookup for _, lookup in columns]):
+        yield json.dumps(dict(zip(headers, row, strict=True)), cls=DjangoJSONEncoder) + "\n"
+
+
+def streaming_export_response(queryset: QuerySet, export_format: str) -> StreamingHttpResponse:
+    """
+    Stream the FSUs of a queryset as a CSV or NDJSON file download.
+
+    Rows are read from a database cursor and written to the response as they are read, so the
+    memory used does not grow with the number of FSUs exported.
+
+    Args:
+        queryset: Filtered and permission-restricted FSUs to export.
+        export_format: Either "csv" or "ndjson".
+
+    Returns:
+        StreamingHttpResponse: The export, as an attachment.
+    """
+    columns = get_export_columns(queryset.model)
+    lines = iter_csv if export_format == "csv" else iter_ndjson
+    response = StreamingHttpResponse(
+        lines(queryset, columns), content_type=EXPORT_FORMATS[export_format]
+    )
+    filename = f"nautobot_{queryset.model._meta.verbose_name_plural}.{export_format}"
+    response["Content-Disposition"] = f'attachment; filename="{filename.lower()}"'
+    return response
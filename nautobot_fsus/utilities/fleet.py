@@ -0,0 +1,256 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Parallel reconciliation of the FSU inventories of a whole fleet of Devices."""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+import multiprocessing
+import os
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Iterable, Iterator
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.db import connections
+from nautobot.dcim.models import Location
+
+from nautobot_fsus.utilities.reconcile import (
+    ChunkDiff,
+    ChunkState,
+    InventoryReconciler,
+    ReconcileResult,
+    inventory_files,
+    read_observed_inventories,
+)
+
+# Number of inventory files parsed by each task sent to a worker process.
+PARSE_BATCH_SIZE = 16
+
+# State of the current worker process, set when the worker starts.
+_worker: dict[str, InventoryReconciler] = {}
+
+
+@dataclass
+class FleetResult(ReconcileResult):
+    """Summary of a parallel fleet reconciliation, with the time spent in each stage."""
+
+    files: int = 0
+    workers: int = 0
+    parse_time: float = 0.0
+    load_time: float = 0.0
+    diff_time: float = 0.0
+    write_time: float = 0.0
+    rediffed: int = 0
+
+    @property
+    def devices_per_second(self) -> float:
+        """Rate at which Devices were reconciled."""
+        return self.devices / self.elapsed if self.elapsed else 0.0
+
+
+def _no_queries(*args, **kwargs):
+    """Refuse database queries in worker processes."""
+    raise RuntimeError("Worker processes must not query the database.")
+
+
+def _init_worker(reconciler: InventoryReconciler) -> None:
+    """Set up a worker process, which parses and diffs inventories without using the database."""
+    _worker["reconciler"] = reconciler
+    # Forked workers share the database connections of the parent process, which would be
+    # corrupted by any query made here.
+    for connection in connections.all():
+        connection.execute_wrappers.append(_no_queries)
+
+
+def _parse_files(paths: list[Path]) -> tuple[float, list[dict[str, Any]]]:
+    """Parse a batch of inventory files in a worker process."""
+    start = perf_counter()
+    inventories = list(read_observed_inventories(paths))
+    return perf_counter() - start, inventories
+
+
+def _diff_chunk(state: ChunkState) -> tuple[float, ChunkDiff]:
+    """Diff a loaded chunk of inventories in a worker process."""
+    start = perf_counter()
+    diff = _worker["reconciler"].diff_chunk(state)
+    return perf_counter() - start, diff
+
+
+def _chunk_keys(state: ChunkState) -> set[tuple]:
+    """Keys of the Devices and serial numbers a chunk of inventories depends on."""
+    keys: set[tuple] = {("device", device.pk) for device, _ in state.devices}
+    keys.update(
+        ("serial", item.model, serial)
+        for _, items in state.devices
+        for item in items
+        if (serial := item.serial_number)
+    )
+    return keys
+
+
+def _written_keys(diff: ChunkDiff) -> set[tuple]:
+    """Keys of the Devices and serial numbers changed by a chunk of Devices."""
+    keys: set[tuple] = set()
+    for changes in diff.changes:
+        if changes.errors:
+            continue
+        keys.add(("device", changes.device.pk))
+        fsus = [*changes.created, *(fsu for update in changes.updated for fsu in update[:2])]
+        keys.update(("serial", type(fsu), fsu.serial_number) for fsu in fsus if fsu.serial_number)
+    return keys
+
+
+class FleetReconciler:
+    """
+    Reconcile the FSU inventories of a fleet of Devices, parsing and diffing them in parallel.
+
+    Inventory files are parsed by a pool of worker processes. Parsed inventories are grouped in
+    chunks of Devices, which the main process loads from the database and sends back to the pool
+    to be matched and diffed, so the CPU-bound stages use every core. The main process is the
+    single writer: it applies the change set of each chunk in its own transaction, in order, while
+    later chunks are still being parsed and diffed.
+
+    A chunk is loaded before the chunks ahead of it are written. If one of those chunks changed
+    a Device or a serial number that the chunk depends on, the chunk is loaded and diffed again
+    before it is written, so its changes are always made against the current FSUs.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        user: AbstractBaseUser | None = None,
+        storage_location: Location | None = None,
+        dry_run: bool = False,
+        workers: int | None = None,
+        chunk_size: int = 500,
+    ):
+        """
+        Set up the reconciliation.
+
+        Args:
+            user: If set, Devices and FSU types must be visible to the user, who must also have
+                permission to add and change the FSUs.
+            storage_location: Where FSUs no longer observed in a Device are stored. Defaults to
+                the Location of the Device.
+            dry_run: Find the changes without applying them.
+            workers: Number of worker processes. Defaults to the number of CPUs.
+            chunk_size: Number of Devices to load, diff, and write together.
+        """
+        self.reconciler = InventoryReconciler(
+            user=user, storage_location=storage_location, dry_run=dry_run
+        )
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.result = FleetResult(workers=self.workers)
+        # Keys changed by each chunk written so far, in order.
+        self._written: list[set[tuple]] = []
+
+    def reconcile(self, paths: Iterable[str | Path]) -> FleetResult:
+        """Reconcile the inventories in a set of files and directories."""
+        start = perf_counter()
+        files = inventory_files(paths)
+        self.result.files = len(files)
+        # Workers are forked, so they start with the app loaded and the reconciler set up.
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+            initargs=(self.reconciler,),
+        ) as pool:
+            inventories = self._parse(pool, files)
+            pending: deque[tuple[list[Any], set[tuple], int, Future]] = deque()
+            while chunk := list(islice(inventories, self.chunk_size)):
+                load_start = perf_counter()
+                state = self.reconciler.load_chunk(chunk)
+                self.result.load_time += perf_counter() - load_start
+                pending.append(
+                    (chunk, _chunk_keys(state), len(self._written), pool.submit(_diff_chunk, state))
+                )
+                # Keep every worker busy diffing while the oldest chunk is written.
+                if len(pending) > self.workers:
+                    self._write(*pending.popleft())
+            while pending:
+                self._write(*pending.popleft())
+
+        self.result.elapsed = perf_counter() - start
+        return self.result
+
+    def _parse(self, pool: ProcessPoolExecutor, files: list[Path]) -> Iterator[dict[str, Any]]:
+        """Parse inventory files in the worker processes, keeping a bounded number in flight."""
+        batches = (files[i : i + PARSE_BATCH_SIZE] for i in range(0, len(files), PARSE_BATCH_SIZE))
+        parsing: deque[Future] = deque()
+        for batch in batches:
+            parsing.append(pool.submit(_parse_files, batch))
+            if len(parsing) >= self.workers * 2:
+                yield from self._parsed(parsing.popleft())
+        while parsing:
+            yield from self._parsed(parsing.popleft())
+
+    def _parsed(self, future: Future) -> list[dict[str, Any]]:
+        """Get the inventories parsed by a worker, adding up the time spent parsing."""
+        parse_time, inventories = future.result()
+        self.result.parse_time += parse_time
+        return inventories
+
+    def _write(self, chunk: list[Any], keys: set[tuple], loaded_at: int, future: Future) -> None:
+        """Write a diffed chunk, diffing it again first if it is out of date."""
+        diff_time, diff = future.result()
+        self.result.diff_time += diff_time
+
+        write_start = perf_counter()
+        if any(keys & written for written in self._written[loaded_at:]):
+            self.result.rediffed += 1
+            diff = self.reconciler.diff_chunk(self.reconciler.load_chunk(chunk))
+        self.reconciler.write_chunk(diff, self.result)
+        self._written.append(set() if self.reconciler.dry_run else _written_keys(diff))
+        self.result.write_time += perf_counter() - write_start
+
+
+def reconcile_fleet(  # noqa: PLR0913
+    paths: Iterable[str | Path],
+    *,
+    user: AbstractBaseUser | None = None,
+    storage_location: Location | None = None,
+    workers: int | None = None,
+    chunk_size: int = 500,
+    dry_run: bool = False,
+) -> FleetResult:
+    """
+    Reconcile the FSUs of a fleet of Devices with their observed inventory files, in parallel.
+
+    Args:
+        paths: Inventory files, or directories of them, in the shape of the Device inventory API.
+        user: If set, Devices and FSU types must be visible to the user, who must also have
+            permission to add and change the FSUs.
+        storage_location: Where FSUs no longer observed in a Device are stored. Defaults to
+            the Location of the Device.
+        workers: Number of worker processes. Defaults to the number of CPUs.
+        chunk_size: Number of Devices to load, diff, and write together.
+        dry_run: Find the changes without applying them.
+
+    Returns:
+        FleetResult: The number of changes of each kind, any errors by Device, and the time spent
+            parsing, loading, diffing, and writing.
+    """
+    reconciler = FleetReconciler(
+        user=user,
+        storage_location=storage_location,
+        dry_run=dry_run,
+        workers=workers,
+        chunk_size=chunk_size,
+    )
+    return reconciler.reconcile(paths)
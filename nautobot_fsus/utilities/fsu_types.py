@@ -0,0 +1,66 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Looking up FSU models and FSU types of any FSU model, by content type."""
+
+from collections import defaultdict
+from typing import Iterable
+from uuid import UUID
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.contrib.contenttypes.models import ContentType
+
+from nautobot_fsus.models import FSU_MODELS
+from nautobot_fsus.models.mixins import FSUModel, FSUTypeModel
+
+
+def get_visible_content_types(user: AbstractBaseUser) -> list[ContentType]:
+    """Get the content types of the FSU models a user has permission to view."""
+    visible_models = [
+        model
+        for model in FSU_MODELS
+        if user.has_perm(f"{model._meta.app_label}.view_{model._meta.model_name}")
+    ]
+    return list(ContentType.objects.get_for_models(*visible_models).values())
+
+
+def get_fsu_types(
+    keys: Iterable[tuple[int, UUID]],
+) -> dict[tuple[int, UUID], tuple[type[FSUModel], FSUTypeModel]]:
+    """
+    Load FSU types identified by the content type of their FSU model and their ID.
+
+    Tables that count FSUs of every model, such as the stored counts, refer to FSU types by the
+    FSU model's content type and the FSU type ID. This loads them, with their manufacturer, using
+    one query per FSU model.
+
+    Args:
+        keys: Pairs of FSU model content type ID and FSU type ID.
+
+    Returns:
+        dict: The FSU model and FSU type of each pair that exists, keyed by the pair.
+    """
+    type_ids: dict[int, set[UUID]] = defaultdict(set)
+    for content_type_id, fsu_type_id in keys:
+        type_ids[content_type_id].add(fsu_type_id)
+
+    fsu_types: dict[tuple[int, UUID], tuple[type[FSUModel], FSUTypeModel]] = {}
+    for content_type_id, pks in type_ids.items():
+        fsu_model = ContentType.objects.get_for_id(content_type_id).model_class()
+        type_model = fsu_model._meta.get_field("fsu_type").related_model
+        for fsu_type in type_model.objects.select_related("manufacturer").filter(pk__in=pks):
+            fsu_types[(content_type_id, fsu_type.pk)] = (fsu_model, fsu_type)
+
+    return fsu_types
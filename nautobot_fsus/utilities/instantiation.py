@@ -0,0 +1,297 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Bulk instantiation of FSUs on Devices from their DeviceType's FSU templates."""
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from functools import partial
+from time import perf_counter
+from typing import Any, Iterable
+from uuid import UUID, uuid4
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import transaction
+from nautobot.dcim.models import Device
+from nautobot.extras.models import CustomField, Status
+
+from nautobot_fsus.models import FSU_MODELS, FSU_TEMPLATE_MODELS, FSUCount, FSUVersionCount
+from nautobot_fsus.models.mixins import FSUModel, FSUTemplateModel
+
+
+@dataclass
+class InstantiationResult:
+    """Summary of a bulk FSU instantiation run."""
+
+    devices: int = 0
+    created: dict[str, int] = field(default_factory=dict)
+    skipped: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def total_created(self) -> int:
+        """Total number of FSUs created, across all FSU models."""
+        return sum(self.created.values())
+
+    @property
+    def devices_per_second(self) -> float:
+        """Provisioning throughput."""
+        return self.devices / self.elapsed if self.elapsed else 0.0
+
+
+# Fields of an FSU that are set per Device when the FSU is instantiated from a plan.
+_PER_DEVICE_FIELDS = {"id", "device", "status", "created", "last_updated", "_custom_field_data"}
+
+PLAN_CACHE_PREFIX = "nautobot_fsus:instantiation_plan"
+PLAN_VERSION_KEY = f"{PLAN_CACHE_PREFIX}:version"
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """The FSUs of one FSU model to create on each Device of a DeviceType."""
+
+    model: type[FSUModel]
+    custom_field_data: tuple[tuple[str, Any], ...]
+    fsus: tuple[tuple[tuple[str, Any], ...], ...]
+
+
+@dataclass(frozen=True)
+class InstantiationPlan:
+    """
+    Compiled, immutable description of the FSUs to create on a new Device of a DeviceType.
+
+    Plans are cached per DeviceType, keyed on a version that changes whenever FSU templates,
+    custom fields, or statuses are modified, so building FSUs from a cached plan needs no
+    database lookups.
+    """
+
+    device_type_id: UUID
+    version: str
+    status_id: UUID | None
+    steps: tuple[PlanStep, ...]
+
+    def build(self, device: Device) -> dict[type[FSUModel], list[FSUModel]]:
+        """Create the unsaved FSU instances for a Device, grouped by FSU model."""
+        return {
+            step.model: [
+                step.model(  # pylint: disable=not-callable
+                    device=device,
+                    status_id=self.status_id,
+                    _custom_field_data=dict(step.custom_field_data),
+                    **dict(values),
+                )
+                for values in step.fsus
+            ]
+            for step in self.steps
+        }
+
+
+def fsu_model_for_template(template_model: type[FSUTemplateModel]) -> type[FSUModel]:
+    """Return the FSU model instantiated by an FSU template model."""
+    type_model = template_model._meta.get_field("fsu_type").related_model
+    fsu_model: type[FSUModel] = type_model._meta.get_field("instances").related_model
+    return fsu_model
+
+
+def custom_field_defaults(
+    fsu_models: Iterable[type[FSUModel]] = FSU_MODELS,
+) -> dict[type[FSUModel], dict[str, Any]]:
+    """Get the default custom field data for each of the FSU models, in a single query."""
+    content_types = ContentType.objects.get_for_models(*fsu_models)
+    models_by_ct = {content_type.pk: model for model, content_type in content_types.items()}
+
+    defaults: dict[type[FSUModel], dict[str, Any]] = {model: {} for model in content_types}
+    for content_type_id, key, default in CustomField.objects.filter(
+        content_types__in=models_by_ct.keys()
+    ).values_list("content_types", "key", "default"):
+        defaults[models_by_ct[content_type_id]][key] = default
+
+    return defaults
+
+
+def get_plan_version() -> str:
+    """Get the current instantiation plan version, starting a new one if none is set."""
+    version: str | None = cache.get(PLAN_VERSION_KEY)
+    if version is None:
+        cache.add(PLAN_VERSION_KEY, uuid4().hex, timeout=None)
+        version = cache.get(PLAN_VERSION_KEY)
+    return str(version)
+
+
+def invalidate_instantiation_plans() -> None:
+    """
+    Discard all cached instantiation plans by moving to a new plan version.
+
+    The version is changed immediately, and again once the current transaction commits, so
+    that a plan compiled by a concurrent request from the uncommitted data is not reused.
+    """
+
+    def _new_version() -> None:
+        cache.set(PLAN_VERSION_KEY, uuid4().hex, timeout=None)
+
+    _new_version()
+    transaction.on_commit(_new_version)
+
+
+def compile_instantiation_plans(
+    device_type_ids: Iterable[UUID],
+    version: str = "",
+) -> dict[UUID, InstantiationPlan]:
+    """Build the instantiation plans for a set of DeviceTypes from the database."""
+    device_type_ids = set(device_type_ids)
+    templates_by_model = {
+        template_model: list(template_model.objects.filter(device_type_id__in=device_type_ids))
+        for template_model in FSU_TEMPLATE_MODELS
+    }
+
+    status: Status | None = None
+    cf_defaults: dict[type[FSUModel], dict[str, Any]] = {}
+    if any(templates_by_model.values()):
+        status = Status.objects.get(name="Active")
+        cf_defaults = custom_field_defaults()
+
+    steps: dict[UUID, list[PlanStep]] = defaultdict(list)
+    for template_model, templates in templates_by_model.items():
+        fsu_model = fsu_model_for_template(template_model)
+        by_device_type: dict[UUID, list[tuple[tuple[str, Any], ...]]] = defaultdict(list)
+        for template in templates:
+            instance = template.instantiate(device=None, status=status, custom_field_data={})
+            by_device_type[template.device_type_id].append(
+                tuple(
+                    (model_field.attname, getattr(instance, model_field.attname))
+                    for model_field in fsu_model._meta.concrete_fields
+                    if model_field.name not in _PER_DEVICE_FIELDS
+                )
+            )
+        for device_type_id, fsus in by_device_type.items():
+            steps[device_type_id].append(
+                PlanStep(
+                    model=fsu_model,
+                    custom_field_data=tuple(cf_defaults[fsu_model].items()),
+                    fsus=tuple(fsus),
+                )
+            )
+
+    return {
+        device_type_id: InstantiationPlan(
+            device_type_id=device_type_id,
+            version=version,
+            status_id=status.pk if status and steps[device_type_id] else None,
+            steps=tuple(steps[device_type_id]),
+        )
+        for device_type_id in device_type_ids
+    }
+
+
+def get_instantiation_plans(device_type_ids: Iterable[UUID]) -> dict[UUID, InstantiationPlan]:
+    """Get the instantiation plans for a set of DeviceTypes, compiling any that are not cached."""
+    version = get_plan_version()
+    keys = {
+        device_type_id: f"{PLAN_CACHE_PREFIX}:{version}:{device_type_id}"
+        for device_type_id in set(device_type_ids)
+    }
+
+    cached = cache.get_many(keys.values())
+    plans = {device_type_id: cached[key] for device_type_id, key in keys.items() if key in cached}
+
+    if missing := keys.keys() - plans.keys():
+        compiled = compile_instantiation_plans(missing, version=version)
+        # Plans compiled from data that is later rolled back must not be cached.
+        transaction.on_commit(
+            partial(
+                cache.set_many,
+                {keys[device_type_id]: plan for device_type_id, plan in compiled.items()},
+            )
+        )
+        plans.update(compiled)
+
+    return plans
+
+
+def instantiate_fsus(
+    devices: Iterable[Device],
+    skip_existing: bool = True,
+    batch_size: int = 1000,
+    new_devices: bool = False,
+) -> InstantiationResult:
+    """
+    Create the FSUs defined by the FSU templates of each Device's DeviceType.
+
+    The FSUs are built from the cached instantiation plan of each DeviceType - plans that are
+    not cached are compiled together, with one query per FSU template model - and each FSU model
+    is written with a single `bulk_create()`. This works for any set of Devices, including ones
+    created with `Device.objects.bulk_create()`, which does not send the signal that instantiates
+    FSUs for individually created Devices.
+
+    Args:
+        devices: Devices to create FSUs for.
+        skip_existing: Skip any FSU whose name is already in use on its Device, so the
+            instantiation can be safely repeated for the same Devices.
+        batch_size: Maximum number of FSUs to insert per database query.
+        new_devices: The Devices were just created and have no FSUs yet, so there is no need
+            to check for existing FSUs or to recalculate the Device FSU counts.
+
+    Returns:
+        InstantiationResult: Number of devices processed and FSUs created for each FSU model.
+    """
+    start = perf_counter()
+    result = InstantiationResult()
+
+    devices_by_type: dict[UUID, list[Device]] = defaultdict(list)
+    for device in devices:
+        devices_by_type[device.device_type_id].append(device)
+        result.devices += 1
+
+    if not devices_by_type:
+        return result
+
+    plans = get_instantiation_plans(devices_by_type.keys())
+    new_fsus_by_model: dict[type[FSUModel], list[FSUModel]] = defaultdict(list)
+    for device_type_id, plan in plans.items():
+        for device in devices_by_type[device_type_id]:
+            for fsu_model, fsus in plan.build(device).items():
+                new_fsus_by_model[fsu_model].extend(fsus)
+
+    with transaction.atomic():
+        for fsu_model, planned_fsus in new_fsus_by_model.items():
+            new_fsus = planned_fsus
+            device_ids = {fsu.device_id for fsu in new_fsus}
+            if skip_existing and not new_devices:
+                existing = set(
+                    fsu_model.objects.filter(device_id__in=device_ids).values_list(
+                        "device_id", "name"
+                    )
+                )
+                count = len(new_fsus)
+                new_fsus = [fsu for fsu in new_fsus if (fsu.device_id, fsu.name) not in existing]
+                result.skipped += count - len(new_fsus)
+
+            created = fsu_model.objects.bulk_create(new_fsus, batch_size=batch_size)
+            if not created:
+                continue
+
+            # bulk_create() bypasses the FSU save signals, so the counts are updated here.
+            if new_devices:
+                FSUCount.objects.set_counts(
+                    fsu_model, "device", Counter(fsu.device_id for fsu in created)
+                )
+            else:
+                FSUCount.objects.refresh(fsu_model, device_ids=device_ids)
+            FSUVersionCount.objects.add_fsus(fsu_model, created)
+            result.created[str(fsu_model._meta.verbose_name_plural)] = len(created)
+
+    result.elapsed = perf_counter() - start
+    return result
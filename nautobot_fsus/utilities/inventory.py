@@ -0,0 +1,184 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Cross-type FSU inventory of Devices."""
+
+from typing import Any, Iterable
+from uuid import UUID
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.db.models import QuerySet
+from nautobot.dcim.models import Device
+
+from nautobot_fsus.models import CPU, FSU_MODELS, GPU, NIC, PSU, Disk
+from nautobot_fsus.models.mixins import FSUModel
+
+# Child FSU models, with the field linking them to their parent FSU and the key of the list
+# they are nested under in the parent's inventory entry.
+CHILD_FSU_FIELDS: dict[type[FSUModel], tuple[str, str]] = {
+    CPU: ("parent_mainboard", "cpus"),
+    Disk: ("parent_hba", "disks"),
+    GPU: ("parent_gpubaseboard", "gpus"),
+}
+
+# Device components provided by an FSU: the FSU model, the M2M field, and its through-table FKs.
+COMPONENT_FIELDS: tuple[tuple[type[FSUModel], str, str, str], ...] = (
+    (NIC, "interfaces", "nic_id", "interface"),
+    (PSU, "power_ports", "psu_id", "powerport"),
+)
+
+INVENTORY_FIELDS = (
+    "id",
+    "name",
+    "serial_number",
+    "firmware_version",
+    "driver_version",
+    "driver_name",
+    "asset_tag",
+    "description",
+)
+
+# Type-specific FSU fields included in the inventory when the model has them.
+EXTRA_INVENTORY_FIELDS = ("pci_slot_id", "slot_id", "redundant")
+
+
+def inventory_key(model: type[FSUModel]) -> str:
+    """Key of an FSU model's list in a Device inventory, e.g. "gpubaseboards"."""
+    return f"{model._meta.model_name}s"
+
+
+def _restrict(queryset: QuerySet, user: AbstractBaseUser | None) -> QuerySet:
+    """Restrict a queryset to the objects a user can view, if a user is given."""
+    return queryset if user is None else queryset.restrict(user, "view")
+
+
+def _fsu_entries(
+    model: type[FSUModel],
+    device_ids: set[UUID],
+    user: AbstractBaseUser | None,
+) -> dict[UUID, dict[str, Any]]:
+    """Get the inventory entries of one FSU model for a set of Devices, keyed by FSU ID."""
+    extra_fields = [
+        field.name for field in model._meta.concrete_fields if field.name in EXTRA_INVENTORY_FIELDS
+    ]
+    parent_fields = [f"{CHILD_FSU_FIELDS[model][0]}_id"] if model in CHILD_FSU_FIELDS else []
+    rows = (
+        _restrict(model.objects.all(), user)
+        .filter(device_id__in=device_ids)
+        .order_by("_name")
+        .values(
+            *INVENTORY_FIELDS,
+            *extra_fields,
+            *parent_fields,
+            "device_id",
+            "status__name",
+            "fsu_type_id",
+            "fsu_type__name",
+            "fsu_type__part_number",
+            "fsu_type__manufacturer__name",
+        )
+    )
+
+    entries: dict[UUID, dict[str, Any]] = {}
+    for row in rows:
+        entry = {field_name: row[field_name] for field_name in INVENTORY_FIELDS}
+        entry["fsu_type"] = {
+            "id": row["fsu_type_id"],
+            "manufacturer": row["fsu_type__manufacturer__name"],
+            "name": row["fsu_type__name"],
+            "part_number": row["fsu_type__part_number"],
+        }
+        entry["status"] = row["status__name"]
+        entry.update({field_name: row[field_name] for field_name in extra_fields})
+        entry["_device_id"] = row["device_id"]
+        entry["_parent_id"] = row[parent_fields[0]] if parent_fields else None
+        entries[row["id"]] = entry
+
+    return entries
+
+
+def _add_components(
+    entries_by_model: dict[type[FSUModel], dict[UUID, dict[str, Any]]],
+    device_ids: set[UUID],
+    user: AbstractBaseUser | None,
+) -> None:
+    """Add the Device components provided by NICs and PSUs to their inventory entries."""
+    for model, field_name, fsu_field, component_field in COMPONENT_FIELDS:
+        entries = entries_by_model[model]
+        for entry in entries.values():
+            entry[field_name] = []
+
+        model_field = model._meta.get_field(field_name)
+        visible = _restrict(model_field.related_model.objects.all(), user).filter(
+            device_id__in=device_ids
+        )
+        for fsu_id, component_id, component_name in (
+            model_field.remote_field.through.objects.filter(
+                **{f"{fsu_field}__in": list(entries), f"{component_field}__in": visible}
+            )
+            .order_by(f"{component_field}___name")
+            .values_list(fsu_field, component_field, f"{component_field}__name")
+        ):
+            entries[fsu_id][field_name].append({"id": component_id, "name": component_name})
+
+
+def get_device_inventories(
+    devices: Iterable[Device | UUID],
+    user: AbstractBaseUser | None = None,
+) -> dict[UUID, dict[str, list[dict[str, Any]]]]:
+    """
+    Get every FSU of every type installed in a set of Devices.
+
+    Each FSU model is read with a single `values()` query for all of the Devices, and the
+    components of NICs and PSUs with one query each, so the number of queries is fixed
+    regardless of how many Devices or FSUs there are. Child FSUs (GPUs, Disks, and CPUs) are
+    nested under their parent FSU, and only listed at the top level when they have no parent.
+
+    Args:
+        devices: Devices, or Device IDs, to get the inventories of.
+        user: If set, only FSUs and components the user has permission to view are included.
+
+    Returns:
+        dict: FSU lists keyed by inventory key, e.g. "gpus", for each Device ID.
+    """
+    device_ids = {getattr(device, "pk", device) for device in devices}
+    inventories: dict[UUID, dict[str, list[dict[str, Any]]]] = {
+        device_id: {inventory_key(model): [] for model in FSU_MODELS} for device_id in device_ids
+    }
+    if not device_ids:
+        return inventories
+
+    entries_by_model = {model: _fsu_entries(model, device_ids, user) for model in FSU_MODELS}
+    _add_components(entries_by_model, device_ids, user)
+
+    # Nest child FSUs under their parent FSU, when the parent is also in the inventory.
+    nested: set[UUID] = set()
+    for model, (parent_field, children_key) in CHILD_FSU_FIELDS.items():
+        parents = entries_by_model[model._meta.get_field(parent_field).related_model]
+        for parent in parents.values():
+            parent[children_key] = []
+        for fsu_id, entry in entries_by_model[model].items():
+            if (parent := parents.get(entry["_parent_id"])) is not None:
+                parent[children_key].append(entry)
+                nested.add(fsu_id)
+
+    for model, entries in entries_by_model.items():
+        for fsu_id, entry in entries.items():
+            device_id = entry.pop("_device_id")
+            del entry["_parent_id"]
+            if fsu_id not in nested:
+                inventories[device_id][inventory_key(model)].append(entry)
+
+    return inventories
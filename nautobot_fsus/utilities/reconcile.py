@@ -0,0 +1,788 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Reconciliation of the FSUs of Devices with their observed hardware inventory."""
+
+from collections import Counter, defaultdict
+from copy import copy
+from dataclasses import dataclass, field
+from itertools import islice
+import json
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Iterable, Iterator
+from uuid import UUID
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
+from nautobot.core.models.fields import NaturalOrderingField
+from nautobot.core.utils.data import is_uuid
+from nautobot.dcim.models import Device, Location
+from nautobot.extras.choices import ObjectChangeActionChoices
+from nautobot.extras.models import Status
+
+from nautobot_fsus.models import FSU_MODELS
+from nautobot_fsus.models.mixins import FSUModel
+from nautobot_fsus.utilities.child_assignment import log_bulk_changes
+from nautobot_fsus.utilities.inventory import CHILD_FSU_FIELDS, inventory_key
+from nautobot_fsus.utilities.upsert import FSUUpserter, UpsertPlan
+
+# Fields of an observed FSU that are applied to the FSU, when the FSU model has them.
+OBSERVED_FIELDS = (
+    "name",
+    "serial_number",
+    "firmware_version",
+    "driver_name",
+    "driver_version",
+    "asset_tag",
+    "description",
+    "pci_slot_id",
+    "slot_id",
+    "redundant",
+)
+
+# Fields identifying the slot an FSU is installed in, matched after serial numbers.
+SLOT_FIELDS = ("pci_slot_id", "slot_id")
+
+# Parent FSU models are reconciled before child FSU models, so new children can join new parents.
+RECONCILE_ORDER = sorted(FSU_MODELS, key=lambda model: model in CHILD_FSU_FIELDS)
+
+
+@dataclass
+class ReconcileResult:
+    """Summary of a reconciliation of Device FSUs with their observed inventory."""
+
+    devices: int = 0
+    created: int = 0
+    updated: int = 0
+    moved: int = 0
+    stored: int = 0
+    reparented: int = 0
+    unchanged: int = 0
+    changes: list[tuple[str, str, str, str]] = field(default_factory=list)
+    errors: list[tuple[str, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+@dataclass
+class ObservedFSU:
+    """An FSU in an observed Device inventory, and the FSU it is reconciled with."""
+
+    model: type[FSUModel]
+    entry: dict[str, Any]
+    parent: "ObservedFSU | None" = None
+    fsu: FSUModel | None = None
+
+    @property
+    def is_fsu(self) -> bool:
+        """Whether the observed entry describes an FSU at all."""
+        return isinstance(self.entry, dict)
+
+    @property
+    def serial_number(self) -> str:
+        """The observed serial number, if any."""
+        return _text(self.entry.get("serial_number")) if self.is_fsu else ""
+
+
+@dataclass
+class DeviceChanges:
+    """The changes reconciling the FSUs of one Device with its observed inventory."""
+
+    device: Device
+    created: list[FSUModel] = field(default_factory=list)
+    updated: list[tuple[FSUModel, FSUModel, frozenset[str]]] = field(default_factory=list)
+    unchanged: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ChunkState:
+    """A chunk of observed inventories, with everything loaded from the database to diff it."""
+
+    devices: list[tuple[Device, list[ObservedFSU]]]
+    fsu_types: dict[type[FSUModel], dict[str, list[models.Model]]]
+    statuses: dict[type[FSUModel], dict[str, Status]]
+    loaded: dict[type[FSUModel], list[FSUModel]]
+    errors: list[tuple[str, str]] = field(default_factory=list)
+
+
+@dataclass
+class ChunkDiff:
+    """The changes for a chunk of Devices, ready to be written."""
+
+    changes: list[DeviceChanges]
+    claimed: set[UUID]
+    errors: list[tuple[str, str]] = field(default_factory=list)
+
+
+def _text(value: Any) -> str:
+    """Convert an observed value to the string stored in an FSU field."""
+    return "" if value is None else str(value).strip()
+
+
+def _has_field(model: type[FSUModel], field_name: str) -> bool:
+    """Whether an FSU model has a concrete field."""
+    return any(model_field.name == field_name for model_field in model._meta.concrete_fields)
+
+
+def _match_field(
+    items: list[ObservedFSU], installed: list[FSUModel], match_field: str, claimed: set[UUID]
+) -> set[UUID]:
+    """Match unmatched observed FSUs to unclaimed installed FSUs by a single field."""
+    index: dict[tuple[type[FSUModel], str], FSUModel] = {}
+    for fsu in installed:
+        if fsu.pk not in claimed and (value := getattr(fsu, match_field, "")):
+            index.setdefault((type(fsu), value), fsu)
+
+    matched = set()
+    for item in items:
+        if item.fsu is not None or not item.is_fsu:
+            continue
+        value = _text(item.entry.get(match_field))
+        fsu = index.pop((item.model, value), None) if value else None
+        serial = item.serial_number
+        if fsu is not None and not (serial and fsu.serial_number and serial != fsu.serial_number):
+            item.fsu = fsu
+            matched.add(fsu.pk)
+    return matched
+
+
+def _storage_names(device: Device, fsu: FSUModel) -> list[str]:
+    """List the names an FSU moved to storage may take, in order of preference."""
+    max_length = fsu._meta.get_field("name").max_length
+    names = [fsu.name, fsu.serial_number, f"{device.name} {fsu.name}"[:max_length]]
+    return [name for name in names if name]
+
+
+def inventory_files(paths: Iterable[str | Path]) -> list[Path]:
+    """List the inventory files at some paths, reading directories recursively in name order."""
+    files = []
+    for path in map(Path, paths):
+        files.extend(sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path])
+    return files
+
+
+def read_observed_inventories(paths: Iterable[str | Path]) -> Iterator[dict[str, Any]]:
+    """
+    Read observed Device inventories from JSON or NDJSON files, or directories of them.
+
+    A file holds one inventory, a list of inventories, a page of Device inventory API results,
+    or one inventory per line. Directories are read recursively, in file name order.
+    """
+    for file_path in inventory_files(paths):
+        text = file_path.read_text(encoding="utf-8-sig").strip()
+        try:
+            data = json.loads(text) if text else []
+        except json.JSONDecodeError:
+            data = [json.loads(line) for line in text.splitlines() if line.strip()]
+        if isinstance(data, dict):
+            data = data.get("results", [data])
+        yield from data
+
+
+def observed_fsus(inventory: dict[str, Any]) -> list[ObservedFSU]:
+    """
+    List the FSUs of an observed Device inventory, with parent FSUs before their children.
+
+    An observed inventory has the shape of the Device inventory API: a list of FSUs for each FSU
+    model, keyed by e.g. "gpus", with child FSUs nested in a list under their parent FSU.
+    """
+    observed = [
+        ObservedFSU(model, entry)
+        for model in RECONCILE_ORDER
+        for entry in inventory.get(inventory_key(model)) or []
+    ]
+    for child_model, (parent_field, children_key) in CHILD_FSU_FIELDS.items():
+        parent_model = child_model._meta.get_field(parent_field).related_model
+        observed.extend(
+            ObservedFSU(child_model, entry, parent=parent)
+            for parent in list(observed)
+            if parent.model is parent_model and isinstance(parent.entry, dict)
+            for entry in parent.entry.get(children_key) or []
+        )
+    return observed
+
+
+class InventoryReconciler:
+    """
+    Reconcile the FSUs of Devices with their observed hardware inventory.
+
+    Devices are reconciled in chunks. For each chunk, the Devices, their FSUs of every model,
+    any FSUs elsewhere with the observed serial numbers, and the FSU types and Statuses named are
+    each loaded with one query per model. Observed FSUs are then matched in memory, using hash
+    indexes: by serial number, then by slot (`pci_slot_id` or `slot_id`), then by name. The
+    result is the smallest set of changes - FSUs to create, FSUs to update, FSUs moved in from
+    another Device or from storage, FSUs moved to storage because they were not observed, and
+    child FSUs moved to another parent - which is applied to the whole chunk in a single
+    transaction, with bulk inserts and updates.
+
+    Each chunk goes through `load_chunk()`, `diff_chunk()`, and `write_chunk()` in turn. Only the
+    first and last query the database, so chunks can be diffed in other processes.
+    """
+
+    def __init__(
+        self,
+        user: AbstractBaseUser | None = None,
+        storage_location: Location | None = None,
+        dry_run: bool = False,
+    ):
+        """
+        Set up the reconciliation.
+
+        Args:
+            user: If set, Devices and FSU types must be visible to the user, who must also have
+                permission to add and change the FSUs.
+            storage_location: Where FSUs no longer observed in a Device are stored. Defaults to
+                the Location of the Device.
+            dry_run: Find the changes without applying them.
+        """
+        self.user = user
+        self.storage_location = storage_location
+        self.dry_run = dry_run
+        self.upserters = {model: FSUUpserter(model, user=user) for model in FSU_MODELS}
+        self.tracked_fields: dict[type[FSUModel], dict[str, str]] = {}
+        self.unchecked_fields: dict[type[FSUModel], list[str]] = {}
+        for model in FSU_MODELS:
+            field_names = [
+                *(name for name in OBSERVED_FIELDS if _has_field(model, name)),
+                "fsu_type",
+                "status",
+                "device",
+                "location",
+                *([CHILD_FSU_FIELDS[model][0]] if model in CHILD_FSU_FIELDS else []),
+            ]
+            self.tracked_fields[model] = {
+                name: model._meta.get_field(name).attname for name in field_names
+            }
+            self.unchecked_fields[model] = [
+                model_field.name
+                for model_field in model._meta.concrete_fields
+                if model_field.is_relation or isinstance(model_field, NaturalOrderingField)
+            ]
+
+    def _restrict(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Restrict a queryset to the objects the user can view."""
+        return queryset if self.user is None else queryset.restrict(self.user, "view")
+
+    def reconcile(
+        self, inventories: Iterable[dict[str, Any]], chunk_size: int = 500
+    ) -> ReconcileResult:
+        """
+        Reconcile the FSUs of the Devices in a set of observed inventories.
+
+        Args:
+            inventories: Observed inventories, each with the ID or name of its Device in `id` or
+                `name`, and lists of FSUs in the shape of the Device inventory API.
+            chunk_size: Number of Devices to load and update together.
+
+        Returns:
+            ReconcileResult: The number of changes of each kind, and any errors by Device.
+        """
+        start = perf_counter()
+        result = ReconcileResult()
+        inventories = iter(inventories)
+        while chunk := list(islice(inventories, chunk_size)):
+            self.write_chunk(self.diff_chunk(self.load_chunk(chunk)), result)
+        result.elapsed = perf_counter() - start
+        return result
+
+    def _resolve_devices(
+        self, chunk: list[Any], errors: list[tuple[str, str]]
+    ) -> list[tuple[Device, list[ObservedFSU]]]:
+        """Look up the Devices of a chunk of inventories with a single query."""
+        refs = [
+            _text(inventory.get("id") or inventory.get("name"))
+            if isinstance(inventory, dict)
+            else ""
+            for inventory in chunk
+        ]
+        ids = {ref for ref in refs if is_uuid(ref)}
+        lookup: dict[str, list[Device]] = defaultdict(list)
+        for device in self._restrict(Device.objects.only("id", "name", "location_id")).filter(
+            Q(pk__in=ids) | Q(name__in=set(refs) - ids - {""})
+        ):
+            lookup[str(device.pk)].append(device)
+            lookup[device.name].append(device)
+
+        devices: list[tuple[Device, list[ObservedFSU]]] = []
+        seen: set[UUID] = set()
+        for ref, inventory in zip(refs, chunk, strict=True):
+            matches = lookup.get(ref, [])
+            if len(matches) != 1:
+                problem = "matches more than one Device" if matches else "not found"
+                errors.append((ref, f"Device {ref!r} {problem}."))
+            elif matches[0].pk in seen:
+                errors.append((ref, "Device has more than one inventory in this chunk."))
+            else:
+                seen.add(matches[0].pk)
+                devices.append((matches[0], observed_fsus(inventory)))
+        return devices
+
+    def _resolve_types(
+        self, observed: list[ObservedFSU]
+    ) -> dict[type[FSUModel], dict[str, list[models.Model]]]:
+        """Look up the FSU types of the observed FSUs by ID, part number, or name."""
+        keys: dict[type[FSUModel], set[str]] = defaultdict(set)
+        for item in observed:
+            if item.is_fsu:
+                keys[item.model].update(self._type_keys(item.entry.get("fsu_type")))
+
+        lookup: dict[type[FSUModel], dict[str, list[models.Model]]] = {}
+        for model, model_keys in keys.items():
+            type_model = model._meta.get_field("fsu_type").related_model
+            lookup[model] = defaultdict(list)
+            for fsu_type in self._restrict(type_model.objects.all()).filter(
+                Q(pk__in={key for key in model_keys if is_uuid(key)})
+                | Q(part_number__in=model_keys)
+                | Q(name__in=model_keys)
+            ):
+                for key in {str(fsu_type.pk), fsu_type.part_number, fsu_type.name}:
+                    lookup[model][key].append(fsu_type)
+        return lookup
+
+    @staticmethod
+    def _type_keys(value: Any) -> list[str]:
+        """Get the ways an observed FSU type can be looked up, most specific first."""
+        if isinstance(value, dict):
+            return [_text(value[key]) for key in ("id", "part_number", "name") if value.get(key)]
+        return [text] if (text := _text(value)) else []
+
+    @staticmethod
+    def _resolve_statuses(observed: list[ObservedFSU]) -> dict[type[FSUModel], dict[str, Status]]:
+        """Look up the Statuses of the observed FSUs, and the default Status of new FSUs."""
+        names: dict[type[FSUModel], set[str]] = defaultdict(set)
+        for item in observed:
+            if item.is_fsu and (status := _text(item.entry.get("status"))):
+                names[item.model].add(status)
+
+        return {
+            model: {
+                status.name: status
+                for status in Status.objects.get_for_model(model).filter(
+                    name__in={"Active", *names[model]}
+                )
+            }
+            for model in {item.model for item in observed}
+        }
+
+    def _load_fsus(
+        self, device_ids: set[UUID], observed: list[ObservedFSU]
+    ) -> dict[type[FSUModel], list[FSUModel]]:
+        """Load the FSUs of the Devices, and any FSUs with the observed serial numbers."""
+        serials: dict[type[FSUModel], set[str]] = defaultdict(set)
+        for item in observed:
+            if serial := item.serial_number:
+                serials[item.model].add(serial)
+
+        loaded = {}
+        for model in RECONCILE_ORDER:
+            queryset = model.objects.order_by()
+            if getattr(model, "slot_capacity_field", None):
+                queryset = queryset.select_related("fsu_type")
+            loaded[model] = list(
+                queryset.filter(Q(device_id__in=device_ids) | Q(serial_number__in=serials[model]))
+            )
+        return loaded
+
+    @staticmethod
+    def _match(
+        devices: list[tuple[Device, list[ObservedFSU]]],
+        loaded: dict[type[FSUModel], list[FSUModel]],
+    ) -> set[UUID]:
+        """
+        Match observed FSUs to loaded FSUs, by serial number, then slot, then name.
+
+        Serial numbers are matched first across every loaded FSU, so FSUs moved from another
+        Device or from storage are followed. Slots and names are then matched within each Device,
+        skipping FSUs with a different serial number, which have been replaced.
+
+        Returns:
+            set: IDs of the matched FSUs.
+        """
+        claimed: set[UUID] = set()
+        by_serial: dict[tuple[type[FSUModel], str], list[FSUModel]] = defaultdict(list)
+        by_device: dict[UUID, list[FSUModel]] = defaultdict(list)
+        for model, fsus in loaded.items():
+            for fsu in fsus:
+                if fsu.serial_number:
+                    by_serial[(model, fsu.serial_number)].append(fsu)
+                if fsu.device_id:
+                    by_device[fsu.device_id].append(fsu)
+
+        for device, items in devices:
+            for item in items:
+                candidates = [
+                    fsu
+                    for fsu in by_serial.get((item.model, item.serial_number), [])
+                    if fsu.pk not in claimed
+                ]
+                local = [fsu for fsu in candidates if fsu.device_id == device.pk]
+                if len(local or candidates) == 1:
+                    item.fsu = (local or candidates)[0]
+                    claimed.add(item.fsu.pk)
+
+        for device, items in devices:
+            for match_field in (*SLOT_FIELDS, "name"):
+                claimed.update(_match_field(items, by_device[device.pk], match_field, claimed))
+        return claimed
+
+    def _changed_fields(self, prior: FSUModel, fsu: FSUModel) -> frozenset[str]:
+        """Get the names of the reconciled fields that differ between two versions of an FSU."""
+        return frozenset(
+            field_name
+            for field_name, attname in self.tracked_fields[type(fsu)].items()
+            if getattr(prior, attname) != getattr(fsu, attname)
+        )
+
+    def _set_type_and_status(
+        self,
+        item: ObservedFSU,
+        fsu_types: dict[type[FSUModel], dict[str, list[models.Model]]],
+        statuses: dict[type[FSUModel], dict[str, Status]],
+    ) -> list[str]:
+        """Set the FSU type and Status of an observed FSU, returning any errors."""
+        model, entry, fsu = item.model, item.entry, item.fsu
+        errors = []
+        if "fsu_type" in entry or fsu.fsu_type_id is None:
+            keys = self._type_keys(entry.get("fsu_type"))
+            matches = next(
+                (fsu_types[model][key] for key in keys if key in fsu_types.get(model, {})), []
+            )
+            if len(matches) == 1:
+                fsu.fsu_type = matches[0]
+            elif not keys:
+                errors.append("fsu_type: This field is required.")
+            else:
+                problem = "matches more than one FSU type" if matches else "not found"
+                errors.append(f"fsu_type: {keys[0]!r} {problem}.")
+
+        if "status" in entry or fsu.status_id is None:
+            status_name = _text(entry.get("status")) or "Active"
+            if status_name in statuses[model]:
+                fsu.status = statuses[model][status_name]
+            else:
+                errors.append(f"status: {status_name!r} not found.")
+        return errors
+
+    def _apply_entry(  # noqa: PLR0913
+        self,
+        item: ObservedFSU,
+        device: Device,
+        fsu_types: dict[type[FSUModel], dict[str, list[models.Model]]],
+        statuses: dict[type[FSUModel], dict[str, Status]],
+        staying: set[UUID],
+    ) -> list[str]:
+        """Apply an observed FSU to its FSU, installed in the Device, returning any errors."""
+        model, entry, fsu = item.model, item.entry, item.fsu
+        errors: list[str] = []
+        for field_name in self.tracked_fields[model].keys() & entry.keys() & set(OBSERVED_FIELDS):
+            value = entry[field_name]
+            if field_name == "redundant" and not isinstance(value, bool):
+                value = _text(value).lower() in ("true", "yes", "1")
+            elif field_name != "redundant":
+                value = _text(value)
+            setattr(fsu, field_name, value)
+
+        errors.extend(self._set_type_and_status(item, fsu_types, statuses))
+
+        fsu.device = device
+        fsu.location = None
+        if model in CHILD_FSU_FIELDS:
+            # Nested FSUs belong to the FSU they are nested under. Top-level child FSUs stay in
+            # their parent FSU, if the parent is still in the Device.
+            parent_field = CHILD_FSU_FIELDS[model][0]
+            if item.parent is not None:
+                setattr(fsu, parent_field, item.parent.fsu)
+            elif getattr(fsu, f"{parent_field}_id") not in staying:
+                setattr(fsu, parent_field, None)
+
+        try:
+            # Related objects have already been resolved, the remaining fields need no queries.
+            models.Model.clean_fields(fsu, exclude=self.unchecked_fields[model])
+        except ValidationError as error:
+            errors.extend(
+                f"{field_name}: {message}"
+                for field_name, messages in error.message_dict.items()
+                for message in messages
+            )
+        return errors
+
+    def _diff_device(  # noqa: PLR0913
+        self,
+        device: Device,
+        items: list[ObservedFSU],
+        installed: list[FSUModel],
+        *,
+        claimed: set[UUID],
+        fsu_types: dict[type[FSUModel], dict[str, list[models.Model]]],
+        statuses: dict[type[FSUModel], dict[str, Status]],
+    ) -> DeviceChanges:
+        """Find the changes reconciling the installed FSUs of a Device with its observed FSUs."""
+        changes = DeviceChanges(device)
+        staying = {item.fsu.pk for item in items if item.fsu is not None}
+        names: set[tuple[type[FSUModel], str]] = set()
+        for item in items:
+            if not item.is_fsu:
+                changes.errors.append(f"{inventory_key(item.model)}: {item.entry!r} is not an FSU.")
+                continue
+
+            prior = copy(item.fsu) if item.fsu is not None else None
+            if item.fsu is None:
+                custom_field_data = self.upserters[item.model].custom_field_data
+                item.fsu = item.model(_custom_field_data=dict(custom_field_data))
+            errors = self._apply_entry(item, device, fsu_types, statuses, staying)
+            if (item.model, item.fsu.name) in names:
+                errors.append("name: Observed more than once in the Device.")
+            names.add((item.model, item.fsu.name))
+            label = f"{item.model._meta.verbose_name} {item.fsu.name!r}"
+            changes.errors.extend(f"{label}: {error}" for error in errors)
+
+            if prior is None:
+                changes.created.append(item.fsu)
+            elif changed := self._changed_fields(prior, item.fsu):
+                changes.updated.append((prior, item.fsu, changed))
+            else:
+                changes.unchanged += 1
+
+        # Installed FSUs that were not observed have been removed from the Device.
+        storage_id = self.storage_location.pk if self.storage_location else device.location_id
+        for fsu in installed:
+            if fsu.pk not in claimed:
+                prior = copy(fsu)
+                fsu.device = None
+                fsu.location_id = storage_id
+                if type(fsu) in CHILD_FSU_FIELDS:
+                    setattr(fsu, CHILD_FSU_FIELDS[type(fsu)][0], None)
+                changes.updated.append((prior, fsu, self._changed_fields(prior, fsu)))
+
+        changes.errors.extend(self._check_slots(items))
+        return changes
+
+    @staticmethod
+    def _check_slots(items: list[ObservedFSU]) -> list[str]:
+        """Check that the observed children of parent FSUs fit in their slots."""
+        errors = []
+        for child_model, (parent_field, _) in CHILD_FSU_FIELDS.items():
+            parent_model = child_model._meta.get_field(parent_field).related_model
+            if not getattr(parent_model, "slot_capacity_field", None):
+                continue
+            parents = {
+                item.fsu.pk: item.fsu
+                for item in items
+                if item.model is parent_model and item.fsu is not None and item.fsu.fsu_type_id
+            }
+            counts = Counter(
+                getattr(item.fsu, f"{parent_field}_id")
+                for item in items
+                if item.model is child_model and item.fsu is not None
+            )
+            for parent_id, count in counts.items():
+                if (parent := parents.get(parent_id)) is None:
+                    continue
+                capacity = getattr(parent.fsu_type, parent_model.slot_capacity_field)
+                if capacity and count > capacity:
+                    errors.append(
+                        f"{parent_model._meta.verbose_name} {parent.name!r}: {count} "
+                        f"{child_model._meta.verbose_name_plural} observed, but it only has "
+                        f"{capacity} slots."
+                    )
+        return errors
+
+    def _store_names(self, all_changes: list[DeviceChanges], claimed: set[UUID]) -> None:
+        """
+        Name the FSUs moved to storage, with one query per FSU model.
+
+        An FSU keeps its name in storage if the name is free at the storage Location, or else is
+        named by its serial number, or by its Device and name. If none of these are free, the
+        Device's changes are not applied.
+        """
+        candidates: dict[type[FSUModel], set[str]] = defaultdict(set)
+        location_ids = set()
+        for changes in all_changes:
+            for _, fsu, _ in changes.updated:
+                if fsu.device_id is None:
+                    candidates[type(fsu)].update(_storage_names(changes.device, fsu))
+                    location_ids.add(fsu.location_id)
+
+        taken: set[tuple[type[FSUModel], UUID, str]] = set()
+        for model, names in candidates.items():
+            taken.update(
+                (model, location_id, name)
+                for pk, location_id, name in model.objects.filter(
+                    location_id__in=location_ids, name__in=names
+                ).values_list("pk", "location_id", "name")
+                # FSUs moving out of storage give up their names.
+                if pk not in claimed
+            )
+
+        for changes in all_changes:
+            names = {}
+            for _, fsu, _ in changes.updated:
+                if fsu.device_id is not None:
+                    continue
+                keys = [
+                    (type(fsu), fsu.location_id, name)
+                    for name in _storage_names(changes.device, fsu)
+                ]
+                key = next((key for key in keys if key not in taken and key not in names), None)
+                if key is None:
+                    changes.errors.append(
+                        f"{fsu._meta.verbose_name} {fsu.name!r}: Name already in use at the "
+                        "storage location."
+                    )
+                else:
+                    names[key] = fsu
+
+            if not changes.errors:
+                taken.update(names)
+                for (_, _, name), fsu in names.items():
+                    fsu.name = name
+                changes.updated = [
+                    (prior, fsu, self._changed_fields(prior, fsu))
+                    for prior, fsu, _ in changes.updated
+                ]
+
+    def _apply(self, valid: list[DeviceChanges]) -> None:
+        """Apply the changes of a chunk of Devices in a single transaction."""
+        plans = {model: UpsertPlan() for model in RECONCILE_ORDER}
+        # FSUs leaving a Device give up their names before any new FSU takes them.
+        updates = sorted(
+            (update for changes in valid for update in changes.updated),
+            key=lambda update: "device" not in update[2],
+        )
+        for prior, fsu, changed in updates:
+            plans[type(fsu)].prior[fsu.pk] = prior
+            plans[type(fsu)].updated.setdefault(changed, []).append(fsu)
+        for changes in valid:
+            for fsu in changes.created:
+                plans[type(fsu)].created.append(fsu)
+
+        with transaction.atomic():
+            for model in RECONCILE_ORDER:
+                upserter, plan = self.upserters[model], plans[model]
+                updated = upserter.update(plan)
+                created = upserter.save(plan.created) if plan.created else []
+                log_bulk_changes(created, ObjectChangeActionChoices.ACTION_CREATE)
+                log_bulk_changes(updated)
+
+    @staticmethod
+    def _count(valid: list[DeviceChanges], result: ReconcileResult) -> None:
+        """Add the applied changes of a chunk of Devices to the result."""
+        for changes in valid:
+            device_name = changes.device.name
+            result.devices += 1
+            result.unchanged += changes.unchanged
+            result.created += len(changes.created)
+            result.changes.extend(
+                (device_name, "create", fsu._meta.verbose_name, fsu.name) for fsu in changes.created
+            )
+            for prior, fsu, changed in changes.updated:
+                if fsu.device_id is None:
+                    action, result.stored = "store", result.stored + 1
+                elif prior.device_id != fsu.device_id:
+                    action, result.moved = "move", result.moved + 1
+                elif type(fsu) in CHILD_FSU_FIELDS and CHILD_FSU_FIELDS[type(fsu)][0] in changed:
+                    action, result.reparented = "reparent", result.reparented + 1
+                else:
+                    action, result.updated = "update", result.updated + 1
+                result.changes.append((device_name, action, fsu._meta.verbose_name, fsu.name))
+
+    def load_chunk(self, chunk: list[Any]) -> ChunkState:
+        """Load what is needed to diff a chunk of inventories, with a fixed number of queries."""
+        errors: list[tuple[str, str]] = []
+        devices = self._resolve_devices(chunk, errors)
+        observed = [item for _, items in devices for item in items]
+        return ChunkState(
+            devices=devices,
+            fsu_types=self._resolve_types(observed),
+            statuses=self._resolve_statuses(observed),
+            loaded=self._load_fsus({device.pk for device, _ in devices}, observed),
+            errors=errors,
+        )
+
+    def diff_chunk(self, state: ChunkState) -> ChunkDiff:
+        """Find the changes for a loaded chunk of inventories, without any queries."""
+        claimed = self._match(state.devices, state.loaded)
+        installed: dict[UUID, list[FSUModel]] = defaultdict(list)
+        for model in RECONCILE_ORDER:
+            for fsu in state.loaded[model]:
+                installed[fsu.device_id].append(fsu)
+
+        changes = [
+            self._diff_device(
+                device,
+                items,
+                installed[device.pk],
+                claimed=claimed,
+                fsu_types=state.fsu_types,
+                statuses=state.statuses,
+            )
+            for device, items in state.devices
+        ]
+        return ChunkDiff(changes=changes, claimed=claimed, errors=state.errors)
+
+    def write_chunk(self, diff: ChunkDiff, result: ReconcileResult) -> None:
+        """Apply the changes of a chunk of Devices in one transaction, adding them to the result."""
+        result.errors.extend(diff.errors)
+        self._store_names(diff.changes, diff.claimed)
+
+        valid = []
+        for changes in diff.changes:
+            if changes.errors:
+                result.errors.extend((changes.device.name, error) for error in changes.errors)
+            else:
+                valid.append(changes)
+
+        if valid and not self.dry_run:
+            try:
+                self._apply(valid)
+            except (IntegrityError, PermissionDenied, ValidationError) as error:
+                message = (
+                    "; ".join(error.messages) if isinstance(error, ValidationError) else str(error)
+                )
+                result.errors.extend(
+                    (changes.device.name, f"Changes not applied: {message}") for changes in valid
+                )
+                return
+        self._count(valid, result)
+
+
+def reconcile_inventories(
+    inventories: Iterable[dict[str, Any]],
+    *,
+    user: AbstractBaseUser | None = None,
+    storage_location: Location | None = None,
+    chunk_size: int = 500,
+    dry_run: bool = False,
+) -> ReconcileResult:
+    """
+    Reconcile the FSUs of Devices with their observed hardware inventory.
+
+    Args:
+        inventories: Observed inventories, in the shape of the Device inventory API.
+        user: If set, Devices and FSU types must be visible to the user, who must also have
+            permission to add and change the FSUs.
+        storage_location: Where FSUs no longer observed in a Device are stored. Defaults to
+            the Location of the Device.
+        chunk_size: Number of Devices to load and update together.
+        dry_run: Find the changes without applying them.
+
+    Returns:
+        ReconcileResult: The number of changes of each kind, and any errors by Device.
+    """
+    reconciler = InventoryReconciler(user=user, storage_location=storage_location, dry_run=dry_run)
+    return reconciler.reconcile(inventories, chunk_size=chunk_size)
@@ -0,0 +1,64 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Spare FSUs on hand, read from the stored spare counts."""
+
+from typing import Iterable
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.db.models import QuerySet
+from nautobot.dcim.models import Location
+
+from nautobot_fsus.models import FSUSpareCount
+from nautobot_fsus.utilities.fsu_types import get_fsu_types, get_visible_content_types
+
+
+def get_spare_counts(user: AbstractBaseUser | None = None) -> QuerySet:
+    """
+    Get the stored spare counts, optionally limited to those a user may view.
+
+    Counts are included for the FSU models the user has permission to view, at the Locations the
+    user has permission to view. They are ordered by Location, FSU model, FSU type, and Status.
+    """
+    queryset = FSUSpareCount.objects.select_related("location", "fsu_content_type", "status")
+    if user is not None:
+        queryset = queryset.filter(
+            fsu_content_type__in=get_visible_content_types(user),
+            location__in=Location.objects.restrict(user, "view"),
+        )
+
+    return queryset.order_by("location__name", "fsu_content_type__model", "fsu_type_id", "status")
+
+
+def with_fsu_types(spare_counts: Iterable[FSUSpareCount]) -> list[FSUSpareCount]:
+    """
+    Set the `fsu_model` and `fsu_type` of each spare count, such as those of a page of them.
+
+    The FSU types are loaded with one query per FSU model. Counts whose FSU type no longer exists
+    are left out.
+    """
+    spare_counts = list(spare_counts)
+    fsu_types = get_fsu_types(
+        (spare_count.fsu_content_type_id, spare_count.fsu_type_id) for spare_count in spare_counts
+    )
+
+    loaded = []
+    for spare_count in spare_counts:
+        key = (spare_count.fsu_content_type_id, spare_count.fsu_type_id)
+        if key in fsu_types:
+            spare_count.fsu_model, spare_count.fsu_type = fsu_types[key]
+            loaded.append(spare_count)
+
+    return loaded
@@ -24,6 +24,7 @@ from nautobot.dcim.models import Device, DeviceType, Location, LocationType, Man
 from nautobot.extras.filters import NautobotFilterSet
 from nautobot.extras.models import Role, Status, Tag
 
+from nautobot_fsus.filters import search
 from nautobot_fsus.models.mixins import FSUModel, FSUTemplateModel, FSUTypeModel
 
 
@@ -123,6 +124,24 @@ class FSUFilterTestCases:
             params = {"firmware_version": ["1.1"]}
             self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
 
+        def test_firmware_version_range(self):
+            """Test filtering on the firmware version in version order."""
+            params = {"firmware_version__gt": "1.0"}
+            self.assertQuerysetEqual(self.filterset(params, self.queryset).qs, [self.fsus[1]])
+            params = {"firmware_version__lte": "1.0"}
+            self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
+            params = {"firmware_version__lt": "1.10"}
+            self.assertEqual(self.filterset(params, self.queryset).qs.count(), 3)
+            params = {"firmware_version__gte": "v1.2"}
+            self.assertFalse(self.filterset(params, self.queryset).qs.exists())
+
+        def test_driver_version_range(self):
+            """Test filtering on the driver version in version order."""
+            params = {"driver_version__lt": "1.1"}
+            self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
+            params = {"driver_version__gte": "1.01"}
+            self.assertQuerysetEqual(self.filterset(params, self.queryset).qs, [self.fsus[2]])
+
         def test_driver_name(self):
             """Test filtering on the FSU driver name."""
             params = {"driver_name": ["test_driver"]}
@@ -158,6 +177,25 @@ class FSUFilterTestCases:
             params = {"fsu_type_id": [fsu_type.pk]}
             self.assertEqual(self.filterset(params, self.queryset).qs.count(), 2)
 
+        def test_q_filter_trigram(self):
+            """Test the `q` filter finds the same FSUs when it is built for the trigram indexes."""
+            # The trigram query only depends on the index existing, so it can be tested without it.
+            search._trigram_indexes[(self.queryset.db, self.model._meta.db_table)] = True
+            try:
+                self.test_q_filter_valid()
+                with self.subTest(search="id"):
+                    params = {"q": str(self.fsus[0].pk).upper()}
+                    self.assertQuerysetEqual(
+                        self.filterset(params, self.queryset).qs, [self.fsus[0]]
+                    )
+                with self.subTest(search="fsu_type"):
+                    params = {"q": self.fsu_types[1].name.upper()}
+                    self.assertQuerysetEqual(
+                        self.filterset(params, self.queryset).qs, [self.fsus[1]]
+                    )
+            finally:
+                search.clear_trigram_search_cache()
+
     class FSUTemplateFilterTestCase(FilterTestCases.FilterTestCase):
         """Common tests for FSU template filters."""
 
@@ -15,17 +15,19 @@
 
 """Test cases for Nautobot FSUs app models."""
 
+from io import StringIO
 from time import sleep
 from typing import Any, Type
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.core.management import call_command
 from django.test import TestCase
 from nautobot.dcim.models import Device, DeviceType, Location, Manufacturer
 from nautobot.extras.choices import CustomFieldTypeChoices
 from nautobot.extras.models import CustomField, Role, Status
 
-from nautobot_fsus.models import FanType, OtherFSUType
+from nautobot_fsus.models import FanType, FSUCount, OtherFSUType
 from nautobot_fsus.models.mixins import FSUModel, FSUTemplateModel, FSUTypeModel
 
 
@@ -138,6 +140,43 @@ class NautobotFSUModelTestCases:  # pylint: disable=too-few-public-methods
             instance1.save()
             instance2.full_clean()
 
+        def test_fsu_counts(self):
+            """Verify the stored FSU counts follow FSU creation, moves, and deletion."""
+            key = f"{self.model._meta.model_name}s"
+
+            def expected(parent: Device | Location) -> int:
+                parent_field = "device" if isinstance(parent, Device) else "location"
+                return self.model.objects.filter(**{parent_field: parent}).count()
+
+            instance = self.model.objects.create(
+                fsu_type=self.fsu_type,
+                device=self.device,
+                name=f"test_{self.model._meta.model_name}",
+                status=self.status,
+            )
+            self.assertEqual(FSUCount.objects.for_parent(self.device)[key], expected(self.device))
+
+            instance.location = self.location
+            instance.device = None
+            instance.save()
+            self.assertEqual(
+                FSUCount.objects.for_parent(self.device).get(key, 0), expected(self.device)
+            )
+            self.assertEqual(
+                FSUCount.objects.for_parent(self.location)[key], expected(self.location)
+            )
+
+            instance.delete()
+            self.assertEqual(
+                FSUCount.objects.for_parent(self.location).get(key, 0), expected(self.location)
+            )
+
+            FSUCount.objects.all().delete()
+            call_command("rebuild_fsu_counts", stdout=StringIO())
+            self.assertEqual(
+                FSUCount.objects.for_parent(self.device).get(key, 0), expected(self.device)
+            )
+
         def test_fsu_incorrect_type(self):
             """Verify validation of the correct FSU type on FSU creation."""
             # if self.model._meta.model_name == "otherfsu":
@@ -0,0 +1,378 @@
+#  SPDX-FileCopyrightText: Copyright (c) "2024" NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+#  SPDX-License-Identifier: Apache-2.0
+#
+#  Licensed under the Apache License, Version 2.0 (the "License")
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#  http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""Idempotent bulk create-or-update of FSUs from inventory records."""
+
+from collections import Counter, defaultdict
+from copy import copy
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping
+from uuid import UUID
+
+from django.contrib.auth.models import AbstractBaseUser
+from django.core.exceptions import PermissionDenied
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from nautobot.core.models.fields import NaturalOrderingField
+from nautobot.dcim.models import Device
+from nautobot.extras.choices import ObjectChangeActionChoices
+
+from nautobot_fsus.models import (
+    FSUCount,
+    FSUSerialIndex,
+    FSUSpareCount,
+    FSUVersionCount,
+)
+from nautobot_fsus.models.fsu_spare_counts import spare_count_key
+from nautobot_fsus.models.fsu_version_counts import version_count_key
+from nautobot_fsus.models.mixins import FSUModel
+from nautobot_fsus.utilities.bulk_import import FSUImporter
+from nautobot_fsus.utilities.child_assignment import log_bulk_changes
+
+
+@dataclass
+class UpsertResult:
+    """Summary of a bulk FSU upsert."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+
+@dataclass
+class UpsertPlan:
+    """
+    The validated changes for a set of records of one FSU model, ready to be saved.
+
+    Attributes:
+        created: New FSUs, not yet saved.
+        updated: Changed FSUs, grouped by the set of fields changed.
+        prior: Each changed FSU as it was before its record was applied, by ID.
+        unchanged: Number of records matching an FSU that they did not change.
+        errors: The (row number, message) of each error found.
+    """
+
+    created: list[FSUModel] = field(default_factory=list)
+    updated: dict[frozenset[str], list[FSUModel]] = field(default_factory=dict)
+    prior: dict[UUID, FSUModel] = field(default_factory=dict)
+    unchanged: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+
+def record_row(record: Mapping[str, Any]) -> dict[str, str]:
+    """Convert the values of a JSON inventory record to the strings used in import rows."""
+    return {key: "" if value is None else str(value) for key, value in record.items()}
+
+
+class FSUUpserter(FSUImporter):
+    """
+    Create or update FSUs of one model from inventory records.
+
+    Each record is matched to an existing FSU by its serial number, or else by its name in its
+    Device or storage Location, with one query for all of the records. A matched FSU is updated
+    with the columns given in its record, and a record matching no FSU creates one; either way
+    the records are resolved and validated as in `FSUImporter`, with a fixed number of queries.
+    New FSUs are saved with `bulk_create()` and changed FSUs with one `bulk_update()` per set of
+    changed fields, so sending the same records again changes nothing.
+    """
+
+    @staticmethod
+    def _parent_key(
+        row: dict[str, str], resolved: dict[str, dict[Any, list]]
+    ) -> tuple[str, UUID, str] | None:
+        """
+        Get the Device, or else the storage Location, named in a row, with the FSU name.
+
+        FSU names are unique in their Device or Location, so this identifies a single FSU.
+        """
+        name = (row.get("name") or "").strip()
+        for parent_field in ("device", "location"):
+            matches = resolved[parent_field].get((row.get(parent_field) or "").strip(), [])
+            if len(matches) == 1 and name:
+                return parent_field, matches[0].pk, name
+        return None
+
+    def _match(
+        self,
+        rows: list[dict[str, str]],
+        resolved: dict[str, dict[Any, list]],
+    ) -> tuple[list[FSUModel | None], list[str | None]]:
+        """
+        Find the existing FSU each row refers to, with a single query.
+
+        Returns:
+            tuple: The matched FSU, or None, and any matching error, for each row.
+        """
+        serials = {(row.get("serial_number") or "").strip() for row in rows} - {""}
+        parent_keys = [self._parent_key(row, resolved) for row in rows]
+        query = Q(serial_number__in=serials) if serials else Q()
+        for parent_field in ("device", "location"):
+            keys = [key for key in parent_keys if key and key[0] == parent_field]
+            if keys:
+                query |= Q(
+                    **{f"{parent_field}_id__in": {key[1] for key in keys}},
+                    name__in={key[2] for key in keys},
+                )
+
+        by_serial: dict[str, list[FSUModel]] = defaultdict(list)
+        by_name: dict[tuple[str, UUID, str], FSUModel] = {}
+        if query:
+            for fsu in self.model.objects.filter(query):
+                if fsu.serial_number:
+                    by_serial[fsu.serial_number].append(fsu)
+                parent_field = "device" if fsu.device_id else "location"
+                by_name[(parent_field, getattr(fsu, f"{parent_field}_id"), fsu.name)] = fsu
+
+        matched: list[FSUModel | None] = []
+        errors: list[str | None] = []
+        claimed: set[UUID] = set()
+        for row, parent_key in zip(rows, parent_keys, strict=True):
+            serial = (row.get("serial_number") or "").strip()
+            fsu, error = None, None
+            if len(by_serial.get(serial, [])) > 1:
+                error = f"serial_number: {serial!r} matches more than one FSU."
+            elif serial in by_serial:
+                fsu = by_serial[serial][0]
+            else:
+                fsu = by_name.get(parent_key)
+
+            if fsu is not None and fsu.pk in claimed:
+                fsu, error = None, "Another record in this request matches the same FSU."
+            if fsu is not None:
+                claimed.add(fsu.pk)
+            matched.append(fsu)
+            errors.append(error)
+
+        return matched, errors
+
+    def _changed_fields(self, prior: FSUModel, instance: FSUModel) -> frozenset[str]:
+        """Get the names of the fields changed by applying a record to an existing FSU."""
+        return frozenset(
+            field_name
+            for field_name in {*self.fields, "device", "location"}
+            if getattr(prior, self.model._meta.get_field(field_name).attname)
+            != getattr(instance, self.model._meta.get_field(field_name).attname)
+        )
+
+    def plan(
+        self,
+        rows: Iterable[dict[str, str]],
+        row_numbers: Iterable[int] | None = None,
+    ) -> UpsertPlan:
+        """
+        Match, build, and validate the FSUs for a set of records, without saving them.
+
+        Args:
+            rows: Inventory records, keyed by the column names of the model's import form.
+            row_numbers: Number of each record, used in error messages. Defaults to counting
+                from 1.
+
+        Returns:
+            UpsertPlan: The new and changed FSUs, or the errors found.
+        """
+        rows = list(rows)
+        row_numbers = list(row_numbers or range(1, len(rows) + 1))
+        resolved = self._resolve(rows)
+        matched, match_errors = self._match(rows, resolved)
+        if self.parent_field:
+            # Records updating an FSU may name a parent FSU without naming the Device.
+            device_ids = {fsu.device_id for fsu in matched if fsu and fsu.device_id}
+            device_ids -= {device.pk for objs in resolved["device"].values() for device in objs}
+            if device_ids:
+                device_ids |= {device.pk for objs in resolved["device"].values() for device in objs}
+                resolved[self.parent_field] = self._resolve_parents(rows, device_ids)
+
+        plan = UpsertPlan()
+        built = []
+        for row, fsu, match_error in zip(rows, matched, match_errors, strict=True):
+            if fsu is not None:
+                plan.prior[fsu.pk] = copy(fsu)
+            instance, row_errors = self._build(row, resolved, instance=fsu)
+            if match_error:
+                row_errors.insert(0, match_error)
+            built.append((instance, row_errors))
+
+        existing = self._existing_names([instance for instance, _ in built])
+        for prior in plan.prior.values():
+            # Matched FSUs may keep or give up their current names.
+            parent_field = "device" if prior.device_id else "location"
+            existing.discard((parent_field, getattr(prior, f"{parent_field}_id"), prior.name))
+
+        prior_parents = (
+            {pk: getattr(prior, f"{self.parent_field}_id") for pk, prior in plan.prior.items()}
+            if self.parent_field
+            else None
+        )
+        valid, plan.errors = self._check(built, existing, row_numbers, prior_parents)
+        for instance in valid:
+            if instance.pk not in plan.prior:
+                plan.created.append(instance)
+            elif changed := self._changed_fields(plan.prior[instance.pk], instance):
+                plan.updated.setdefault(changed, []).append(instance)
+            else:
+                plan.unchanged += 1
+
+        for pk in set(plan.prior) - {
+            instance.pk for instances in plan.updated.values() for instance in instances
+        }:
+            del plan.prior[pk]
+
+        return plan
+
+    def _check_permission(self, pks: list[UUID], message: str) -> None:
+        """Ensure the user may change all of the given FSUs, as they are in the database now."""
+        if self.user is not None and pks:
+            permitted = (
+                self._restrict(self.model.objects.all(), "change").filter(pk__in=pks).count()
+            )
+            if permitted != len(pks):
+                raise PermissionDenied(message)
+
+    def update(self, plan: UpsertPlan, batch_size: int = 1000) -> list[FSUModel]:
+        """
+        Save the changed FSUs of a plan, with one `bulk_update()` per set of changed fields.
+
+        Raises:
+            PermissionDenied: If the user is not permitted to change all of the FSUs, before or
+                after the update.
+        """
+        updated = [instance for instances in plan.updated.values() for instance in instances]
+        if not updated:
+            return []
+
+        pks = [instance.pk for instance in updated]
+        now = timezone.now()
+        with transaction.atomic():
+            self._check_permission(pks, "Not permitted to change some of the matched FSUs.")
+            for changed, instances in plan.updated.items():
+                # bulk_update() does not call pre_save(), which sets the natural ordering fields.
+                sort_fields = [
+                    model_field
+                    for model_field in self.model._meta.concrete_fields
+                    if isinstance(model_field, NaturalOrderingField)
+                    and model_field.target_field in changed
+                ]
+                for instance in instances:
+                    for model_field in sort_fields:
+                        model_field.pre_save(instance, add=False)
+                    instance.last_updated = now
+                self.model.objects.bulk_update(
+                    instances,
+                    [*sorted(changed), *(f.name for f in sort_fields), "last_updated"],
+                    batch_size=batch_size,
+                )
+            self._check_permission(pks, "Not permitted to make some of the requested changes.")
+            self._update_derived(plan, updated)
+
+        return updated
+
+    def _update_derived(self, plan: UpsertPlan, updated: list[FSUModel]) -> None:
+        """Update the counts and the serial number index after a bulk update of FSUs."""
+        # bulk_update() bypasses the FSU save signals, so the counts, the serial number index,
+        # and the version, spare, and slot counts are updated here, as in FSUImporter.save().
+        pairs = [(plan.prior[instance.pk], instance) for instance in updated]
+        moved = [pair for pair in pairs if {"device", "location"} & self._changed_fields(*pair)]
+        FSUCount.objects.refresh(
+            self.model,
+            device_ids={fsu.device_id for pair in moved for fsu in pair},
+            location_ids={fsu.location_id for pair in moved for fsu in pair},
+        )
+        FSUSerialIndex.objects.refresh(
+            self.model,
+            [
+                new.pk
+                for old, new in pairs
+                if (old.serial_number, old.asset_tag) != (new.serial_number, new.asset_tag)
+            ],
+        )
+
+        device_locations = dict(
+            Device.objects.filter(
+                pk__in={fsu.device_id for pair in pairs for fsu in pair} - {None}
+            ).values_list("pk", "location_id")
+        )
+        version_deltas: Counter = Counter()
+        spare_deltas: Counter = Counter()
+        slot_deltas: Counter = Counter()
+        for old, new in pairs:
+            version_deltas[version_count_key(old, device_locations)] -= 1
+            version_deltas[version_count_key(new, device_locations)] += 1
+            for key, delta in ((spare_count_key(old), -1), (spare_count_key(new), 1)):
+                if key is not None:
+                    spare_deltas[key] += delta
+            if self._slot_count_field():
+                slot_deltas[getattr(old, f"{self.parent_field}_id")] -= 1
+                slot_deltas[getattr(new, f"{self.parent_field}_id")] += 1
+
+        FSUVersionCount.objects.adjust(self.model, version_deltas)
+        FSUSpareCount.objects.adjust(self.model, spare_deltas)
+        if slot_deltas:
+            parent_model = self.related_fields[self.parent_field].related_model
+            parent_model.objects.adjust_slots(slot_deltas)
+
+
+def upsert_fsus(
+    records: Iterable[tuple[type[FSUModel], dict[str, str]]],
+    *,
+    user: AbstractBaseUser | None = None,
+    batch_size: int = 1000,
+) -> UpsertResult:
+    """
+    Create or update FSUs of any models from inventory records, all or nothing.
+
+    Args:
+        records: The FSU model and the import row of each record, in order.
+        user: If set, related objects must be visible to the user, who must also have
+            permission to add the new FSUs and change the matched FSUs.
+        batch_size: Maximum number of FSUs to insert or update per database query.
+
+    Returns:
+        UpsertResult: Number of FSUs created, updated, and left unchanged, or the errors found
+            by record number, in which case nothing is saved.
+
+    Raises:
+        PermissionDenied: If the user is not permitted to make all of the changes.
+    """
+    by_model: dict[type[FSUModel], list[tuple[int, dict[str, str]]]] = defaultdict(list)
+    for row_number, (model, row) in enumerate(records, start=1):
+        by_model[model].append((row_number, row))
+
+    result = UpsertResult()
+    plans = []
+    for model, numbered_rows in by_model.items():
+        upserter = FSUUpserter(model, user=user)
+        plan = upserter.plan(
+            [row for _, row in numbered_rows], [row_number for row_number, _ in numbered_rows]
+        )
+        result.errors.extend(plan.errors)
+        plans.append((upserter, plan))
+
+    if result.errors:
+        result.errors.sort(key=lambda error: error[0])
+        return result
+
+    with transaction.atomic():
+        for upserter, plan in plans:
+            created = upserter.save(plan.created, batch_size=batch_size) if plan.created else []
+            updated = upserter.update(plan, batch_size=batch_size)
+            log_bulk_changes(created, ObjectChangeActionChoices.ACTION_CREATE)
+            log_bulk_changes(updated)
+            result.created += len(created)
+            result.updated += len(updated)
+            result.unchanged += plan.unchanged
+
+    return result
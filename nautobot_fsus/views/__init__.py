@@ -17,12 +17,20 @@
 
 from typing import Any, Type
 
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, HttpRequest, HttpResponse
+from django.shortcuts import get_object_or_404, render
+from django.views.generic import View
+from django_tables2 import RequestConfig
 from nautobot.core.views import generic
+from nautobot.core.views.paginator import EnhancedPaginator, get_paginate_count
 from nautobot.dcim.models import Device, Location
 
 from nautobot_fsus import models, tables
 from nautobot_fsus.models.mixins import FSUModel
 from nautobot_fsus.tables.mixins import FSUModelTable
+from nautobot_fsus.utilities.all_fsus import get_all_fsus
+from nautobot_fsus.utilities.spares import get_spare_counts, with_fsu_types
 from nautobot_fsus.views.fsu_templates import (
     CPUTemplateUIViewSet,
     DiskTemplateUIViewSet,
@@ -75,147 +83,138 @@ from nautobot_fsus.views.fsus import (
 )
 
 
-class DeviceFSUViewTab(generic.ObjectView):
-    """Tab view for FSUs assigned to a Device."""
-
-    queryset = Device.objects.all()
-    template_name = "nautobot_fsus/device_fsu_tab.html"
+class AllFSUsListView(LoginRequiredMixin, View):
+    """List of the FSUs of every type, read with a single query across the FSU tables."""
 
-    def get_extra_context(self, request, instance) -> dict[str, Any]:
-        """Add the tables to the view context."""
-
-        def _fsu_table(table: Type[FSUModelTable], fsu: Type[FSUModel]) -> FSUModelTable:
-            """Helper method to set up the table for an FSU."""
-            fsu_table: FSUModelTable = table(fsu.objects.filter(device__pk=instance.pk))
-            fsu_table.columns["actions"].column.extra_context["return_url_extra"] = (
-                f"?{request.GET.urlencode()}"
-            )
-            fsu_table.columns.hide("parent")
-            for table_column in ("firmware_version", "driver_name", "driver_version"):
-                fsu_table.columns.show(table_column)
+    template_name = "nautobot_fsus/all_fsus.html"
 
-            return fsu_table
-
-        context: dict[str, Any] = super().get_extra_context(request, instance)
+    def get(self, request: HttpRequest) -> HttpResponse:
+        """Render a page of FSUs, filtered and sorted by the request query parameters."""
+        all_fsus, errors = get_all_fsus(request.GET, request.user)
+        table = tables.AllFSUsTable(all_fsus)
+        RequestConfig(
+            request,
+            {"paginator_class": EnhancedPaginator, "per_page": get_paginate_count(request)},
+        ).configure(table)
 
-        context["cpu_table"] = _fsu_table(tables.CPUTable, models.CPU)
-        if request.user.has_perm("nautobot_fsus.change_cpu"):
-            context["cpu_table"].columns.show("pk")
+        return render(
+            request,
+            self.template_name,
+            {
+                "errors": errors,
+                "fsu_models": [
+                    (model._meta.model_name, model._meta.verbose_name)
+                    for model in models.FSU_MODELS
+                ],
+                "selected_fsu_models": request.GET.getlist("fsu_model"),
+                "table": table,
+                "title": "All FSUs",
+            },
+        )
 
-        context["disk_table"] = _fsu_table(tables.DiskTable, models.Disk)
-        if request.user.has_perm("nautobot_fsus.change_disk"):
-            context["disk_table"].columns.show("pk")
 
-        context["fan_table"] = _fsu_table(tables.FanTable, models.Fan)
-        if request.user.has_perm("nautobot_fsus.change_fan"):
-            context["fan_table"].columns.show("pk")
+class FSUParentViewTab(generic.ObjectView):
+    """
+    Base tab view for the FSUs assigned to a Device or Location.
 
-        context["gpu_table"] = _fsu_table(tables.GPUTable, models.GPU)
-        if request.user.has_perm("nautobot_fsus.change_gpu"):
-            context["gpu_table"].columns.show("pk")
+    The tab itself only lists the FSU types the parent has, using the stored FSU counts, and the
+    table of each type is loaded separately from `?fsu_model=<model name>`, one page at a time.
+    """
 
-        context["gpubaseboard_table"] = _fsu_table(tables.GPUBaseboardTable, models.GPUBaseboard)
-        if request.user.has_perm("nautobot_fsus.change_gpubaseboard"):
-            context["gpubaseboard_table"].columns.show("pk")
+    parent_field: str
 
-        context["hba_table"] = _fsu_table(tables.HBATable, models.HBA)
-        if request.user.has_perm("nautobot_fsus.change_hba"):
-            context["hba_table"].columns.show("pk")
+    def get(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Render the tab, or the table of one FSU type if `fsu_model` is given."""
+        if model_name := request.GET.get("fsu_model"):
+            instance = get_object_or_404(self.queryset.restrict(request.user, "view"), **kwargs)
+            return self.fsu_table_response(request, instance, model_name)
 
-        context["mainboard_table"] = _fsu_table(tables.MainboardTable, models.Mainboard)
-        if request.user.has_perm("nautobot_fsus.change_mainboard"):
-            context["mainboard_table"].columns.show("pk")
+        response: HttpResponse = super().get(request, *args, **kwargs)
+        return response
 
-        context["nic_table"] = _fsu_table(tables.NICTable, models.NIC)
-        if request.user.has_perm("nautobot_fsus.change_nic"):
-            context["nic_table"].columns.show("pk")
-
-        context["otherfsu_table"] = _fsu_table(tables.OtherFSUTable, models.OtherFSU)
-        if request.user.has_perm("nautobot_fsus.change_otherfsu"):
-            context["otherfsu_table"].columns.show("pk")
+    def get_extra_context(self, request, instance) -> dict[str, Any]:
+        """Add the FSU types the parent has, and their counts, to the view context."""
+        context: dict[str, Any] = super().get_extra_context(request, instance)
+        counts = models.FSUCount.objects.for_parent(instance)
+        context["fsu_tables"] = [
+            {
+                "fsu_model": model._meta.model_name,
+                "title": model._meta.verbose_name_plural,
+                "count": counts[f"{model._meta.model_name}s"],
+            }
+            for model in models.FSU_MODELS
+            if counts.get(f"{model._meta.model_name}s")
+        ]
 
-        context["psu_table"] = _fsu_table(tables.PSUTable, models.PSU)
-        if request.user.has_perm("nautobot_fsus.change_psu"):
-            context["psu_table"].columns.show("pk")
+        return context
 
-        context["rammodule_table"] = _fsu_table(tables.RAMModuleTable, models.RAMModule)
-        if request.user.has_perm("nautobot_fsus.change_rammodule"):
-            context["rammodule_table"].columns.show("pk")
+    def fsu_table_response(
+        self, request: HttpRequest, instance: Device | Location, model_name: str
+    ) -> HttpResponse:
+        """Render a page of the table of one FSU type assigned to the parent."""
+        fsu_model: Type[FSUModel] | None = next(
+            (model for model in models.FSU_MODELS if model._meta.model_name == model_name), None
+        )
+        if fsu_model is None:
+            raise Http404(f"Unknown FSU type: {model_name}")
+
+        table_class: Type[FSUModelTable] = getattr(tables, f"{fsu_model.__name__}Table")
+        fsu_table = table_class(
+            fsu_model.objects.restrict(request.user, "view").filter(
+                **{self.parent_field: instance}
+            ),
+            user=request.user,
+        )
+        fsu_table.columns.hide("parent")
+        for table_column in ("firmware_version", "driver_name", "driver_version"):
+            fsu_table.columns.show(table_column)
+        if request.user.has_perm(f"nautobot_fsus.change_{model_name}"):
+            fsu_table.columns.show("pk")
+
+        RequestConfig(
+            request,
+            {"paginator_class": EnhancedPaginator, "per_page": get_paginate_count(request)},
+        ).configure(fsu_table)
+
+        return render(
+            request,
+            "nautobot_fsus/inc/fsu_tab_table.html",
+            {
+                "table": fsu_table,
+                "title": fsu_model._meta.verbose_name_plural,
+                "return_url": request.path,
+                "bulk_rename_url": f"plugins:nautobot_fsus:{model_name}_bulk_rename",
+                "bulk_edit_url": f"plugins:nautobot_fsus:{model_name}_bulk_edit",
+                "bulk_delete_url": f"plugins:nautobot_fsus:{model_name}_bulk_delete",
+            },
+        )
+
+
+class DeviceFSUViewTab(FSUParentViewTab):
+    """Tab view for FSUs assigned to a Device."""
 
-        return context
+    queryset = Device.objects.all()
+    template_name = "nautobot_fsus/device_fsu_tab.html"
+    parent_field = "device"
 
 
-class LocationFSUViewTab(generic.ObjectView):
+class LocationFSUViewTab(FSUParentViewTab):
     """Tab view for FSUs assigned to a Location."""
 
     queryset = Location.objects.all()
     template_name = "nautobot_fsus/location_fsu_tab.html"
+    parent_field = "location"
 
     def get_extra_context(self, request, instance) -> dict[str, Any]:
-        """Add the tables to the view context."""
-
-        def _fsu_table(table: Type[FSUModelTable], fsu: Type[FSUModel]) -> FSUModelTable:
-            """Helper method to set up the table for an FSU."""
-            fsu_table: FSUModelTable = table(fsu.objects.filter(location__pk=instance.pk))
-            fsu_table.columns["actions"].column.extra_context["return_url_extra"] = (
-                f"?{request.GET.urlencode()}"
-            )
-            fsu_table.columns.hide("parent")
-            for table_column in ("firmware_version", "driver_name", "driver_version"):
-                fsu_table.columns.show(table_column)
-
-            return fsu_table
-
+        """Add the spares stored at or below the Location, from the stored spare counts."""
         context: dict[str, Any] = super().get_extra_context(request, instance)
-
-        context["cpu_table"] = _fsu_table(tables.CPUTable, models.CPU)
-        if request.user.has_perm("nautobot_fsus.change_cpu"):
-            context["cpu_table"].columns.show("pk")
-
-        context["disk_table"] = _fsu_table(tables.DiskTable, models.Disk)
-        if request.user.has_perm("nautobot_fsus.change_disk"):
-            context["disk_table"].columns.show("pk")
-
-        context["fan_table"] = _fsu_table(tables.FanTable, models.Fan)
-        if request.user.has_perm("nautobot_fsus.change_fan"):
-            context["fan_table"].columns.show("pk")
-
-        context["gpu_table"] = _fsu_table(tables.GPUTable, models.GPU)
-        if request.user.has_perm("nautobot_fsus.change_gpu"):
-            context["gpu_table"].columns.show("pk")
-
-        context["gpubaseboard_table"] = _fsu_table(tables.GPUBaseboardTable, models.GPUBaseboard)
-        if request.user.has_perm("nautobot_fsus.change_gpubaseboard"):
-            context["gpubaseboard_table"].columns.show("pk")
-
-        context["hba_table"] = _fsu_table(tables.HBATable, models.HBA)
-        if request.user.has_perm("nautobot_fsus.change_hba"):
-            context["hba_table"].columns.show("pk")
-
-        context["mainboard_table"] = _fsu_table(tables.MainboardTable, models.Mainboard)
-        if request.user.has_perm("nautobot_fsus.change_mainboard"):
-            context["mainboard_table"].columns.show("pk")
-
-        context["nic_table"] = _fsu_table(tables.NICTable, models.NIC)
-        if request.user.has_perm("nautobot_fsus.change_nic"):
-            context["nic_table"].columns.show("pk")
-
-        context["otherfsu_table"] = _fsu_table(tables.OtherFSUTable, models.OtherFSU)
-        if request.user.has_perm("nautobot_fsus.change_otherfsu"):
-            context["otherfsu_table"].columns.show("pk")
-
-        context["psu_table"] = _fsu_table(tables.PSUTable, models.PSU)
-        if request.user.has_perm("nautobot_fsus.change_psu"):
-            context["psu_table"].columns.show("pk")
-
-        context["rammodule_table"] = _fsu_table(tables.RAMModuleTable, models.RAMModule)
-        if request.user.has_perm("nautobot_fsus.change_rammodule"):
-            context["rammodule_table"].columns.show("pk")
+        context["spares"] = with_fsu_types(get_spare_counts(request.user).filter(location=instance))
 
         return context
 
 
 __all__ = (
+    "AllFSUsListView",
     "CPUBulkRenameView",
     "CPUTemplateUIViewSet",
     "CPUTypeUIViewSet",
@@ -18,6 +18,7 @@
 from typing import Any
 
 from django.urls import reverse
+from nautobot.apps.models import count_related
 
 from nautobot_fsus import filters, forms, models, tables
 from nautobot_fsus.api import serializers
@@ -32,7 +33,7 @@ class CPUTypeUIViewSet(FSUTypeModelViewSet):
     filterset_form_class = forms.CPUTypeFilterForm
     form_class = forms.CPUTypeForm
     lookup_field = "pk"
-    queryset = models.CPUType.objects.all()
+    queryset = models.CPUType.objects.annotate(instance_count=count_related(models.CPU, "fsu_type"))
     serializer_class = serializers.CPUTypeSerializer
     table_class = tables.CPUTypeTable
 
@@ -59,7 +60,9 @@ class DiskTypeUIViewSet(FSUTypeModelViewSet):
     filterset_form_class = forms.DiskTypeFilterForm
     form_class = forms.DiskTypeForm
     lookup_field = "pk"
-    queryset = models.DiskType.objects.all()
+    queryset = models.DiskType.objects.annotate(
+        instance_count=count_related(models.Disk, "fsu_type")
+    )
     serializer_class = serializers.DiskTypeSerializer
     table_class = tables.DiskTypeTable
 
@@ -86,7 +89,7 @@ class FanTypeUIViewSet(FSUTypeModelViewSet):
     filterset_form_class = forms.FanTypeFilterForm
     form_class = forms.FanTypeForm
     lookup_field = "pk"
-    queryset = models.FanType.objects.all()
+    queryset = models.FanType.objects.annotate(instance_count=count_related(models.Fan, "fsu_type"))
     serializer_class = serializers.FanTypeSerializer
     table_class = tables.FanTypeTable
 
@@ -113,7 +116,7 @@ class GPUTypeUIViewSet(FSUTypeModelViewSet):
     filterset_form_class = forms.GPUTypeFilterForm
     form_class = forms.GPUTypeForm
     lookup_field = "pk"
-    queryset = models.GPUType.objects.all()
+    queryset = models.GPUType.objects.annotate(instance_count=count_related(models.GPU, "fsu_type"))
     serializer_class = serializers.GPUTypeSerializer
     table_class = tables.GPUTypeTable
 
@@ -140,7 +143,9 @@ class GPUBaseboardTypeUIViewSet(FSUTypeModelViewSet):
     filterset_form_class = forms.GPUBaseboardTypeFilterForm
     form_class = forms.GPUBaseboardTypeForm
     lookup_field = "pk"
-    queryset = models.GPUBaseboardType.objects.all()
+    queryset = models.GPUBaseboardType.objects.annotate(
+        instance_count=count_related(models.GPUBaseboard, "fsu_type")
+    )
     serializer_class = serializers.GPUBaseboardTypeSerializer
     table_class = tables.GPUBaseboardTypeTable
 
@@ -167,7 +172,7 @@ class HBATypeUIViewSet(FSUTypeModelViewSet):
     filterset_form_class = forms.HBATypeFilterForm
     form_class = forms.HBATypeForm
     lookup_field = "pk"
-    queryset = models.HBAType.objects.all()
+    queryset = models.HBAType.objects.annotate(instance_count=count_related(models.HBA, "fsu_type"))
     serializer_class = serializers.HBATypeSerializer
     table_class = tables.HBATypeTable
 
@@ -194,7 +199,9 @@ class MainboardTypeUIViewSet(FSUTypeModelViewSet):
     filterset_form_class = forms.MainboardTypeFilterForm
     form_class = forms.MainboardTypeForm
     lookup_field = "pk"
-    queryset = models.MainboardType.objects.all()
+    queryset = models.MainboardType.objects.annotate(
+        instance_count=count_related(models.Mainboard, "fsu_type")
+    )
     serializer_class = serializers.MainboardTypeSerializer
     table_class = tables.MainboardTypeTable
 
@@ -221,7 +228,7 @@ class NICTypeUIViewSet(FSUTypeModelViewSet):
     filterset_form_class = forms.NICTypeFilterForm
     form_class = forms.NICTypeForm
     lookup_field = "pk"
-    queryset = models.NICType.objects.all()
+    queryset = models.NICType.objects.annotate(instance_count=count_related(models.NIC, "fsu_type"))
     serializer_class = serializers.NICTypeSerializer
     table_class = tables.NICTypeTable
 
@@ -248,7 +255,9 @@ class OtherFSUTypeUIViewSet(FSUTypeModelViewSet):
     filterset_form_class = forms.OtherFSUTypeFilterForm
     form_class = forms.OtherFSUTypeForm
     lookup_field = "pk"
-    queryset = models.OtherFSUType.objects.all()
+    queryset = models.OtherFSUType.objects.annotate(
+        instance_count=count_related(models.OtherFSU, "fsu_type")
+    )
     serializer_class = serializers.OtherFSUTypeSerializer
     table_class = tables.OtherFSUTypeTable
 
@@ -275,7 +284,7 @@ class PSUTypeUIViewSet(FSUTypeModelViewSet):
     filterset_form_class = forms.PSUTypeFilterForm
     form_class = forms.PSUTypeForm
     lookup_field = "pk"
-    queryset = models.PSUType.objects.all()
+    queryset = models.PSUType.objects.annotate(instance_count=count_related(models.PSU, "fsu_type"))
     serializer_class = serializers.PSUTypeSerializer
     table_class = tables.PSUTypeTable
 
@@ -302,7 +311,9 @@ class RAMModuleTypeUIViewSet(FSUTypeModelViewSet):
     filterset_form_class = forms.RAMModuleTypeFilterForm
     form_class = forms.RAMModuleTypeForm
     lookup_field = "pk"
-    queryset = models.RAMModuleType.objects.all()
+    queryset = models.RAMModuleType.objects.annotate(
+        instance_count=count_related(models.RAMModule, "fsu_type")
+    )
     serializer_class = serializers.RAMModuleTypeSerializer
     table_class = tables.RAMModuleTypeTable
 
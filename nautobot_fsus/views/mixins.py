@@ -22,6 +22,7 @@ from django.contrib import messages
 from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from django.forms import Form
+from django.http import StreamingHttpResponse
 from django.http.request import HttpRequest
 from django.http.response import HttpResponseRedirect
 from django.template.loader import TemplateDoesNotExist, select_template
@@ -29,9 +30,11 @@ from nautobot.apps.tables import BaseTable
 from nautobot.apps.utils import resolve_permission
 from nautobot.apps.views import BulkRenameView, NautobotUIViewSet
 from nautobot.dcim.models import DeviceType
+from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from nautobot_fsus.forms.mixins import FSUTemplateCreateForm, FSUTemplateModelForm
+from nautobot_fsus.utilities.export import EXPORT_FORMATS, streaming_export_response
 
 
 class FSUBulkRenameView(BulkRenameView):
@@ -51,6 +54,16 @@ class FSUModelViewSet(NautobotUIViewSet):
     base_template = "nautobot_fsus/fsu.html"
     bulk_table_class: Type[BaseTable]
 
+    @action(
+        detail=False,
+        url_path=f"export/(?P<export_format>{'|'.join(EXPORT_FORMATS)})",
+        url_name="export",
+        custom_view_base_action="view",
+    )
+    def export(self, request: HttpRequest, export_format: str) -> StreamingHttpResponse:
+        """Stream the filtered list of FSUs as a CSV or NDJSON file."""
+        return streaming_export_response(self.filter_queryset(self.get_queryset()), export_format)
+
     def get_form_class(self, **kwargs) -> Type[Form]:
         """Add FSU-specific help text to import form class."""
         form_class: Type[Form] = super().get_form_class(**kwargs)